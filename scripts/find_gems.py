@@ -5,17 +5,25 @@ Consolidated screening pipeline: scrape exchange listings + filter by fundamenta
 Two-phase internal pipeline:
   Phase 1 (scrape): Download ticker listings from configured exchanges
   Phase 2 (filter): Fetch yfinance financials and apply hard filters
+    --bulk-quotes first pulls quote fields for hundreds of symbols per request
+    and applies Filters A/B/C column-wise, so only survivors get the
+    per-symbol info + income-statement fetch.
 
 Modes:
   Default:        Run both phases in-memory (scrape → filter → output)
   --scrape-only:  Only scrape exchanges, output raw CSV, skip filtering
-  --filter-only:  Skip scraping, filter from existing CSV file
+  --filter-only:  Skip scraping, filter from existing CSV file (or re-filter a
+                  scan journal offline)
+  --resume:       Continue an interrupted filter run from its checkpoint journal
+                  (a rerun without it refuses to overwrite an unfinished
+                  journal; --fresh-journal starts over)
 
 Replaces the manual chaining of ticker_scraper.py + filter_tickers.py.
 Both original scripts remain untouched for backward compatibility.
 """
 
 import argparse
+import contextlib
 import io
 import json
 import logging
@@ -47,6 +55,12 @@ configure_yfinance_defaults()
 DEFAULT_CONFIG_PATH = "config/exchanges.json"
 DEFAULT_WORKERS = 4
 BATCH_SIZE = 50
+QUOTE_BATCH_SIZE = 200
+DEFAULT_MAX_RPS = 4.0
+# AIMD: grow the worker limit by one while latency stays within this factor
+# of the best observed EWMA; halve it on a rate-limit response.
+AIMD_LATENCY_TOLERANCE = 1.5
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
 DEFAULT_MAX_PE = PE_MAX  # thesis P/E ceiling (src/thesis_constants.py)
 DEFAULT_MAX_PE_CONTEXTUAL = 24.0
 DEFAULT_MIN_ROE = 13.0
@@ -658,13 +672,173 @@ def scrape_exchanges(config: dict, *, exclude_us: bool = True) -> pd.DataFrame:
 # ============================================================
 
 
-def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=False):
+def _skip(row, reason: str) -> None:
+    """Tag *row* with a definitive skip reason and return None.
+
+    Only answers that a rerun would repeat (no data, not an equity, below the
+    size/liquidity floors, 404) are tagged; transient failures stay untagged
+    so a resumed scan retries them.
+    """
+    row["_skip_reason"] = reason
+    return None
+
+
+class AdaptiveThrottle:
+    """AIMD worker limit plus one token bucket shared by every worker thread.
+
+    Replaces the per-call random sleep and per-thread rate-limit backoff:
+    every yfinance call takes a token, and a rate-limit response halves the
+    worker limit and pauses the whole bucket instead of just one thread.
+    The limit grows by one after ``limit`` successes in a row while the
+    latency EWMA stays within ``AIMD_LATENCY_TOLERANCE`` of its best value.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_workers: int,
+        max_workers: int,
+        rate_per_second: float = DEFAULT_MAX_RPS,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.limit = min(max(1, initial_workers), self.max_workers)
+        self.peak_limit = self.limit
+        self.rate_per_second = rate_per_second
+        self.throttle_events = 0
+        self._cond = threading.Condition()
+        self._active = 0
+        self._tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._latency_ewma: float | None = None
+        self._latency_best: float | None = None
+        self._streak = 0
+        self._started_at = time.monotonic()
+        self._rows = 0
+        self._exchanges: dict[str, dict] = {}
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one of the ``limit`` concurrent worker slots."""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait(timeout=0.5)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def wait_for_token(self) -> None:
+        """Block until the shared bucket grants one request."""
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    elapsed = now - self._refilled_at
+                    self._tokens = min(
+                        max(1.0, self.rate_per_second),
+                        self._tokens + elapsed * self.rate_per_second,
+                    )
+                    self._refilled_at = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    delay = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(delay)
+
+    def record_success(self, latency: float) -> None:
+        with self._cond:
+            ewma = self._latency_ewma
+            ewma = latency if ewma is None else 0.8 * ewma + 0.2 * latency
+            self._latency_ewma = ewma
+            if self._latency_best is None or ewma < self._latency_best:
+                self._latency_best = ewma
+            self._streak += 1
+            if (
+                self._streak >= self.limit
+                and self.limit < self.max_workers
+                and ewma <= self._latency_best * AIMD_LATENCY_TOLERANCE
+            ):
+                self.limit += 1
+                self.peak_limit = max(self.peak_limit, self.limit)
+                self._streak = 0
+                self._cond.notify_all()
+
+    def record_throttle(self, backoff: float, *, exchange=None) -> None:
+        with self._cond:
+            now = time.monotonic()
+            self.throttle_events += 1
+            self._exchange_stats(exchange)["throttles"] += 1
+            self._streak = 0
+            # In-flight calls often hit the same 429 together; decrease once
+            # per pause rather than once per response.
+            if now >= self._paused_until:
+                self.limit = max(1, self.limit // 2)
+            self._paused_until = max(self._paused_until, now + backoff)
+            self._tokens = 0.0
+
+    def record_row(self, exchange=None) -> None:
+        with self._cond:
+            now = time.monotonic()
+            self._rows += 1
+            stats = self._exchange_stats(exchange)
+            stats["rows"] += 1
+            stats["first"] = stats["first"] if stats["first"] is not None else now
+            stats["last"] = now
+
+    def _exchange_stats(self, exchange) -> dict:
+        key = str(exchange) if exchange is not None and not pd.isna(exchange) else "?"
+        return self._exchanges.setdefault(
+            key, {"rows": 0, "throttles": 0, "first": None, "last": None}
+        )
+
+    def summary(self) -> str:
+        """Achieved rows/second and throttle events, overall and per exchange."""
+        with self._cond:
+            elapsed = time.monotonic() - self._started_at
+            overall = self._rows / elapsed if elapsed > 0 else 0.0
+            lines = [
+                f"Throughput: {self._rows} rows in {elapsed:.0f}s "
+                f"({overall:.2f} rows/s), {self.throttle_events} throttle events, "
+                f"workers peak {self.peak_limit} / final {self.limit}"
+            ]
+            for exchange, stats in sorted(self._exchanges.items()):
+                span = (
+                    stats["last"] - stats["first"]
+                    if stats["first"] is not None
+                    else 0.0
+                )
+                rate = stats["rows"] / span if span > 0 else 0.0
+                lines.append(
+                    f"  {exchange[:42]:<42} {stats['rows']:>6} rows "
+                    f"{rate:>6.2f} rows/s {stats['throttles']:>4} throttles"
+                )
+            return "\n".join(lines)
+
+
+def _process_row(
+    row,
+    *,
+    fx_rates=None,
+    min_mcap=None,
+    min_volume=None,
+    debug=False,
+    throttle: AdaptiveThrottle | None = None,
+):
     """Fetch financials for a single ticker via yfinance.
 
     Early-exit filters (A/B/C) run BEFORE the expensive income_stmt fetch:
       A) Quote type must be EQUITY (reject ETFs, warrants, CBBCs)
       B) Market cap (USD) must exceed *min_mcap*
       C) Daily dollar volume (USD) must exceed *min_volume*
+
+    With a *throttle*, calls are paced by its shared token bucket and rate
+    limits are reported to it instead of sleeping in this thread.
     """
     ticker_symbol = row.get("YF_Ticker")
     if pd.isna(ticker_symbol) or not ticker_symbol or str(ticker_symbol).strip() == "":
@@ -676,16 +850,22 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
 
     max_retries = 4
     for attempt in range(max_retries + 1):
-        time.sleep(random.uniform(0.5, 1.5))
+        if throttle is not None:
+            throttle.wait_for_token()
+        else:
+            time.sleep(random.uniform(0.5, 1.5))
 
         try:
+            started = time.monotonic()
             ticker = yf.Ticker(yf_symbol)
             info = ticker.info
+            if throttle is not None:
+                throttle.record_success(time.monotonic() - started)
 
             if not info:
                 if debug:
                     print(f"[DEBUG] {yf_symbol}: Empty info", file=sys.stderr)
-                return None
+                return _skip(row, "no_data")
 
             if (
                 "regularMarketPrice" not in info
@@ -696,7 +876,7 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
                     print(
                         f"[DEBUG] {yf_symbol}: No price/PE data found", file=sys.stderr
                     )
-                return None
+                return _skip(row, "no_data")
 
             # --- Filter A: Quote type guard (ETFs, warrants, CBBCs) ---
             quote_type = info.get("quoteType")
@@ -706,7 +886,7 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
                         f"[SKIP] {yf_symbol}: quoteType={quote_type} (not EQUITY)",
                         file=sys.stderr,
                     )
-                return None
+                return _skip(row, "not_equity")
 
             # Extract price/currency early (needed for Filters B & C)
             currency = info.get("currency")
@@ -729,7 +909,7 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
                         f"[SKIP] {yf_symbol}: Micro-cap ${mcap_usd:,.0f} < ${min_mcap:,.0f}",
                         file=sys.stderr,
                     )
-                return None
+                return _skip(row, "micro_cap")
 
             # --- Filter C: Minimum daily dollar volume (USD) ---
             turnover_usd = None
@@ -750,7 +930,7 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
                         f"[SKIP] {yf_symbol}: Low volume ${turnover_usd:,.0f} < ${min_volume:,.0f}",
                         file=sys.stderr,
                     )
-                return None
+                return _skip(row, "low_volume")
 
             # --- Populate standard fields ---
             row["Company_YF"] = info.get("longName") or info.get("shortName")
@@ -814,6 +994,8 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
             # Revenue history: count annual periods with positive revenue
             row["Revenue_Years_Positive"] = None
             try:
+                if throttle is not None:
+                    throttle.wait_for_token()
                 income_stmt = ticker.income_stmt
                 if income_stmt is not None and not income_stmt.empty:
                     for label in ["Total Revenue", "Operating Revenue"]:
@@ -834,6 +1016,9 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
         except YFRateLimitError as e:
             if attempt < max_retries:
                 wait_time = (20 * (attempt + 1)) + random.uniform(1, 5)
+                if throttle is not None:
+                    throttle.record_throttle(wait_time, exchange=row.get("Exchange"))
+                    continue
                 if debug:
                     print(
                         f"[RETRY] {yf_symbol}: yfinance rate limited, sleeping {wait_time:.1f}s",
@@ -850,13 +1035,18 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
             if "404" in str_e and "Not Found" in str_e:
                 if debug:
                     print(f"[DEBUG] {yf_symbol}: 404 Not Found", file=sys.stderr)
-                return None
+                return _skip(row, "not_found")
 
             if "429" in str_e or "Too Many Requests" in str_e or "500" in str_e:
                 if attempt < max_retries:
                     is_rate_limit = "429" in str_e or "Too Many Requests" in str_e
                     base_wait = 20 if is_rate_limit else 5
                     wait_time = (base_wait * (attempt + 1)) + random.uniform(1, 5)
+                    if is_rate_limit and throttle is not None:
+                        throttle.record_throttle(
+                            wait_time, exchange=row.get("Exchange")
+                        )
+                        continue
                     if debug:
                         print(
                             f"[RETRY] {yf_symbol}: Sleeping {wait_time:.1f}s",
@@ -873,14 +1063,20 @@ def _process_row(row, *, fx_rates=None, min_mcap=None, min_volume=None, debug=Fa
 
 
 def _process_row_pool_task(task):
-    row, fx_rates, min_mcap, min_volume, debug = task
-    return _process_row(
-        dict(row),
+    row, fx_rates, min_mcap, min_volume, debug, throttle = task
+    work_row = dict(row)
+    result = _process_row(
+        work_row,
         fx_rates=fx_rates,
         min_mcap=min_mcap,
         min_volume=min_volume,
         debug=debug,
+        throttle=throttle,
     )
+    if result is None and work_row.get("_skip_reason"):
+        # Surface the skip reason on the source record for the scan journal.
+        row["_skip_reason"] = work_row["_skip_reason"]
+    return result
 
 
 def _process_row_serial_task(task):
@@ -922,12 +1118,14 @@ def _log_filter_progress(
     )
 
 
-def _iter_enrichment_tasks(records, *, fx_rates, criteria: ScreenCriteria, debug: bool):
+def _iter_enrichment_tasks(
+    records, *, fx_rates, criteria: ScreenCriteria, debug: bool, throttle=None
+):
     for row in records:
-        yield (row, fx_rates, criteria.min_mcap, criteria.min_volume, debug)
+        yield (row, fx_rates, criteria.min_mcap, criteria.min_volume, debug, throttle)
 
 
-def _run_threaded_enrichment(tasks, *, workers, worker_fn):
+def _run_threaded_enrichment(tasks, *, workers, worker_fn, throttle=None):
     """Yield enrichment results as they complete, using daemon worker threads.
 
     Enrichment is pure network I/O (yfinance HTTP), so threads parallelize it
@@ -937,6 +1135,9 @@ def _run_threaded_enrichment(tasks, *, workers, worker_fn):
     with no cleanup obligations (idempotent, retried reads), so a
     ``KeyboardInterrupt`` abandons any in-flight read and the process exits
     promptly instead of hanging on a join (matching the old ``pool.terminate()``).
+
+    With a *throttle*, ``throttle.max_workers`` threads are started and each
+    task runs inside one of the throttle's (adaptive) worker slots.
     """
     task_queue: queue.Queue = queue.Queue()
     result_queue: queue.Queue = queue.Queue()
@@ -947,19 +1148,30 @@ def _run_threaded_enrichment(tasks, *, workers, worker_fn):
     if submitted == 0:
         return
 
+    def _run_one() -> bool:
+        try:
+            task = task_queue.get_nowait()
+        except queue.Empty:
+            return False
+        try:
+            result_queue.put(worker_fn(task))
+        except Exception:
+            # Mirror the serial path: a failed row yields no data, not a crash.
+            result_queue.put(None)
+        return True
+
     def _worker() -> None:
         while True:
-            try:
-                task = task_queue.get_nowait()
-            except queue.Empty:
-                return
-            try:
-                result_queue.put(worker_fn(task))
-            except Exception:
-                # Mirror the serial path: a failed row yields no data, not a crash.
-                result_queue.put(None)
+            if throttle is None:
+                if not _run_one():
+                    return
+                continue
+            with throttle.slot():
+                if not _run_one():
+                    return
 
-    for _ in range(max(1, workers)):
+    thread_count = throttle.max_workers if throttle is not None else workers
+    for _ in range(max(1, thread_count)):
         threading.Thread(target=_worker, daemon=True).start()
 
     for _ in range(submitted):
@@ -973,6 +1185,15 @@ def _run_threaded_enrichment(tasks, *, workers, worker_fn):
                 continue
 
 
+def _with_source_row(worker_fn):
+    """Wrap *worker_fn* so each result travels with the record it came from."""
+
+    def run(task):
+        return task[0], worker_fn(task)
+
+    return run
+
+
 def _collect_enrichment_results(
     records,
     *,
@@ -981,6 +1202,8 @@ def _collect_enrichment_results(
     workers: int,
     debug: bool = False,
     worker_fn=_process_row_pool_task,
+    journal=None,
+    throttle: AdaptiveThrottle | None = None,
 ):
     passing = []
     all_enriched = []
@@ -988,7 +1211,7 @@ def _collect_enrichment_results(
     total = len(records)
     start_time = time.time()
 
-    if workers <= 1:
+    if workers <= 1 and throttle is None:
         try:
             for task in _iter_enrichment_tasks(
                 records,
@@ -1008,6 +1231,7 @@ def _collect_enrichment_results(
                     passing=passing,
                     all_enriched=all_enriched,
                 )
+                _journal_result(journal, task[0], data)
                 _log_filter_progress(
                     processed_count=processed_count,
                     total=total,
@@ -1015,21 +1239,27 @@ def _collect_enrichment_results(
                     passing=passing,
                 )
         except KeyboardInterrupt:
-            print("\nInterrupted! Returning partial results...", file=sys.stderr)
+            _report_interrupt(journal)
         return passing, all_enriched
 
     try:
-        for data in _run_threaded_enrichment(
+        for item in _run_threaded_enrichment(
             _iter_enrichment_tasks(
                 records,
                 fx_rates=fx_rates,
                 criteria=criteria,
                 debug=debug,
+                throttle=throttle,
             ),
             workers=workers,
-            worker_fn=worker_fn,
+            worker_fn=_with_source_row(worker_fn),
+            throttle=throttle,
         ):
+            # A worker exception yields a bare None instead of a pair.
+            source, data = item if item is not None else (None, None)
             processed_count += 1
+            if throttle is not None:
+                throttle.record_row(source.get("Exchange") if source else None)
             _handle_enriched_row_result(
                 data,
                 criteria=criteria,
@@ -1037,6 +1267,7 @@ def _collect_enrichment_results(
                 passing=passing,
                 all_enriched=all_enriched,
             )
+            _journal_result(journal, source, data)
             _log_filter_progress(
                 processed_count=processed_count,
                 total=total,
@@ -1044,11 +1275,362 @@ def _collect_enrichment_results(
                 passing=passing,
             )
     except KeyboardInterrupt:
-        print("\nInterrupted! Returning partial results...", file=sys.stderr)
+        _report_interrupt(journal)
+
+    return passing, all_enriched
+
+
+# ============================================================
+# Scan journal (checkpoint / resume / offline re-filter)
+# ============================================================
+
+_JOURNAL_FINISHED = "finished"
+
+
+def _json_default(value):
+    # numpy scalars from pandas rows; anything else is stored as text.
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _journal_finished(path: Path) -> bool:
+    """Whether the journal's last record is the end-of-scan marker."""
+    with open(path, "rb") as handle:
+        handle.seek(0, 2)
+        handle.seek(max(0, handle.tell() - 4096))
+        lines = handle.read().splitlines()
+    for line in reversed(lines):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return False
+        return isinstance(entry, dict) and entry.get("status") == _JOURNAL_FINISHED
+    return False
+
+
+def load_journal(path) -> dict[str, dict]:
+    """Return the latest journal entry per ``YF_Ticker``.
+
+    A torn last line (process killed mid-write) is ignored, so that ticker is
+    simply screened again.
+    """
+    entries: dict[str, dict] = {}
+    journal_path = Path(path)
+    if not journal_path.exists():
+        return entries
+    with open(journal_path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            ticker = entry.get("YF_Ticker") if isinstance(entry, dict) else None
+            if ticker:
+                entries[ticker] = entry
+    return entries
+
+
+class ScanJournal:
+    """Append-only JSONL checkpoint with one record per screened ``YF_Ticker``.
 
+    Enriched rows are stored whole (with their ``_reject_reason``) so a later
+    ``--filter-only <journal>`` can re-apply changed criteria offline. Rows
+    dropped before enrichment keep only their ``_skip_reason``. Each record
+    is flushed as it is written.
+
+    A scan that runs to the end appends a ``finish()`` marker, and a journal
+    ending in one is simply started over by the next run. An unfinished
+    journal is only ever appended to (``resume=True``) or, with
+    ``fresh=True``, deliberately started over; anything else raises
+    ``FileExistsError`` so a rerun after a crash cannot wipe the checkpoint.
+    """
+
+    def __init__(self, path, *, resume: bool = False, fresh: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not resume and not fresh and self.path.exists():
+            if self.path.stat().st_size > 0 and not _journal_finished(self.path):
+                raise FileExistsError(
+                    f"Scan journal {self.path} holds an unfinished scan; pass "
+                    "--resume to continue it or --fresh-journal to start over"
+                )
+        self.completed = load_journal(self.path) if resume else {}
+        self.interrupted = False
+        self._handle = open(self.path, "a" if resume else "w", encoding="utf-8")
+
+    def record(self, ticker, *, row=None, reason=None) -> None:
+        entry = {
+            "YF_Ticker": ticker,
+            "status": "enriched" if row is not None else "skipped",
+            "reason": reason,
+            "row": row,
+        }
+        self._handle.write(json.dumps(entry, default=_json_default) + "\n")
+        self._handle.flush()
+
+    def finish(self) -> None:
+        """Mark the scan as run to the end (no ``YF_Ticker``, so never loaded)."""
+        self._handle.write(json.dumps({"status": _JOURNAL_FINISHED}) + "\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _report_interrupt(journal) -> None:
+    """Ctrl-C keeps the partial results but leaves the journal unfinished."""
+    print("\nInterrupted! Returning partial results...", file=sys.stderr)
+    if journal is not None:
+        journal.interrupted = True
+
+
+def _journal_result(journal, source, data) -> None:
+    """Journal one collected result; untagged failures stay retryable."""
+    if journal is None or source is None:
+        return
+    ticker = source.get("YF_Ticker")
+    if pd.isna(ticker) or not ticker:
+        return
+    if data is not None:
+        journal.record(ticker, row=data, reason=data.get("_reject_reason"))
+    elif source.get("_skip_reason"):
+        journal.record(ticker, reason=source["_skip_reason"])
+
+
+def _refilter_rows(rows, *, criteria: ScreenCriteria, debug: bool = False):
+    """Re-apply ``_passes_filters`` to previously enriched rows (no network)."""
+    passing: list[dict] = []
+    all_enriched: list[dict] = []
+    for row in rows:
+        data = dict(row)
+        data.pop("_reject_reason", None)
+        _handle_enriched_row_result(
+            data,
+            criteria=criteria,
+            debug=debug,
+            passing=passing,
+            all_enriched=all_enriched,
+        )
     return passing, all_enriched
 
 
+def _result_frames(passing, all_enriched):
+    passing_df = (
+        pd.DataFrame(passing) if passing else pd.DataFrame(columns=ENRICHED_COLUMNS)
+    )
+    enriched_df = (
+        pd.DataFrame(all_enriched)
+        if all_enriched
+        else pd.DataFrame(columns=ENRICHED_COLUMNS)
+    )
+    return passing_df, enriched_df
+
+
+def filter_journal(
+    journal_path, *, criteria: ScreenCriteria, debug: bool = False
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Re-screen a scan journal's enriched rows under *criteria*, offline.
+
+    Filters A/B/C ran before enrichment, so tickers they skipped are not
+    reconsidered here even if ``min_mcap``/``min_volume`` were loosened.
+    """
+    entries = load_journal(journal_path)
+    rows = [entry["row"] for entry in entries.values() if entry.get("row")]
+    print(
+        f"Re-filtering {len(rows)} journaled rows ({len(entries)} tickers) offline",
+        file=sys.stderr,
+    )
+    print(f"Criteria: {criteria.describe()}", file=sys.stderr)
+    passing, all_enriched = _refilter_rows(rows, criteria=criteria, debug=debug)
+    passing_df, enriched_df = _result_frames(passing, all_enriched)
+    print(
+        f"\nFilter complete: {len(passing_df)}/{len(rows)} tickers passed",
+        file=sys.stderr,
+    )
+    _log_per_exchange_pass_rates(enriched_df, passing_df)
+    return passing_df, enriched_df
+
+
+# ============================================================
+# Bulk quote pre-screen (Filters A/B/C, vectorized)
+# ============================================================
+
+
+def _fetch_quote_batch(symbols, *, debug=False, max_retries=4):
+    """Fetch quote-level fields for many symbols in one request.
+
+    Returns ``{symbol: quote}`` for the symbols Yahoo recognised, or ``None``
+    when the request itself failed (callers then keep the whole batch).
+    """
+    from yfinance.data import YfData
+
+    params = {"symbols": ",".join(symbols), "formatted": "false"}
+    for attempt in range(max_retries + 1):
+        try:
+            payload = YfData().get_raw_json(_QUOTE_URL, params=params)
+            results = (payload.get("quoteResponse") or {}).get("result") or []
+            return {q["symbol"]: q for q in results if q.get("symbol")}
+        except Exception as e:
+            str_e = str(e)
+            is_rate_limit = isinstance(e, YFRateLimitError) or (
+                "429" in str_e or "Too Many Requests" in str_e
+            )
+            if attempt < max_retries and (is_rate_limit or "500" in str_e):
+                base_wait = 20 if is_rate_limit else 5
+                wait_time = (base_wait * (attempt + 1)) + random.uniform(1, 5)
+                if debug:
+                    print(
+                        f"[RETRY] quote batch ({len(symbols)} symbols): "
+                        f"sleeping {wait_time:.1f}s",
+                        file=sys.stderr,
+                    )
+                time.sleep(wait_time)
+                continue
+            if debug:
+                print(f"[DEBUG] quote batch failed: {str_e}", file=sys.stderr)
+            return None
+    return None
+
+
+def _quote_frame(records, *, fetch_batch, batch_size=QUOTE_BATCH_SIZE, debug=False):
+    """One row per input record with the quote fields Filters A/B/C need.
+
+    ``Quote_Found`` is False only when a successful batch response omitted the
+    symbol (unknown to Yahoo); a failed batch leaves its rows unknown (NA) so
+    the per-symbol path still gets to decide.
+    """
+    symbols = [
+        to_yfinance(str(row.get("YF_Ticker")))
+        if not pd.isna(row.get("YF_Ticker")) and str(row.get("YF_Ticker")).strip()
+        else None
+        for row in records
+    ]
+    unique = list(dict.fromkeys(sym for sym in symbols if sym))
+    quotes: dict[str, dict] = {}
+    failed: set[str] = set()
+    start_time = time.time()
+    for offset in range(0, len(unique), batch_size):
+        chunk = unique[offset : offset + batch_size]
+        if offset:
+            time.sleep(random.uniform(0.5, 1.5))
+        batch = fetch_batch(chunk, debug=debug)
+        if batch is None:
+            failed.update(chunk)
+        else:
+            quotes.update(batch)
+        done = min(offset + batch_size, len(unique))
+        elapsed = time.time() - start_time
+        rate = done / elapsed if elapsed > 0 else 0
+        print(
+            f"Quote pre-screen: {done}/{len(unique)} ({rate:.1f} t/s)",
+            file=sys.stderr,
+        )
+
+    rows = []
+    for sym in symbols:
+        quote = quotes.get(sym) or {}
+        found = pd.NA if (sym is None or sym in failed) else sym in quotes
+        rows.append(
+            {
+                "Symbol": sym,
+                "Quote_Found": found,
+                "Quote_Type": quote.get("quoteType"),
+                "Market_Cap": quote.get("marketCap"),
+                # summaryDetail.averageVolume (used by .info) is the 3-month mean
+                "Avg_Volume": quote.get("averageDailyVolume3Month"),
+                "Price": quote.get("regularMarketPrice"),
+                "Currency": quote.get("currency"),
+            }
+        )
+    frame = pd.DataFrame(
+        rows,
+        columns=[
+            "Symbol",
+            "Quote_Found",
+            "Quote_Type",
+            "Market_Cap",
+            "Avg_Volume",
+            "Price",
+            "Currency",
+        ],
+    )
+    for column in ("Market_Cap", "Avg_Volume", "Price"):
+        frame[column] = pd.to_numeric(frame[column], errors="coerce")
+    return frame
+
+
+def _prescreen_mask(quotes: pd.DataFrame, *, fx_rates, criteria: ScreenCriteria):
+    """Vectorized Filters A/B/C with ``_process_row``'s missing-data semantics.
+
+    A filter only rejects when its inputs are known: a missing quote type,
+    market cap, volume or FX rate lets the symbol through to the full fetch.
+    """
+    usd_per_unit = {
+        currency: _to_usd(1.0, currency, fx_rates)
+        for currency in quotes["Currency"].dropna().unique()
+    }
+    to_usd = pd.to_numeric(quotes["Currency"].map(usd_per_unit), errors="coerce")
+
+    unknown_to_yahoo = quotes["Quote_Found"].astype("boolean").eq(False)
+    keep = quotes["Symbol"].notna() & ~unknown_to_yahoo.fillna(False)
+
+    # A) Quote type guard (ETFs, warrants, CBBCs)
+    quote_type = quotes["Quote_Type"]
+    keep &= quote_type.isna() | (quote_type == "") | (quote_type == "EQUITY")
+
+    # B) Minimum market cap (USD)
+    if criteria.min_mcap and criteria.min_mcap > 0:
+        mcap_usd = quotes["Market_Cap"] * to_usd
+        keep &= ~(mcap_usd < criteria.min_mcap)
+
+    # C) Minimum daily dollar volume (USD); zero volume/price counts as unknown,
+    # matching the truthiness checks in _process_row.
+    if criteria.min_volume and criteria.min_volume > 0:
+        local_turnover = (quotes["Avg_Volume"] * quotes["Price"]).where(
+            (quotes["Avg_Volume"] != 0) & (quotes["Price"] != 0)
+        )
+        pence = quotes["Symbol"].fillna("").str.endswith(".L")
+        local_turnover = local_turnover.where(~pence, local_turnover / 100.0)
+        keep &= ~(local_turnover * to_usd < criteria.min_volume)
+
+    return keep.fillna(False).astype(bool)
+
+
+def _bulk_prescreen(
+    records,
+    *,
+    fx_rates,
+    criteria: ScreenCriteria,
+    debug: bool = False,
+    fetch_batch=None,
+):
+    """Return the records that survive the batched Filters A/B/C pass."""
+    if not records:
+        return []
+    quotes = _quote_frame(
+        records, fetch_batch=fetch_batch or _fetch_quote_batch, debug=debug
+    )
+    keep = _prescreen_mask(quotes, fx_rates=fx_rates, criteria=criteria)
+    if debug:
+        for symbol in quotes.loc[~keep, "Symbol"].dropna():
+            print(f"[SKIP] {symbol}: rejected by quote pre-screen", file=sys.stderr)
+    survivors = [row for row, kept in zip(records, keep, strict=True) if kept]
+    print(
+        f"Quote pre-screen kept {len(survivors)}/{len(records)} tickers",
+        file=sys.stderr,
+    )
+    return survivors
+
+
 def _safe_float(val):
     try:
         return float(val)
@@ -1370,13 +1952,39 @@ def fetch_and_filter(
     ocf_waiver: bool = True,
     workers: int = 4,
     debug: bool = False,
+    bulk_quotes: bool = False,
+    journal: ScanJournal | None = None,
+    max_workers: int | None = None,
+    max_rps: float = DEFAULT_MAX_RPS,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Fetch yfinance financials and apply hard filters.
 
+    With ``bulk_quotes``, Filters A/B/C run first over batched quote data and
+    only the survivors get the per-symbol fetch. With a ``journal``, every
+    screened ticker is checkpointed and a scan that is not interrupted is
+    marked finished; tickers the journal already completed
+    (``ScanJournal(..., resume=True)``) are re-filtered from their journaled
+    rows instead of fetched again. With ``max_workers``, an
+    ``AdaptiveThrottle`` grows the pool from ``workers`` up to that ceiling
+    and paces all calls at ``max_rps``.
+
     Returns (passing_df, all_enriched_df).
     """
     records = tickers_df.to_dict("records")
     total = len(records)
+    journaled_rows: list[dict] = []
+    if journal is not None and journal.completed:
+        journaled_rows = [
+            entry["row"] for entry in journal.completed.values() if entry.get("row")
+        ]
+        records = [
+            row for row in records if row.get("YF_Ticker") not in journal.completed
+        ]
+        print(
+            f"Resuming: {total - len(records)} tickers already journaled, "
+            f"{len(records)} remaining",
+            file=sys.stderr,
+        )
     criteria = ScreenCriteria(
         max_pe=max_pe,
         max_pe_contextual=max_pe_contextual,
@@ -1394,28 +2002,57 @@ def fetch_and_filter(
     fx_rates = _fetch_fx_rates()
     print(f"OK ({len(fx_rates)} currencies)", file=sys.stderr)
 
+    print(f"Criteria: {criteria.describe()}", file=sys.stderr)
+
+    if bulk_quotes:
+        try:
+            survivors = _bulk_prescreen(
+                records, fx_rates=fx_rates, criteria=criteria, debug=debug
+            )
+        except KeyboardInterrupt:
+            _report_interrupt(journal)
+            survivors = []
+        else:
+            kept = {id(row) for row in survivors}
+            for row in records:
+                if id(row) not in kept:
+                    _journal_result(
+                        journal, {**row, "_skip_reason": "quote_prescreen"}, None
+                    )
+        records = survivors
+
     print(
-        f"Scanning {total} tickers with {workers} workers...",
+        f"Scanning {len(records)} tickers with {workers} workers...",
         file=sys.stderr,
     )
-    print(f"Criteria: {criteria.describe()}", file=sys.stderr)
 
-    passing, all_enriched = _collect_enrichment_results(
+    passing, all_enriched = _refilter_rows(
+        journaled_rows, criteria=criteria, debug=debug
+    )
+    throttle = (
+        AdaptiveThrottle(
+            initial_workers=workers, max_workers=max_workers, rate_per_second=max_rps
+        )
+        if max_workers
+        else None
+    )
+    new_passing, new_enriched = _collect_enrichment_results(
         records,
         fx_rates=fx_rates,
         criteria=criteria,
         workers=workers,
         debug=debug,
+        journal=journal,
+        throttle=throttle,
     )
+    if throttle is not None:
+        print(throttle.summary(), file=sys.stderr)
+    if journal is not None and not journal.interrupted:
+        journal.finish()
+    passing.extend(new_passing)
+    all_enriched.extend(new_enriched)
 
-    passing_df = (
-        pd.DataFrame(passing) if passing else pd.DataFrame(columns=ENRICHED_COLUMNS)
-    )
-    enriched_df = (
-        pd.DataFrame(all_enriched)
-        if all_enriched
-        else pd.DataFrame(columns=ENRICHED_COLUMNS)
-    )
+    passing_df, enriched_df = _result_frames(passing, all_enriched)
 
     print(
         f"\nFilter complete: {len(passing_df)}/{total} tickers passed",
@@ -1508,6 +2145,15 @@ Examples:
   # Filter from existing CSV (skip scraping)
   python scripts/find_gems.py --filter-only scratch/raw_tickers.csv --output scratch/gems.txt
 
+  # Continue an interrupted scan from its checkpoint journal
+  python scripts/find_gems.py --filter-only scratch/raw_tickers.csv --output scratch/gems.txt --resume
+
+  # Discard that journal and scan from scratch
+  python scripts/find_gems.py --filter-only scratch/raw_tickers.csv --output scratch/gems.txt --fresh-journal
+
+  # Re-apply changed criteria to a finished scan without network calls
+  python scripts/find_gems.py --filter-only scratch/gems.journal.jsonl --max-pe 15 --output scratch/gems15.txt
+
   # Include US exchanges
   python scripts/find_gems.py --include-us --output scratch/gems.txt --debug
 
@@ -1538,7 +2184,10 @@ when profitability, leverage, cash-flow quality, and coverage are stronger.
     mode_group.add_argument(
         "--filter-only",
         metavar="FILE",
-        help="Skip scraping, filter from existing CSV file.",
+        help=(
+            "Skip scraping, filter from existing CSV file. A scan journal "
+            "(.jsonl) is re-filtered offline with the current criteria."
+        ),
     )
 
     parser.add_argument(
@@ -1605,11 +2254,78 @@ when profitability, leverage, cash-flow quality, and coverage are stronger.
         default=DEFAULT_WORKERS,
         help="Enrichment worker-thread concurrency (default: 4; 1 = serial)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help=(
+            "Adaptive concurrency: grow from --workers up to this many threads "
+            "while latency stays flat, halve on rate limits"
+        ),
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_MAX_RPS,
+        help=(
+            "Shared request budget per second with --max-workers "
+            f"(default: {DEFAULT_MAX_RPS:g})"
+        ),
+    )
+    parser.add_argument(
+        "--bulk-quotes",
+        action="store_true",
+        help=(
+            "Pre-screen quote type, market cap and volume in batches of "
+            f"{QUOTE_BATCH_SIZE} symbols before the per-ticker fetch"
+        ),
+    )
+    parser.add_argument(
+        "--journal",
+        metavar="FILE",
+        help=(
+            "Checkpoint journal, one JSONL record per screened ticker "
+            "(default: <output>.journal.jsonl)"
+        ),
+    )
+    parser.add_argument(
+        "--no-journal",
+        action="store_true",
+        help="Do not write a checkpoint journal",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip tickers already in the journal and continue the scan",
+    )
+    parser.add_argument(
+        "--fresh-journal",
+        action="store_true",
+        help="Discard an existing checkpoint journal and start the scan over",
+    )
     parser.add_argument(
         "--debug", action="store_true", help="Show skip reasons per ticker"
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.no_journal and (args.resume or args.fresh_journal):
+        parser.error("--resume/--fresh-journal need a journal; drop --no-journal")
+    if args.resume and args.fresh_journal:
+        parser.error("--resume and --fresh-journal are mutually exclusive")
+    return args
+
+
+def _open_journal(args):
+    """Scan journal for a filter run, or a no-op context with ``--no-journal``."""
+    if args.no_journal:
+        return contextlib.nullcontext(None)
+    path = args.journal or Path(args.output).with_suffix(".journal.jsonl")
+    try:
+        journal = ScanJournal(path, resume=args.resume, fresh=args.fresh_journal)
+    except FileExistsError as exc:
+        print(str(exc), file=sys.stderr)
+        sys.exit(1)
+    print(f"Checkpoint journal: {journal.path}", file=sys.stderr)
+    return journal
 
 
 def main():
@@ -1632,24 +2348,54 @@ def main():
         print(f"Saved {len(scraped_df)} rows to {out}", file=sys.stderr)
         return
 
+    # --- Mode: filter-only from a scan journal (offline) ---
+    if args.filter_only and Path(args.filter_only).suffix == ".jsonl":
+        passing_df, _ = filter_journal(
+            args.filter_only,
+            criteria=ScreenCriteria(
+                max_pe=args.max_pe,
+                max_pe_contextual=args.max_pe_contextual,
+                min_roe=args.min_roe,
+                min_roa=args.min_roa,
+                max_de=args.max_de,
+                min_mcap=args.min_mcap,
+                min_volume=args.min_volume,
+                max_coverage=args.max_coverage,
+                ocf_waiver=not args.no_ocf_waiver,
+            ),
+            debug=args.debug,
+        )
+
+        if passing_df.empty:
+            print("No tickers passed filters.", file=sys.stderr)
+            sys.exit(1)
+
+        write_outputs(passing_df, args.output, args.details)
+        return
+
     # --- Mode: filter-only ---
     if args.filter_only:
         tickers_df = _load_csv_robust(args.filter_only)
 
-        passing_df, enriched_df = fetch_and_filter(
-            tickers_df,
-            max_pe=args.max_pe,
-            max_pe_contextual=args.max_pe_contextual,
-            min_roe=args.min_roe,
-            min_roa=args.min_roa,
-            max_de=args.max_de,
-            min_mcap=args.min_mcap,
-            min_volume=args.min_volume,
-            max_coverage=args.max_coverage,
-            ocf_waiver=not args.no_ocf_waiver,
-            workers=args.workers,
-            debug=args.debug,
-        )
+        with _open_journal(args) as journal:
+            passing_df, enriched_df = fetch_and_filter(
+                tickers_df,
+                max_pe=args.max_pe,
+                max_pe_contextual=args.max_pe_contextual,
+                min_roe=args.min_roe,
+                min_roa=args.min_roa,
+                max_de=args.max_de,
+                min_mcap=args.min_mcap,
+                min_volume=args.min_volume,
+                max_coverage=args.max_coverage,
+                ocf_waiver=not args.no_ocf_waiver,
+                workers=args.workers,
+                debug=args.debug,
+                bulk_quotes=args.bulk_quotes,
+                journal=journal,
+                max_workers=args.max_workers,
+                max_rps=args.max_rps,
+            )
 
         if passing_df.empty:
             print("No tickers passed filters.", file=sys.stderr)
@@ -1668,20 +2414,25 @@ def main():
         print("No tickers scraped. Aborting.", file=sys.stderr)
         sys.exit(1)
 
-    passing_df, enriched_df = fetch_and_filter(
-        scraped_df,
-        max_pe=args.max_pe,
-        max_pe_contextual=args.max_pe_contextual,
-        min_roe=args.min_roe,
-        min_roa=args.min_roa,
-        max_de=args.max_de,
-        min_mcap=args.min_mcap,
-        min_volume=args.min_volume,
-        max_coverage=args.max_coverage,
-        ocf_waiver=not args.no_ocf_waiver,
-        workers=args.workers,
-        debug=args.debug,
-    )
+    with _open_journal(args) as journal:
+        passing_df, enriched_df = fetch_and_filter(
+            scraped_df,
+            max_pe=args.max_pe,
+            max_pe_contextual=args.max_pe_contextual,
+            min_roe=args.min_roe,
+            min_roa=args.min_roa,
+            max_de=args.max_de,
+            min_mcap=args.min_mcap,
+            min_volume=args.min_volume,
+            max_coverage=args.max_coverage,
+            ocf_waiver=not args.no_ocf_waiver,
+            workers=args.workers,
+            debug=args.debug,
+            bulk_quotes=args.bulk_quotes,
+            journal=journal,
+            max_workers=args.max_workers,
+            max_rps=args.max_rps,
+        )
 
     if passing_df.empty:
         print("No tickers passed filters.", file=sys.stderr)
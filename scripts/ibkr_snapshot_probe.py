@@ -150,8 +150,9 @@ async def main() -> int:
         tickers += [c for c in ("0005.HK", "AAPL") if c not in tickers]
 
     any_ok = False
+    probes = await service.probe_securities(tickers)
     for tk in tickers:
-        probe = await service.probe_security(tk)
+        probe = probes.get(tk) or await service.probe_security(tk)
         if not args.raw_only:
             _print_probe(tk, probe)
         if not args.no_raw and probe.resolved_conid:
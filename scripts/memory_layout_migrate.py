@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Copy per-ticker agent memories into the consolidated collection layout.
+
+Reads every ``{ticker}_{role}_memory`` collection of the current embedding
+binding and upserts its rows, vectors unchanged, into the shared collection for
+``--layout`` with ``memory_ticker``/``memory_role`` metadata. Row ids get the
+same scope prefix that new writes use, so re-running is idempotent.
+
+Without ``--apply`` this only reports what would be copied. Source collections
+are deleted only with ``--delete-source``, and only after the target holds at
+least as many rows for that scope as the source. Collections of other
+embedding bindings are listed but never touched. Set
+``MEMORY_COLLECTION_LAYOUT`` to the same layout once the copy is done.
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from src.config import config
+from src.embeddings import fingerprinted_collection_name, resolve_embedding_binding
+from src.memory import (
+    LEGACY_MEMORY_PREFIX,
+    MEMORY_ROLES,
+    consolidated_collection_base,
+    scope_id_prefix,
+    scoped_where,
+    ticker_memory_scope,
+)
+
+_LEGACY_NAME = re.compile(
+    rf"^(?P<ticker>.+)_(?P<role>{'|'.join(MEMORY_ROLES)})_memory$"
+)
+# Chroma rejects very large add/upsert batches.
+_UPSERT_BATCH = 1000
+
+
+def _collection(client: Any, item: Any) -> Any:
+    return client.get_collection(item) if isinstance(item, str) else item
+
+
+def plan_migration(client: Any, layout: str) -> list[dict[str, Any]]:
+    """Per-ticker collections of the current binding, with their targets."""
+    binding = resolve_embedding_binding(config)
+    rows: list[dict[str, Any]] = []
+    for item in client.list_collections():
+        collection = _collection(client, item)
+        base = str((collection.metadata or {}).get("legacy_base_name") or "")
+        match = _LEGACY_NAME.match(base)
+        if not match or match["ticker"] == LEGACY_MEMORY_PREFIX:
+            # The unscoped legacy_{role}_memory collections are still read
+            # directly; copying them in would strand them under ticker "legacy".
+            continue
+        current = collection.name == fingerprinted_collection_name(base, binding)
+        rows.append(
+            {
+                "source": collection.name,
+                "target": fingerprinted_collection_name(
+                    consolidated_collection_base(match["role"], layout), binding
+                ),
+                "scope": ticker_memory_scope(match["ticker"], match["role"]),
+                "rows": collection.count(),
+                "current_binding": current,
+            }
+        )
+    return sorted(rows, key=lambda row: row["source"])
+
+
+def _target_collection(client: Any, name: str, base: str) -> Any:
+    binding = resolve_embedding_binding(config)
+    return client.get_or_create_collection(
+        name=name,
+        metadata={
+            **binding.metadata(),
+            "description": f"Financial debate memory for {base}",
+            "legacy_base_name": base,
+            "version": "3.0",
+        },
+    )
+
+
+def copy_collection(client: Any, entry: dict[str, Any], layout: str) -> int:
+    """Upsert one source collection's rows into its target; returns rows copied."""
+    source = client.get_collection(entry["source"])
+    scope = entry["scope"]
+    target = _target_collection(
+        client,
+        entry["target"],
+        consolidated_collection_base(scope["memory_role"], layout),
+    )
+    data = source.get(include=["embeddings", "documents", "metadatas"])
+    ids = list(data.get("ids") or [])
+    prefix = scope_id_prefix(scope)
+    for start in range(0, len(ids), _UPSERT_BATCH):
+        stop = start + _UPSERT_BATCH
+        target.upsert(
+            ids=[f"{prefix}{doc_id}" for doc_id in ids[start:stop]],
+            embeddings=list(data["embeddings"][start:stop]),
+            documents=list(data["documents"][start:stop]),
+            metadatas=[
+                {**(metadata or {}), **scope}
+                for metadata in data["metadatas"][start:stop]
+            ],
+        )
+    return len(ids)
+
+
+def scoped_count(client: Any, entry: dict[str, Any]) -> int:
+    target = client.get_collection(entry["target"])
+    return len(target.get(where=scoped_where(entry["scope"], None), include=[])["ids"])
+
+
+def migrate(
+    client: Any, layout: str, *, apply: bool, delete_source: bool
+) -> list[dict[str, Any]]:
+    report = plan_migration(client, layout)
+    for entry in report:
+        entry.update(copied=0, deleted=False)
+        if not apply or not entry["current_binding"]:
+            continue
+        entry["copied"] = copy_collection(client, entry, layout)
+        if delete_source and scoped_count(client, entry) >= entry["rows"]:
+            client.delete_collection(entry["source"])
+            entry["deleted"] = True
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layout", choices=("per_role", "single"), default="per_role")
+    parser.add_argument("--persist-dir", type=Path)
+    parser.add_argument("--apply", action="store_true")
+    parser.add_argument("--delete-source", action="store_true")
+    args = parser.parse_args()
+    if args.delete_source and not args.apply:
+        parser.error("--delete-source requires --apply")
+
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(
+        path=str(args.persist_dir or config.chroma_persist_directory),
+        settings=Settings(anonymized_telemetry=False),
+    )
+    report = migrate(
+        client, args.layout, apply=args.apply, delete_source=args.delete_source
+    )
+    print(
+        json.dumps(
+            {
+                "layout": args.layout,
+                "applied": args.apply,
+                "collections": report,
+                "destructive_actions": any(entry["deleted"] for entry in report),
+            },
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
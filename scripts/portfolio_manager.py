@@ -146,6 +146,14 @@ def IbkrPortfolioDataService(*args: Any, **kwargs: Any) -> Any:
     return _IbkrPortfolioDataService(*args, **kwargs)
 
 
+def get_security_data_service() -> Any:
+    from src.ibkr.security_data_service import (
+        get_security_data_service as _get_security_data_service,
+    )
+
+    return _get_security_data_service()
+
+
 def PortfolioRecommendationRequest(*args: Any, **kwargs: Any) -> Any:
     from src.ibkr.recommendation_service import (
         PortfolioRecommendationRequest as _PortfolioRecommendationRequest,
@@ -1737,6 +1745,7 @@ def main() -> None:
         compute_portfolio_health_fn=compute_portfolio_health,
         run_analysis_fn=_run_analysis_for_refresh,
         save_results_fn=_save_refresh_result,
+        security_data_service=(None if args.read_only else get_security_data_service()),
     )
 
     request = PortfolioRecommendationRequest(
@@ -18,6 +18,7 @@ from src.async_utils import run_with_hard_timeout
 from src.config import config as settings_config
 from src.error_safety import summarize_exception
 from src.llm_usage import extract_token_usage_breakdown
+from src.run_profiler import profile_span
 from src.runtime_config import get_runtime_config
 from src.runtime_diagnostics import (
     classify_failure,
@@ -490,11 +491,18 @@ async def invoke_with_rate_limit_handling(
             if network_breaker is not None:
                 network_breaker.before_call()
 
-            result = await run_with_hard_timeout(
-                runnable.ainvoke(input_data),
-                timeout=effective_timeout,
-                label=f"llm:{context}:{resolved_provider}:{resolved_model}",
-            )
+            with profile_span(
+                f"llm:{context}",
+                "llm",
+                attempt=attempt + 1,
+                provider=resolved_provider,
+                model=resolved_model,
+            ):
+                result = await run_with_hard_timeout(
+                    runnable.ainvoke(input_data),
+                    timeout=effective_timeout,
+                    label=f"llm:{context}:{resolved_provider}:{resolved_model}",
+                )
             # Refusal / provider safety block: a returned response that the
             # provider blocked or refused (finish_reason SAFETY/content_filter,
             # Anthropic stop_reason=refusal, OpenAI structured .refusal, Gemini
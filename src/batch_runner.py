@@ -0,0 +1,193 @@
+"""In-process multi-ticker batch runner for the analysis CLI.
+
+``scripts/run_tickers.sh`` launches one Python process per ticker, so every
+ticker pays interpreter start, LangChain/LangGraph imports, provider client
+construction, Chroma client creation and a cold ``SmartMarketDataFetcher``.
+This module runs many tickers inside one process instead: the caller builds
+``RuntimeServices`` once and each ticker gets
+
+- a run-scoped copy via ``RuntimeServices.for_new_run()`` (fresh evidence
+  ledger and issuer-authority registry, shared providers/inspection/MCP),
+- an isolated ``TokenTracker`` bound with ``use_tracker`` so concurrent
+  tickers never ``reset()`` or read each other's usage, and
+- a hard wall-clock deadline via ``run_with_hard_timeout``.
+
+Concurrency is bounded by a semaphore; provider RPM budgets are still
+enforced by the shared rate limiters in ``ProviderRuntime``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import structlog
+
+from src.async_utils import run_with_hard_timeout
+from src.error_safety import summarize_exception
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BATCH_CONCURRENCY = 2
+DEFAULT_TICKER_TIMEOUT_SECONDS = 1800.0
+
+BatchTickerStatus = Literal["ok", "failed", "timeout"]
+
+# (ticker_args, runtime_services) -> report path (or None when no result)
+AnalyzeTickerFn = Callable[[argparse.Namespace, Any], Awaitable[Path | None]]
+
+
+@dataclass(frozen=True)
+class BatchTickerOutcome:
+    """Result of one ticker inside an in-process batch."""
+
+    ticker: str
+    status: BatchTickerStatus
+    elapsed_seconds: float
+    report_path: Path | None = None
+    error: str | None = None
+    total_cost_usd: float | None = None
+
+
+def load_tickers_file(path: Path) -> list[str]:
+    """Read tickers one per line, skipping blanks, ``#`` comments and duplicates.
+
+    Matches the input format of ``scripts/run_tickers.sh`` so the same
+    ``scratch/*.txt`` lists work with either runner.
+    """
+    tickers: list[str] = []
+    seen: set[str] = set()
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        ticker = line.split()[0].upper()
+        if ticker in seen:
+            continue
+        seen.add(ticker)
+        tickers.append(ticker)
+    return tickers
+
+
+def batch_report_path(output_dir: Path, ticker: str) -> Path:
+    """Return the per-ticker markdown report path used by batch runs."""
+    safe_ticker = ticker.replace(".", "_").replace("/", "_")
+    return output_dir / f"{safe_ticker}.md"
+
+
+def ticker_args_for(
+    args: argparse.Namespace, ticker: str, output_dir: Path
+) -> argparse.Namespace:
+    """Clone batch-level CLI args into single-ticker args.
+
+    Batch runs always render markdown to a per-ticker file in quiet mode:
+    concurrent tickers cannot share stdout or a Rich console.
+    """
+    ticker_args = copy.copy(args)
+    ticker_args.ticker = ticker
+    ticker_args.output = str(batch_report_path(output_dir, ticker))
+    ticker_args.quiet = True
+    ticker_args.tickers_file = None
+    return ticker_args
+
+
+async def run_ticker_batch(
+    args: argparse.Namespace,
+    tickers: Iterable[str],
+    *,
+    runtime_services: Any,
+    analyze_ticker: AnalyzeTickerFn,
+    output_dir: Path,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ticker_timeout: float = DEFAULT_TICKER_TIMEOUT_SECONDS,
+    on_outcome: Callable[[BatchTickerOutcome], None] | None = None,
+) -> list[BatchTickerOutcome]:
+    """Analyze *tickers* concurrently against one warm runtime.
+
+    Outcomes are returned in input order. One ticker failing or timing out
+    never aborts the others; ``on_outcome`` fires as each ticker completes.
+    """
+    from src.runtime_services import use_runtime_services
+    from src.token_tracker import TokenTracker, use_tracker
+
+    ticker_list = list(tickers)
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    async def run_one(ticker: str) -> BatchTickerOutcome:
+        async with semaphore:
+            ticker_args = ticker_args_for(args, ticker, output_dir)
+            run_services = runtime_services.for_new_run()
+            tracker = TokenTracker.create_isolated()
+            started = time.monotonic()
+            logger.info("batch_ticker_starting", ticker=ticker)
+            with use_tracker(tracker), use_runtime_services(run_services):
+                try:
+                    report_path = await run_with_hard_timeout(
+                        analyze_ticker(ticker_args, run_services),
+                        timeout=ticker_timeout,
+                        label=f"batch.analyze.{ticker}",
+                    )
+                    status: BatchTickerStatus = "ok" if report_path else "failed"
+                    error = None if report_path else "analysis_returned_no_result"
+                except TimeoutError:
+                    report_path, status = None, "timeout"
+                    error = f"exceeded {ticker_timeout:.0f}s hard timeout"
+                except Exception as exc:
+                    report_path, status = None, "failed"
+                    error = type(exc).__name__
+                    logger.error(
+                        "batch_ticker_failed",
+                        ticker=ticker,
+                        **summarize_exception(
+                            exc,
+                            operation="running batch ticker analysis",
+                            provider="unknown",
+                        ),
+                        exc_info=True,
+                    )
+            outcome = BatchTickerOutcome(
+                ticker=ticker,
+                status=status,
+                elapsed_seconds=round(time.monotonic() - started, 2),
+                report_path=report_path,
+                error=error,
+                total_cost_usd=tracker.get_total_stats().get("total_cost_usd"),
+            )
+            logger.info(
+                "batch_ticker_finished",
+                ticker=ticker,
+                status=outcome.status,
+                elapsed_seconds=outcome.elapsed_seconds,
+            )
+            if on_outcome is not None:
+                on_outcome(outcome)
+            return outcome
+
+    return list(await asyncio.gather(*(run_one(ticker) for ticker in ticker_list)))
+
+
+def format_batch_summary(outcomes: list[BatchTickerOutcome]) -> str:
+    """Render a compact markdown summary table for a finished batch."""
+    ok = sum(1 for outcome in outcomes if outcome.status == "ok")
+    lines = [
+        "# Batch Analysis Summary",
+        "",
+        f"{ok}/{len(outcomes)} tickers completed.",
+        "",
+        "| Ticker | Status | Seconds | Report |",
+        "|---|---|---|---|",
+    ]
+    for outcome in outcomes:
+        target = str(outcome.report_path) if outcome.report_path else outcome.error
+        lines.append(
+            f"| {outcome.ticker} | {outcome.status} | "
+            f"{outcome.elapsed_seconds:.1f} | {target or ''} |"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,9 @@
+"""Hot-path benchmarks for the deterministic pipeline stages.
+
+Run with ``python -m src.benchmarks.runner``; see that module for the
+history and baseline-comparison options.
+"""
+
+from .cases import BENCHMARK_CASES, BenchmarkCase, get_benchmark_case
+
+__all__ = ["BENCHMARK_CASES", "BenchmarkCase", "get_benchmark_case"]
@@ -0,0 +1,367 @@
+"""Benchmark cases for the deterministic hot-path stages.
+
+Every case is built from the committed fixtures under ``tests/fixtures`` (the
+frozen 2330.TW artifacts, the prompt-injection corpus and the distilled
+analysis snapshot), scaled up to the sizes a nightly batch sees so that
+super-linear behavior shows up as wall time rather than noise. Cases never
+touch the network, an LLM or the results directory.
+
+A case's ``setup`` receives a private scratch directory and returns the
+zero-argument callable that gets timed; everything expensive and incidental
+(fixture loading, file generation) happens in ``setup``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+FIXTURES_DIR = Path(__file__).resolve().parents[2] / "tests" / "fixtures"
+FROZEN_DIR = FIXTURES_DIR / "frozen"
+
+# Snapshot directory size for the load/reconcile cases: two dated snapshots per
+# ticker, so the latest-per-ticker dedupe is exercised on every load.
+SNAPSHOT_TICKERS = 150
+SNAPSHOT_DATES = ("2026-08-14", "2026-08-15")
+STATEMENT_PERIODS = ("2025-12-31", "2024-12-31", "2023-12-31", "2022-12-31")
+MERGE_SOURCES = ("yahooquery", "fmp", "alpha_vantage", "eodhd", "yfinance", "ibkr")
+
+BenchmarkFn = Callable[[], object]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One named benchmark: ``setup(work_dir)`` returns the timed callable."""
+
+    name: str
+    description: str
+    setup: Callable[[Path], BenchmarkFn]
+    loops: int = 1
+
+
+def _frozen_text(name: str) -> str:
+    return (FROZEN_DIR / name).read_text(encoding="utf-8")
+
+
+def _frozen_json(name: str) -> dict[str, Any]:
+    return json.loads((FROZEN_DIR / name).read_text(encoding="utf-8"))
+
+
+def _setup_extract_metrics(_work_dir: Path) -> BenchmarkFn:
+    from src.validators.metric_extractor import extract_metrics
+
+    report = _frozen_text("2330_TW_data_block.txt")
+    return lambda: extract_metrics(report, ticker="2330.TW")
+
+
+def _setup_detect_red_flags(_work_dir: Path) -> BenchmarkFn:
+    from src.validators.financial_rules import detect_red_flags
+    from src.validators.metric_extractor import extract_metrics
+    from src.validators.sector_classifier import Sector
+
+    metrics = extract_metrics(_frozen_text("2330_TW_data_block.txt"))
+    snapshot_metrics = _frozen_json("2330_TW_metrics_snapshot.json")
+
+    def run() -> None:
+        for sector in Sector:
+            for strict_mode in (False, True):
+                detect_red_flags(metrics, "2330.TW", sector, strict_mode)
+                detect_red_flags(snapshot_metrics, "2330.TW", sector, strict_mode)
+
+    return run
+
+
+def _merge_source_results() -> dict[str, dict | None]:
+    regression = _frozen_json("6782_TW_regression.json")
+    base: dict[str, Any] = {
+        key: value
+        for key, value in _frozen_json("2330_TW_metrics_snapshot.json").items()
+        if isinstance(value, int | float) and not isinstance(value, bool)
+    }
+    base.update(
+        {
+            key: value
+            for key, value in regression["raw_metrics"].items()
+            if value is not None
+        }
+    )
+    # Pad to the width of a real vendor info payload.
+    for key, value in list(base.items()):
+        if isinstance(value, int | float) and not key.startswith("_"):
+            for copy_index in range(3):
+                base[f"{key}_{copy_index}"] = value * (1 + copy_index / 10)
+
+    results: dict[str, dict | None] = {}
+    for index, source in enumerate(MERGE_SOURCES):
+        # Alternate agreeing and >20%-disagreeing sources so conflict tracking runs.
+        scale = 1.0 + (0.01 * index if index % 2 == 0 else 0.3)
+        results[source] = {
+            key: value * scale if isinstance(value, int | float) else value
+            for key, value in base.items()
+        }
+    return results
+
+
+def _setup_smart_merge_with_quality(_work_dir: Path) -> BenchmarkFn:
+    from src.data.merge_policy import (
+        quarantine_forward_pe_outlier,
+        smart_merge_with_quality,
+    )
+
+    source_results = _merge_source_results()
+    return lambda: smart_merge_with_quality(
+        source_results, "6782.TW", quarantine_forward_pe_outlier
+    )
+
+
+def _statement_frames() -> tuple[Any, Any, Any]:
+    import pandas as pd
+
+    from src.data.metric_extraction import STATEMENT_ROW_ALIASES
+
+    columns = [pd.Timestamp(period) for period in STATEMENT_PERIODS]
+    rows: dict[str, list[float]] = {}
+    for index, labels in enumerate(STATEMENT_ROW_ALIASES.values()):
+        base = 1_000_000.0 * (index + 1)
+        rows[labels[0]] = [base * (1.0 - 0.08 * period) for period in range(4)]
+    # yfinance statements carry dozens of rows the extractor never asks for.
+    for index in range(60):
+        rows[f"Unmapped Line Item {index}"] = [float(index)] * len(columns)
+    frame = pd.DataFrame.from_dict(rows, orient="index", columns=columns)
+    return frame, frame.copy(), frame.copy()
+
+
+def _setup_extract_from_financial_statements(_work_dir: Path) -> BenchmarkFn:
+    import pandas as pd
+
+    from src.data.metric_extraction import extract_from_financial_statements
+
+    financials, cashflow, balance_sheet = _statement_frames()
+    ticker = SimpleNamespace(
+        financials=financials,
+        cashflow=cashflow,
+        balance_sheet=balance_sheet,
+        quarterly_financials=pd.DataFrame(),
+        quarterly_cashflow=pd.DataFrame(),
+    )
+    fetcher = SimpleNamespace(stats={"sources": {"statements": 0}})
+    return lambda: extract_from_financial_statements(fetcher, ticker, "2330.TW")
+
+
+def _setup_heuristic_inspector(_work_dir: Path) -> BenchmarkFn:
+    from src.tooling.heuristic_inspector import HeuristicInspector
+    from src.tooling.inspector import InspectionEnvelope, SourceKind
+
+    corpus = json.loads(
+        (FIXTURES_DIR / "injection_payloads" / "corpus.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    envelopes = [
+        InspectionEnvelope(
+            content_text=case["payload"],
+            source_kind=SourceKind(case["source_kind"]),
+            source_name="benchmark",
+            tool_name="benchmark",
+        )
+        for case in corpus
+    ]
+    # Clean tool output dominates production traffic: the frozen reports.
+    for name in ("2330_TW_data_block.txt", "2330_TW_pm_block.txt"):
+        envelopes.append(
+            InspectionEnvelope(
+                content_text=_frozen_text(name),
+                source_kind=SourceKind.mcp_tool_output,
+                source_name="benchmark",
+                tool_name="benchmark",
+            )
+        )
+    inspector = HeuristicInspector()
+
+    async def inspect_all() -> None:
+        for envelope in envelopes:
+            await inspector.inspect(envelope)
+
+    return lambda: asyncio.run(inspect_all())
+
+
+def _benchmark_ticker(index: int) -> str:
+    return f"BM{index:03d}"
+
+
+def write_snapshot_directory(results_dir: Path) -> None:
+    """Write the benchmark snapshot set derived from the distilled GAMA.L fixture."""
+    template = json.loads(
+        (FIXTURES_DIR / "gama_scale_incoherent_analysis.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    template.pop("_fixture_note", None)
+    # Re-denominate in USD with levels coherent with the price, so the
+    # reconcile case measures the normal path rather than the FX guards.
+    trader_plan = template["investment_analysis"]["trader_plan"].replace(
+        "PRICE_CURRENCY: GBP", "PRICE_CURRENCY: USD"
+    )
+    verdicts = ("BUY", "HOLD", "SELL")
+    results_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(SNAPSHOT_TICKERS):
+        ticker = _benchmark_ticker(index)
+        for analysis_date in SNAPSHOT_DATES:
+            payload = copy.deepcopy(template)
+            verdict = verdicts[index % len(verdicts)]
+            payload["prediction_snapshot"].update(
+                ticker=ticker,
+                analysis_date=analysis_date,
+                verdict=verdict,
+                currency="USD",
+                current_price=1000.0 + index,
+            )
+            payload["investment_analysis"]["trader_plan"] = trader_plan.replace(
+                "ACTION: HOLD", f"ACTION: {verdict}"
+            )
+            (results_dir / f"{ticker}_{analysis_date}_analysis.json").write_text(
+                json.dumps(payload), encoding="utf-8"
+            )
+
+
+def _setup_load_latest_analyses(work_dir: Path) -> BenchmarkFn:
+    from src.ibkr.analysis_index import load_latest_analyses
+
+    results_dir = work_dir / "results"
+    write_snapshot_directory(results_dir)
+
+    def run() -> None:
+        # Cold rebuild: drop the summary and per-file index sidecars.
+        for sidecar in work_dir.iterdir():
+            if sidecar.is_file():
+                sidecar.unlink()
+        load_latest_analyses(results_dir, parse_workers=1)
+
+    return run
+
+
+def _setup_reconcile(work_dir: Path) -> BenchmarkFn:
+    from src.ibkr import reconciler
+    from src.ibkr.analysis_index import load_latest_analyses
+    from src.ibkr.models import NormalizedPosition, PortfolioSummary
+    from src.ibkr.ticker import Ticker
+
+    results_dir = work_dir / "results"
+    write_snapshot_directory(results_dir)
+    analyses = load_latest_analyses(results_dir, parse_workers=1)
+
+    positions = [
+        NormalizedPosition(
+            conid=500_000 + index,
+            ticker=Ticker.from_yf(_benchmark_ticker(index), currency="USD"),
+            quantity=10,
+            avg_cost_local=950.0,
+            market_value_usd=10 * (1000.0 + index),
+            currency="USD",
+            current_price_local=1000.0 + index,
+            ticker_identity_verified=True,
+            ticker_resolution_source="exchange_map",
+        )
+        for index in range(0, SNAPSHOT_TICKERS, 2)
+    ]
+    value = sum(position.market_value_usd for position in positions) / 0.9
+    cash = value * 0.1
+    portfolio = PortfolioSummary(
+        account_id="U0000000",
+        portfolio_value_usd=value,
+        cash_balance_usd=cash,
+        cash_pct=cash / value,
+        available_cash_usd=cash - value * 0.05,
+    )
+
+    def run() -> None:
+        # The macro-event store is ChromaDB I/O, not the stage under measurement.
+        with patch.object(reconciler, "_load_structural_macro_events", list):
+            reconciler.reconcile(positions, analyses, portfolio)
+
+    return run
+
+
+def _setup_generate_report(work_dir: Path) -> BenchmarkFn:
+    from src.report_generator import QuietModeReporter
+
+    result = {
+        "fundamentals_report": _frozen_text("2330_TW_data_block.txt"),
+        "final_trade_decision": _frozen_text("2330_TW_pm_block.txt"),
+        "trader_investment_plan": _frozen_text("2330_TW_trade_block.txt"),
+        "valuation_params": _frozen_text("2330_TW_valuation_params.txt"),
+        "market_report": _frozen_text("2330_TW_value_trap_block.txt"),
+    }
+    reporter = QuietModeReporter(
+        "2330.TW",
+        "Taiwan Semiconductor Manufacturing",
+        skip_charts=True,
+        report_dir=work_dir,
+    )
+    return lambda: reporter.generate_report(result)
+
+
+BENCHMARK_CASES: tuple[BenchmarkCase, ...] = (
+    BenchmarkCase(
+        "extract_metrics",
+        "DATA_BLOCK metric extraction over the frozen 2330.TW report",
+        _setup_extract_metrics,
+        loops=50,
+    ),
+    BenchmarkCase(
+        "detect_red_flags",
+        "Red-flag rules for every sector, strict and lenient",
+        _setup_detect_red_flags,
+        loops=5,
+    ),
+    BenchmarkCase(
+        "smart_merge_with_quality",
+        "Six-source quality merge with conflict tracking",
+        _setup_smart_merge_with_quality,
+        loops=10,
+    ),
+    BenchmarkCase(
+        "extract_from_financial_statements",
+        "Statement-derived metrics over four annual periods",
+        _setup_extract_from_financial_statements,
+        loops=20,
+    ),
+    BenchmarkCase(
+        "heuristic_inspector",
+        "HeuristicInspector over the injection corpus plus clean reports",
+        _setup_heuristic_inspector,
+        loops=5,
+    ),
+    BenchmarkCase(
+        "load_latest_analyses",
+        f"Cold index rebuild over {SNAPSHOT_TICKERS * len(SNAPSHOT_DATES)} snapshots",
+        _setup_load_latest_analyses,
+    ),
+    BenchmarkCase(
+        "reconcile",
+        f"Reconcile {SNAPSHOT_TICKERS // 2} positions against "
+        f"{SNAPSHOT_TICKERS} analyses",
+        _setup_reconcile,
+        loops=5,
+    ),
+    BenchmarkCase(
+        "generate_report",
+        "Markdown report generation for the frozen 2330.TW run",
+        _setup_generate_report,
+        loops=5,
+    ),
+)
+
+
+def get_benchmark_case(name: str) -> BenchmarkCase:
+    for case in BENCHMARK_CASES:
+        if case.name == name:
+            return case
+    raise KeyError(f"unknown benchmark case: {name}")
@@ -0,0 +1,301 @@
+"""Run the hot-path benchmarks, record history and gate regressions.
+
+Each case runs in its own child interpreter so that peak RSS is per case and
+import or cache warmth from one case cannot flatter the next. Within the
+child the timed callable is warmed once, then timed over ``--repeats`` rounds
+of ``case.loops`` calls; a separate ``tracemalloc`` pass records the
+allocation peak of a single call (tracing distorts wall time, so the two are
+never measured together).
+
+Usage::
+
+    python -m src.benchmarks.runner                   # run all, append history
+    python -m src.benchmarks.runner --save-baseline   # pin the current numbers
+    python -m src.benchmarks.runner --compare         # exit 1 on regression
+
+Only minimum wall time and allocation peak are gated: they are the most
+stable statistics on a shared machine. Median wall time and peak RSS are
+recorded in the history for trend reading.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.benchmarks.cases import BENCHMARK_CASES, BenchmarkCase, get_benchmark_case
+from src.eval.git_meta import get_git_metadata
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BENCHMARK_DIR = REPO_ROOT / "evals" / "benchmarks"
+DEFAULT_HISTORY_PATH = BENCHMARK_DIR / "history.jsonl"
+DEFAULT_BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.25
+CHILD_TIMEOUT_SECONDS = 600
+
+# Absolute floors below which a relative regression is treated as jitter.
+GATED_METRICS: dict[str, float] = {
+    "wall_min_ms": 0.5,
+    "alloc_peak_bytes": 64 * 1024,
+}
+
+
+@dataclass(frozen=True)
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure_case(case: BenchmarkCase, *, repeats: int, work_dir: Path) -> dict:
+    """Measure one case in the current process."""
+    fn = case.setup(work_dir)
+    fn()
+
+    per_call_ms: list[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(case.loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        per_call_ms.append(elapsed * 1000 / case.loops)
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "case": case.name,
+        "loops": case.loops,
+        "repeats": repeats,
+        "wall_min_ms": min(per_call_ms),
+        "wall_median_ms": statistics.median(per_call_ms),
+        "alloc_peak_bytes": peak - before,
+        "alloc_retained_bytes": after - before,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def run_case_isolated(name: str, *, repeats: int) -> dict:
+    """Measure one case in a fresh interpreter and return its result row."""
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as tmp:
+        output_path = Path(tmp) / "result.json"
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "src.benchmarks.runner",
+                "--child",
+                name,
+                "--repeats",
+                str(repeats),
+                "--child-output",
+                str(output_path),
+            ],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=CHILD_TIMEOUT_SECONDS,
+            check=False,
+        )
+        if completed.returncode != 0 or not output_path.exists():
+            tail = "\n".join(completed.stderr.strip().splitlines()[-20:])
+            raise RuntimeError(f"benchmark case {name} failed:\n{tail}")
+        return json.loads(output_path.read_text(encoding="utf-8"))
+
+
+def run_benchmarks(
+    names: list[str] | None = None, *, repeats: int = DEFAULT_REPEATS
+) -> list[dict]:
+    cases = [get_benchmark_case(n) for n in names] if names else BENCHMARK_CASES
+    return [run_case_isolated(case.name, repeats=repeats) for case in cases]
+
+
+def append_history(path: Path, results: list[dict]) -> dict:
+    entry = {
+        "recorded_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+        **get_git_metadata(REPO_ROOT),
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry, sort_keys=True) + "\n")
+    return entry
+
+
+def save_baseline(path: Path, results: list[dict]) -> None:
+    payload = {
+        "recorded_at": datetime.now(UTC).isoformat(),
+        "node": platform.node(),
+        "git_commit": get_git_metadata(REPO_ROOT)["git_commit"],
+        "cases": {row["case"]: row for row in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    return json.loads(path.read_text(encoding="utf-8"))["cases"]
+
+
+def find_regressions(
+    results: list[dict],
+    baseline: dict[str, dict],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Return gated metrics that grew by more than *threshold* over baseline.
+
+    Cases missing from the baseline are new and never regress.
+    """
+    regressions: list[Regression] = []
+    for row in results:
+        reference = baseline.get(row["case"])
+        if reference is None:
+            continue
+        for metric, floor in GATED_METRICS.items():
+            base_value = float(reference.get(metric) or 0.0)
+            current = float(row[metric])
+            if current > base_value * (1 + threshold) and current - base_value > floor:
+                regressions.append(Regression(row["case"], metric, base_value, current))
+    return regressions
+
+
+def _format_row(row: dict, reference: dict | None) -> str:
+    line = (
+        f"{row['case']:<36} {row['wall_min_ms']:>9.2f} {row['wall_median_ms']:>9.2f}"
+        f" {row['alloc_peak_bytes'] / 1024:>10.1f} {row['peak_rss_bytes'] / 2**20:>8.1f}"
+    )
+    if reference and reference.get("wall_min_ms"):
+        change = row["wall_min_ms"] / reference["wall_min_ms"] - 1
+        line += f" {change:>+8.1%}"
+    return line
+
+
+def print_results(results: list[dict], baseline: dict[str, dict] | None) -> None:
+    header = (
+        f"{'case':<36} {'min ms':>9} {'med ms':>9} {'alloc KiB':>10} {'rss MiB':>8}"
+    )
+    if baseline is not None:
+        header += f" {'vs base':>8}"
+    print(header)
+    for row in results:
+        print(_format_row(row, (baseline or {}).get(row["case"])))
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the deterministic hot-path stages."
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=[case.name for case in BENCHMARK_CASES],
+        help="Run only this case (repeatable). Default: all cases.",
+    )
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=DEFAULT_HISTORY_PATH,
+        help="JSONL file each run is appended to.",
+    )
+    parser.add_argument(
+        "--no-history", action="store_true", help="Do not append to the history."
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run's numbers.",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Exit 1 if any case regresses past --threshold against the baseline.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed relative growth before failing (default: {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", type=Path, help=argparse.SUPPRESS)
+    return parser
+
+
+def _run_child(name: str, *, repeats: int, output: Path) -> int:
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-work-") as work_dir:
+        row = measure_case(
+            get_benchmark_case(name), repeats=repeats, work_dir=Path(work_dir)
+        )
+    output.write_text(json.dumps(row), encoding="utf-8")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    if args.child:
+        return _run_child(args.child, repeats=args.repeats, output=args.child_output)
+
+    baseline: dict[str, dict] | None = None
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+            return 2
+        baseline = load_baseline(args.baseline)
+
+    results = run_benchmarks(args.case, repeats=args.repeats)
+    print_results(results, baseline)
+    if not args.no_history:
+        append_history(args.history, results)
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+
+    if baseline is None:
+        return 0
+    regressions = find_regressions(results, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.case} {regression.metric}: "
+            f"{regression.baseline:.2f} -> {regression.current:.2f} "
+            f"({regression.ratio:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -69,6 +69,9 @@ Examples:
   # Enable Langfuse tracing for this run
   poetry run python -m src.main --ticker 0005.HK --enable-langfuse
 
+  # In-process batch: one warm runtime, bounded concurrency
+  poetry run python -m src.main --tickers-file scratch/sample_tickers.txt --quick --batch-concurrency 3
+
   # Batch retrospective: process all past tickers
   poetry run python -m src.main --retrospective-only
 
@@ -85,6 +88,47 @@ Examples:
         help="Stock ticker symbol to analyze (e.g., AAPL, NVDA, TSLA)",
     )
 
+    parser.add_argument(
+        "--tickers-file",
+        type=str,
+        default=None,
+        help=(
+            "Analyze every ticker listed in this file (one per line, '#' comments "
+            "allowed) inside one process, reusing the warm runtime. Reports are "
+            "written to --batch-output-dir."
+        ),
+    )
+
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=None,
+        help=(
+            "With --tickers-file, maximum tickers analyzed concurrently "
+            "(default: 2). Provider rate limits still apply across all of them."
+        ),
+    )
+
+    parser.add_argument(
+        "--ticker-timeout",
+        type=float,
+        default=None,
+        help=(
+            "With --tickers-file, hard wall-clock limit in seconds per ticker "
+            "(default: 1800)."
+        ),
+    )
+
+    parser.add_argument(
+        "--batch-output-dir",
+        type=str,
+        default=None,
+        help=(
+            "With --tickers-file, directory for per-ticker markdown reports "
+            "(default: {results_dir}/batch)."
+        ),
+    )
+
     parser.add_argument(
         "--quick",
         action="store_true",
@@ -251,6 +295,16 @@ Examples:
         ),
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Record per-node, LLM, tool, rate-limit and data-source timings and "
+            "write a Chrome trace (<artifact>.trace.json) next to the saved "
+            "analysis, with the critical path through the graph."
+        ),
+    )
+
     parser.add_argument(
         "--capture-baseline",
         action="store_true",
@@ -281,12 +335,22 @@ def parse_arguments() -> argparse.Namespace:
         not args.retrospective_only
         and not args.capture_baseline_cleanup
         and not args.ticker
+        and not args.tickers_file
     ):
         parser.error(
-            "--ticker is required unless --retrospective-only or "
+            "--ticker is required unless --tickers-file, --retrospective-only or "
             "--capture-baseline-cleanup is specified"
         )
 
+    if args.tickers_file and args.ticker:
+        parser.error("--ticker and --tickers-file are mutually exclusive")
+
+    if args.tickers_file and (args.capture_baseline or args.article):
+        parser.error(
+            "--tickers-file does not support --capture-baseline or --article; "
+            "run those per ticker"
+        )
+
     if args.debug:
         args.verbose = True
 
@@ -373,11 +373,143 @@ class Settings(BaseSettings):
         validation_alias="DATA_CACHE_DIR",
         description="Directory for cached data files",
     )
+    market_data_disk_cache_enabled: bool = Field(
+        default=False,
+        validation_alias="MARKET_DATA_DISK_CACHE_ENABLED",
+        description=(
+            "Persist merged financial metrics and price history under "
+            "DATA_CACHE_DIR/market_data so every process on the box reuses "
+            "same-day fetches instead of hitting yfinance/FMP/EODHD again."
+        ),
+    )
+    market_data_disk_cache_metrics_ttl_seconds: int = Field(
+        default=6 * 3600,
+        ge=0,
+        validation_alias="MARKET_DATA_DISK_CACHE_METRICS_TTL_SECONDS",
+        description="TTL for disk-cached merged financial metrics",
+    )
+    market_data_disk_cache_history_ttl_seconds: int = Field(
+        default=12 * 3600,
+        ge=0,
+        validation_alias="MARKET_DATA_DISK_CACHE_HISTORY_TTL_SECONDS",
+        description=(
+            "TTL for disk-cached open-ended price-history windows; windows whose "
+            "end date is in the past are kept for 30 days"
+        ),
+    )
+    search_cache_enabled: bool = Field(
+        default=False,
+        validation_alias="SEARCH_CACHE_ENABLED",
+        description=(
+            "Cache inspected Tavily/DuckDuckGo results under DATA_CACHE_DIR/search, "
+            "keyed by profile, normalized query and UTC date, and coalesce "
+            "concurrent identical searches within a run."
+        ),
+    )
+    search_cache_news_ttl_seconds: int = Field(
+        default=6 * 3600,
+        ge=0,
+        validation_alias="SEARCH_CACHE_NEWS_TTL_SECONDS",
+        description="TTL for cached news-profile Tavily and DuckDuckGo results",
+    )
+    search_cache_finance_ttl_seconds: int = Field(
+        default=24 * 3600,
+        ge=0,
+        validation_alias="SEARCH_CACHE_FINANCE_TTL_SECONDS",
+        description="TTL for cached finance_deep Tavily searches and extractions",
+    )
+    data_source_early_exit_coverage: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        validation_alias="DATA_SOURCE_EARLY_EXIT_COVERAGE",
+        description=(
+            "Race the market-data sources and stop waiting once yfinance has "
+            "answered, a quote identity is present and this fraction of the "
+            "important fields is covered; late sources finish in the background "
+            "and are reused by the next fetch. 0 waits for every source."
+        ),
+    )
+    official_document_cache_enabled: bool = Field(
+        default=False,
+        validation_alias="OFFICIAL_DOCUMENT_CACHE_ENABLED",
+        description=(
+            "Keep Auditor/Consultant official documents and their extracted PDF "
+            "page text under DATA_CACHE_DIR/official_documents, keyed by content "
+            "hash, so repeat runs over the same filing skip download and parsing."
+        ),
+    )
+    official_document_cache_ttl_seconds: int = Field(
+        default=24 * 3600,
+        ge=0,
+        validation_alias="OFFICIAL_DOCUMENT_CACHE_TTL_SECONDS",
+        description=(
+            "How long a cached document is served without contacting the host; "
+            "older entries are revalidated with ETag/Last-Modified"
+        ),
+    )
+    price_history_store_enabled: bool = Field(
+        default=False,
+        validation_alias="PRICE_HISTORY_STORE_ENABLED",
+        description=(
+            "Serve daily price history from an incremental per-ticker store "
+            "under DATA_CACHE_DIR/price_store that downloads only bars newer "
+            "than the last stored date (plus backfill for older windows)."
+        ),
+    )
+    retrospective_bulk_prices_enabled: bool = Field(
+        default=False,
+        validation_alias="RETROSPECTIVE_BULK_PRICES_ENABLED",
+        description=(
+            "Price a retrospective run's selected snapshots from daily bars "
+            "fetched once per distinct ticker and benchmark, in multi-symbol "
+            "requests, instead of two history requests per snapshot."
+        ),
+    )
+    snapshot_catalog_enabled: bool = Field(
+        default=False,
+        validation_alias="SNAPSHOT_CATALOG_ENABLED",
+        description=(
+            "Keep extracted prediction snapshots in a SQLite catalog next to "
+            "RESULTS_DIR, keyed by file size and mtime, so retrospective loads "
+            "parse only new or changed *_analysis.json files and settled archive "
+            "directories are not re-listed."
+        ),
+    )
+    analysis_parse_workers: int = Field(
+        default=1,
+        ge=0,
+        validation_alias="ANALYSIS_PARSE_WORKERS",
+        description=(
+            "Worker processes used to parse *_analysis.json snapshots when the "
+            "latest-analyses index is rebuilt; 1 parses in-process, 0 uses one "
+            "per CPU."
+        ),
+    )
+    official_document_pdf_workers: int = Field(
+        default=1,
+        ge=0,
+        validation_alias="OFFICIAL_DOCUMENT_PDF_WORKERS",
+        description=(
+            "Worker processes used to extract text from large official-document "
+            "PDFs; 1 extracts in-process, 0 uses one per CPU."
+        ),
+    )
     chroma_persist_directory: str = Field(
         default="./chroma_db",
         validation_alias="CHROMA_PERSIST_DIR",
         description="Directory for ChromaDB vector storage",
     )
+    memory_collection_layout: Literal["per_ticker", "per_role", "single"] = Field(
+        default="per_ticker",
+        validation_alias="MEMORY_COLLECTION_LAYOUT",
+        description=(
+            "How ticker agent memories map to Chroma collections: per_ticker keeps "
+            "five collections per ticker; per_role shares one collection per role "
+            "and single one overall, isolating tickers by memory_ticker/"
+            "memory_role metadata. Migrate with scripts/memory_layout_migrate.py."
+        ),
+    )
     embedding_provider: Literal["google", "openai"] = Field(
         default="google", validation_alias="EMBEDDING_PROVIDER"
     )
@@ -390,6 +522,29 @@ class Settings(BaseSettings):
     embedding_schema_version: int = Field(
         default=1, ge=1, validation_alias="EMBEDDING_SCHEMA_VERSION"
     )
+    embedding_cache_enabled: bool = Field(
+        default=False,
+        validation_alias="EMBEDDING_CACHE_ENABLED",
+        description=(
+            "Cache memory embedding vectors keyed by embedding binding fingerprint "
+            "and text hash, so a run embeds each distinct text once and concurrent "
+            "identical embeddings are coalesced."
+        ),
+    )
+    embedding_cache_db_path: Path | None = Field(
+        default=None,
+        validation_alias="EMBEDDING_CACHE_DB_PATH",
+        description=(
+            "Optional SQLite file that persists cached embedding vectors across "
+            "runs and processes. Unset keeps the cache in-process only."
+        ),
+    )
+    embedding_cache_max_entries: int = Field(
+        default=50_000,
+        ge=1,
+        validation_alias="EMBEDDING_CACHE_MAX_ENTRIES",
+        description="Maximum cached embedding vectors, evicted by least-recent use",
+    )
     images_dir: Path = Field(
         default=Path("images"),
         validation_alias="IMAGES_DIR",
@@ -1226,6 +1381,57 @@ class Settings(BaseSettings):
         description="xAI application rate limit (requests per minute)",
     )
 
+    shared_rate_limit_db_path: Path | None = Field(
+        default=None,
+        validation_alias="SHARED_RATE_LIMIT_DB_PATH",
+        description=(
+            "Optional SQLite file holding cross-process LLM token buckets per "
+            "(vendor, endpoint host). Set it to the same path in every analysis "
+            "process on one box so parallel runs share one provider RPM budget "
+            "instead of each assuming it owns the whole quota."
+        ),
+    )
+    llm_cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off",
+        validation_alias="LLM_CASSETTE_MODE",
+        description=(
+            "record: append every chat-model response and tool result to "
+            "LLM_CASSETTE_DIR. replay: serve them from there without provider "
+            "clients or network, for offline end-to-end benchmarks."
+        ),
+    )
+    llm_cassette_dir: Path = Field(
+        default=Path("evals/cassettes/default"),
+        validation_alias="LLM_CASSETTE_DIR",
+        description="Directory holding chat.jsonl and tools.jsonl recordings",
+    )
+    llm_cassette_latency_scale: float = Field(
+        default=0.0,
+        ge=0.0,
+        validation_alias="LLM_CASSETTE_LATENCY_SCALE",
+        description=(
+            "Replay delay as a multiple of each recorded call latency "
+            "(0 = full speed, 1 = as recorded)"
+        ),
+    )
+    llm_cassette_strict: bool = Field(
+        default=False,
+        validation_alias="LLM_CASSETTE_STRICT",
+        description=(
+            "Fail replay on any request without an exact recording instead of "
+            "falling back to the next unused recording for the same seat"
+        ),
+    )
+
+    run_profile_enabled: bool = Field(
+        default=False,
+        validation_alias="RUN_PROFILE_ENABLED",
+        description=(
+            "Write a Chrome trace of graph-node, LLM, tool, rate-limit and "
+            "data-source spans next to each saved analysis (same as --profile)"
+        ),
+    )
+
     # --- Token Management ---
     # Default: 7000 chars (~1750 tokens) per search result
     tavily_max_chars: int = Field(
@@ -1286,6 +1492,30 @@ class Settings(BaseSettings):
             "(heuristic), and composite (heuristic plus selective judge)."
         ),
     )
+    llm_judge_cache_db_path: Path | None = Field(
+        default=None,
+        validation_alias="LLM_JUDGE_CACHE_DB_PATH",
+        description=(
+            "Optional SQLite file that persists LLM-judge verdicts across runs. "
+            "Point every analysis process at the same path so a snippet judged "
+            "once is not re-judged by the next ticker or the next day's run."
+        ),
+    )
+    llm_judge_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600,
+        ge=60,
+        validation_alias="LLM_JUDGE_CACHE_TTL_SECONDS",
+        description="How long a persisted judge verdict stays valid",
+    )
+    llm_judge_cache_max_entries: int = Field(
+        default=50_000,
+        ge=100,
+        validation_alias="LLM_JUDGE_CACHE_MAX_ENTRIES",
+        description=(
+            "Size bound for the persisted verdict cache; least recently used "
+            "verdicts are evicted beyond it"
+        ),
+    )
 
     # --- MCP Client Configuration ---
     mcp_enabled: bool = Field(
@@ -1308,6 +1538,23 @@ class Settings(BaseSettings):
         validation_alias="MCP_USAGE_DB_PATH",
         description="Path to the SQLite database for MCP usage tracking",
     )
+    mcp_session_pool_enabled: bool = Field(
+        default=False,
+        validation_alias="MCP_SESSION_POOL_ENABLED",
+        description=(
+            "Keep initialized MCP sessions open and share them across tool calls "
+            "instead of connecting and handshaking per call"
+        ),
+    )
+    mcp_session_idle_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        validation_alias="MCP_SESSION_IDLE_SECONDS",
+        description=(
+            "Close a pooled MCP session after this many idle seconds "
+            "(0 keeps it for the life of the process)"
+        ),
+    )
 
     # --- Optional IBKR market-data source (analysis pipeline) ---
     ibkr_data_source_enabled: bool = Field(
@@ -0,0 +1,361 @@
+"""Persistent, cross-process cache for fetched market data.
+
+``SmartMarketDataFetcher`` keeps a 30-second in-process cache, so the same
+ticker fetched by find_gems, Stage 1, Stage 2, the retrospective and the IBKR
+refresh goes back to yfinance/FMP/EODHD/Alpha Vantage every time. This module
+adds a TTL-aware cache under ``DATA_CACHE_DIR/market_data`` that any process
+on the box can read:
+
+- merged financial metrics are stored as JSON, one file per ticker/source;
+- price history is stored column-wise as ``.npy`` arrays (index as int64 UTC
+  epoch ticks plus one array per numeric column) so reads can memory-map the
+  arrays instead of parsing them.
+
+Every write goes through a temp file + ``os.replace`` so concurrent readers
+never observe a partial entry. Corrupt or mismatched entries read as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SOURCE_TTL_SECONDS: dict[str, float] = {
+    "merged": 6 * 3600,
+    "yfinance": 12 * 3600,
+}
+# A window whose end lies in the past is immutable apart from corporate-action
+# readjustment, so it is kept much longer than an open-ended window.
+CLOSED_WINDOW_TTL_SECONDS = 30 * 24 * 3600
+_SAFE_COMPONENT = re.compile(r"[^A-Za-z0-9_.-]+")
+_HISTORY_META = "meta.json"
+
+
+def _safe_component(value: str) -> str:
+    return _SAFE_COMPONENT.sub("_", value).strip("._") or "_"
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _atomic_save_npy(path: Path, array: np.ndarray) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.save(handle, array, allow_pickle=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_columnar_frame(
+    directory: Path, frame: pd.DataFrame, extra_meta: dict[str, Any] | None = None
+) -> bool:
+    """Store a numeric, datetime-indexed frame column-wise under ``directory``.
+
+    Returns ``False`` (and writes nothing) for frames that cannot be stored
+    without pickle. ``meta.json`` is written last so readers never see arrays
+    from a newer write paired with an older row count.
+    """
+    if frame is None or frame.empty or not isinstance(frame.index, pd.DatetimeIndex):
+        return False
+    numeric = frame.select_dtypes(include="number")
+    if numeric.shape[1] != frame.shape[1]:
+        return False
+    index = frame.index
+    tz = str(index.tz) if index.tz is not None else None
+    utc_index = index.tz_convert("UTC") if tz else index.tz_localize("UTC")
+    directory.mkdir(parents=True, exist_ok=True)
+    _atomic_save_npy(directory / "index.npy", utc_index.asi8.astype(np.int64))
+    for position, name in enumerate(numeric.columns):
+        values = numeric[name].to_numpy()
+        if values.dtype == object:
+            values = numeric[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        _atomic_save_npy(directory / f"col{position}.npy", values)
+    meta = {
+        **(extra_meta or {}),
+        "stored_at": time.time(),
+        "rows": len(frame),
+        "columns": [str(name) for name in numeric.columns],
+        "tz": tz,
+        "unit": index.unit,
+        "index_name": index.name,
+    }
+    _atomic_write_bytes(directory / _HISTORY_META, json.dumps(meta).encode("utf-8"))
+    return True
+
+
+def read_columnar_meta(directory: Path) -> dict[str, Any]:
+    """Return the ``meta.json`` of a columnar entry; raises ``OSError``/``ValueError``."""
+    return json.loads((directory / _HISTORY_META).read_text(encoding="utf-8"))
+
+
+def read_columnar_frame(
+    directory: Path, meta: dict[str, Any], *, mmap: bool = True
+) -> pd.DataFrame:
+    """Load a frame written by ``write_columnar_frame``.
+
+    Raises ``OSError``/``ValueError``/``KeyError`` on a missing or torn entry.
+    """
+    mmap_mode = "r" if mmap else None
+    rows = int(meta["rows"])
+    index_values = np.load(
+        directory / "index.npy", mmap_mode=mmap_mode, allow_pickle=False
+    )
+    if len(index_values) != rows:
+        raise ValueError("index length mismatch")
+    columns: dict[str, np.ndarray] = {}
+    for position, name in enumerate(meta["columns"]):
+        values = np.load(
+            directory / f"col{position}.npy", mmap_mode=mmap_mode, allow_pickle=False
+        )
+        if len(values) != rows:
+            raise ValueError("column length mismatch")
+        columns[name] = values
+
+    unit = meta.get("unit", "ns")
+    index = pd.DatetimeIndex(
+        pd.to_datetime(np.asarray(index_values), unit=unit, utc=True)
+    ).as_unit(unit)
+    index = index.tz_convert(meta["tz"]) if meta.get("tz") else index.tz_localize(None)
+    index.name = meta.get("index_name")
+    return pd.DataFrame(columns, index=index)
+
+
+def history_window_key(period: str, start: str | None, end: str | None) -> str:
+    """Return a filesystem-safe identity for a price-history window."""
+    raw = f"{period}|{start or ''}|{end or ''}"
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+    label = _safe_component(f"{start}_{end}" if (start or end) else period)
+    return f"{label}-{digest}"
+
+
+def _is_closed_window(end: str | None) -> bool:
+    if not end:
+        return False
+    try:
+        end_date = datetime.fromisoformat(end).date()
+    except ValueError:
+        return False
+    return end_date < datetime.now(UTC).date()
+
+
+class MarketDataDiskCache:
+    """TTL-aware on-disk cache for financial metrics and price history."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        source_ttls: dict[str, float] | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.source_ttls = {**DEFAULT_SOURCE_TTL_SECONDS, **(source_ttls or {})}
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    @classmethod
+    def from_config(cls, settings: Any) -> MarketDataDiskCache | None:
+        """Return the configured cache, or ``None`` when it is disabled."""
+        if not getattr(settings, "market_data_disk_cache_enabled", False):
+            return None
+        return cls(
+            Path(settings.data_cache_dir) / "market_data",
+            source_ttls={
+                "merged": float(settings.market_data_disk_cache_metrics_ttl_seconds),
+                "yfinance": float(settings.market_data_disk_cache_history_ttl_seconds),
+            },
+        )
+
+    def _ttl(self, source: str) -> float:
+        return float(self.source_ttls.get(source, DEFAULT_SOURCE_TTL_SECONDS["merged"]))
+
+    def _metrics_path(self, ticker: str, source: str) -> Path:
+        return (
+            self.root
+            / "metrics"
+            / _safe_component(source)
+            / f"{_safe_component(ticker)}.json"
+        )
+
+    def _history_dir(
+        self,
+        ticker: str,
+        source: str,
+        period: str,
+        start: str | None,
+        end: str | None,
+    ) -> Path:
+        return (
+            self.root
+            / "history"
+            / _safe_component(source)
+            / _safe_component(ticker)
+            / history_window_key(period, start, end)
+        )
+
+    def _record(self, hit: bool) -> None:
+        self.stats["hits" if hit else "misses"] += 1
+
+    # --- financial metrics ----------------------------------------------
+
+    def get_metrics(
+        self,
+        ticker: str,
+        source: str = "merged",
+        *,
+        ttl_seconds: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Stored metrics younger than the source TTL (or *ttl_seconds*)."""
+        path = self._metrics_path(ticker, source)
+        try:
+            envelope = json.loads(path.read_text(encoding="utf-8"))
+            stored_at = float(envelope["stored_at"])
+            payload = envelope["payload"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._record(False)
+            return None
+        ttl = self._ttl(source) if ttl_seconds is None else ttl_seconds
+        if time.time() - stored_at >= ttl or not isinstance(payload, dict):
+            self._record(False)
+            return None
+        self._record(True)
+        logger.debug("financial_metrics_disk_cache_hit", symbol=ticker, source=source)
+        return payload
+
+    def set_metrics(
+        self, ticker: str, payload: dict[str, Any], source: str = "merged"
+    ) -> None:
+        if not payload or payload.get("error"):
+            return
+        try:
+            body = json.dumps(
+                {"stored_at": time.time(), "source": source, "payload": payload},
+                default=str,
+            ).encode("utf-8")
+            _atomic_write_bytes(self._metrics_path(ticker, source), body)
+            self.stats["writes"] += 1
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(
+                "financial_metrics_disk_cache_write_failed",
+                symbol=ticker,
+                error_type=type(exc).__name__,
+            )
+
+    # --- price history --------------------------------------------------
+
+    def get_history(
+        self,
+        ticker: str,
+        period: str,
+        start: str | None = None,
+        end: str | None = None,
+        *,
+        source: str = "yfinance",
+        mmap: bool = True,
+    ) -> pd.DataFrame | None:
+        directory = self._history_dir(ticker, source, period, start, end)
+        try:
+            meta = read_columnar_meta(directory)
+            ttl = (
+                CLOSED_WINDOW_TTL_SECONDS
+                if _is_closed_window(end)
+                else self._ttl(source)
+            )
+            if time.time() - float(meta["stored_at"]) >= ttl:
+                self._record(False)
+                return None
+            frame = read_columnar_frame(directory, meta, mmap=mmap)
+        except (OSError, ValueError, KeyError, TypeError):
+            self._record(False)
+            return None
+
+        self._record(True)
+        logger.debug(
+            "price_history_disk_cache_hit",
+            symbol=ticker,
+            period=period,
+            start=start,
+            end=end,
+            rows=len(frame),
+        )
+        return frame
+
+    def set_history(
+        self,
+        ticker: str,
+        period: str,
+        frame: pd.DataFrame,
+        start: str | None = None,
+        end: str | None = None,
+        *,
+        source: str = "yfinance",
+    ) -> None:
+        directory = self._history_dir(ticker, source, period, start, end)
+        try:
+            # Non-numeric columns cannot be stored column-wise without pickle.
+            if write_columnar_frame(directory, frame):
+                self.stats["writes"] += 1
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(
+                "price_history_disk_cache_write_failed",
+                symbol=ticker,
+                error_type=type(exc).__name__,
+            )
+
+    # --- invalidation ---------------------------------------------------
+
+    def invalidate(self, ticker: str | None = None, *, kind: str | None = None) -> int:
+        """Remove cached entries; scope by ``ticker`` and/or ``kind``.
+
+        ``kind`` is ``"metrics"`` or ``"history"``; ``None`` clears both.
+        Returns the number of entries removed.
+        """
+        kinds = [kind] if kind else ["metrics", "history"]
+        removed = 0
+        for entry_kind in kinds:
+            base = self.root / entry_kind
+            if not base.exists():
+                continue
+            for source_dir in base.iterdir():
+                if not source_dir.is_dir():
+                    continue
+                if entry_kind == "metrics":
+                    pattern = f"{_safe_component(ticker)}.json" if ticker else "*.json"
+                    for path in source_dir.glob(pattern):
+                        path.unlink(missing_ok=True)
+                        removed += 1
+                    continue
+                targets = (
+                    [source_dir / _safe_component(ticker)]
+                    if ticker
+                    else [p for p in source_dir.iterdir() if p.is_dir()]
+                )
+                for target in targets:
+                    if target.exists():
+                        removed += sum(1 for p in target.iterdir() if p.is_dir())
+                        shutil.rmtree(target, ignore_errors=True)
+        return removed
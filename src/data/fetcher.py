@@ -46,6 +46,7 @@ import yfinance as yf
 
 from src.async_utils import run_with_hard_timeout
 from src.config import config
+from src.data.disk_cache import MarketDataDiskCache
 from src.data.gap_fill import (
     calculate_coverage as calculate_coverage_impl,
 )
@@ -91,6 +92,7 @@ from src.data.metric_extraction import (
     extract_quarterly_horizons as extract_quarterly_horizons_impl,
 )
 from src.data.pattern_extraction import FinancialPatternExtractor
+from src.data.price_store import PriceHistoryStore, get_price_store
 from src.data.source_fetchers import (
     classify_aggregate_source_failure as classify_aggregate_source_failure_impl,
 )
@@ -174,6 +176,9 @@ FX_CACHE_TTL_SECONDS = 3600
 FETCH_RESULT_CACHE_TTL_SECONDS = 30
 PRICE_HISTORY_CACHE_TTL_SECONDS = 30
 PER_SOURCE_TIMEOUT = 15
+# Per-source results kept by the early-exit race so late sources warm the next
+# fetch of the same symbol.
+SOURCE_RESULT_CACHE_TTL_SECONDS = 15 * 60
 
 RECENT_SPLIT_WINDOW_DAYS = 180
 SPLIT_RATIO_MATCH_TOLERANCE = 0.25
@@ -308,6 +313,10 @@ class SmartMarketDataFetcher(FinancialFetcher):
     _MNEMONIC_EXCHANGES = frozenset({".KL"})
     _MNEMONIC_CACHE_FILE = Path("scratch/ticker_mnemonic_map.json")
     _MNEMONIC_CACHE_TTL = 30 * 24 * 3600  # 30 days
+    # Cross-process cache; None unless MARKET_DATA_DISK_CACHE_ENABLED.
+    _disk_cache: MarketDataDiskCache | None = None
+    # Incremental daily-bar store; None unless PRICE_HISTORY_STORE_ENABLED.
+    _price_store: PriceHistoryStore | None = None
 
     IMPORTANT_FIELDS = [
         "sector",  # Prevents sector hallucination (e.g., industrial classified as tech)
@@ -343,6 +352,7 @@ class SmartMarketDataFetcher(FinancialFetcher):
         self._mnemonic_cache: dict[str, str] = self._load_mnemonic_cache()
         self._metrics_cache: dict[str, tuple[float, dict[str, Any]]] = {}
         self._metrics_inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._source_results: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
         self._history_failure_logged: set[str] = set()
         self._history_cache: dict[
             tuple[str, str, str | None, str | None], tuple[float, pd.DataFrame]
@@ -350,6 +360,8 @@ class SmartMarketDataFetcher(FinancialFetcher):
         self._history_inflight: dict[
             tuple[str, str, str | None, str | None], asyncio.Task[pd.DataFrame]
         ] = {}
+        self._disk_cache = MarketDataDiskCache.from_config(config)
+        self._price_store = get_price_store()
 
         self.fmp_fetcher = get_fmp_fetcher() if FMP_AVAILABLE else None
         self.eodhd_fetcher = get_eodhd_fetcher() if EODHD_AVAILABLE else None
@@ -399,6 +411,30 @@ class SmartMarketDataFetcher(FinancialFetcher):
             copy.deepcopy(payload),
         )
 
+    def _cached_source_result(self, source: str, symbol: str) -> dict[str, Any] | None:
+        """Return a recent single-source result kept by the early-exit race."""
+        cached = self._source_results.get((source, symbol))
+        if cached and time.monotonic() < cached[0]:
+            return copy.deepcopy(cached[1])
+        self._source_results.pop((source, symbol), None)
+        if self._disk_cache is not None:
+            return self._disk_cache.get_metrics(
+                symbol,
+                source=f"source_{source}",
+                ttl_seconds=SOURCE_RESULT_CACHE_TTL_SECONDS,
+            )
+        return None
+
+    def _remember_source_result(
+        self, source: str, symbol: str, payload: dict[str, Any]
+    ) -> None:
+        self._source_results[(source, symbol)] = (
+            time.monotonic() + SOURCE_RESULT_CACHE_TTL_SECONDS,
+            copy.deepcopy(payload),
+        )
+        if self._disk_cache is not None:
+            self._disk_cache.set_metrics(symbol, payload, source=f"source_{source}")
+
     def _get_ibkr_security_service(self):
         # Delegate to the process-wide shared service (one instance, one probe cache
         # shared with ticker_utils name-resolution and the IBKR market source).
@@ -809,6 +845,7 @@ class SmartMarketDataFetcher(FinancialFetcher):
             PER_SOURCE_TIMEOUT,
             logger_obj=logger,
             asyncio_module=asyncio,
+            early_exit_coverage=config.data_source_early_exit_coverage,
         )
 
     def _classify_aggregate_source_failure(
@@ -1938,6 +1975,12 @@ class SmartMarketDataFetcher(FinancialFetcher):
         if cached is not None:
             return cached
 
+        if self._disk_cache is not None:
+            persisted = self._disk_cache.get_metrics(ticker)
+            if persisted is not None:
+                self._set_cached_metrics(ticker, persisted)
+                return persisted
+
         inflight = self._metrics_inflight.get(ticker)
         if inflight is not None:
             logger.debug("financial_metrics_inflight_wait", symbol=ticker)
@@ -1960,6 +2003,8 @@ class SmartMarketDataFetcher(FinancialFetcher):
         result = await task
 
         self._set_cached_metrics(ticker, result)
+        if self._disk_cache is not None:
+            self._disk_cache.set_metrics(ticker, result)
         return copy.deepcopy(result)
 
     async def _get_price_history_uncached(
@@ -1971,10 +2016,20 @@ class SmartMarketDataFetcher(FinancialFetcher):
     ) -> pd.DataFrame:
         """Fetch historical price data."""
         try:
-            stock = yf.Ticker(ticker)
-            history_kwargs: dict[str, str] = {}
             normalized_start = _normalize_history_bound(start)
             normalized_end = _normalize_history_bound(end)
+            if self._price_store is not None:
+                try:
+                    stored = await self._price_store.aget_window(
+                        ticker, period, start=normalized_start, end=normalized_end
+                    )
+                except ValueError:
+                    stored = None  # period the store cannot express; fetch directly
+                if stored is not None and not stored.empty:
+                    return stored
+
+            stock = yf.Ticker(ticker)
+            history_kwargs: dict[str, str] = {}
             if normalized_start is not None:
                 history_kwargs["start"] = normalized_start
             if normalized_end is not None:
@@ -2036,6 +2091,20 @@ class SmartMarketDataFetcher(FinancialFetcher):
         if cached is not None:
             return cached
 
+        if self._disk_cache is not None:
+            persisted = self._disk_cache.get_history(
+                ticker, period, start=normalized_start, end=normalized_end
+            )
+            if persisted is not None:
+                self._set_cached_history(
+                    ticker,
+                    period,
+                    persisted,
+                    start=normalized_start,
+                    end=normalized_end,
+                )
+                return persisted
+
         key = self._history_cache_key(
             ticker,
             period,
@@ -2079,6 +2148,10 @@ class SmartMarketDataFetcher(FinancialFetcher):
             start=normalized_start,
             end=normalized_end,
         )
+        if self._disk_cache is not None:
+            self._disk_cache.set_history(
+                ticker, period, hist, start=normalized_start, end=normalized_end
+            )
         return hist.copy(deep=True)
 
     # Alias for backward compatibility and interface compliance
@@ -2098,7 +2171,23 @@ class SmartMarketDataFetcher(FinancialFetcher):
 
     def get_stats(self) -> dict[str, Any]:
         """Get comprehensive statistics on fetcher performance."""
-        return cast(dict[str, Any], self.stats.copy())
+        stats = cast(dict[str, Any], self.stats.copy())
+        if self._disk_cache is not None:
+            stats["disk_cache"] = dict(self._disk_cache.stats)
+        return stats
+
+    def invalidate_cache(self, ticker: str | None = None) -> int:
+        """Drop in-process and on-disk cached metrics/history for ``ticker`` (or all)."""
+        if ticker is None:
+            self._metrics_cache.clear()
+            self._history_cache.clear()
+        else:
+            self._metrics_cache.pop(ticker, None)
+            for key in [key for key in self._history_cache if key[0] == ticker]:
+                self._history_cache.pop(key, None)
+        if self._disk_cache is None:
+            return 0
+        return self._disk_cache.invalidate(ticker)
 
     def clear_fx_cache(self):
         """Clear FX rate cache."""
@@ -2138,6 +2227,9 @@ class _LazyFetcherProxy:
     def get_stats(self, *args, **kwargs):
         return get_current_market_data_fetcher().get_stats(*args, **kwargs)
 
+    def invalidate_cache(self, *args, **kwargs):
+        return get_current_market_data_fetcher().invalidate_cache(*args, **kwargs)
+
     def clear_fx_cache(self, *args, **kwargs):
         return get_current_market_data_fetcher().clear_fx_cache(*args, **kwargs)
 
@@ -0,0 +1,320 @@
+"""Incremental per-ticker daily OHLCV store.
+
+``get_price_history``, ``compare_to_reality`` and ``get_technical_indicators``
+each re-download whole history windows from yfinance. ``PriceHistoryStore``
+keeps one daily-bar series per ticker under ``DATA_CACHE_DIR/price_store``
+(same column-wise ``.npy`` layout as ``src.data.disk_cache``), remembers the
+last stored bar, and fetches only:
+
+- the delta since the last bar (with a few days of overlap), and
+- a backfill when a caller asks for a window older than the stored start.
+
+Any ``period``/``start``/``end`` window is then served from local data.
+
+yfinance returns dividend/split-adjusted closes, so an adjustment after the
+last refresh rescales every older bar. Both the delta and the backfill overlap
+the stored series by a few days, and the overlapping bars are compared with
+the stored ones; when they disagree the series is re-downloaded in full
+rather than stitched together from two different adjustment bases. The last
+stored bar is left out of that comparison and always overwritten, since it
+may have been written from an intraday partial bar; a bar dated today is
+re-fetched whenever the store is older than ``min_refresh_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import structlog
+
+from src.async_utils import run_with_hard_timeout
+from src.data.disk_cache import (
+    read_columnar_frame,
+    read_columnar_meta,
+    write_columnar_frame,
+)
+
+logger = structlog.get_logger(__name__)
+
+# (ticker, start, end) -> daily bars; ``start``/``end`` are ISO dates or None
+# (None start = full history). ``end`` is exclusive, as in yfinance.
+FetchBarsFn = Callable[[str, str | None, str | None], pd.DataFrame]
+
+REFRESH_OVERLAP_DAYS = 5
+# Relative close difference on overlapping bars that signals a re-adjustment.
+ADJUSTMENT_DRIFT_TOLERANCE = 0.005
+DEFAULT_MIN_REFRESH_SECONDS = 3600.0
+_PERIOD_PATTERN = re.compile(r"^(\d+)(d|wk|mo|y)$")
+_PERIOD_UNIT_DAYS = {"d": 1, "wk": 7, "mo": 31, "y": 366}
+_SAFE_COMPONENT = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def period_start(period: str, today: date) -> date | None:
+    """Translate a yfinance ``period`` into a start date; ``None`` means max."""
+    if period == "max":
+        return None
+    if period == "ytd":
+        return date(today.year, 1, 1)
+    match = _PERIOD_PATTERN.match(period)
+    if not match:
+        raise ValueError(f"unsupported history period: {period!r}")
+    count, unit = int(match.group(1)), match.group(2)
+    return today - timedelta(days=count * _PERIOD_UNIT_DAYS[unit])
+
+
+def _bar_dates(frame: pd.DataFrame) -> pd.DatetimeIndex:
+    """Exchange-local calendar dates of each bar, timezone-naive."""
+    index = frame.index
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _default_fetch_bars(
+    ticker: str, start: str | None, end: str | None
+) -> pd.DataFrame:
+    import yfinance as yf
+
+    kwargs: dict[str, Any] = {}
+    if start is None:
+        kwargs["period"] = "max"
+    else:
+        kwargs["start"] = start
+    if end is not None:
+        kwargs["end"] = end
+    return yf.Ticker(ticker).history(**kwargs)
+
+
+class PriceHistoryStore:
+    """Local daily-bar store that appends only the bars it is missing."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        fetch_bars: FetchBarsFn | None = None,
+        min_refresh_seconds: float = DEFAULT_MIN_REFRESH_SECONDS,
+        clock: Callable[[], date] | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self._fetch_bars = fetch_bars or _default_fetch_bars
+        self.min_refresh_seconds = min_refresh_seconds
+        self._today = clock or date.today
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {"served": 0, "delta_fetches": 0, "full_fetches": 0}
+
+    @classmethod
+    def from_config(cls, settings: Any) -> PriceHistoryStore | None:
+        """Return the configured store, or ``None`` when it is disabled."""
+        if not getattr(settings, "price_history_store_enabled", False):
+            return None
+        return cls(Path(settings.data_cache_dir) / "price_store")
+
+    def _directory(self, ticker: str) -> Path:
+        return self.root / (_SAFE_COMPONENT.sub("_", ticker).strip("._") or "_")
+
+    def _lock_for(self, ticker: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _load(self, ticker: str) -> tuple[pd.DataFrame | None, dict[str, Any]]:
+        directory = self._directory(ticker)
+        try:
+            meta = read_columnar_meta(directory)
+            return read_columnar_frame(directory, meta, mmap=False), meta
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, {}
+
+    def _save(self, ticker: str, frame: pd.DataFrame, *, from_inception: bool) -> None:
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        write_columnar_frame(
+            self._directory(ticker),
+            frame,
+            {
+                "ticker": ticker,
+                "from_inception": from_inception,
+                "refreshed_at": time.time(),
+            },
+        )
+
+    def _fetch(self, ticker: str, start: date | None, end: date | None) -> pd.DataFrame:
+        return self._fetch_bars(
+            ticker,
+            start.isoformat() if start else None,
+            end.isoformat() if end else None,
+        )
+
+    @staticmethod
+    def _adjustment_drifted(stored: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+        if "Close" not in stored or "Close" not in fresh:
+            return False
+        # The last stored bar may have been written intraday; its close is
+        # simply replaced, not evidence of a re-adjustment.
+        overlap = stored.index[:-1].intersection(fresh.index)
+        for stamp in overlap:
+            old = float(stored.at[stamp, "Close"])
+            new = float(fresh.at[stamp, "Close"])
+            if math.isnan(old) or math.isnan(new) or old == 0:
+                continue
+            if abs(new - old) / abs(old) > ADJUSTMENT_DRIFT_TOLERANCE:
+                return True
+        return False
+
+    def _ensure(self, ticker: str, start: date | None, end: date) -> pd.DataFrame:
+        """Bring the stored series up to date for ``[start, end)`` and return it."""
+        stored, meta = self._load(ticker)
+        if stored is None or stored.empty:
+            fresh = self._fetch(ticker, start, None)
+            self.stats["full_fetches"] += 1
+            if fresh is not None and not fresh.empty:
+                self._save(ticker, fresh, from_inception=start is None)
+            return fresh if fresh is not None else pd.DataFrame()
+
+        from_inception = bool(meta.get("from_inception"))
+        dates = _bar_dates(stored)
+        first_date, last_date = dates[0].date(), dates[-1].date()
+        changed = False
+
+        if (start is None and not from_inception) or (
+            start is not None and start < first_date and not from_inception
+        ):
+            # Overlap the stored start so a re-adjustment since the last
+            # refresh is caught here as well, not stitched onto the old basis.
+            fetched = self._fetch(
+                ticker, start, first_date + timedelta(days=REFRESH_OVERLAP_DAYS)
+            )
+            self.stats["full_fetches"] += 1
+            older = fetched if fetched is not None else pd.DataFrame()
+            if not older.empty and self._adjustment_drifted(stored, older):
+                logger.info("price_store_adjustment_refetch", ticker=ticker)
+                refetched = self._fetch(ticker, start, None)
+                self.stats["full_fetches"] += 1
+                if refetched is not None and not refetched.empty:
+                    stored = refetched
+            if not older.empty:
+                older = older.loc[_bar_dates(older) < pd.Timestamp(first_date)]
+            has_older = not older.empty
+            # Nothing (or nothing near ``start``) before the stored series means
+            # the listing itself starts later; remember that so the backfill
+            # is not retried on every call.
+            if (
+                start is None
+                or not has_older
+                or _bar_dates(older)[0].date() > start + timedelta(days=7)
+            ):
+                from_inception = True
+            if has_older:
+                stored = pd.concat([older, stored])
+            stored = stored[~stored.index.duplicated(keep="last")].sort_index()
+            dates = _bar_dates(stored)
+            first_date, last_date = dates[0].date(), dates[-1].date()
+            changed = True
+
+        stale = time.time() - float(meta.get("refreshed_at", 0)) >= (
+            self.min_refresh_seconds
+        )
+        # A bar dated today was written mid-session; once the store is stale
+        # it is re-fetched (the overlap overwrites it) rather than served as
+        # the day's close until tomorrow.
+        partial_today = last_date >= self._today() and end > last_date
+        if stale and (last_date < end - timedelta(days=1) or partial_today):
+            overlap_start = last_date - timedelta(days=REFRESH_OVERLAP_DAYS)
+            fresh = self._fetch(ticker, overlap_start, None)
+            self.stats["delta_fetches"] += 1
+            if fresh is not None and not fresh.empty:
+                if self._adjustment_drifted(stored, fresh):
+                    logger.info("price_store_adjustment_refetch", ticker=ticker)
+                    full_start = None if from_inception else first_date
+                    if start is not None and full_start is not None:
+                        full_start = min(full_start, start)
+                    refetched = self._fetch(ticker, full_start, None)
+                    self.stats["full_fetches"] += 1
+                    if refetched is not None and not refetched.empty:
+                        stored = refetched
+                else:
+                    stored = pd.concat([stored, fresh])
+                changed = True
+
+        if changed:
+            self._save(ticker, stored, from_inception=from_inception)
+            stored, _ = self._load(ticker)
+        return stored if stored is not None else pd.DataFrame()
+
+    def get_window(
+        self,
+        ticker: str,
+        period: str = "1y",
+        start: str | None = None,
+        end: str | None = None,
+    ) -> pd.DataFrame:
+        """Return daily bars for a yfinance-style window, fetching only the gap.
+
+        Explicit ``start``/``end`` take precedence over ``period``; ``end`` is
+        exclusive.
+        """
+        today = self._today()
+        end_date = datetime.fromisoformat(end).date() if end else today + timedelta(1)
+        start_date = (
+            datetime.fromisoformat(start).date()
+            if start
+            else (period_start(period, today) if not end else None)
+        )
+        with self._lock_for(ticker):
+            series = self._ensure(ticker, start_date, end_date)
+        self.stats["served"] += 1
+        if series.empty:
+            return series
+
+        dates = _bar_dates(series)
+        mask = dates < pd.Timestamp(end_date)
+        if start_date is not None:
+            mask &= dates >= pd.Timestamp(start_date)
+        return series.loc[mask].copy()
+
+    async def aget_window(
+        self,
+        ticker: str,
+        period: str = "1y",
+        start: str | None = None,
+        end: str | None = None,
+        *,
+        timeout: float = 30.0,
+    ) -> pd.DataFrame:
+        """Async ``get_window`` bounded by a hard deadline."""
+        return await run_with_hard_timeout(
+            asyncio.to_thread(self.get_window, ticker, period, start, end),
+            timeout=timeout,
+            label=f"price_store.window:{ticker}",
+        )
+
+
+_store_instance: PriceHistoryStore | None = None
+_store_resolved = False
+
+
+def get_price_store() -> PriceHistoryStore | None:
+    """Return the process-wide store, or ``None`` when disabled in config."""
+    global _store_instance, _store_resolved
+    if not _store_resolved:
+        from src.config import config
+
+        _store_instance = PriceHistoryStore.from_config(config)
+        _store_resolved = True
+    return _store_instance
+
+
+def reset_price_store_for_tests() -> None:
+    """Forget the process-wide store so tests can rebind config."""
+    global _store_instance, _store_resolved
+    _store_instance = None
+    _store_resolved = False
@@ -3,17 +3,31 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import time
+from collections import deque
 from typing import Any, cast
 
 import structlog
 import yfinance as yf
 
 from src.error_safety import summarize_exception
+from src.run_profiler import profile_span
 from src.yfinance_runtime import YFRateLimitError
 
 logger = structlog.get_logger(__name__)
 
 MIN_INFO_FIELDS = 3
+# Primary source the merge pipeline treats as the quote anchor (a missing
+# yfinance result triggers ticker re-resolution), so an early exit waits for it.
+EARLY_EXIT_REQUIRED_SOURCES = ("yfinance",)
+_LATENCY_WINDOW = 256
+
+_source_latency_samples: dict[str, deque[float]] = {}
+_source_timeout_counts: dict[str, int] = {}
+# Sources still running after an early exit; referenced here so they are not
+# garbage-collected before they finish.
+_background_source_tasks: set[asyncio.Task] = set()
 
 try:
     from yahooquery import Ticker as YQTicker
@@ -251,6 +265,63 @@ async def fetch_av_fallback(fetcher: Any, symbol: str) -> dict | None:
         return None
 
 
+def record_source_latency(name: str, seconds: float, outcome: str) -> None:
+    """Keep a rolling window of per-source wall time (timeouts included)."""
+    samples = _source_latency_samples.setdefault(name, deque(maxlen=_LATENCY_WINDOW))
+    samples.append(seconds * 1000)
+    if outcome == "timeout":
+        _source_timeout_counts[name] = _source_timeout_counts.get(name, 0) + 1
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return round(ordered[rank - 1], 1)
+
+
+def source_latency_snapshot() -> dict[str, dict[str, float | int]]:
+    """Per-source latency percentiles (ms) over the rolling window.
+
+    Reported in the run summary so ``PER_SOURCE_TIMEOUT`` and the early-exit
+    threshold can be set from observed latency rather than guessed.
+    """
+    snapshot: dict[str, dict[str, float | int]] = {}
+    for name, samples in sorted(_source_latency_samples.items()):
+        ordered = sorted(samples)
+        if not ordered:
+            continue
+        snapshot[name] = {
+            "count": len(ordered),
+            "p50": _percentile(ordered, 0.50),
+            "p90": _percentile(ordered, 0.90),
+            "p99": _percentile(ordered, 0.99),
+            "max": round(ordered[-1], 1),
+            "timeouts": _source_timeout_counts.get(name, 0),
+        }
+    return snapshot
+
+
+def _early_exit_ready(
+    fetcher: Any, arrived: dict[str, dict | None], coverage_threshold: float
+) -> bool:
+    """True once the sources so far cover enough fields and anchor identity.
+
+    Uses a plain field union rather than the quality merge: it only has to
+    answer "is anything important still missing", and the merge logs.
+    """
+    if any(not arrived.get(source) for source in EARLY_EXIT_REQUIRED_SOURCES):
+        return False
+    union: dict[str, Any] = {}
+    for result in arrived.values():
+        for key, value in (result or {}).items():
+            if value is not None:
+                union.setdefault(key, value)
+    return (
+        fetcher._has_required_quote_identity(union)
+        and fetcher._calculate_coverage(union) >= coverage_threshold
+    )
+
+
 def classify_aggregate_source_failure(source_outcomes: dict[str, str]) -> str:
     """Classify aggregate multi-source failure conservatively."""
     transient_markers = ("timeout", "connect", "proxy", "ssl", "dns", "socket")
@@ -272,6 +343,7 @@ async def fetch_all_sources_parallel(
     *,
     logger_obj: Any = logger,
     asyncio_module: Any = asyncio,
+    early_exit_coverage: float = 0.0,
 ) -> dict[str, dict | None]:
     """Launch all configured sources concurrently and collect outcomes.
 
@@ -279,6 +351,14 @@ async def fetch_all_sources_parallel(
     task if it exceeds the deadline (see ``run_with_hard_timeout``); slow or
     hung providers cannot block sibling providers or the caller's wall clock
     beyond ``per_source_timeout``.
+
+    With ``early_exit_coverage`` > 0 the sources are raced instead: results
+    are taken as they arrive (recently fetched per-source results are reused
+    without a call), and the function returns as soon as yfinance has answered,
+    the arrived fields carry a quote identity, and they cover at least that
+    fraction of ``IMPORTANT_FIELDS``. Sources still running are reported as
+    ``None`` and left to finish in the background, where their results are
+    kept for the next fetch of the same symbol.
     """
     from src.async_utils import run_with_hard_timeout
 
@@ -303,6 +383,14 @@ async def fetch_all_sources_parallel(
         builders["ibkr"] = lambda: fetcher._fetch_ibkr_fallback(symbol)
 
     async def _run_one(name: str) -> tuple[str, dict | None, str]:
+        started = time.perf_counter()
+        with profile_span(f"source:{name}", "data_source", symbol=symbol) as span:
+            name, result, outcome = await _fetch_one(name)
+            span["outcome"] = outcome
+        record_source_latency(name, time.perf_counter() - started, outcome)
+        return name, result, outcome
+
+    async def _fetch_one(name: str) -> tuple[str, dict | None, str]:
         try:
             result = await run_with_hard_timeout(
                 builders[name](),
@@ -334,10 +422,20 @@ async def fetch_all_sources_parallel(
         logger_obj.debug(f"{name}_returned_none", symbol=symbol)
         return name, None, "empty"
 
-    completed = await asyncio_module.gather(
-        *(_run_one(name) for name in builders),
-        return_exceptions=False,
-    )
+    if early_exit_coverage > 0:
+        completed = await _race_sources(
+            fetcher,
+            symbol,
+            list(builders),
+            _run_one,
+            coverage_threshold=early_exit_coverage,
+            logger_obj=logger_obj,
+        )
+    else:
+        completed = await asyncio_module.gather(
+            *(_run_one(name) for name in builders),
+            return_exceptions=False,
+        )
 
     results: dict[str, dict | None] = {}
     source_outcomes: dict[str, str] = {}
@@ -355,3 +453,59 @@ async def fetch_all_sources_parallel(
         )
 
     return results
+
+
+async def _race_sources(
+    fetcher: Any,
+    symbol: str,
+    names: list[str],
+    run_one: Any,
+    *,
+    coverage_threshold: float,
+    logger_obj: Any,
+) -> list[tuple[str, dict | None, str]]:
+    """Collect sources as they finish and stop once ``_early_exit_ready``."""
+    arrived: dict[str, dict | None] = {}
+    outcomes: dict[str, str] = {}
+    tasks: dict[asyncio.Task, str] = {}
+    for name in names:
+        cached = fetcher._cached_source_result(name, symbol)
+        if cached is not None:
+            arrived[name], outcomes[name] = cached, "cached"
+        else:
+            tasks[asyncio.ensure_future(run_one(name))] = name
+
+    started = time.perf_counter()
+    pending = set(tasks)
+    while pending and not _early_exit_ready(fetcher, arrived, coverage_threshold):
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            name, result, outcome = task.result()
+            arrived[name], outcomes[name] = result, outcome
+            if result:
+                fetcher._remember_source_result(name, symbol, result)
+
+    if pending:
+        late = sorted(tasks[task] for task in pending)
+        logger_obj.info(
+            "data_sources_early_exit",
+            symbol=symbol,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+            arrived=sorted(arrived),
+            continuing=late,
+        )
+
+        def _keep_late_result(task: asyncio.Task) -> None:
+            _background_source_tasks.discard(task)
+            if task.cancelled() or task.exception() is not None:
+                return
+            name, result, _ = task.result()
+            if result:
+                fetcher._remember_source_result(name, symbol, result)
+
+        for task in pending:
+            _background_source_tasks.add(task)
+            task.add_done_callback(_keep_late_result)
+            arrived[tasks[task]], outcomes[tasks[task]] = None, "pending"
+
+    return [(name, arrived[name], outcomes[name]) for name in names]
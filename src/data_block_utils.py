@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from enum import Enum
+from functools import lru_cache
 
 
 class BlockShape(Enum):
@@ -76,6 +78,138 @@ _FIELD_VALUE_PATTERN = r"(?m)^{field_name}:\s*(.+?)\s*$"
 _NUMBER_TOKEN_PATTERN = re.compile(r"[-+]?\d[\d,]*(?:\.\d+)?")
 
 
+# Report-level memo size. A run touches a few dozen report strings, each looked
+# up for a handful of block names; lookups are keyed by the report string, which
+# the caller usually passes as the same object, so hits cost an identity check.
+_BLOCK_CACHE_SIZE = 256
+
+
+class StructuredBlock:
+    """A structured block body parsed once into an ordered ``FIELD: value`` map.
+
+    Field lookups match ``_FIELD_VALUE_PATTERN`` exactly -- the first line that
+    starts with ``FIELD:`` (case-insensitive) wins, and an empty value takes the
+    next non-blank line -- without re-scanning the body per field. Instances are
+    shared through ``parse_structured_block`` and must be treated as immutable.
+    """
+
+    __slots__ = ("text", "_keys", "_values", "_numbers")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._keys: list[str] = []
+        self._values: dict[str, str] = {}
+        self._numbers: dict[str, float | None] = {}
+        lines = text.split("\n")
+        for index, line in enumerate(lines):
+            key, colon, rest = line.partition(":")
+            if not colon:
+                continue
+            lookup = key.lower()
+            if lookup in self._values:
+                continue
+            value = rest.strip() or _continuation_value(rest, lines, index + 1)
+            if value is None:
+                continue
+            self._keys.append(key)
+            self._values[lookup] = value
+
+    def __contains__(self, field_name: object) -> bool:
+        return isinstance(field_name, str) and self.raw(field_name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Yield ``(field, raw value)`` pairs in block order."""
+        for key in self._keys:
+            yield key, self._values[key.lower()]
+
+    def raw(self, field_name: str) -> str | None:
+        """Return the literal value of *field_name*, if present."""
+        if ":" in field_name or "\n" in field_name:
+            # Not a key the line split can produce; fall back to the regex.
+            match = re.search(
+                _FIELD_VALUE_PATTERN.format(field_name=re.escape(field_name)),
+                self.text,
+                re.IGNORECASE,
+            )
+            return match.group(1).strip() if match else None
+        return self._values.get(field_name.lower())
+
+    def field(self, field_name: str) -> str | None:
+        """Return the value of *field_name*, with null tokens mapped to None."""
+        value = self.raw(field_name)
+        if value is None or value.upper() in _NULL_TOKENS:
+            return None
+        return value
+
+    def number(self, field_name: str) -> float | None:
+        """Return the first numeric token of *field_name*'s value."""
+        lookup = field_name.lower()
+        if lookup not in self._numbers:
+            self._numbers[lookup] = _coerce_number(self.field(field_name))
+        return self._numbers[lookup]
+
+
+def _continuation_value(rest: str, lines: list[str], start: int) -> str | None:
+    # The field pattern's leading ``\s*`` crosses newlines, so an empty value
+    # takes the next non-blank line; with none left it still matches (as "")
+    # when any non-newline whitespace follows the colon.
+    trailing_whitespace = bool(rest)
+    for line in lines[start:]:
+        stripped = line.strip()
+        if stripped:
+            return stripped
+        trailing_whitespace = trailing_whitespace or bool(line)
+    return "" if trailing_whitespace else None
+
+
+def _coerce_number(raw: str | None) -> float | None:
+    if raw is None:
+        return None
+    match = _NUMBER_TOKEN_PATTERN.search(raw)
+    if not match:
+        return None
+    try:
+        return float(match.group(0).replace(",", ""))
+    except ValueError:
+        return None
+
+
+_EMPTY_BLOCK = StructuredBlock("")
+
+
+@lru_cache(maxsize=_BLOCK_CACHE_SIZE)
+def _parse_structured_block(block_text: str) -> StructuredBlock:
+    return StructuredBlock(block_text)
+
+
+def parse_structured_block(block_text: str | None) -> StructuredBlock:
+    """Return the memoized parse of an extracted block body.
+
+    Missing or non-string input yields an empty block, so lookups return None.
+    """
+    if not block_text or not isinstance(block_text, str):
+        return _EMPTY_BLOCK
+    return _parse_structured_block(block_text)
+
+
+def structured_block(report: str | None, block_name: str) -> StructuredBlock | None:
+    """Return the last parseable structured block of *report*, parsed once."""
+    if block_name == "DATA_BLOCK":
+        block_text = extract_last_data_block(report)
+    else:
+        block_text = extract_last_fenced_block(report, block_name)
+    if block_text is None:
+        return None
+    return parse_structured_block(block_text)
+
+
+@lru_cache(maxsize=64)
 def _compile_named_block_pattern(block_name: str) -> re.Pattern[str]:
     start_fragment = fenced_marker_fragment(block_name, "START")
     end_fragment = fenced_marker_fragment(block_name, "END")
@@ -238,7 +372,13 @@ def extract_last_fenced_block(
     """Return the last parseable fenced block for the given structured block name."""
     if not report or not isinstance(report, str):
         return None
+    return _extract_last_fenced_block(report, block_name, include_markers)
 
+
+@lru_cache(maxsize=_BLOCK_CACHE_SIZE)
+def _extract_last_fenced_block(
+    report: str, block_name: str, include_markers: bool
+) -> str | None:
     normalized_report = normalize_structured_block_boundaries(report) or report
     blocks = list(_compile_named_block_pattern(block_name).finditer(normalized_report))
     if not blocks:
@@ -285,6 +425,13 @@ def extract_last_data_block(
     report: str | None, *, include_markers: bool = False
 ) -> str | None:
     """Return the last parseable fenced DATA_BLOCK, if present."""
+    if not report or not isinstance(report, str):
+        return None
+    return _extract_last_data_block(report, include_markers)
+
+
+@lru_cache(maxsize=_BLOCK_CACHE_SIZE)
+def _extract_last_data_block(report: str, include_markers: bool) -> str | None:
     block = extract_last_fenced_block(
         report, "DATA_BLOCK", include_markers=include_markers
     )
@@ -327,25 +474,14 @@ def extract_block_field_from_text(
     block_text: str | None, field_name: str
 ) -> str | None:
     """Extract a normalized field value from an already extracted block body."""
-    value = extract_block_field_from_text_raw(block_text, field_name)
-    if value is None:
-        return None
-    return None if value.upper() in _NULL_TOKENS else value
+    return parse_structured_block(block_text).field(field_name)
 
 
 def extract_block_field_from_text_raw(
     block_text: str | None, field_name: str
 ) -> str | None:
     """Extract a literal field value from an already extracted block body."""
-    if not block_text or not isinstance(block_text, str):
-        return None
-
-    pattern = _FIELD_VALUE_PATTERN.format(field_name=re.escape(field_name))
-    match = re.search(pattern, block_text, re.IGNORECASE)
-    if not match:
-        return None
-
-    return match.group(1).strip()
+    return parse_structured_block(block_text).raw(field_name)
 
 
 def extract_block_text_value(block_text: str, field_name: str) -> str:
@@ -378,18 +514,7 @@ def extract_block_number_from_text(
     block_text: str | None, field_name: str
 ) -> float | None:
     """Extract a numeric field value from an already extracted block body."""
-    raw = extract_block_field_from_text(block_text, field_name)
-    if raw is None:
-        return None
-
-    match = _NUMBER_TOKEN_PATTERN.search(raw)
-    if not match:
-        return None
-
-    try:
-        return float(match.group(0).replace(",", ""))
-    except ValueError:
-        return None
+    return parse_structured_block(block_text).number(field_name)
 
 
 def extract_block_field(
@@ -398,11 +523,8 @@ def extract_block_field(
     field_name: str,
 ) -> str | None:
     """Extract a normalized field value from the last parseable structured block."""
-    if block_name == "DATA_BLOCK":
-        block_text = extract_last_data_block(report)
-    else:
-        block_text = extract_last_fenced_block(report, block_name)
-    return extract_block_field_from_text(block_text, field_name)
+    block = structured_block(report, block_name)
+    return block.field(field_name) if block is not None else None
 
 
 def extract_block_number(
@@ -411,11 +533,8 @@ def extract_block_number(
     field_name: str,
 ) -> float | None:
     """Extract a numeric field value from the last parseable structured block."""
-    if block_name == "DATA_BLOCK":
-        block_text = extract_last_data_block(report)
-    else:
-        block_text = extract_last_fenced_block(report, block_name)
-    return extract_block_number_from_text(block_text, field_name)
+    block = structured_block(report, block_name)
+    return block.number(field_name) if block is not None else None
 
 
 def extract_data_block_field(report: str | None, field_name: str) -> str | None:
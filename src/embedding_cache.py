@@ -0,0 +1,283 @@
+"""Embedding-vector cache keyed by (embedding binding fingerprint, text hash).
+
+Every agent's memory retrieval embeds the same situation text, and same-day
+reruns embed it again, each as a separate provider call under the shared RPM
+limiter. With ``EMBEDDING_CACHE_ENABLED=true`` vectors are kept in a bounded
+in-process LRU, so a run pays for each distinct text once; with
+``EMBEDDING_CACHE_DB_PATH`` set they are also persisted in a SQLite file that
+later runs and other processes reuse.
+
+The key binds the text to the binding fingerprint (provider, model, dimension,
+schema version), so changing any of those never serves a vector from another
+embedding space. Vectors are deterministic for a binding, so entries do not
+expire; the SQLite table is trimmed back to ``max_entries`` by least-recent
+use. Concurrent embeddings of one text inside an event loop are coalesced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_BUSY_TIMEOUT_SECONDS = 5.0
+# Trimming counts the table, so it runs once per this many writes rather than
+# on every write; the table may overshoot ``max_entries`` by at most this much.
+_TRIM_EVERY_N_WRITES = 64
+
+
+def embedding_cache_key(binding_fingerprint: str, text: str) -> str:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{binding_fingerprint}:{digest}"
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("d", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array("d")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """Bounded in-memory vector cache, optionally backed by a shared SQLite file."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        db_path: str | Path | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._db_path = Path(db_path) if db_path else None
+        self._local = threading.local()
+        self._writes_since_trim = 0
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+        self.stats = {
+            "hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+        if self._db_path is not None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
+
+    @classmethod
+    def from_config(cls, settings: Any) -> EmbeddingCache | None:
+        """Return the configured cache, or ``None`` when it is disabled."""
+        if not getattr(settings, "embedding_cache_enabled", False):
+            return None
+        return cls(
+            max_entries=int(settings.embedding_cache_max_entries),
+            db_path=getattr(settings, "embedding_cache_db_path", None),
+        )
+
+    # --- SQLite -----------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                cache_key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used "
+            "ON embeddings (last_used_at)"
+        )
+
+    def _db_get(self, cache_key: str) -> list[float] | None:
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT vector FROM embeddings WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE embeddings SET last_used_at = ? WHERE cache_key = ?",
+                (time.time(), cache_key),
+            )
+        except sqlite3.Error as exc:
+            logger.debug("embedding_cache_read_failed", error_type=type(exc).__name__)
+            return None
+        return _unpack(row[0]) or None
+
+    def _db_set(self, cache_key: str, vector: list[float]) -> None:
+        now = time.time()
+        try:
+            self._connect().execute(
+                """
+                INSERT INTO embeddings (cache_key, vector, stored_at, last_used_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    vector = excluded.vector,
+                    stored_at = excluded.stored_at,
+                    last_used_at = excluded.last_used_at
+                """,
+                (cache_key, _pack(vector), now, now),
+            )
+        except sqlite3.Error as exc:
+            logger.debug("embedding_cache_write_failed", error_type=type(exc).__name__)
+            return
+        self._writes_since_trim += 1
+        if self._writes_since_trim >= _TRIM_EVERY_N_WRITES:
+            self.trim()
+
+    def trim(self) -> int:
+        """Drop the least recently used persisted vectors beyond ``max_entries``."""
+        if self._db_path is None:
+            return 0
+        self._writes_since_trim = 0
+        conn = self._connect()
+        removed = conn.execute(
+            """
+            DELETE FROM embeddings WHERE cache_key IN (
+                SELECT cache_key FROM embeddings
+                ORDER BY last_used_at ASC
+                LIMIT max(0, (SELECT COUNT(*) FROM embeddings) - ?)
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        removed = max(0, removed)
+        self.stats["evictions"] += removed
+        return removed
+
+    # --- lookups ----------------------------------------------------------
+
+    def get(self, cache_key: str) -> list[float] | None:
+        """Return a copy of the cached vector, or ``None`` on a miss."""
+        with self._memory_lock:
+            vector = self._memory.get(cache_key)
+            if vector is not None:
+                self._memory.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                return list(vector)
+        if self._db_path is not None:
+            vector = self._db_get(cache_key)
+            if vector is not None:
+                self._remember(cache_key, vector)
+                self.stats["persistent_hits"] += 1
+                return list(vector)
+        return None
+
+    def set(self, cache_key: str, vector: list[float]) -> None:
+        vector = [float(value) for value in vector]
+        self._remember(cache_key, vector)
+        self.stats["writes"] += 1
+        if self._db_path is not None:
+            self._db_set(cache_key, vector)
+
+    def _remember(self, cache_key: str, vector: list[float]) -> None:
+        with self._memory_lock:
+            self._memory[cache_key] = vector
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    async def get_or_embed(
+        self, cache_key: str, embed: Callable[[], Awaitable[list[float]]]
+    ) -> list[float]:
+        """Return the cached vector, or run *embed* once for concurrent callers."""
+        cached = self.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, cache_key)
+        task = self._inflight.get(inflight_key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return list(await asyncio.shield(task))
+
+        self.stats["misses"] += 1
+        task = loop.create_task(self._embed_and_store(cache_key, embed))
+        self._inflight[inflight_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        # Shielded so one cancelled caller does not cancel the embedding for
+        # the others waiting on it.
+        return list(await asyncio.shield(task))
+
+    async def _embed_and_store(
+        self, cache_key: str, embed: Callable[[], Awaitable[list[float]]]
+    ) -> list[float]:
+        vector = await embed()
+        if vector:
+            self.set(cache_key, vector)
+        return vector
+
+    def record_misses(self, count: int) -> None:
+        """Count misses resolved outside ``get_or_embed`` (the batched path)."""
+        self.stats["misses"] += count
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._memory_lock:
+            entries = len(self._memory)
+        return {
+            **self.stats,
+            "entries": entries,
+            "persistent": self._db_path is not None,
+        }
+
+
+_UNSET = object()
+_embedding_cache: Any = _UNSET
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Return the process-wide cache, building it from config on first use."""
+    global _embedding_cache
+    if _embedding_cache is _UNSET:
+        from src.config import config
+
+        _embedding_cache = EmbeddingCache.from_config(config)
+    return _embedding_cache
+
+
+def set_embedding_cache(cache: EmbeddingCache | None) -> None:
+    """Install (or, with ``None``, disable) the process-wide cache."""
+    global _embedding_cache
+    _embedding_cache = cache
+
+
+def embedding_cache_snapshot() -> dict[str, Any]:
+    """JSON-serializable hit/miss counters for the run summary; empty when disabled."""
+    cache = _embedding_cache if isinstance(_embedding_cache, EmbeddingCache) else None
+    return cache.snapshot() if cache is not None else {}
@@ -9,6 +9,7 @@ from langgraph.types import RunnableConfig
 
 from src.agents import AgentState
 from src.eval import BaselineCaptureManager
+from src.run_profiler import active_run_profiler
 
 from .components import build_graph_components
 from .routing import (
@@ -111,6 +112,7 @@ def create_trading_graph(
     )
 
     workflow = StateGraph(AgentState)
+    run_profiler = active_run_profiler()
 
     async def dispatcher_node(state: AgentState, config: RunnableConfig):
         """Entry point that triggers parallel analyst streams."""
@@ -258,6 +260,8 @@ BEAR RESEARCHER:
             wrapped = baseline_capture.wrap_node(node_name, wrapped)
         if node_observer is not None:
             wrapped = node_observer.wrap_node(node_name, wrapped)
+        if run_profiler is not None:
+            wrapped = run_profiler.wrap_node(node_name, wrapped)
         return wrapped
 
     workflow.add_node("Dispatcher", maybe_wrap("Dispatcher", dispatcher_node))
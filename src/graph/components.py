@@ -154,14 +154,14 @@ def build_seat_model(
 
 
 def _create_legacy_memories() -> tuple[Any, Any, Any, Any, Any]:
-    from src.memory import FinancialSituationMemory
+    from src.memory import LEGACY_MEMORY_PREFIX, FinancialSituationMemory
 
     return (
-        FinancialSituationMemory("legacy_bull_memory"),
-        FinancialSituationMemory("legacy_bear_memory"),
-        FinancialSituationMemory("legacy_invest_judge_memory"),
-        FinancialSituationMemory("legacy_trader_memory"),
-        FinancialSituationMemory("legacy_risk_manager_memory"),
+        FinancialSituationMemory(f"{LEGACY_MEMORY_PREFIX}_bull_memory"),
+        FinancialSituationMemory(f"{LEGACY_MEMORY_PREFIX}_bear_memory"),
+        FinancialSituationMemory(f"{LEGACY_MEMORY_PREFIX}_invest_judge_memory"),
+        FinancialSituationMemory(f"{LEGACY_MEMORY_PREFIX}_trader_memory"),
+        FinancialSituationMemory(f"{LEGACY_MEMORY_PREFIX}_risk_manager_memory"),
     )
 
 
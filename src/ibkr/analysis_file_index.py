@@ -0,0 +1,239 @@
+"""
+Per-file SQLite index of parsed analysis snapshots.
+
+``load_latest_analyses`` keeps a small latest-per-ticker JSON summary for its
+fast path, but whenever that summary is invalidated (new file, version bump,
+stale entry) it used to re-parse every ``*_analysis.json``. This index keeps
+one row per snapshot file, keyed by file name within the results directory,
+with ``(mtime_ns, size)`` plus a content hash as the freshness check, so a
+rebuild only parses files that are new or changed. Rows are upserted
+individually.
+
+Each row remembers the record schema version it was derived with. Rows from
+an older version are not served, but they are not discarded either: their
+ticker still lets older duplicates be skipped, and the record itself is
+re-derived only for files a load actually consults.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_BUSY_TIMEOUT_SECONDS = 10.0
+
+
+def analysis_file_index_path(results_dir: Path) -> Path:
+    """Return the sibling SQLite file that stores per-snapshot parse results."""
+    return results_dir.parent / f".{results_dir.name}.analysis_files.sqlite3"
+
+
+def file_content_hash(path: Path) -> str:
+    """Return the SHA-256 of a snapshot file's bytes."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisFileRow:
+    """Freshness metadata for one indexed snapshot file."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    schema_version: int
+    ticker: str | None
+
+
+class AnalysisFileIndex:
+    """SQLite-backed parse cache keyed by snapshot file name."""
+
+    def __init__(self, db_path: Path, *, schema_version: int) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.schema_version = schema_version
+        self._conn = sqlite3.connect(
+            self._db_path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._init_db()
+        self._rows = self._load_rows()
+        self.stats = {"hits": 0, "misses": 0, "rehashed": 0}
+
+    @classmethod
+    def for_results_dir(
+        cls, results_dir: Path, *, schema_version: int
+    ) -> AnalysisFileIndex:
+        return cls(analysis_file_index_path(results_dir), schema_version=schema_version)
+
+    def _init_db(self) -> None:
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS analysis_files (
+                name TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                schema_version INTEGER NOT NULL,
+                ticker TEXT,
+                record_json TEXT
+            )
+            """
+        )
+
+    def _load_rows(self) -> dict[str, AnalysisFileRow]:
+        rows = self._conn.execute(
+            """
+            SELECT name, mtime_ns, size, content_hash, schema_version, ticker
+            FROM analysis_files
+            """
+        ).fetchall()
+        return {
+            name: AnalysisFileRow(
+                mtime_ns=int(mtime_ns),
+                size=int(size),
+                content_hash=str(content_hash),
+                schema_version=int(schema_version),
+                ticker=ticker,
+            )
+            for name, mtime_ns, size, content_hash, schema_version, ticker in rows
+        }
+
+    def _unchanged_row(
+        self, path: Path, stat: os.stat_result
+    ) -> AnalysisFileRow | None:
+        row = self._rows.get(path.name)
+        if row is None:
+            return None
+        if row.mtime_ns == stat.st_mtime_ns and row.size == stat.st_size:
+            return row
+        if row.size != stat.st_size:
+            return None
+        # Same size, new mtime (copied, touched, restored): compare contents
+        # before paying for a full parse.
+        try:
+            content_hash = file_content_hash(path)
+        except OSError:
+            return None
+        if content_hash != row.content_hash:
+            return None
+        self.stats["rehashed"] += 1
+        self._conn.execute(
+            "UPDATE analysis_files SET mtime_ns = ? WHERE name = ?",
+            (stat.st_mtime_ns, path.name),
+        )
+        row = AnalysisFileRow(
+            mtime_ns=stat.st_mtime_ns,
+            size=row.size,
+            content_hash=row.content_hash,
+            schema_version=row.schema_version,
+            ticker=row.ticker,
+        )
+        self._rows[path.name] = row
+        return row
+
+    def is_current(self, path: Path, stat: os.stat_result) -> bool:
+        """True when ``lookup`` would hit; does not count towards ``stats``."""
+        row = self._unchanged_row(path, stat)
+        return row is not None and row.schema_version == self.schema_version
+
+    def known_ticker(self, path: Path, stat: os.stat_result) -> str | None:
+        """Ticker recorded for an unchanged file, from any schema version."""
+        row = self._unchanged_row(path, stat)
+        return row.ticker if row is not None else None
+
+    def lookup(
+        self, path: Path, stat: os.stat_result
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Return ``(hit, record_payload)`` for an unchanged, current-schema file.
+
+        A hit with a ``None`` payload means the file is known to yield no
+        record (for example, a snapshot without a ticker).
+        """
+        row = self._unchanged_row(path, stat)
+        if row is None or row.schema_version != self.schema_version:
+            self.stats["misses"] += 1
+            return False, None
+        fetched = self._conn.execute(
+            "SELECT record_json FROM analysis_files WHERE name = ?", (path.name,)
+        ).fetchone()
+        if fetched is None:
+            self.stats["misses"] += 1
+            return False, None
+        try:
+            payload = json.loads(fetched[0]) if fetched[0] is not None else None
+        except ValueError:
+            self.stats["misses"] += 1
+            return False, None
+        self.stats["hits"] += 1
+        return True, payload
+
+    def upsert(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        *,
+        ticker: str | None,
+        record_payload: dict[str, Any] | None,
+        content_hash: str | None = None,
+    ) -> None:
+        """Insert or replace the row for one snapshot file."""
+        content_hash = content_hash or file_content_hash(path)
+        self._conn.execute(
+            """
+            INSERT INTO analysis_files (
+                name, mtime_ns, size, content_hash, schema_version, ticker,
+                record_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(name)
+            DO UPDATE SET
+                mtime_ns = excluded.mtime_ns,
+                size = excluded.size,
+                content_hash = excluded.content_hash,
+                schema_version = excluded.schema_version,
+                ticker = excluded.ticker,
+                record_json = excluded.record_json
+            """,
+            (
+                path.name,
+                stat.st_mtime_ns,
+                stat.st_size,
+                content_hash,
+                self.schema_version,
+                ticker,
+                json.dumps(record_payload) if record_payload is not None else None,
+            ),
+        )
+        self._rows[path.name] = AnalysisFileRow(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash,
+            schema_version=self.schema_version,
+            ticker=ticker,
+        )
+
+    def prune(self, existing_names: set[str]) -> int:
+        """Delete rows for files that no longer exist; return the count."""
+        stale = [name for name in self._rows if name not in existing_names]
+        if stale:
+            self._conn.executemany(
+                "DELETE FROM analysis_files WHERE name = ?",
+                [(name,) for name in stale],
+            )
+            for name in stale:
+                self._rows.pop(name, None)
+        return len(stale)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> AnalysisFileIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -6,12 +6,15 @@ from __future__ import annotations
 
 import fcntl
 import json
+import multiprocessing
 import os
 import re
+import sqlite3
 import tempfile
 import threading
 import time
 from collections.abc import Callable, Iterable
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -28,6 +31,7 @@ from src.fx_normalization import (
     canonical_currency_code,
     get_fx_rate_fallback,
 )
+from src.ibkr.analysis_file_index import AnalysisFileIndex
 from src.ibkr.models import AnalysisRecord, PortfolioEvidence, TradeBlockData
 from src.ibkr.order_builder import parse_trade_block
 from src.ibkr.reconciliation_rules import _exchange_from_ticker, _normalize_verdict
@@ -62,6 +66,9 @@ logger = structlog.get_logger(__name__)
 #     rendered as a fabricated "price drift 98.9% down [SELL]".
 _ANALYSIS_INDEX_VERSION = 10
 _DATA_VACUUM_COVERAGE_THRESHOLD_PCT = 40.0
+# Below this many files to parse, spawning worker processes costs more than
+# it saves.
+_MIN_PARALLEL_PARSE_FILES = 16
 
 # The TradeBlockData price fields, cleared alongside the canonical ones when a
 # record's levels are refused. `risk_reward` is deliberately excluded: it is a
@@ -739,6 +746,171 @@ def _build_analysis_record_from_file(filepath: Path) -> AnalysisRecord | None:
     return _build_analysis_record_from_data(filepath, data)
 
 
+def _open_analysis_file_index(results_dir: Path) -> AnalysisFileIndex | None:
+    """Open the per-file parse index; ``None`` (parse everything) if unavailable."""
+    try:
+        return AnalysisFileIndex.for_results_dir(
+            results_dir, schema_version=_ANALYSIS_INDEX_VERSION
+        )
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning(
+            "analysis_file_index_unavailable",
+            results_dir=str(results_dir),
+            **_safe_exception_fields(exc, operation="opening analysis file index"),
+        )
+        return None
+
+
+def _index_analysis_file(
+    file_index: AnalysisFileIndex,
+    filepath: Path,
+    stat: os.stat_result,
+    record: AnalysisRecord | None,
+) -> None:
+    """Upsert one parsed snapshot; index failures never fail the load."""
+    try:
+        file_index.upsert(
+            filepath,
+            stat,
+            ticker=record.ticker if record is not None else None,
+            record_payload=(
+                record.model_dump(mode="json") if record is not None else None
+            ),
+        )
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning(
+            "analysis_file_index_write_failed",
+            file=filepath.name,
+            **_safe_exception_fields(exc, operation="writing analysis file index"),
+        )
+
+
+def _resolve_parse_workers(parse_workers: int | None) -> int:
+    """Worker processes for a rebuild; ``0`` means one per CPU."""
+    if parse_workers is None:
+        from src.config import config
+
+        parse_workers = int(getattr(config, "analysis_parse_workers", 1))
+    if parse_workers <= 0:
+        parse_workers = os.cpu_count() or 1
+    return parse_workers
+
+
+def _plan_parallel_parses(
+    filepaths: list[Path], file_index: AnalysisFileIndex | None
+) -> list[Path]:
+    """Return the files (newest first) a rebuild will almost certainly parse.
+
+    Mirrors the merge loop's skip rules without parsing anything: a file whose
+    filename key or indexed ticker is already claimed by a newer file is left
+    out. Such files are normally skipped as duplicates; in the rare case the
+    newer file yields no record, the merge loop parses them inline.
+    """
+    claimed_keys: set[str] = set()
+    claimed_tickers: set[str] = set()
+    planned: list[Path] = []
+    for filepath in filepaths:
+        filename_key = _extract_filename_analysis_key(filepath.name)
+        if filename_key is not None:
+            if filename_key in claimed_keys:
+                continue
+            claimed_keys.add(filename_key)
+        if file_index is not None:
+            try:
+                stat = filepath.stat()
+                known_ticker = file_index.known_ticker(filepath, stat)
+                if known_ticker is not None:
+                    if known_ticker in claimed_tickers:
+                        continue
+                    claimed_tickers.add(known_ticker)
+                if file_index.is_current(filepath, stat):
+                    continue
+            except (sqlite3.Error, OSError):
+                pass
+        planned.append(filepath)
+    return planned
+
+
+def _parse_snapshot_file(filepath: Path) -> AnalysisRecord | None:
+    """Process-pool entry point for ``_build_analysis_record_from_file``."""
+    return _build_analysis_record_from_file(filepath)
+
+
+def _start_parse_pool(
+    filepaths: list[Path], *, workers: int
+) -> tuple[ProcessPoolExecutor | None, dict[Path, Future[AnalysisRecord | None]]]:
+    """Submit cold-rebuild parses to a process pool, newest file first.
+
+    Parsing is CPU-bound regex work (red flags, metrics, sector, supplemental
+    flags), so threads would serialize on the GIL. Workers are started with
+    "spawn": the caller already runs the heartbeat thread, and forking a
+    threaded process is unsafe (and crashes on macOS, see config.py).
+    """
+    if workers <= 1 or len(filepaths) < _MIN_PARALLEL_PARSE_FILES:
+        return None, {}
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(filepaths)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        futures = {
+            filepath: executor.submit(_parse_snapshot_file, filepath)
+            for filepath in filepaths
+        }
+    except (OSError, RuntimeError) as exc:
+        logger.warning(
+            "analysis_parse_pool_unavailable",
+            workers=workers,
+            **_safe_exception_fields(exc, operation="starting analysis parse pool"),
+        )
+        return None, {}
+    logger.debug(
+        "analysis_parse_pool_started",
+        workers=min(workers, len(filepaths)),
+        files=len(filepaths),
+    )
+    return executor, futures
+
+
+def _take_parsed_record(
+    prefetched: dict[Path, Future[AnalysisRecord | None]], filepath: Path
+) -> tuple[AnalysisRecord | None, bool]:
+    """Return ``(record, parsed_inline)`` for a file the merge loop needs.
+
+    Raises what ``_build_analysis_record_from_file`` raises, whether the parse
+    ran in the pool or inline.
+    """
+    future = prefetched.pop(filepath, None)
+    if future is not None:
+        try:
+            return future.result(), False
+        except BrokenExecutor as exc:
+            logger.warning(
+                "analysis_parse_pool_broken",
+                file=filepath.name,
+                **_safe_exception_fields(exc, operation="parsing analysis snapshot"),
+            )
+    return _build_analysis_record_from_file(filepath), True
+
+
+def _index_leftover_parses(
+    prefetched: dict[Path, Future[AnalysisRecord | None]],
+    file_index: AnalysisFileIndex | None,
+) -> None:
+    """Index pool results the merge skipped as duplicates, then drop them."""
+    for filepath, future in prefetched.items():
+        if file_index is None or not future.done() or future.cancelled():
+            future.cancel()
+            continue
+        try:
+            record = future.result()
+            stat = filepath.stat()
+        except Exception:  # noqa: BLE001 - duplicates only; the next rebuild retries
+            continue
+        _index_analysis_file(file_index, filepath, stat, record)
+    prefetched.clear()
+
+
 def _load_latest_analyses_from_index(
     results_dir: Path,
     *,
@@ -969,6 +1141,16 @@ def update_latest_analyses_index(
             ),
         )
         return False
+    file_index = _open_analysis_file_index(results_dir)
+    if file_index is not None:
+        with file_index:
+            source_path = Path(record.file_path)
+            try:
+                source_stat = source_path.stat()
+            except OSError:
+                pass
+            else:
+                _index_analysis_file(file_index, source_path, source_stat, record)
     logger.info(
         "analysis_index_incremental_updated",
         ticker=record.ticker,
@@ -982,8 +1164,14 @@ def load_latest_analyses(
     results_dir: Path,
     *,
     progress: Callable[[AnalysisLoadProgress], None] | None = None,
+    parse_workers: int | None = None,
 ) -> dict[str, AnalysisRecord]:
-    """Load the most recent analysis JSON for each ticker from results_dir."""
+    """Load the most recent analysis JSON for each ticker from results_dir.
+
+    A rebuild parses cache misses in ``parse_workers`` processes (default:
+    ``ANALYSIS_PARSE_WORKERS``) and merges the results newest file first, so
+    the newest file per ticker still wins.
+    """
     if not results_dir.exists():
         logger.warning("results_dir_not_found", path=str(results_dir))
         return {}
@@ -1035,75 +1223,134 @@ def load_latest_analyses(
     threading.Thread(
         target=_heartbeat_worker, daemon=True, name="index-scan-heartbeat"
     ).start()
+    # Per-file parse cache: the summary above is all-or-nothing, this is not.
+    file_index = _open_analysis_file_index(results_dir)
+    workers = _resolve_parse_workers(parse_workers)
+    executor: ProcessPoolExecutor | None = None
+    prefetched: dict[Path, Future[AnalysisRecord | None]] = {}
+    if workers > 1:
+        executor, prefetched = _start_parse_pool(
+            _plan_parallel_parses(filepaths, file_index), workers=workers
+        )
 
-    for processed_files, filepath in enumerate(filepaths, start=1):
-        heartbeat_state["file"] = filepath.name
-        heartbeat_state["n"] = processed_files
-        heartbeat_state["loaded"] = len(analyses)
-        filename_key = _extract_filename_analysis_key(filepath.name)
+    try:
+        for processed_files, filepath in enumerate(filepaths, start=1):
+            heartbeat_state["file"] = filepath.name
+            heartbeat_state["n"] = processed_files
+            heartbeat_state["loaded"] = len(analyses)
+            filename_key = _extract_filename_analysis_key(filepath.name)
+
+            def emit_progress(
+                processed_files_: int = processed_files,
+                current_file: str = filepath.name,
+            ) -> None:
+                if progress is None or not _should_emit_analysis_progress(
+                    processed_files_, total_files
+                ):
+                    return
+                progress(
+                    AnalysisLoadProgress(
+                        phase="parsing",
+                        total_files=total_files,
+                        processed_files=processed_files_,
+                        loaded_analyses=len(analyses),
+                        current_file=current_file,
+                    )
+                )
+
+            if filename_key is not None and filename_key in seen_filename_keys:
+                filename_duplicates_skipped += 1
+                emit_progress()
+                continue
+
+            stat: os.stat_result | None = None
+            cached_hit = False
+            cached_payload: dict[str, Any] | None = None
+            if file_index is not None:
+                try:
+                    stat = filepath.stat()
+                    known_ticker = file_index.known_ticker(filepath, stat)
+                    if known_ticker is not None and known_ticker in analyses:
+                        duplicate_files += 1
+                        emit_progress()
+                        continue
+                    cached_hit, cached_payload = file_index.lookup(filepath, stat)
+                except (sqlite3.Error, OSError) as exc:
+                    logger.warning(
+                        "analysis_file_index_read_failed",
+                        file=filepath.name,
+                        **_safe_exception_fields(
+                            exc, operation="reading analysis file index"
+                        ),
+                    )
+                    stat = None
 
-        def emit_progress(
-            processed_files_: int = processed_files,
-            current_file: str = filepath.name,
-        ) -> None:
-            if progress is None or not _should_emit_analysis_progress(
-                processed_files_, total_files
-            ):
-                return
-            progress(
-                AnalysisLoadProgress(
-                    phase="parsing",
-                    total_files=total_files,
-                    processed_files=processed_files_,
-                    loaded_analyses=len(analyses),
-                    current_file=current_file,
+            started = time.monotonic()
+            parsed_inline = True
+            try:
+                if cached_hit:
+                    record = (
+                        _deserialize_analysis_record(cached_payload)
+                        if cached_payload is not None
+                        else None
+                    )
+                else:
+                    record, parsed_inline = _take_parsed_record(prefetched, filepath)
+                    if file_index is not None and stat is not None:
+                        _index_analysis_file(file_index, filepath, stat, record)
+            except (json.JSONDecodeError, OSError) as exc:
+                failed_files += 1
+                logger.warning(
+                    "analysis_file_unparseable",
+                    file=filepath.name,
+                    **_safe_exception_fields(
+                        exc, operation="loading analysis snapshot"
+                    ),
+                    recommendation="delete_and_rerun_analysis",
+                )
+                emit_progress()
+                continue
+            elapsed = time.monotonic() - started
+            # Waiting on a pool worker is not a slow read of this file.
+            if parsed_inline and elapsed > 5.0:
+                logger.warning(
+                    "analysis_file_slow_read",
+                    file=filepath.name,
+                    elapsed_s=round(elapsed, 1),
+                    hint="possible_spotlight_contention",
                 )
-            )
 
-        if filename_key is not None and filename_key in seen_filename_keys:
-            filename_duplicates_skipped += 1
-            emit_progress()
-            continue
+            if record is None:
+                missing_ticker_files += 1
+                emit_progress()
+                continue
+            ticker = record.ticker
+
+            if ticker in analyses:
+                duplicate_files += 1
+                emit_progress()
+                continue
 
-        started = time.monotonic()
+            analyses[ticker] = record
+            if filename_key is not None:
+                seen_filename_keys.add(filename_key)
+            emit_progress()
+    finally:
+        heartbeat_stop.set()
+        if executor is not None:
+            _index_leftover_parses(prefetched, file_index)
+            executor.shutdown(wait=False, cancel_futures=True)
+    file_index_stats: dict[str, int] = {}
+    if file_index is not None:
         try:
-            record = _build_analysis_record_from_file(filepath)
-        except (json.JSONDecodeError, OSError) as exc:
-            failed_files += 1
+            file_index.prune({filepath.name for filepath in filepaths})
+        except sqlite3.Error as exc:
             logger.warning(
-                "analysis_file_unparseable",
-                file=filepath.name,
-                **_safe_exception_fields(exc, operation="loading analysis snapshot"),
-                recommendation="delete_and_rerun_analysis",
+                "analysis_file_index_prune_failed",
+                **_safe_exception_fields(exc, operation="pruning analysis file index"),
             )
-            emit_progress()
-            continue
-        elapsed = time.monotonic() - started
-        if elapsed > 5.0:
-            logger.warning(
-                "analysis_file_slow_read",
-                file=filepath.name,
-                elapsed_s=round(elapsed, 1),
-                hint="possible_spotlight_contention",
-            )
-
-        if record is None:
-            missing_ticker_files += 1
-            emit_progress()
-            continue
-        ticker = record.ticker
-
-        if ticker in analyses:
-            duplicate_files += 1
-            emit_progress()
-            continue
-
-        analyses[ticker] = record
-        if filename_key is not None:
-            seen_filename_keys.add(filename_key)
-        emit_progress()
-
-    heartbeat_stop.set()
+        file_index_stats = dict(file_index.stats)
+        file_index.close()
     logger.debug(
         "analyses_scan_complete",
         total_files=total_files,
@@ -1112,6 +1359,7 @@ def load_latest_analyses(
         duplicates_skipped=duplicate_files,
         filename_duplicates_skipped=filename_duplicates_skipped,
         missing_ticker=missing_ticker_files,
+        file_index=file_index_stats,
     )
     logger.info("analyses_loaded", count=len(analyses))
     _write_latest_analyses_index(results_dir, analyses, total_files=total_files)
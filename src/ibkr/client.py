@@ -50,6 +50,12 @@ _BROKERAGE_READY_TTL_S = 60.0
 # caller re-checks status inside the lock and returns without a redundant init.
 _BROKERAGE_INIT_LOCK = threading.Lock()
 
+# /iserver/marketdata/snapshot takes a comma-separated conid list; keep each
+# request within the gateway's per-request conid limit.
+_SNAPSHOT_MAX_CONIDS = 100
+_SNAPSHOT_WARM_UP_S = 0.5
+_DEFAULT_SNAPSHOT_FIELDS = "31,55,84,86,87,6004,6008,6509,7051"
+
 
 def _brief_detail(value: Any) -> str | None:
     """Normalize an IBKR status ``message``/``prompts`` field (str|list|None) to a
@@ -638,7 +644,7 @@ class IbkrClient:
         self,
         conid: int,
         *,
-        fields: str = "31,55,84,86,87,6004,6008,6509,7051",
+        fields: str = _DEFAULT_SNAPSHOT_FIELDS,
         compete: bool = False,
     ) -> dict:
         """
@@ -673,7 +679,7 @@ class IbkrClient:
             result = self._throttle.call_with_warmup(
                 preflight=_request,
                 request=_request,
-                warm_up_secs=0.5,
+                warm_up_secs=_SNAPSHOT_WARM_UP_S,
                 label="marketdata_snapshot",
             )
             data = result.data if hasattr(result, "data") else result
@@ -684,6 +690,96 @@ class IbkrClient:
             logger.debug("marketdata_snapshot_failed", conid=conid, error=str(exc))
             return {}
 
+    def get_marketdata_snapshots(
+        self,
+        conids: list[int],
+        *,
+        fields: str = _DEFAULT_SNAPSHOT_FIELDS,
+        compete: bool = False,
+        chunk_size: int = _SNAPSHOT_MAX_CONIDS,
+    ) -> dict[int, dict]:
+        """
+        Fetch market data snapshots for many contracts, keyed by conid.
+
+        Same preflight pattern as ``get_marketdata_snapshot``, amortized: every
+        chunk of up to ``chunk_size`` conids is pre-flighted, then a single
+        warm-up pause covers the whole batch before the real requests. Conids
+        missing from the response (or from a failed chunk) are simply absent.
+        """
+        unique = list(dict.fromkeys(int(conid) for conid in conids))
+        if not unique:
+            return {}
+        self._ensure_connected()
+
+        if not self.initialize_brokerage_session(compete=compete):
+            logger.debug(
+                "marketdata_snapshots_skipped_no_session",
+                conids=len(unique),
+                compete=compete,
+            )
+            return {}
+
+        snapshot_method = self._get_marketdata_snapshot_method()
+        if snapshot_method is None:
+            logger.debug("marketdata_snapshot_method_unavailable", conids=len(unique))
+            return {}
+
+        field_ids = [field.strip() for field in fields.split(",") if field.strip()]
+        size = max(1, chunk_size)
+        chunks = [unique[i : i + size] for i in range(0, len(unique), size)]
+
+        def _request(chunk: list[int]):
+            return snapshot_method(
+                conids=[str(conid) for conid in chunk], fields=field_ids
+            )
+
+        try:
+            self._call_iserver_accounts()
+            for chunk in chunks:
+                self._throttle.call(lambda chunk=chunk: _request(chunk))
+        except Exception as exc:
+            logger.debug(
+                "marketdata_snapshots_preflight_failed",
+                conids=len(unique),
+                error=str(exc),
+            )
+            return {}
+        logger.debug(
+            "ibkr_warmup",
+            label="marketdata_snapshots",
+            duration_secs=_SNAPSHOT_WARM_UP_S,
+        )
+        time.sleep(_SNAPSHOT_WARM_UP_S)
+
+        snapshots: dict[int, dict] = {}
+        for chunk in chunks:
+            try:
+                result = self._throttle.call(lambda chunk=chunk: _request(chunk))
+            except Exception as exc:
+                logger.debug(
+                    "marketdata_snapshots_chunk_failed",
+                    conids=len(chunk),
+                    error=str(exc),
+                )
+                continue
+            data = result.data if hasattr(result, "data") else result
+            for row in data if isinstance(data, list) else []:
+                if not isinstance(row, dict):
+                    continue
+                try:
+                    conid = int(row.get("conid"))
+                except (TypeError, ValueError):
+                    continue
+                if conid in chunk:
+                    snapshots[conid] = row
+        logger.debug(
+            "marketdata_snapshots_fetched",
+            requested=len(unique),
+            returned=len(snapshots),
+            chunks=len(chunks),
+        )
+        return snapshots
+
     def get_watchlist(self, name_hint: str = "default watchlist") -> list[dict] | None:
         """
         Fetch watchlist rows from IBKR.
@@ -35,10 +35,18 @@ from src.ibkr.screening_freshness import (
     ScreeningFreshnessSummary,
     load_screening_freshness,
 )
+from src.ibkr.security_data_service import IbkrSecurityDataService
 from src.ibkr.types import ProgressCallback
 
 logger = structlog.get_logger(__name__)
 
+# The refresh queue is prewarmed a window of analyses at a time, just before
+# the first analysis of each window runs, and the window's quoted probes are
+# kept for a budget per analysis; a full (non-quick) analysis takes several
+# minutes.
+_PREWARM_WINDOW_ANALYSES = 3
+_PREWARM_PROBE_TTL_PER_ANALYSIS_SECONDS = 15 * 60.0
+
 
 def _load_active_macro_events() -> list:
     """Best-effort fetch of unexpired macro events to sustain SELL demotions."""
@@ -122,8 +130,10 @@ class PortfolioRecommendationService:
         compute_portfolio_health_fn: Callable[..., list[str]] | None = None,
         run_analysis_fn: Callable[..., Awaitable[dict | None]] | None = None,
         save_results_fn: Callable[..., Path] | None = None,
+        security_data_service: IbkrSecurityDataService | None = None,
     ) -> None:
         self._portfolio_data_service = portfolio_data_service
+        self._security_data_service = security_data_service
         self._refresh_service = refresh_service or AnalysisRefreshService()
         self._load_analyses_fn = load_analyses_fn or load_latest_analyses
         self._reconcile_fn = reconcile_fn or reconcile
@@ -214,7 +224,7 @@ class PortfolioRecommendationService:
             refresh_activity = await self._refresh_service.execute(
                 refresh_activity,
                 execution=RefreshExecutionOptions(quick_mode=request.quick_mode),
-                run_analysis_fn=self._run_analysis_fn,
+                run_analysis_fn=self._prewarming_runner(refresh_activity.queued),
                 save_results_fn=self._save_results_fn,
                 progress=progress,
             )
@@ -252,6 +262,52 @@ class PortfolioRecommendationService:
             watchlist_unavailable=watchlist_unavailable,
         )
 
+    def _prewarming_runner(self, queued: list[str]):
+        """Wrap ``run_analysis_fn`` to prewarm each window of the queue.
+
+        Before the first analysis of every ``_PREWARM_WINDOW_ANALYSES``-sized
+        window, that window is batch-probed, so each analysis starts from a
+        warm IBKR probe cache instead of a per-ticker snapshot round-trip,
+        and no cached quote is older than one window of analyses when used.
+        """
+        run_analysis_fn = self._run_analysis_fn
+        window_starts = {
+            queued[index]: index
+            for index in range(0, len(queued), _PREWARM_WINDOW_ANALYSES)
+        }
+
+        async def run(*, ticker: str, **kwargs):
+            start = window_starts.get(ticker)
+            if start is not None:
+                await self._prewarm_security_probes(
+                    queued[start : start + _PREWARM_WINDOW_ANALYSES]
+                )
+            return await run_analysis_fn(ticker=ticker, **kwargs)
+
+        return run
+
+    async def _prewarm_security_probes(self, tickers: list[str]) -> None:
+        """Batch-probe *tickers*, keeping their quotes for one window.
+
+        Analyses run one after another for minutes each, so quoted probes are
+        kept for a budget per analysis in the window rather than the probe
+        cache's default TTL, which would expire them after the first.
+        """
+        if self._security_data_service is None or not tickers:
+            return
+        try:
+            await self._security_data_service.probe_securities(
+                tickers,
+                cache_ttl_secs=_PREWARM_PROBE_TTL_PER_ANALYSIS_SECONDS * len(tickers),
+            )
+        except Exception as exc:
+            from src.error_safety import summarize_exception
+
+            logger.warning(
+                "ibkr_security_probe_prewarm_failed",
+                **summarize_exception(exc, operation="security_probe_prewarm"),
+            )
+
     @staticmethod
     def _validate_watchlist_snapshot(
         snapshot: PortfolioSnapshot,
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
+from src.async_utils import run_with_hard_timeout
 from src.ibkr.client import IbkrClient
 from src.ibkr.exceptions import IBKRAPIError, IBKRAuthError, IBKRSessionConflictError
 from src.ibkr.order_builder import parse_price
@@ -20,6 +22,13 @@ from src.ibkr.ticker_mapper import (
 logger = structlog.get_logger(__name__)
 
 _PROBE_CACHE_TTL_SECONDS = 60.0
+# Ceiling for a caller-extended probe lifetime; the cached last price is
+# served as a quote for that long.
+_MAX_PROBE_CACHE_TTL_SECONDS = 60 * 60.0
+# Batch probes identify each ticker with two throttled IBKR calls before the
+# shared snapshot, so the deadline grows with the batch.
+_BATCH_PROBE_TIMEOUT_BASE_SECONDS = 30.0
+_BATCH_PROBE_TIMEOUT_PER_TICKER_SECONDS = 2.0
 _FIELD_LAST_PRICE = "31"
 _FIELD_SYMBOL = "55"
 _FIELD_BID = "84"
@@ -136,181 +145,313 @@ class IbkrSecurityDataService:
             return None
         return probe
 
-    def _set_cached_probe(self, yf_ticker: str, probe: IbkrSecurityProbe) -> None:
-        self._probe_cache[yf_ticker.upper()] = (
-            time.monotonic() + self._cache_ttl_secs,
-            probe,
-        )
+    def _set_cached_probe(
+        self,
+        yf_ticker: str,
+        probe: IbkrSecurityProbe,
+        *,
+        cache_ttl_secs: float | None = None,
+    ) -> None:
+        ttl = self._cache_ttl_secs
+        if cache_ttl_secs is not None and self._holds_quote(probe):
+            ttl = min(cache_ttl_secs, _MAX_PROBE_CACHE_TTL_SECONDS)
+        self._probe_cache[yf_ticker.upper()] = (time.monotonic() + ttl, probe)
 
-    def _probe_security_sync(self, yf_ticker: str) -> IbkrSecurityProbe:
-        config = self._resolve_config()
-        if not config.is_configured():
-            if not self._not_configured_logged:
-                logger.info("ibkr_security_probe_unavailable", reason="not_configured")
-                self._not_configured_logged = True
-            return IbkrSecurityProbe(
-                configured=False,
-                requested_ticker=yf_ticker,
-                identity_confidence="UNVERIFIED",
-                error_kind="NOT_CONFIGURED",
-            )
+    async def probe_securities(
+        self,
+        yf_tickers: Iterable[str],
+        *,
+        cache_ttl_secs: float | None = None,
+    ) -> dict[str, IbkrSecurityProbe]:
+        """Probe many tickers, sharing one batched market-data snapshot.
+
+        Cached probes are reused; the rest are identified one by one (conid
+        search + contract info) and then snapshotted together, so a portfolio
+        of N names pays one snapshot preflight/warm-up instead of N. Every
+        result lands in the probe cache, so later ``probe_security`` calls for
+        these tickers are served from it. If the batch overruns its deadline
+        the uncached tickers are left out and callers fall back to
+        ``probe_security``. ``cache_ttl_secs`` extends the cache lifetime
+        (capped at an hour) of newly probed VERIFIED results that carry a
+        snapshot quote, for prewarming ahead of a long batch of work; failed,
+        unverified and quote-less probes keep the default TTL so they are
+        retried soon.
+        """
+        results: dict[str, IbkrSecurityProbe] = {}
+        missing: list[str] = []
+        for yf_ticker in dict.fromkeys(yf_tickers):
+            cached = self._get_cached_probe(yf_ticker)
+            if cached is not None:
+                results[yf_ticker] = cached
+            else:
+                missing.append(yf_ticker)
+        if missing:
+            try:
+                probes = await run_with_hard_timeout(
+                    asyncio.to_thread(self._probe_securities_sync, missing),
+                    timeout=_BATCH_PROBE_TIMEOUT_BASE_SECONDS
+                    + _BATCH_PROBE_TIMEOUT_PER_TICKER_SECONDS * len(missing),
+                    label="ibkr_security_probe_batch",
+                )
+            except TimeoutError:
+                logger.warning(
+                    "ibkr_security_probe_batch_timeout", tickers=len(missing)
+                )
+                return results
+            for yf_ticker, probe in probes.items():
+                self._set_cached_probe(yf_ticker, probe, cache_ttl_secs=cache_ttl_secs)
+                results[yf_ticker] = probe
+        return results
 
+    def _acquire_client(self, config) -> IbkrClient:
         # Reuse the process-wide pooled connection instead of a fresh OAuth
         # handshake per probe (which minted many never-logged-out sessions).
         manager = get_ibkr_session_manager()
         manager.configure(client_cls=self._client_cls, config=config)
-        try:
-            client = manager.acquire()
-            symbol, expected_exchange = yf_to_ibkr_format(yf_ticker)
-            raw_candidates = client.stock_conid_by_symbol(
-                symbol, default_filtering=False
-            )
-            candidates = self._extract_candidates(raw_candidates, symbol)
-            candidate, confidence = self._select_candidate(
-                candidates, expected_exchange
-            )
+        return manager.acquire()
+
+    def _not_configured_probe(self, yf_ticker: str) -> IbkrSecurityProbe:
+        if not self._not_configured_logged:
+            logger.info("ibkr_security_probe_unavailable", reason="not_configured")
+            self._not_configured_logged = True
+        return IbkrSecurityProbe(
+            configured=False,
+            requested_ticker=yf_ticker,
+            identity_confidence="UNVERIFIED",
+            error_kind="NOT_CONFIGURED",
+        )
 
-            if candidate is None:
-                error_kind = "NO_MATCH" if not candidates else "AMBIGUOUS"
-                return IbkrSecurityProbe(
-                    configured=True,
-                    requested_ticker=yf_ticker,
-                    identity_confidence=confidence,
-                    error_kind=error_kind,
-                )
+    @staticmethod
+    def _holds_quote(probe: IbkrSecurityProbe) -> bool:
+        return (
+            probe.identity_confidence == "VERIFIED"
+            and probe.error_kind is None
+            and probe.last_price is not None
+        )
 
-            conid = self._to_int(candidate.get("conid"))
-            if conid is None:
-                return IbkrSecurityProbe(
-                    configured=True,
-                    requested_ticker=yf_ticker,
-                    identity_confidence="UNVERIFIED",
-                    error_kind="NO_MATCH",
+    @staticmethod
+    def _snapshot_ready(probe: IbkrSecurityProbe) -> bool:
+        return (
+            probe.identity_confidence == "VERIFIED" and probe.resolved_conid is not None
+        )
+
+    def _probe_security_sync(self, yf_ticker: str) -> IbkrSecurityProbe:
+        config = self._resolve_config()
+        if not config.is_configured():
+            return self._not_configured_probe(yf_ticker)
+
+        try:
+            client = self._acquire_client(config)
+            probe = self._identify_security(client, yf_ticker)
+            if self._snapshot_ready(probe):
+                snapshot = client.get_marketdata_snapshot(
+                    probe.resolved_conid, fields=_SNAPSHOT_REQUEST_FIELDS, compete=False
                 )
+                self._apply_snapshot(probe, snapshot)
+            return probe
+        except Exception as exc:
+            return self._error_probe(yf_ticker, exc)
 
-            info = client.get_contract_info(conid, compete=False)
-            exchange = self._first_non_empty(
-                info.get("exchange"),
-                candidate.get("exchange"),
-            )
-            listing_exchange = self._first_non_empty(
-                info.get("primaryExch"),
-                info.get("listingExchange"),
-                exchange,
-            )
-            currency = self._first_non_empty(
-                info.get("currency"),
-                candidate.get("currency"),
-            )
-            resolved_symbol = self._first_non_empty(
-                info.get("symbol"),
-                candidate.get("symbol"),
-                symbol,
-            )
-            company_name = self._first_non_empty(
-                info.get("companyName"),
-                info.get("longName"),
-                info.get("name"),
+    def _probe_securities_sync(
+        self, yf_tickers: list[str]
+    ) -> dict[str, IbkrSecurityProbe]:
+        config = self._resolve_config()
+        if not config.is_configured():
+            return {
+                yf_ticker: self._not_configured_probe(yf_ticker)
+                for yf_ticker in yf_tickers
+            }
+
+        try:
+            client = self._acquire_client(config)
+        except Exception as exc:
+            return {
+                yf_ticker: self._error_probe(yf_ticker, exc) for yf_ticker in yf_tickers
+            }
+
+        probes: dict[str, IbkrSecurityProbe] = {}
+        for yf_ticker in yf_tickers:
+            try:
+                probes[yf_ticker] = self._identify_security(client, yf_ticker)
+            except Exception as exc:
+                probes[yf_ticker] = self._error_probe(yf_ticker, exc)
+
+        by_conid: dict[int, list[str]] = {}
+        for yf_ticker, probe in probes.items():
+            if self._snapshot_ready(probe):
+                by_conid.setdefault(probe.resolved_conid, []).append(yf_ticker)
+        if not by_conid:
+            return probes
+
+        try:
+            snapshots = client.get_marketdata_snapshots(
+                list(by_conid), fields=_SNAPSHOT_REQUEST_FIELDS, compete=False
             )
-            resolved_yf_ticker = ibkr_symbol_to_yf(
-                resolved_symbol or symbol,
-                listing_exchange or exchange or "",
-                currency or "",
+        except Exception as exc:
+            for tickers in by_conid.values():
+                for yf_ticker in tickers:
+                    probes[yf_ticker] = self._error_probe(yf_ticker, exc)
+            return probes
+
+        for conid, tickers in by_conid.items():
+            for yf_ticker in tickers:
+                self._apply_snapshot(probes[yf_ticker], snapshots.get(conid) or {})
+        logger.debug(
+            "ibkr_security_probe_batch",
+            tickers=len(yf_tickers),
+            snapshot_conids=len(by_conid),
+            snapshots_returned=len(snapshots),
+        )
+        return probes
+
+    def _identify_security(
+        self, client: IbkrClient, yf_ticker: str
+    ) -> IbkrSecurityProbe:
+        """Resolve the conid and contract identity; no market data yet."""
+        symbol, expected_exchange = yf_to_ibkr_format(yf_ticker)
+        raw_candidates = client.stock_conid_by_symbol(symbol, default_filtering=False)
+        candidates = self._extract_candidates(raw_candidates, symbol)
+        candidate, confidence = self._select_candidate(candidates, expected_exchange)
+
+        if candidate is None:
+            error_kind = "NO_MATCH" if not candidates else "AMBIGUOUS"
+            return IbkrSecurityProbe(
+                configured=True,
+                requested_ticker=yf_ticker,
+                identity_confidence=confidence,
+                error_kind=error_kind,
             )
 
-            probe = IbkrSecurityProbe(
+        conid = self._to_int(candidate.get("conid"))
+        if conid is None:
+            return IbkrSecurityProbe(
                 configured=True,
                 requested_ticker=yf_ticker,
-                identity_confidence=confidence,
-                resolved_conid=conid,
-                resolved_symbol=resolved_symbol,
-                resolved_yf_ticker=resolved_yf_ticker,
-                company_name=company_name,
-                listing_exchange=listing_exchange,
-                exchange=exchange,
-                currency=currency,
-                is_tradeable=self._to_bool(
-                    info.get("tradeable"),
-                    info.get("isTradeable"),
-                ),
-                used_brokerage_session=bool(info),
+                identity_confidence="UNVERIFIED",
+                error_kind="NO_MATCH",
             )
 
-            if confidence != "VERIFIED":
-                return probe
+        info = client.get_contract_info(conid, compete=False)
+        exchange = self._first_non_empty(
+            info.get("exchange"),
+            candidate.get("exchange"),
+        )
+        listing_exchange = self._first_non_empty(
+            info.get("primaryExch"),
+            info.get("listingExchange"),
+            exchange,
+        )
+        currency = self._first_non_empty(
+            info.get("currency"),
+            candidate.get("currency"),
+        )
+        resolved_symbol = self._first_non_empty(
+            info.get("symbol"),
+            candidate.get("symbol"),
+            symbol,
+        )
+        company_name = self._first_non_empty(
+            info.get("companyName"),
+            info.get("longName"),
+            info.get("name"),
+        )
+        resolved_yf_ticker = ibkr_symbol_to_yf(
+            resolved_symbol or symbol,
+            listing_exchange or exchange or "",
+            currency or "",
+        )
+
+        probe = IbkrSecurityProbe(
+            configured=True,
+            requested_ticker=yf_ticker,
+            identity_confidence=confidence,
+            resolved_conid=conid,
+            resolved_symbol=resolved_symbol,
+            resolved_yf_ticker=resolved_yf_ticker,
+            company_name=company_name,
+            listing_exchange=listing_exchange,
+            exchange=exchange,
+            currency=currency,
+            is_tradeable=self._to_bool(
+                info.get("tradeable"),
+                info.get("isTradeable"),
+            ),
+            used_brokerage_session=bool(info),
+        )
 
+        if confidence == "VERIFIED":
             cache_conid_mapping(
                 resolved_yf_ticker,
                 conid,
                 resolved_symbol or symbol,
                 listing_exchange or exchange or "",
             )
+        return probe
 
-            snapshot = client.get_marketdata_snapshot(
-                conid, fields=_SNAPSHOT_REQUEST_FIELDS, compete=False
-            )
-            if snapshot:
-                probe.used_brokerage_session = True
-                probe.market_data_availability = self._first_non_empty(
-                    snapshot.get(_FIELD_MARKET_DATA_AVAILABILITY),
-                    probe.market_data_availability,
-                )
-                probe.company_name = self._first_non_empty(
-                    snapshot.get(_FIELD_COMPANY_NAME),
-                    probe.company_name,
-                )
-                probe.resolved_symbol = self._first_non_empty(
-                    snapshot.get(_FIELD_SYMBOL),
-                    probe.resolved_symbol,
-                )
-                probe.exchange = self._first_non_empty(
-                    snapshot.get(_FIELD_EXCHANGE),
-                    probe.exchange,
-                )
-                probe.last_price = self._snapshot_number(
-                    snapshot.get(_FIELD_LAST_PRICE)
-                )
-                probe.bid = self._snapshot_number(snapshot.get(_FIELD_BID))
-                probe.ask = self._snapshot_number(snapshot.get(_FIELD_ASK))
-                probe.volume = self._snapshot_number(snapshot.get(_FIELD_VOLUME))
-                probe.market_cap = self._snapshot_number(
-                    snapshot.get(_FIELD_MARKET_CAP)
-                )
-                probe.trailing_pe = self._snapshot_number(snapshot.get(_FIELD_PE))
-                probe.eps = self._snapshot_number(snapshot.get(_FIELD_EPS))
-                probe.dividend_yield = self._snapshot_number(
-                    snapshot.get(_FIELD_DIVIDEND_YIELD)
-                )
-                probe.fifty_two_week_high = self._snapshot_number(
-                    snapshot.get(_FIELD_FIFTY_TWO_WEEK_HIGH)
-                )
-                probe.fifty_two_week_low = self._snapshot_number(
-                    snapshot.get(_FIELD_FIFTY_TWO_WEEK_LOW)
-                )
-                probe.fundamentals_status = (
-                    "OK"
-                    if any(
-                        value is not None
-                        for value in (
-                            probe.trailing_pe,
-                            probe.eps,
-                            probe.market_cap,
-                            probe.dividend_yield,
-                            probe.fifty_two_week_high,
-                            probe.fifty_two_week_low,
-                        )
-                    )
-                    else "NO_FIELDS"
+    def _apply_snapshot(
+        self, probe: IbkrSecurityProbe, snapshot: dict[str, Any]
+    ) -> None:
+        """Fold a market-data snapshot into a VERIFIED probe (no-op when empty)."""
+        if not snapshot:
+            return
+        probe.used_brokerage_session = True
+        probe.market_data_availability = self._first_non_empty(
+            snapshot.get(_FIELD_MARKET_DATA_AVAILABILITY),
+            probe.market_data_availability,
+        )
+        probe.company_name = self._first_non_empty(
+            snapshot.get(_FIELD_COMPANY_NAME),
+            probe.company_name,
+        )
+        probe.resolved_symbol = self._first_non_empty(
+            snapshot.get(_FIELD_SYMBOL),
+            probe.resolved_symbol,
+        )
+        probe.exchange = self._first_non_empty(
+            snapshot.get(_FIELD_EXCHANGE),
+            probe.exchange,
+        )
+        probe.last_price = self._snapshot_number(snapshot.get(_FIELD_LAST_PRICE))
+        probe.bid = self._snapshot_number(snapshot.get(_FIELD_BID))
+        probe.ask = self._snapshot_number(snapshot.get(_FIELD_ASK))
+        probe.volume = self._snapshot_number(snapshot.get(_FIELD_VOLUME))
+        probe.market_cap = self._snapshot_number(snapshot.get(_FIELD_MARKET_CAP))
+        probe.trailing_pe = self._snapshot_number(snapshot.get(_FIELD_PE))
+        probe.eps = self._snapshot_number(snapshot.get(_FIELD_EPS))
+        probe.dividend_yield = self._snapshot_number(
+            snapshot.get(_FIELD_DIVIDEND_YIELD)
+        )
+        probe.fifty_two_week_high = self._snapshot_number(
+            snapshot.get(_FIELD_FIFTY_TWO_WEEK_HIGH)
+        )
+        probe.fifty_two_week_low = self._snapshot_number(
+            snapshot.get(_FIELD_FIFTY_TWO_WEEK_LOW)
+        )
+        probe.fundamentals_status = (
+            "OK"
+            if any(
+                value is not None
+                for value in (
+                    probe.trailing_pe,
+                    probe.eps,
+                    probe.market_cap,
+                    probe.dividend_yield,
+                    probe.fifty_two_week_high,
+                    probe.fifty_two_week_low,
                 )
-                if probe.resolved_symbol:
-                    probe.resolved_yf_ticker = ibkr_symbol_to_yf(
-                        probe.resolved_symbol,
-                        probe.listing_exchange or probe.exchange or "",
-                        probe.currency or "",
-                    )
+            )
+            else "NO_FIELDS"
+        )
+        if probe.resolved_symbol:
+            probe.resolved_yf_ticker = ibkr_symbol_to_yf(
+                probe.resolved_symbol,
+                probe.listing_exchange or probe.exchange or "",
+                probe.currency or "",
+            )
 
-            return probe
-        except IBKRSessionConflictError as exc:
+    @staticmethod
+    def _error_probe(yf_ticker: str, exc: Exception) -> IbkrSecurityProbe:
+        if isinstance(exc, IBKRSessionConflictError):
             return IbkrSecurityProbe(
                 configured=True,
                 requested_ticker=yf_ticker,
@@ -318,7 +459,7 @@ class IbkrSecurityDataService:
                 error_kind="SESSION_CONFLICT",
                 error_message=str(exc),
             )
-        except IBKRAuthError as exc:
+        if isinstance(exc, IBKRAuthError):
             return IbkrSecurityProbe(
                 configured=True,
                 requested_ticker=yf_ticker,
@@ -326,7 +467,7 @@ class IbkrSecurityDataService:
                 error_kind="AUTH",
                 error_message=str(exc),
             )
-        except IBKRAPIError as exc:
+        if isinstance(exc, IBKRAPIError):
             error_text = str(exc)
             return IbkrSecurityProbe(
                 configured=True,
@@ -335,15 +476,14 @@ class IbkrSecurityDataService:
                 error_kind="RATE_LIMIT" if "429" in error_text else "API_ERROR",
                 error_message=error_text,
             )
-        except Exception as exc:
-            logger.debug("ibkr_security_probe_failed", ticker=yf_ticker, error=str(exc))
-            return IbkrSecurityProbe(
-                configured=True,
-                requested_ticker=yf_ticker,
-                identity_confidence="UNVERIFIED",
-                error_kind="API_ERROR",
-                error_message=str(exc),
-            )
+        logger.debug("ibkr_security_probe_failed", ticker=yf_ticker, error=str(exc))
+        return IbkrSecurityProbe(
+            configured=True,
+            requested_ticker=yf_ticker,
+            identity_confidence="UNVERIFIED",
+            error_kind="API_ERROR",
+            error_message=str(exc),
+        )
 
     @staticmethod
     def _extract_candidates(raw_candidates: dict[str, Any], symbol: str) -> list[dict]:
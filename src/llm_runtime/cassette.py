@@ -0,0 +1,466 @@
+"""Record/replay cassettes for chat-model calls and tool results.
+
+With ``LLM_CASSETTE_MODE=record`` every chat model built by
+``build_model_for_seat`` is wrapped so its responses are appended to
+``LLM_CASSETTE_DIR/chat.jsonl`` (keyed by seat, prompt hash and message
+digest), and every ``TOOL_SERVICE`` result is appended to ``tools.jsonl``.
+With ``LLM_CASSETTE_MODE=replay`` the same construction path returns a model
+that serves the recorded responses without building a provider client, and
+tools return their recorded results, so the full graph (reducers, validators,
+inspection hooks, report generation) runs offline at full speed.
+
+Replay sleeps ``LLM_CASSETTE_LATENCY_SCALE`` times the recorded latency
+(0 = no delay). Digests mask ISO dates, so a cassette recorded on one day
+still matches prompts built on another. When no exact match exists, replay
+falls back to the next unused recording for the same seat (or tool) in
+recorded order, unless ``LLM_CASSETTE_STRICT`` is set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import structlog
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import ConfigDict
+
+from src.eval.prompt_digest import stable_digest
+
+logger = structlog.get_logger(__name__)
+
+CassetteMode = Literal["off", "record", "replay"]
+
+CHAT_FILE = "chat.jsonl"
+TOOLS_FILE = "tools.jsonl"
+_ISO_DATE = re.compile(r"\b\d{4}-\d{2}-\d{2}(?:[T ][0-9:.+Z-]+)?\b")
+
+
+class CassetteMissError(LookupError):
+    """Replay found no recording for a chat request or tool call."""
+
+
+def _mask_dates(value: Any) -> Any:
+    if isinstance(value, str):
+        return _ISO_DATE.sub("<date>", value)
+    if isinstance(value, dict):
+        return {key: _mask_dates(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_mask_dates(item) for item in value]
+    return value
+
+
+def _digest(payload: Any) -> str:
+    return stable_digest(_mask_dates(payload)).removeprefix("sha256:")[:24]
+
+
+def _message_view(message: BaseMessage) -> dict[str, Any]:
+    """The digestible part of a message: ids and provider metadata excluded."""
+    view: dict[str, Any] = {"type": message.type, "content": message.content}
+    if message.name:
+        view["name"] = message.name
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        view["tool_calls"] = [
+            {"name": call["name"], "args": call["args"]} for call in tool_calls
+        ]
+    return view
+
+
+def chat_request_key(
+    seat: str, messages: Sequence[BaseMessage], tool_names: Sequence[str] = ()
+) -> tuple[str, str, str]:
+    """Return ``(key, prompt_hash, message_digest)`` for one chat request."""
+    system = [m.content for m in messages if m.type == "system"]
+    prompt_hash = _digest(system)
+    message_digest = _digest(
+        {"messages": [_message_view(m) for m in messages], "tools": list(tool_names)}
+    )
+    return f"{seat}:{prompt_hash}:{message_digest}", prompt_hash, message_digest
+
+
+def tool_call_key(name: str, args: dict[str, Any]) -> str:
+    return f"{name}:{_digest(args)}"
+
+
+@dataclass
+class _Recording:
+    key: str
+    group: str
+    payload: Any
+    latency_seconds: float
+    used: bool = False
+
+
+class _RecordingSet:
+    """Recordings from one JSONL file, indexed by exact key and by group."""
+
+    def __init__(self, path: Path) -> None:
+        self._by_key: dict[str, list[_Recording]] = {}
+        self._by_group: dict[str, list[_Recording]] = {}
+        self._lock = threading.Lock()
+        if not path.exists():
+            return
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                recording = _Recording(
+                    key=row["key"],
+                    group=row["group"],
+                    payload=row["payload"],
+                    latency_seconds=float(row.get("latency_seconds") or 0.0),
+                )
+                self._by_key.setdefault(recording.key, []).append(recording)
+                self._by_group.setdefault(recording.group, []).append(recording)
+
+    def take(self, key: str, group: str, *, strict: bool) -> tuple[_Recording, bool]:
+        """Return ``(recording, exact)``; raises ``CassetteMissError``."""
+        with self._lock:
+            exact = self._by_key.get(key, [])
+            for recording in exact:
+                if not recording.used:
+                    recording.used = True
+                    return recording, True
+            if exact:
+                # More identical requests than were recorded (e.g. a retry):
+                # keep answering with the last recorded response.
+                return exact[-1], True
+            if not strict:
+                for recording in self._by_group.get(group, []):
+                    if not recording.used:
+                        recording.used = True
+                        return recording, False
+        raise CassetteMissError(f"no cassette recording for {key}")
+
+
+class LLMCassette:
+    """One cassette directory in record or replay mode."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        mode: Literal["record", "replay"],
+        latency_scale: float = 0.0,
+        strict: bool = False,
+    ) -> None:
+        self.root = Path(root)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self._write_lock = threading.Lock()
+        self.stats = {"recorded": 0, "replayed": 0, "fuzzy": 0}
+        if mode == "record":
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._chat: _RecordingSet | None = None
+            self._tools: _RecordingSet | None = None
+        else:
+            self._chat = _RecordingSet(self.root / CHAT_FILE)
+            self._tools = _RecordingSet(self.root / TOOLS_FILE)
+
+    @classmethod
+    def from_config(cls, settings: Any) -> LLMCassette | None:
+        """Return the configured cassette, or ``None`` when the mode is off."""
+        mode = getattr(settings, "llm_cassette_mode", "off")
+        if mode not in ("record", "replay"):
+            return None
+        return cls(
+            Path(settings.llm_cassette_dir),
+            mode=mode,
+            latency_scale=float(settings.llm_cassette_latency_scale),
+            strict=bool(settings.llm_cassette_strict),
+        )
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _append(self, filename: str, row: dict[str, Any]) -> None:
+        line = json.dumps(row, default=str, sort_keys=True)
+        with self._write_lock:
+            with open(self.root / filename, "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+            self.stats["recorded"] += 1
+
+    def _take(
+        self, recordings: _RecordingSet | None, key: str, group: str
+    ) -> _Recording:
+        if recordings is None:
+            raise RuntimeError("cassette is not in replay mode")
+        recording, exact = recordings.take(key, group, strict=self.strict)
+        self.stats["replayed"] += 1
+        if not exact:
+            self.stats["fuzzy"] += 1
+            logger.debug("llm_cassette_fuzzy_match", key=key, matched=recording.key)
+        return recording
+
+    def _delay(self, recording: _Recording) -> float:
+        return recording.latency_seconds * self.latency_scale
+
+    # --- chat -----------------------------------------------------------
+
+    def record_chat(
+        self,
+        seat: str,
+        messages: Sequence[BaseMessage],
+        tool_names: Sequence[str],
+        response: BaseMessage,
+        latency_seconds: float,
+    ) -> None:
+        key, prompt_hash, message_digest = chat_request_key(seat, messages, tool_names)
+        self._append(
+            CHAT_FILE,
+            {
+                "key": key,
+                "group": seat,
+                "prompt_hash": prompt_hash,
+                "message_digest": message_digest,
+                "latency_seconds": round(latency_seconds, 4),
+                "payload": message_to_dict(response),
+            },
+        )
+
+    def replay_chat(
+        self,
+        seat: str,
+        messages: Sequence[BaseMessage],
+        tool_names: Sequence[str],
+    ) -> tuple[BaseMessage, float]:
+        """Return the recorded response and the synthetic delay to apply."""
+        key, _, _ = chat_request_key(seat, messages, tool_names)
+        recording = self._take(self._chat, key, seat)
+        return messages_from_dict([recording.payload])[0], self._delay(recording)
+
+    def record_structured(
+        self, seat: str, schema: str, messages: Sequence[BaseMessage], value: Any
+    ) -> None:
+        key, prompt_hash, message_digest = chat_request_key(
+            seat, messages, (f"structured:{schema}",)
+        )
+        payload = (
+            value.model_dump(mode="json") if hasattr(value, "model_dump") else value
+        )
+        self._append(
+            CHAT_FILE,
+            {
+                "key": key,
+                "group": f"{seat}:structured:{schema}",
+                "prompt_hash": prompt_hash,
+                "message_digest": message_digest,
+                "latency_seconds": 0.0,
+                "payload": payload,
+            },
+        )
+
+    def replay_structured(
+        self, seat: str, schema: str, messages: Sequence[BaseMessage]
+    ) -> Any:
+        key, _, _ = chat_request_key(seat, messages, (f"structured:{schema}",))
+        return self._take(self._chat, key, f"{seat}:structured:{schema}").payload
+
+    # --- tools ----------------------------------------------------------
+
+    def wrap_tool_runner(
+        self,
+        name: str,
+        runner: Callable[[dict[str, Any]], Awaitable[Any]],
+    ) -> Callable[[dict[str, Any]], Awaitable[Any]]:
+        """Return a runner that records or replays this tool's results."""
+
+        async def recording_runner(args: dict[str, Any]) -> Any:
+            started = time.monotonic()
+            value = await runner(args)
+            self._append(
+                TOOLS_FILE,
+                {
+                    "key": tool_call_key(name, args),
+                    "group": name,
+                    "latency_seconds": round(time.monotonic() - started, 4),
+                    "payload": value,
+                },
+            )
+            return value
+
+        async def replaying_runner(args: dict[str, Any]) -> Any:
+            recording = self._take(self._tools, tool_call_key(name, args), name)
+            delay = self._delay(recording)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return recording.payload
+
+        return replaying_runner if self.replaying else recording_runner
+
+
+def _tool_name(tool: Any) -> str:
+    if isinstance(tool, dict):
+        return str(tool.get("name") or tool.get("function", {}).get("name"))
+    return str(getattr(tool, "name", None) or getattr(tool, "__name__", tool))
+
+
+class CassetteChatModel(BaseChatModel):
+    """Chat model that records through ``inner`` or replays without it."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, protected_namespaces=())
+
+    seat: str
+    cassette: Any
+    inner: Any = None
+    model_name: str | None = None
+    tool_names: tuple[str, ...] = ()
+
+    @property
+    def _llm_type(self) -> str:
+        return "cassette"
+
+    def _result(self, message: BaseMessage) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.cassette.replaying:
+            message, delay = self.cassette.replay_chat(
+                self.seat, messages, self.tool_names
+            )
+            if delay > 0:
+                time.sleep(delay)
+            return self._result(message)
+        started = time.monotonic()
+        message = self.inner.invoke(messages, stop=stop, **kwargs)
+        self.cassette.record_chat(
+            self.seat, messages, self.tool_names, message, time.monotonic() - started
+        )
+        return self._result(message)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.cassette.replaying:
+            message, delay = self.cassette.replay_chat(
+                self.seat, messages, self.tool_names
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return self._result(message)
+        started = time.monotonic()
+        message = await self.inner.ainvoke(messages, stop=stop, **kwargs)
+        self.cassette.record_chat(
+            self.seat, messages, self.tool_names, message, time.monotonic() - started
+        )
+        return self._result(message)
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> CassetteChatModel:
+        names = tuple(_tool_name(tool) for tool in tools)
+        inner = self.inner.bind_tools(tools, **kwargs) if self.inner else None
+        return self.model_copy(update={"inner": inner, "tool_names": names})
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> Any:
+        schema_name = getattr(schema, "__name__", str(schema))
+        cassette, seat = self.cassette, self.seat
+
+        def as_messages(value: Any) -> list[BaseMessage]:
+            return self._convert_input(value).to_messages()
+
+        def restore(payload: Any) -> Any:
+            validate = getattr(schema, "model_validate", None)
+            return validate(payload) if callable(validate) else payload
+
+        if cassette.replaying:
+
+            def replay(value: Any) -> Any:
+                messages = as_messages(value)
+                return restore(cassette.replay_structured(seat, schema_name, messages))
+
+            async def areplay(value: Any) -> Any:
+                return replay(value)
+
+            return RunnableLambda(replay, afunc=areplay)
+
+        structured = self.inner.with_structured_output(schema, **kwargs)
+
+        def record(value: Any) -> Any:
+            result = structured.invoke(value)
+            cassette.record_structured(seat, schema_name, as_messages(value), result)
+            return result
+
+        async def arecord(value: Any) -> Any:
+            result = await structured.ainvoke(value)
+            cassette.record_structured(seat, schema_name, as_messages(value), result)
+            return result
+
+        return RunnableLambda(record, afunc=arecord)
+
+
+def wrap_seat_model(
+    seat: str,
+    model: BaseChatModel | None,
+    *,
+    cassette: LLMCassette,
+    model_name: str | None = None,
+    callbacks: Sequence[Any] = (),
+) -> BaseChatModel | None:
+    """Wrap a freshly built seat model (record) or stand in for it (replay)."""
+    if cassette.replaying:
+        return CassetteChatModel(
+            seat=seat,
+            cassette=cassette,
+            model_name=model_name,
+            callbacks=list(callbacks) or None,
+        )
+    if model is None:
+        return None
+    return CassetteChatModel(
+        seat=seat,
+        cassette=cassette,
+        inner=model,
+        model_name=model_name,
+    )
+
+
+_cassette_instance: LLMCassette | None = None
+_cassette_resolved = False
+
+
+def active_cassette() -> LLMCassette | None:
+    """Return the process-wide cassette, or ``None`` when the mode is off."""
+    global _cassette_instance, _cassette_resolved
+    if not _cassette_resolved:
+        from src.config import config
+
+        _cassette_instance = LLMCassette.from_config(config)
+        _cassette_resolved = True
+    return _cassette_instance
+
+
+def configure_cassette(cassette: LLMCassette | None) -> None:
+    """Install *cassette* process-wide (benchmarks, tests); ``None`` disables."""
+    global _cassette_instance, _cassette_resolved
+    _cassette_instance = cassette
+    _cassette_resolved = True
+
+
+def reset_cassette_for_tests() -> None:
+    """Forget the process-wide cassette so the next call re-reads config."""
+    global _cassette_instance, _cassette_resolved
+    _cassette_instance = None
+    _cassette_resolved = False
@@ -255,7 +255,56 @@ def _default_legacy_builder(request: LegacySeatRequest) -> BaseChatModel | None:
     return build_legacy_model(request)
 
 
+@dataclass(frozen=True)
+class _ReplayStandIn:
+    """What replay "builds" instead of a provider client."""
+
+    model_name: str | None
+
+
+class _ReplayFactory(SeatModelFactory):
+    def build(self, request: SeatModelRequest) -> Any:
+        return _ReplayStandIn(request.binding.model)
+
+
+def _replay_legacy(request: LegacySeatRequest) -> Any:
+    return _ReplayStandIn(request.resolved_model)
+
+
 def build_model_for_seat(
+    seat_id: SeatId,
+    **kwargs: Any,
+) -> BaseChatModel | None:
+    """Construct one fresh client from a canonical seat binding.
+
+    With an active record/replay cassette (``LLM_CASSETTE_MODE``) the client
+    is wrapped to record its responses, or replaced by one that replays them.
+    """
+    from src.llm_runtime.cassette import active_cassette, wrap_seat_model
+
+    cassette = active_cassette()
+    if cassette is None:
+        return _build_model_for_seat(seat_id, **kwargs)
+    if cassette.replaying:
+        # Keep disabled seats disabled, but never build a provider client.
+        kwargs = {
+            **kwargs,
+            "factory": _ReplayFactory(),
+            "legacy_builder": _replay_legacy,
+        }
+    model = _build_model_for_seat(seat_id, **kwargs)
+    if model is None:
+        return None
+    return wrap_seat_model(
+        seat_id.value,
+        model,
+        cassette=cassette,
+        model_name=getattr(model, "model_name", None),
+        callbacks=kwargs.get("callbacks", ()),
+    )
+
+
+def _build_model_for_seat(
     seat_id: SeatId,
     *,
     settings: Settings = config,
@@ -268,8 +317,6 @@ def build_model_for_seat(
     model_override: str | None = None,
     legacy_builder: LegacyBuilder | None = None,
 ) -> BaseChatModel | None:
-    """Construct one fresh client from a canonical seat binding."""
-
     resolved_plan = plan or resolve_binding_plan(settings)
     callback_list = list(callbacks)
     status = resolved_plan.status_for(seat_id, quick_mode=quick_mode)
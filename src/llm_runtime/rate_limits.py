@@ -1,11 +1,14 @@
 """Provider-neutral application rate-limit construction and fallback ownership."""
 
+from functools import cache
 from threading import Lock
 from typing import Any
 
 import structlog
 from langchain_core.rate_limiters import BaseRateLimiter, InMemoryRateLimiter
 
+from src.run_profiler import profile_span
+
 logger = structlog.get_logger(__name__)
 
 _PROVIDER_RPM_FIELDS = {
@@ -21,25 +24,79 @@ _FALLBACK_LIMITERS: dict[tuple[str, str | None, int], BaseRateLimiter] = {}
 _FALLBACK_LIMITERS_LOCK = Lock()
 
 
-def create_process_rate_limiter(rpm: int) -> InMemoryRateLimiter:
-    """Create one independently owned limiter from a provider RPM ceiling."""
+def create_process_rate_limiter(
+    rpm: int,
+    *,
+    vendor_id: str = "google",
+    endpoint_host: str | None = None,
+) -> BaseRateLimiter:
+    """Create one limiter from a provider RPM ceiling.
+
+    When ``SHARED_RATE_LIMIT_DB_PATH`` is set the bucket for
+    ``(vendor_id, endpoint_host)`` is shared with every other process using the
+    same file; otherwise the limiter is independently owned by this process.
+    """
 
     safety_factor = 0.8
     requests_per_second = (rpm / 60.0) * safety_factor
     max_bucket_size = max(5, int(rpm * 0.1))
+    shared_db_path = _shared_rate_limit_db_path()
     logger.info(
         "rate_limiter_configured",
         rpm=rpm,
         rps=round(requests_per_second, 2),
         max_bucket=max_bucket_size,
+        vendor_id=vendor_id,
+        shared=shared_db_path is not None,
     )
-    return InMemoryRateLimiter(
+    if shared_db_path is not None:
+        from src.llm_runtime.shared_rate_limits import SharedTokenBucketRateLimiter
+
+        return SharedTokenBucketRateLimiter(
+            shared_db_path,
+            vendor_id=vendor_id,
+            endpoint_host=endpoint_host,
+            requests_per_second=requests_per_second,
+            max_bucket_size=max_bucket_size,
+            check_every_n_seconds=0.1,
+        )
+    return _profiled_limiter_class(InMemoryRateLimiter)(
         requests_per_second=requests_per_second,
         check_every_n_seconds=0.1,
         max_bucket_size=max_bucket_size,
     )
 
 
+@cache
+def _profiled_limiter_class(base: type[BaseRateLimiter]) -> type[BaseRateLimiter]:
+    """Subclass *base* so blocking acquires show up as run-profiler spans.
+
+    Resolved at call time rather than import time so the class stays
+    substitutable in tests.
+    """
+
+    class ProfiledRateLimiter(base):  # type: ignore[misc, valid-type]
+        def acquire(self, *, blocking: bool = True) -> bool:
+            if not blocking:
+                return super().acquire(blocking=False)
+            with profile_span("rate_limit_wait", "rate_limit"):
+                return super().acquire(blocking=True)
+
+        async def aacquire(self, *, blocking: bool = True) -> bool:
+            if not blocking:
+                return await super().aacquire(blocking=False)
+            with profile_span("rate_limit_wait", "rate_limit"):
+                return await super().aacquire(blocking=True)
+
+    return ProfiledRateLimiter
+
+
+def _shared_rate_limit_db_path() -> Any:
+    from src.config import config
+
+    return getattr(config, "shared_rate_limit_db_path", None)
+
+
 def limiter_for_binding(
     settings: Any,
     vendor_id: str,
@@ -61,7 +118,9 @@ def limiter_for_binding(
     with _FALLBACK_LIMITERS_LOCK:
         limiter = _FALLBACK_LIMITERS.get(key)
         if limiter is None:
-            limiter = create_process_rate_limiter(int(rpm))
+            limiter = create_process_rate_limiter(
+                int(rpm), vendor_id=vendor_id, endpoint_host=endpoint_host
+            )
             _FALLBACK_LIMITERS[key] = limiter
         return limiter
 
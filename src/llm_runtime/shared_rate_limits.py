@@ -0,0 +1,203 @@
+"""Cross-process token-bucket rate limiting backed by a local SQLite file.
+
+``InMemoryRateLimiter`` budgets are per process, so pipeline children, the
+dashboard worker and parallel ``run_tickers`` invocations each assume they own
+the whole provider RPM. ``SharedTokenBucketRateLimiter`` keeps one bucket per
+``(vendor_id, endpoint_host)`` in a shared SQLite database and refills/consumes
+it inside a ``BEGIN IMMEDIATE`` transaction, so every process on the box draws
+from the same budget.
+
+Semantics match ``InMemoryRateLimiter``: a new bucket starts empty, refills at
+``requests_per_second`` up to ``max_bucket_size``, and each acquire consumes
+one token.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import structlog
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from src.async_utils import run_with_hard_timeout
+from src.run_profiler import profile_span
+
+logger = structlog.get_logger(__name__)
+
+# Upper bounds (seconds) of the wait-time histogram buckets; the last bucket
+# is open-ended.
+WAIT_HISTOGRAM_BOUNDS: tuple[float, ...] = (0.0, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+_BUSY_TIMEOUT_SECONDS = 10.0
+
+
+def bucket_key(vendor_id: str, endpoint_host: str | None = None) -> str:
+    """Return the stable bucket identity; credentials and paths never participate."""
+    return f"{vendor_id}@{endpoint_host}" if endpoint_host else vendor_id
+
+
+class SharedTokenBucketRateLimiter(BaseRateLimiter):
+    """Token bucket whose state lives in a SQLite file shared across processes."""
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        vendor_id: str,
+        endpoint_host: str | None = None,
+        requests_per_second: float,
+        max_bucket_size: float,
+        check_every_n_seconds: float = 0.1,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.key = bucket_key(vendor_id, endpoint_host)
+        self.requests_per_second = requests_per_second
+        self.max_bucket_size = max_bucket_size
+        self.check_every_n_seconds = check_every_n_seconds
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._wait_counts = [0] * (len(WAIT_HISTOGRAM_BOUNDS) + 1)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_buckets (
+                bucket_key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                requests_per_second REAL NOT NULL,
+                max_bucket_size REAL NOT NULL
+            )
+            """
+        )
+
+    def _consume(self) -> bool:
+        """Refill and try to take one token atomically across processes."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_buckets WHERE bucket_key = ?",
+                (self.key,),
+            ).fetchone()
+            if row is None:
+                tokens = 0.0
+            else:
+                elapsed = max(0.0, now - float(row[1]))
+                tokens = min(
+                    self.max_bucket_size,
+                    float(row[0]) + elapsed * self.requests_per_second,
+                )
+            acquired = tokens >= 1.0
+            if acquired:
+                tokens -= 1.0
+            conn.execute(
+                """
+                INSERT INTO rate_buckets (
+                    bucket_key, tokens, updated_at, requests_per_second, max_bucket_size
+                )
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(bucket_key)
+                DO UPDATE SET
+                    tokens = excluded.tokens,
+                    updated_at = excluded.updated_at,
+                    requests_per_second = excluded.requests_per_second,
+                    max_bucket_size = excluded.max_bucket_size
+                """,
+                (
+                    self.key,
+                    tokens,
+                    now,
+                    self.requests_per_second,
+                    self.max_bucket_size,
+                ),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return acquired
+
+    def _record_wait(self, seconds: float) -> None:
+        index = bisect.bisect_left(WAIT_HISTOGRAM_BOUNDS, seconds)
+        with self._stats_lock:
+            self._wait_counts[index] += 1
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        started = time.monotonic()
+        if not blocking:
+            return self._consume()
+        with profile_span("rate_limit_wait", "rate_limit", bucket=self.key):
+            while not self._consume():
+                time.sleep(self.check_every_n_seconds)
+        self._record_wait(time.monotonic() - started)
+        return True
+
+    async def _aconsume(self) -> bool:
+        # SQLite's busy timeout bounds the lock wait; the hard timeout only
+        # guards against a wedged filesystem.
+        return await run_with_hard_timeout(
+            asyncio.to_thread(self._consume),
+            timeout=_BUSY_TIMEOUT_SECONDS + 5.0,
+            label=f"shared_rate_limiter.consume:{self.key}",
+        )
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        started = time.monotonic()
+        if not blocking:
+            return await self._aconsume()
+        with profile_span("rate_limit_wait", "rate_limit", bucket=self.key):
+            while not await self._aconsume():
+                await asyncio.sleep(self.check_every_n_seconds)
+        self._record_wait(time.monotonic() - started)
+        return True
+
+    def token_levels(self) -> dict[str, float]:
+        """Return the current (refilled) token level of every shared bucket."""
+        now = time.time()
+        rows = (
+            self._connect()
+            .execute(
+                """
+                SELECT bucket_key, tokens, updated_at, requests_per_second,
+                       max_bucket_size
+                FROM rate_buckets
+                """
+            )
+            .fetchall()
+        )
+        levels: dict[str, float] = {}
+        for key, tokens, updated_at, rps, capacity in rows:
+            refill = max(0.0, now - float(updated_at)) * float(rps)
+            levels[key] = round(min(float(capacity), float(tokens) + refill), 3)
+        return levels
+
+    def wait_histogram(self) -> dict[str, int]:
+        """Return this process's blocking-acquire wait times, bucketed by seconds."""
+        labels = [f"<={bound:g}s" for bound in WAIT_HISTOGRAM_BOUNDS]
+        labels.append(f">{WAIT_HISTOGRAM_BOUNDS[-1]:g}s")
+        with self._stats_lock:
+            return dict(zip(labels, self._wait_counts, strict=True))
+
+    def __repr__(self) -> str:
+        return f"<SharedTokenBucketRateLimiter {self.key} db={self._db_path}>"
@@ -18,7 +18,7 @@ from urllib.parse import urlsplit
 import structlog
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseChatModel
-from langchain_core.rate_limiters import BaseRateLimiter, InMemoryRateLimiter
+from langchain_core.rate_limiters import BaseRateLimiter
 from langchain_google_genai import (
     ChatGoogleGenerativeAI,
     HarmBlockThreshold,
@@ -337,15 +337,17 @@ def is_gemini_v3_or_greater(model_name: str) -> bool:
     return _is_gemini_v3_or_greater(model_name)
 
 
-def _create_rate_limiter_from_rpm(rpm: int) -> InMemoryRateLimiter:
+def _create_rate_limiter_from_rpm(
+    rpm: int, vendor_id: str = "google"
+) -> BaseRateLimiter:
     """Compatibility wrapper around the provider-neutral limiter factory."""
 
     from src.llm_runtime.rate_limits import create_process_rate_limiter
 
-    return create_process_rate_limiter(rpm)
+    return create_process_rate_limiter(rpm, vendor_id=vendor_id)
 
 
-def create_process_rate_limiter(rpm: int | None = None) -> InMemoryRateLimiter:
+def create_process_rate_limiter(rpm: int | None = None) -> BaseRateLimiter:
     """Create an owned rate limiter for a long-lived process/runtime.
 
     Bare calls intentionally use base config. CLI-scoped runs pass an explicit
@@ -431,7 +433,7 @@ GLOBAL_RATE_LIMITER = _LazyRateLimiterProxy(
 
 # Lazily-constructed OpenAI rate limiter.  None when OPENAI_RPM_LIMIT is unset
 # (the default) so existing deployments are not throttled without opt-in.
-_openai_rate_limiter: InMemoryRateLimiter | None = None
+_openai_rate_limiter: BaseRateLimiter | None = None
 _openai_rate_limiter_initialized: bool = False
 _warned_openai_unthrottled: set[str] = set()
 
@@ -453,7 +455,7 @@ def _get_openai_rate_limiter(*, settings: Any | None = None) -> BaseRateLimiter
         _openai_rate_limiter_initialized = True
         rpm = config_module.config.openai_rpm_limit
         if rpm is not None:
-            _openai_rate_limiter = _create_rate_limiter_from_rpm(rpm)
+            _openai_rate_limiter = _create_rate_limiter_from_rpm(rpm, "openai")
     return _openai_rate_limiter
 
 
@@ -521,13 +521,20 @@ async def run_analysis(
 
         from src.agents import AgentState, InvestDebateState, RiskDebateState
         from src.graph import TradingContext, create_trading_graph
+        from src.run_profiler import RunProfiler, profile_span, use_run_profiler
         from src.runtime_services import use_runtime_services
         from src.token_tracker import get_tracker
 
+        run_profiler = (
+            RunProfiler(label=ticker)
+            if get_runtime_config(config).profile_run
+            else None
+        )
         with (
             use_runtime_services(runtime_services)
             if runtime_services
-            else nullcontext()
+            else nullcontext(),
+            use_run_profiler(run_profiler),
         ):
             # Reset token tracker for fresh analysis
             tracker = get_tracker()
@@ -805,16 +812,17 @@ async def run_analysis(
 
             try:
                 try:
-                    result = await graph.ainvoke(
-                        initial_state,
-                        config={
-                            "recursion_limit": 100,
-                            "configurable": {"context": context},
-                            "callbacks": tracing_callbacks or [],
-                            "tags": tags,
-                            "metadata": graph_metadata,
-                        },
-                    )
+                    with profile_span("graph", "graph"):
+                        result = await graph.ainvoke(
+                            initial_state,
+                            config={
+                                "recursion_limit": 100,
+                                "configurable": {"context": context},
+                                "callbacks": tracing_callbacks or [],
+                                "tags": tags,
+                                "metadata": graph_metadata,
+                            },
+                        )
                 except (asyncio.CancelledError, KeyboardInterrupt):
                     from src.async_utils import (
                         dump_pending_tasks,
@@ -876,6 +884,19 @@ async def run_analysis(
                     prompts_used["macro_context_analyst"] = macro_context_prompt_used
                     result["prompts_used"] = prompts_used
                 result["analysis_validity"] = build_analysis_validity(result)
+                if run_profiler is not None:
+                    # Internal key: written next to the artifact on persist.
+                    result["_run_profile"] = run_profiler.to_chrome_trace()
+                    profile_summary = result["_run_profile"]["otherData"]
+                    logger.info(
+                        "run_profile_recorded",
+                        ticker=ticker,
+                        wall_ms=profile_summary["wall_ms"],
+                        critical_path=[
+                            f"{step['node']}={step['duration_ms']:.0f}ms"
+                            for step in profile_summary["critical_path"]
+                        ],
+                    )
 
             return cast(dict, result)
 
@@ -1249,6 +1270,105 @@ async def _execute_analysis(
     return result
 
 
+async def _analyze_batch_ticker(
+    args: argparse.Namespace,
+    runtime_services: Any,
+    *,
+    provider_preflight: dict[str, dict[str, str]],
+) -> Path | None:
+    """Analyze one ticker of an in-process batch and persist its artifacts.
+
+    Runs with the batch-scoped ``RuntimeServices`` and ``TokenTracker`` already
+    bound by ``src.batch_runner``; output is always a quiet markdown file. Like
+    a single-ticker run, the ticker's retrospective runs before its analysis.
+    """
+    await _maybe_run_ticker_retrospective(args)
+    output_targets = cli._resolve_output_targets(args)
+    result = await _execute_analysis(
+        args,
+        output_targets,
+        runtime_services=runtime_services,
+        session_id=f"{args.ticker}-{datetime.now().strftime('%Y-%m-%d')}-{uuid.uuid4().hex[:8]}",
+    )
+    if not result:
+        return None
+
+    _attach_run_summary(result, args, provider_preflight)
+    output._render_primary_output(
+        result,
+        args,
+        output_targets,
+        "",
+        console_obj=console,
+        logger_obj=logger,
+        cost_suffix_fn=_cost_suffix,
+    )
+    persistence._persist_analysis_outputs(
+        result,
+        args,
+        logger_obj=logger,
+        cost_suffix_fn=_cost_suffix,
+        error_message_formatter=_safe_cli_error_message,
+    )
+    await persistence._maybe_save_rejection_record(result, args, logger_obj=logger)
+    _log_final_summary(result, args, article_generated=False)
+    return output_targets.output_file
+
+
+async def _run_ticker_batch(
+    args: argparse.Namespace,
+    runtime_services: Any,
+    provider_preflight: dict[str, dict[str, str]],
+) -> int:
+    """Run ``--tickers-file`` mode and return the process exit code."""
+    from src.batch_runner import (
+        DEFAULT_BATCH_CONCURRENCY,
+        DEFAULT_TICKER_TIMEOUT_SECONDS,
+        BatchTickerOutcome,
+        format_batch_summary,
+        load_tickers_file,
+        run_ticker_batch,
+    )
+
+    tickers = load_tickers_file(Path(args.tickers_file))
+    if not tickers:
+        print(f"# Batch Analysis\n\nNo tickers found in {args.tickers_file}.")
+        return 1
+
+    output_dir = (
+        Path(args.batch_output_dir)
+        if getattr(args, "batch_output_dir", None)
+        else Path(config.results_dir) / "batch"
+    )
+    verbose_console = not args.quiet and not args.brief
+    if verbose_console:
+        console.print(
+            f"[cyan]Batch analysis: {len(tickers)} ticker(s) -> {output_dir}[/cyan]"
+        )
+
+    def report(outcome: BatchTickerOutcome) -> None:
+        print(
+            f"  [{outcome.status}] {outcome.ticker} in {outcome.elapsed_seconds:.1f}s",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    outcomes = await run_ticker_batch(
+        args,
+        tickers,
+        runtime_services=runtime_services,
+        analyze_ticker=partial(
+            _analyze_batch_ticker, provider_preflight=provider_preflight
+        ),
+        output_dir=output_dir,
+        concurrency=args.batch_concurrency or DEFAULT_BATCH_CONCURRENCY,
+        ticker_timeout=args.ticker_timeout or DEFAULT_TICKER_TIMEOUT_SECONDS,
+        on_outcome=report,
+    )
+    print(format_batch_summary(outcomes))
+    return 0 if all(outcome.status == "ok" for outcome in outcomes) else 1
+
+
 def _create_baseline_capture_manager(
     args: argparse.Namespace,
 ) -> BaselineCaptureManager | None:
@@ -1630,6 +1750,9 @@ async def run_with_args(
             with use_runtime_services(runtime_services):
                 return await _run_retrospective_only(args)
 
+        if getattr(args, "tickers_file", None):
+            return await _run_ticker_batch(args, runtime_services, provider_preflight)
+
         with use_runtime_services(runtime_services):
             await _maybe_run_ticker_retrospective(args)
         welcome_banner = output._emit_start_banner(
@@ -22,6 +22,12 @@ class ToolCatalog:
     def update(self, server_id: str, tools: list[ToolDescriptor]) -> None:
         self._tools[server_id] = tools
 
+    def has(self, server_id: str) -> bool:
+        return server_id in self._tools
+
+    def invalidate(self, server_id: str) -> None:
+        self._tools.pop(server_id, None)
+
     def list_for_server(
         self,
         server_id: str,
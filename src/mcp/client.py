@@ -23,6 +23,7 @@ from src.mcp.errors import (
     classify_mcp_error,
 )
 from src.mcp.normalize import normalize_result
+from src.mcp.session_pool import MCPSessionPool
 from src.tooling.inspection_service import INSPECTION_SERVICE
 from src.tooling.inspector import InspectionDecision, InspectionEnvelope, SourceKind
 
@@ -37,7 +38,13 @@ _MAX_BACKOFF_SECONDS = 5.0
 class MCPRuntime:
     """Run MCP tool calls against configured servers with inspection and budgeting."""
 
-    def __init__(self, servers: list[MCPServerSpec], budget_db_path: str) -> None:
+    def __init__(
+        self,
+        servers: list[MCPServerSpec],
+        budget_db_path: str,
+        *,
+        session_idle_seconds: float | None = None,
+    ) -> None:
         self._specs = {spec.id: spec for spec in servers}
         self._resolved: dict[str, MCPResolvedServer] = {}
         self._unavailable: dict[str, str] = {}
@@ -63,6 +70,17 @@ class MCPRuntime:
         self._budget = BudgetTracker(budget_db_path)
         self._inspection_service = INSPECTION_SERVICE
         self._cooldowns: dict[str, dt.datetime] = {}
+        # ``None`` opens a fresh session per call; otherwise initialized sessions
+        # are pooled and closed after this many idle seconds (0 = never).
+        self._session_pool = (
+            MCPSessionPool(
+                lambda spec: self._open_session(spec),
+                idle_seconds=session_idle_seconds,
+                on_discard=self._catalog.invalidate,
+            )
+            if session_idle_seconds is not None
+            else None
+        )
 
     @property
     def specs(self) -> dict[str, MCPServerSpec]:
@@ -214,6 +232,17 @@ class MCPRuntime:
         except Exception as exc:
             raise classify_mcp_error(exc, server_id=spec.id) from exc
 
+    def _session(self, spec: MCPServerSpec):
+        """Pooled session lease when pooling is on, else a one-shot session."""
+        if self._session_pool is not None:
+            return self._session_pool.session(spec)
+        return self._open_session(spec)
+
+    async def aclose(self) -> None:
+        """Close pooled sessions owned by the running event loop."""
+        if self._session_pool is not None:
+            await self._session_pool.aclose()
+
     def _on_call_failure(self, err: MCPCallError) -> None:
         if err.category is MCPErrorCategory.AUTH:
             self._register_cooldown(
@@ -233,7 +262,7 @@ class MCPRuntime:
         last_err: MCPCallError | None = None
         for attempt in range(_MAX_RETRY_ATTEMPTS):
             try:
-                async with self._open_session(spec) as session:
+                async with self._session(spec) as session:
                     result: CallToolResult = await session.call_tool(
                         tool_name, arguments
                     )
@@ -293,20 +322,23 @@ class MCPRuntime:
             if not spec.enabled or not spec.supports_scope(scope):
                 continue
 
-            async with self._open_session(spec) as session:
-                tool_result: ListToolsResult = await session.list_tools()
+            # Tool lists are stable for a server's lifetime; a discarded pooled
+            # session invalidates the entry so a restarted server is re-listed.
+            if not self._catalog.has(spec.id):
+                async with self._session(spec) as session:
+                    tool_result: ListToolsResult = await session.list_tools()
 
-            server_tools = [
-                ToolDescriptor(
-                    server_id=spec.id,
-                    name=tool.name,
-                    description=tool.description or "",
-                    input_schema=tool.inputSchema,
-                    output_schema=tool.outputSchema,
-                )
-                for tool in tool_result.tools
-            ]
-            self._catalog.update(spec.id, server_tools)
+                server_tools = [
+                    ToolDescriptor(
+                        server_id=spec.id,
+                        name=tool.name,
+                        description=tool.description or "",
+                        input_schema=tool.inputSchema,
+                        output_schema=tool.outputSchema,
+                    )
+                    for tool in tool_result.tools
+                ]
+                self._catalog.update(spec.id, server_tools)
             descriptors.extend(
                 self._catalog.list_for_server(
                     spec.id,
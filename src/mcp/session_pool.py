@@ -0,0 +1,197 @@
+"""Long-lived, shared MCP client sessions.
+
+Opening an MCP session means starting a transport (an HTTP client or a stdio
+subprocess) and running the ``initialize`` handshake. Doing that per tool call
+puts connection setup in every call's latency. ``MCPSessionPool`` keeps one
+initialized session per server per event loop and lets concurrent calls share
+it, since ``ClientSession`` multiplexes requests by JSON-RPC id.
+
+The transport context managers are built on anyio task groups, so they must be
+entered and exited by the same task. Each pooled session therefore lives in its
+own owner task, which opens the session, publishes it, and then waits until the
+session is discarded, goes idle, or the loop shuts down. ``asyncio.run``
+cancels leftover tasks on exit, which closes the sessions cleanly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from src.mcp.config import MCPServerSpec
+from src.mcp.errors import MCPCallError, MCPErrorCategory, classify_mcp_error
+
+logger = structlog.get_logger(__name__)
+
+SessionOpener = Callable[[MCPServerSpec], AbstractAsyncContextManager[Any]]
+
+
+@dataclass(eq=False)
+class _PooledSession:
+    server_id: str
+    session: Any = None
+    task: asyncio.Task | None = None
+    closing: asyncio.Event = field(default_factory=asyncio.Event)
+    in_use: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    closed: bool = False
+
+    def close(self) -> None:
+        self.closed = True
+        self.closing.set()
+
+
+class MCPSessionPool:
+    """Per-server pool of initialized sessions, reconnecting after transport failures.
+
+    ``idle_seconds`` bounds how long an unused session stays open; ``0`` keeps
+    it for the life of the event loop. ``on_discard`` is told the server id
+    whenever a broken session is dropped.
+    """
+
+    def __init__(
+        self,
+        opener: SessionOpener,
+        *,
+        idle_seconds: float = 0.0,
+        on_discard: Callable[[str], None] | None = None,
+    ) -> None:
+        self._opener = opener
+        self.idle_seconds = idle_seconds
+        self._on_discard = on_discard
+        self._entries: dict[tuple[asyncio.AbstractEventLoop, str], _PooledSession] = {}
+        self._locks: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Lock] = {}
+        self.stats = {"opened": 0, "reused": 0, "discarded": 0, "idle_closed": 0}
+
+    @asynccontextmanager
+    async def session(self, spec: MCPServerSpec) -> AsyncIterator[Any]:
+        """Lease the server's shared session for one call."""
+        entry = await self._acquire(spec)
+        try:
+            yield entry.session
+        except MCPCallError as err:
+            if err.category is MCPErrorCategory.TRANSPORT:
+                self._discard(entry, reason=err.category.value)
+            raise
+        except Exception as exc:
+            category = classify_mcp_error(exc, server_id=spec.id).category
+            if category is MCPErrorCategory.TRANSPORT:
+                self._discard(entry, reason=type(exc).__name__)
+            raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    async def _acquire(self, spec: MCPServerSpec) -> _PooledSession:
+        key = (asyncio.get_running_loop(), spec.id)
+        entry = self._live_entry(key)
+        if entry is None:
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = self._live_entry(key)
+                if entry is None:
+                    entry = await self._connect(spec)
+                    self._entries[key] = entry
+                    self.stats["opened"] += 1
+                else:
+                    self.stats["reused"] += 1
+        else:
+            self.stats["reused"] += 1
+        # Claimed before any further await, so the idle check cannot close it.
+        entry.in_use += 1
+        return entry
+
+    def _live_entry(
+        self, key: tuple[asyncio.AbstractEventLoop, str]
+    ) -> _PooledSession | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.closed or entry.task is None or entry.task.done():
+            self._entries.pop(key, None)
+            return None
+        return entry
+
+    async def _connect(self, spec: MCPServerSpec) -> _PooledSession:
+        loop = asyncio.get_running_loop()
+        key = (loop, spec.id)
+        ready: asyncio.Future[Any] = loop.create_future()
+        entry = _PooledSession(server_id=spec.id)
+
+        async def _own() -> None:
+            try:
+                async with self._opener(spec) as session:
+                    ready.set_result(session)
+                    await self._hold(entry)
+            except Exception as exc:
+                if not ready.done():
+                    ready.set_exception(exc)
+                else:
+                    logger.debug(
+                        "mcp_pooled_session_ended",
+                        server_id=spec.id,
+                        error_type=type(exc).__name__,
+                    )
+            finally:
+                entry.closed = True
+                if not ready.done():
+                    ready.cancel()
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+
+        entry.task = loop.create_task(_own(), name=f"mcp-session-{spec.id}")
+        try:
+            entry.session = await ready
+        except BaseException:
+            # A cancelled caller must not leave an unowned session running.
+            entry.close()
+            raise
+        return entry
+
+    async def _hold(self, entry: _PooledSession) -> None:
+        while not entry.closing.is_set():
+            if self.idle_seconds <= 0:
+                await entry.closing.wait()
+                return
+            remaining = entry.last_used + self.idle_seconds - time.monotonic()
+            try:
+                await asyncio.wait_for(
+                    entry.closing.wait(), timeout=max(remaining, 0.05)
+                )
+            except TimeoutError:
+                idle_for = time.monotonic() - entry.last_used
+                if entry.in_use == 0 and idle_for >= self.idle_seconds:
+                    entry.closed = True
+                    self.stats["idle_closed"] += 1
+                    return
+
+    def _discard(self, entry: _PooledSession, *, reason: str) -> None:
+        if entry.closed:
+            return
+        entry.close()
+        self.stats["discarded"] += 1
+        logger.info(
+            "mcp_pooled_session_discarded", server_id=entry.server_id, reason=reason
+        )
+        if self._on_discard is not None:
+            self._on_discard(entry.server_id)
+
+    async def aclose(self) -> None:
+        """Close this loop's pooled sessions and wait for their transports."""
+        loop = asyncio.get_running_loop()
+        tasks = []
+        for key, entry in list(self._entries.items()):
+            if key[0] is not loop:
+                continue
+            self._entries.pop(key, None)
+            entry.close()
+            if entry.task is not None:
+                tasks.append(entry.task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -27,6 +27,7 @@ from tenacity import (
 
 from src.async_utils import run_with_hard_timeout
 from src.config import config
+from src.embedding_cache import embedding_cache_key, get_embedding_cache
 from src.embeddings import (
     build_embeddings,
     embedding_credential,
@@ -80,6 +81,50 @@ def _is_missing_collection_error(exc: Exception) -> bool:
     return "does not exist" in message or "Collection not found" in message
 
 
+# Role suffixes of the per-ticker memory collections, in creation order.
+MEMORY_ROLES = ("bull", "bear", "trader", "invest_judge", "risk_manager")
+# Prefix of the unscoped ``legacy_{role}_memory`` collections used when a graph
+# is built without a ticker. They look like per-ticker collections but are not.
+LEGACY_MEMORY_PREFIX = "legacy"
+
+
+def consolidated_collection_base(role: str, layout: str) -> str:
+    """Shared collection holding *role*'s ticker memories under *layout*.
+
+    Hyphenated so it can never equal a per-ticker collection name: sanitized
+    tickers contain no hyphens.
+    """
+    return f"memory-{role}" if layout == "per_role" else "memory-all"
+
+
+def ticker_memory_scope(safe_ticker: str, role: str) -> dict[str, str]:
+    """Metadata isolating one ticker's role memory inside a shared collection."""
+    return {"memory_ticker": safe_ticker, "memory_role": role}
+
+
+def scope_id_prefix(scope: dict[str, str] | None) -> str:
+    return "".join(f"{value}_" for value in (scope or {}).values())
+
+
+def scoped_where(
+    scope: dict[str, str] | None, metadata_filter: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Chroma ``where`` clause requiring every scope key plus the caller's filter."""
+    clauses: list[dict[str, Any]] = [
+        {key: value} for key, value in (scope or {}).items()
+    ]
+    if metadata_filter:
+        clauses.append(metadata_filter)
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def _memory_layout() -> str:
+    layout = getattr(config, "memory_collection_layout", "per_ticker")
+    return layout if layout in ("per_role", "single") else "per_ticker"
+
+
 class FinancialSituationMemory:
     """
     Vector memory storage for financial agent debate history.
@@ -102,23 +147,45 @@ class FinancialSituationMemory:
     # 2026-07-11 full-suite pytest run). Both embedding paths are bounded here.
     _HEALTHCHECK_TIMEOUT_SECONDS = 15.0
     _EMBEDDING_CALL_TIMEOUT_SECONDS = 30.0
+    _EMBEDDING_MAX_CHARS = 9000
+    # Gemini's batchEmbedContents accepts at most 100 texts per request.
+    _EMBEDDING_BATCH_SIZE = 100
     _shared_embeddings: Any | None = None
     _shared_embeddings_available: bool = False
     _shared_embeddings_key: tuple[str, str, int | None, str] | None = None
     _shared_chroma_client: Any | None = None
     _shared_chroma_key: str | None = None
+    # Set for memories that live in a consolidated collection (see
+    # MEMORY_COLLECTION_LAYOUT): the shared collection's base name, and the
+    # metadata that isolates this memory's rows inside it.
+    collection_base: str | None = None
+    scope: dict[str, str] | None = None
 
-    def __init__(self, name: str):
+    def __init__(
+        self,
+        name: str,
+        *,
+        collection_base: str | None = None,
+        scope: dict[str, str] | None = None,
+    ):
         """
         Initialize a memory collection.
 
         Args:
             name: Unique identifier for this memory collection (e.g., "0005_HK_bull_memory")
+            collection_base: Store rows in this shared collection instead of one
+                named after ``name``; requires ``scope``.
+            scope: Metadata stamped on every write and required on every read,
+                so memories sharing a collection never see each other's rows.
         """
+        if collection_base is not None and not scope:
+            raise ValueError("A consolidated memory collection requires a scope")
         self.name = name
+        self.collection_base = collection_base
+        self.scope = dict(scope) if scope else None
         self.embedding_binding = resolve_embedding_binding(config)
         self.collection_name = fingerprinted_collection_name(
-            name, self.embedding_binding
+            collection_base or name, self.embedding_binding
         )
         self.available = False
         self.situation_collection: Any = None
@@ -153,12 +220,14 @@ class FinancialSituationMemory:
             self.situation_collection = self.chroma_client.get_or_create_collection(
                 name=self.collection_name,
                 metadata={
-                    "description": f"Financial debate memory for {name}",
+                    "description": (
+                        f"Financial debate memory for {collection_base or name}"
+                    ),
                     "embedding_provider": self.embedding_binding.provider,
                     "embedding_model": self.embedding_binding.model,
                     "embedding_dimension": self.embedding_binding.dimension,
                     "embedding_schema_version": self.embedding_binding.schema_version,
-                    "legacy_base_name": self.name,
+                    "legacy_base_name": collection_base or self.name,
                     "created_at": datetime.now().isoformat(),
                     "version": "3.0",
                 },
@@ -349,8 +418,21 @@ class FinancialSituationMemory:
             raise ValueError(f"Memory not available for {self.name}")
 
         # Truncate text to avoid token limits
-        truncated_text = text[:9000]
+        truncated_text = text[: self._EMBEDDING_MAX_CHARS]
+
+        cache = get_embedding_cache()
+        if cache is None:
+            return await self._embed_query(truncated_text)
+        return await cache.get_or_embed(
+            self._embedding_cache_key(truncated_text),
+            lambda: self._embed_query(truncated_text),
+        )
+
+    def _embedding_cache_key(self, truncated_text: str) -> str:
+        return embedding_cache_key(self.embedding_binding.fingerprint(), truncated_text)
 
+    async def _embed_query(self, truncated_text: str) -> list[float]:
+        """One provider call for one (already truncated) text."""
         # Import rate limiter here to avoid circular dependency
         # Use rate limiter to share RPM quota with LLM calls
         try:
@@ -400,6 +482,73 @@ class FinancialSituationMemory:
 
         return cast(list[float], embedding)
 
+    async def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed many texts, one vector per input, in as few provider calls as possible.
+
+        Cached and duplicate texts are resolved first; the remaining distinct
+        texts are sent through ``aembed_documents`` in chunks of
+        ``_EMBEDDING_BATCH_SIZE``, one rate-limiter slot per chunk. If a batch
+        call fails, each text falls back to ``_get_embedding`` and its retries.
+        """
+        truncated = [text[: self._EMBEDDING_MAX_CHARS] for text in texts]
+        distinct = list(dict.fromkeys(truncated))
+        cache = get_embedding_cache()
+        if getattr(self, "embedding_binding", None) is None:
+            cache = None
+
+        resolved: dict[str, list[float]] = {}
+        if cache is not None:
+            for text in distinct:
+                cached = cache.get(self._embedding_cache_key(text))
+                if cached is not None:
+                    resolved[text] = cached
+        pending = [text for text in distinct if text not in resolved]
+
+        if len(pending) > 1 and getattr(self, "embeddings", None) is not None:
+            try:
+                vectors = await self._embed_documents(pending)
+            except Exception as exc:
+                logger.warning(
+                    "embedding_batch_fallback",
+                    collection=self.name,
+                    batch_size=len(pending),
+                    fallback="per_text_embed_query",
+                    **summarize_exception(exc, operation="memory batch embedding"),
+                )
+            else:
+                if cache is not None:
+                    cache.record_misses(len(pending))
+                for text, vector in zip(pending, vectors, strict=True):
+                    resolved[text] = vector
+                    if cache is not None:
+                        cache.set(self._embedding_cache_key(text), vector)
+
+        for text in pending:
+            if text not in resolved:
+                resolved[text] = await self._get_embedding(text)
+        return [resolved[text] for text in truncated]
+
+    async def _embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Batch provider calls for already truncated texts."""
+        from src.llms import GLOBAL_RATE_LIMITER
+
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), self._EMBEDDING_BATCH_SIZE):
+            chunk = texts[start : start + self._EMBEDDING_BATCH_SIZE]
+            async with GLOBAL_RATE_LIMITER:
+                batch = await run_with_hard_timeout(
+                    self.embeddings.aembed_documents(chunk),
+                    timeout=self._EMBEDDING_CALL_TIMEOUT_SECONDS,
+                    label=f"memory_embedding_batch:{self.name}",
+                )
+            if len(batch) != len(chunk) or not all(batch):
+                raise ValueError(
+                    f"Embedding batch returned {len(batch)} vectors for {len(chunk)} texts"
+                )
+            vectors.extend(cast(list[float], vector) for vector in batch)
+        return vectors
+
     async def add_situations(
         self, situations: list[str], metadata: list[dict[str, Any]] | None = None
     ) -> bool:
@@ -466,7 +615,8 @@ class FinancialSituationMemory:
                 approved_situations.append(
                     approved if isinstance(approved, str) else situation
                 )
-                approved_metadata.append(meta)
+                # Scope keys win over caller metadata: they are the isolation.
+                approved_metadata.append({**meta, **(self.scope or {})})
 
             if not approved_situations:
                 logger.warning(
@@ -477,13 +627,14 @@ class FinancialSituationMemory:
                 return False
 
             # Generate embeddings only for approved situations.
-            embeddings = []
-            for situation in approved_situations:
-                emb = await self._get_embedding(situation)
-                embeddings.append(emb)
+            embeddings = await self._get_embeddings(approved_situations)
 
-            # Prepare IDs (use timestamp + index)
-            ids = [f"{timestamp}_{i}" for i in range(len(approved_situations))]
+            # Prepare IDs (use timestamp + index), prefixed by the scope in a
+            # shared collection so concurrent tickers cannot collide.
+            id_prefix = scope_id_prefix(self.scope)
+            ids = [
+                f"{id_prefix}{timestamp}_{i}" for i in range(len(approved_situations))
+            ]
 
             # Add to collection. The cached handle can become stale after an
             # explicit operator cleanup. Re-fetch once on NotFoundError — this turns the
@@ -514,7 +665,10 @@ class FinancialSituationMemory:
                 self.situation_collection = self.chroma_client.get_or_create_collection(
                     name=getattr(self, "collection_name", self.name),
                     metadata={
-                        "description": f"Financial debate memory for {self.name}",
+                        "description": (
+                            "Financial debate memory for "
+                            f"{self.collection_base or self.name}"
+                        ),
                         "embedding_provider": getattr(
                             getattr(self, "embedding_binding", None),
                             "provider",
@@ -537,7 +691,7 @@ class FinancialSituationMemory:
                                 1,
                             )
                         ),
-                        "legacy_base_name": self.name,
+                        "legacy_base_name": self.collection_base or self.name,
                         "created_at": datetime.now().isoformat(),
                         "version": "3.0",
                     },
@@ -615,8 +769,9 @@ class FinancialSituationMemory:
                 "n_results": n_results,
             }
 
-            if metadata_filter:
-                query_kwargs["where"] = metadata_filter
+            where = scoped_where(self.scope, metadata_filter)
+            if where:
+                query_kwargs["where"] = where
 
             results = self.situation_collection.query(**query_kwargs)
 
@@ -763,7 +918,9 @@ class FinancialSituationMemory:
                     If None, clean ALL collections in the database.
 
         Returns:
-            Dict of collection_name -> documents_deleted
+            Dict of collection_name -> documents_deleted. Under a consolidated
+            ``MEMORY_COLLECTION_LAYOUT`` a ticker-scoped cleanup deletes only
+            that ticker's rows and is keyed by the memory names instead.
         """
         results = {}
 
@@ -776,6 +933,9 @@ class FinancialSituationMemory:
                 settings=Settings(anonymized_telemetry=False, allow_reset=True),
             )
 
+            if ticker and _memory_layout() != "per_ticker":
+                return _cleanup_consolidated_ticker(client, ticker, days_to_keep)
+
             collections = client.list_collections()
 
             # Calculate ticker prefix if provided
@@ -880,7 +1040,14 @@ class FinancialSituationMemory:
             return {"available": False, "name": self.name, "count": 0}
 
         try:
-            count = self.situation_collection.count()
+            if self.scope:
+                count = len(
+                    self.situation_collection.get(
+                        where=scoped_where(self.scope, None), include=[]
+                    )["ids"]
+                )
+            else:
+                count = self.situation_collection.count()
             return {"available": True, "name": self.name, "count": count}
         except Exception as e:
             # FIX: Gracefully handle deleted collections (zombies)
@@ -954,6 +1121,10 @@ def create_memory_instances(ticker: str) -> dict[str, FinancialSituationMemory]:
 
     This prevents Canon's analysis from contaminating HSBC's memory and vice versa.
 
+    With ``MEMORY_COLLECTION_LAYOUT=per_role`` (or ``single``) the instances keep
+    those names but store rows in a few shared collections, isolated by
+    ``memory_ticker``/``memory_role`` metadata on every write and read.
+
     Args:
         ticker: Stock ticker symbol (e.g., "0005.HK", "AAPL", "7915.T")
 
@@ -963,18 +1134,23 @@ def create_memory_instances(ticker: str) -> dict[str, FinancialSituationMemory]:
     # Sanitize ticker for use in collection names
     safe_ticker = sanitize_ticker_for_collection(ticker)
 
-    memory_configs = [
-        f"{safe_ticker}_bull_memory",
-        f"{safe_ticker}_bear_memory",
-        f"{safe_ticker}_trader_memory",
-        f"{safe_ticker}_invest_judge_memory",
-        f"{safe_ticker}_risk_manager_memory",
-    ]
+    layout = _memory_layout()
+
+    def _build(role: str) -> FinancialSituationMemory:
+        name = f"{safe_ticker}_{role}_memory"
+        if layout == "per_ticker":
+            return FinancialSituationMemory(name)
+        return FinancialSituationMemory(
+            name,
+            collection_base=consolidated_collection_base(role, layout),
+            scope=ticker_memory_scope(safe_ticker, role),
+        )
 
     instances = {}
-    for name in memory_configs:
+    for role in MEMORY_ROLES:
+        name = f"{safe_ticker}_{role}_memory"
         try:
-            instances[name] = FinancialSituationMemory(name)
+            instances[name] = _build(role)
             logger.debug(
                 "ticker_memory_created",
                 ticker=ticker,
@@ -989,7 +1165,7 @@ def create_memory_instances(ticker: str) -> dict[str, FinancialSituationMemory]:
                 **summarize_exception(e, operation="ticker memory creation"),
             )
             # Create a disabled instance
-            instances[name] = FinancialSituationMemory(name)
+            instances[name] = _build(role)
 
     return instances
 
@@ -1017,6 +1193,10 @@ def get_ticker_memory_stats(ticker: str) -> dict[str, dict[str, Any]]:
     if client is None:
         return {role: {"name": name, **unavailable} for role, name in role_map.items()}
 
+    layout = _memory_layout()
+    if layout != "per_ticker":
+        return _consolidated_ticker_stats(client, ticker, safe_ticker, role_map, layout)
+
     try:
         existing_collections = client.list_collections()
         existing_names = {
@@ -1063,6 +1243,120 @@ def get_ticker_memory_stats(ticker: str) -> dict[str, dict[str, Any]]:
     return stats
 
 
+def _consolidated_ticker_stats(
+    client: Any,
+    ticker: str,
+    safe_ticker: str,
+    role_map: dict[str, str],
+    layout: str,
+) -> dict[str, dict[str, Any]]:
+    """Count one ticker's rows per role with metadata filters, not a collection walk."""
+    binding = resolve_embedding_binding(config)
+    stats: dict[str, dict[str, Any]] = {}
+    for stat_role, name in role_map.items():
+        role = name[len(safe_ticker) + 1 : -len("_memory")]
+        try:
+            collection = client.get_collection(
+                name=fingerprinted_collection_name(
+                    consolidated_collection_base(role, layout), binding
+                )
+            )
+            count = len(
+                collection.get(
+                    where=scoped_where(ticker_memory_scope(safe_ticker, role), None),
+                    include=[],
+                )["ids"]
+            )
+        except Exception as exc:
+            if _is_missing_collection_error(exc) or type(exc).__name__ == (
+                "NotFoundError"
+            ):
+                stats[stat_role] = {"name": name, "available": False, "count": 0}
+                continue
+            logger.warning(
+                "ticker_memory_stats_failed",
+                ticker=ticker,
+                collection=name,
+                **summarize_exception(exc, operation="ticker memory stats"),
+            )
+            stats[stat_role] = safe_error_payload(
+                exc,
+                operation="ticker memory stats",
+                extra={"available": False, "name": name, "count": 0},
+            )
+            continue
+        stats[stat_role] = {"available": True, "name": name, "count": count}
+    return stats
+
+
+def _cleanup_consolidated_ticker(client: Any, ticker: str, days: int) -> dict[str, int]:
+    """Delete one ticker's rows from the shared collections by metadata filter."""
+    safe_ticker = sanitize_ticker_for_collection(ticker)
+    layout = _memory_layout()
+    binding = resolve_embedding_binding(config)
+    cutoff_iso = None
+    if days:
+        from datetime import timedelta
+
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
+
+    results: dict[str, int] = {}
+    for role in MEMORY_ROLES:
+        name = f"{safe_ticker}_{role}_memory"
+        try:
+            collection = client.get_collection(
+                fingerprinted_collection_name(
+                    consolidated_collection_base(role, layout), binding
+                )
+            )
+        except Exception as exc:
+            if not (
+                _is_missing_collection_error(exc)
+                or type(exc).__name__ == "NotFoundError"
+            ):
+                logger.error(
+                    "collection_cleanup_failed",
+                    collection=name,
+                    **summarize_exception(exc, operation="memory collection cleanup"),
+                )
+            results[name] = 0
+            continue
+        try:
+            where = scoped_where(ticker_memory_scope(safe_ticker, role), None)
+            if cutoff_iso is None:
+                ids = list(collection.get(where=where, include=[])["ids"])
+            else:
+                rows = collection.get(where=where, include=["metadatas"])
+                ids = [
+                    doc_id
+                    for doc_id, metadata in zip(
+                        rows.get("ids") or [],
+                        rows.get("metadatas") or [],
+                        strict=False,
+                    )
+                    if isinstance(metadata, dict)
+                    and isinstance(metadata.get("timestamp", ""), str)
+                    and metadata.get("timestamp", "") < cutoff_iso
+                ]
+            if ids:
+                collection.delete(ids=ids)
+            results[name] = len(ids)
+            logger.debug(
+                "scoped_memories_deleted",
+                collection=name,
+                count=len(ids),
+                days_kept=days,
+            )
+        except Exception as exc:
+            logger.error(
+                "collection_cleanup_failed",
+                collection=name,
+                **summarize_exception(exc, operation="memory collection cleanup"),
+            )
+            results[name] = 0
+    return results
+
+
 def cleanup_all_memories(days: int = 0, ticker: str | None = None) -> dict[str, int]:
     """
     Clean up memories from collections.
@@ -1080,7 +1374,9 @@ def cleanup_all_memories(days: int = 0, ticker: str | None = None) -> dict[str,
                 If None, clean ALL collections in the database.
 
     Returns:
-        Dict of collection_name -> documents_deleted
+        Dict of collection_name -> documents_deleted. Under a consolidated
+        ``MEMORY_COLLECTION_LAYOUT`` a ticker-scoped cleanup deletes only that
+        ticker's rows and is keyed by the memory names instead.
     """
     results = {}
 
@@ -1093,6 +1389,9 @@ def cleanup_all_memories(days: int = 0, ticker: str | None = None) -> dict[str,
             settings=Settings(anonymized_telemetry=False, allow_reset=True),
         )
 
+        if ticker and _memory_layout() != "per_ticker":
+            return _cleanup_consolidated_ticker(client, ticker, days)
+
         collections = client.list_collections()
 
         # Calculate ticker prefix if provided
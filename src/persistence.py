@@ -231,7 +231,10 @@ def build_run_summary(
     """Build a compact summary for saved artifacts and end-of-run logs."""
     from langchain_core.messages import ToolMessage
 
+    from src.data.source_fetchers import source_latency_snapshot
+    from src.embedding_cache import embedding_cache_snapshot
     from src.llm_runtime.bindings import active_models_or_legacy, resolve_binding_plan
+    from src.search_cache import search_cache_snapshot
     from src.service_tiers import flex_degradation_snapshot
     from src.token_tracker import get_tracker
 
@@ -382,6 +385,15 @@ def build_run_summary(
         # 2-hour artifact explains itself without anyone reading the logs.
         # Empty mapping on a healthy run — an absent key would be ambiguous.
         "service_tier_downgrades": flex_degradation_snapshot(),
+        # Tavily/DDG cache hits, misses and coalesced duplicates; empty mapping
+        # when SEARCH_CACHE_ENABLED is off.
+        "search_cache": search_cache_snapshot(),
+        # Memory embedding-vector hits, misses and coalesced duplicates; empty
+        # mapping when EMBEDDING_CACHE_ENABLED is off.
+        "embedding_cache": embedding_cache_snapshot(),
+        # Rolling per-source market-data latency (p50/p90/p99 ms, timeouts), the
+        # evidence for PER_SOURCE_TIMEOUT and DATA_SOURCE_EARLY_EXIT_COVERAGE.
+        "data_source_latency_ms": source_latency_snapshot(),
         "pre_screening_result": result.get("pre_screening_result", ""),
         # `count` tallies debate *turns* (one Bull + one Bear per round → even), so
         # actual rounds = count // 2 (quick=1, full=2). `debate_turns` keeps the raw value.
@@ -988,6 +1000,18 @@ def _persist_analysis_outputs(
         # self-persists): lets post-persistence steps such as the article
         # writer-model stamp patch the saved JSON in place.
         result["_saved_analysis_path"] = str(filepath)
+        if result.get("_run_profile"):
+            from src.run_profiler import write_run_profile
+
+            try:
+                write_run_profile(result["_run_profile"], filepath)
+            except OSError as exc:
+                logger_obj.warning(
+                    "run_profile_write_failed",
+                    **summarize_exception(
+                        exc, operation="writing run profile", provider="local"
+                    ),
+                )
         if not args.quiet and not args.brief and console_obj is not None:
             console_obj.print(
                 f"[green]Results saved to:[/green] [cyan]{filepath}[/cyan]{cost_suffix_fn()}"
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import json
 import re
+import sqlite3
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
@@ -53,10 +54,17 @@ from src.lesson_disposition import (
     derive_disposition,
     render_record,
 )
+from src.retrospective_prices import RetrospectivePriceFrames, prefetch_price_frames
 from src.runtime_config import get_runtime_config
 from src.runtime_diagnostics import classify_failure, get_runtime_provider
 from src.runtime_diagnostics.failure_classification import ProviderName, get_model_name
 from src.runtime_services import get_current_inspection_service
+from src.snapshot_catalog import (
+    SNAPSHOT_EMPTY,
+    SNAPSHOT_FOUND,
+    SNAPSHOT_MALFORMED,
+    SnapshotCatalog,
+)
 from src.ticker_policy import get_ticker_suffix
 from src.tooling.inspector import InspectionEnvelope, SourceKind
 
@@ -1502,6 +1510,126 @@ class EvaluationMemo:
             )
 
 
+def _open_snapshot_catalog(results_dir: Path) -> SnapshotCatalog | None:
+    """Open the snapshot catalog when enabled; ``None`` (parse everything) if not."""
+    if not getattr(config, "snapshot_catalog_enabled", False):
+        return None
+    try:
+        return SnapshotCatalog.for_results_dir(results_dir)
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning(
+            "snapshot_catalog_unavailable",
+            results_dir=str(results_dir),
+            **summarize_exception(exc, operation="opening snapshot catalog"),
+        )
+        return None
+
+
+def _settled_snapshot_names(
+    catalog: SnapshotCatalog, directory: Path, patterns: Sequence[str | None]
+) -> list[str] | None:
+    """Catalogued names for a settled archive, in glob order; ``None`` to list it."""
+    names: list[str] = []
+    try:
+        for pattern in patterns:
+            if not pattern:
+                continue
+            matched = catalog.settled_names(directory, pattern)
+            if matched is None:
+                return None
+            names.extend(sorted(matched, reverse=True))
+    except (sqlite3.Error, OSError):
+        return None
+    return names
+
+
+def _parse_snapshot_file(filepath: Path) -> tuple[str, dict[str, Any] | None]:
+    """Read one artifact's snapshot as the retrospective consumes it."""
+    try:
+        with open(filepath) as handle:
+            data = json.load(handle)
+    except json.JSONDecodeError:
+        return SNAPSHOT_MALFORMED, None
+
+    snapshot = data.get("prediction_snapshot")
+    if not snapshot:
+        return SNAPSHOT_EMPTY, None
+    # Attach source file before deriving identity — it is the legacy fallback
+    # for snapshots written before analysis_id existed.
+    snapshot["_source_file"] = filepath.name
+    _resolve_bear_evidence(snapshot, data)
+    return SNAPSHOT_FOUND, snapshot
+
+
+def _load_snapshot_file(
+    filepath: Path, catalog: SnapshotCatalog | None, *, trusted: bool = False
+) -> tuple[str, dict[str, Any] | None]:
+    """Serve a snapshot from the catalog, parsing (and cataloguing) on a miss.
+
+    ``trusted`` files sit in a settled archive and are not stat'ed on a hit.
+    """
+    if catalog is None:
+        return _parse_snapshot_file(filepath)
+    directory = filepath.parent
+    stat = None if trusted else filepath.stat()
+    try:
+        cached = catalog.lookup(directory, filepath.name, stat)
+    except sqlite3.Error:
+        cached = None
+    if cached is not None:
+        return cached
+    stat = stat or filepath.stat()
+    kind, snapshot = _parse_snapshot_file(filepath)
+    try:
+        catalog.store(directory, filepath.name, stat, kind=kind, snapshot=snapshot)
+    except sqlite3.Error as exc:
+        logger.warning(
+            "snapshot_catalog_write_failed",
+            file=filepath.name,
+            **summarize_exception(exc, operation="writing snapshot catalog"),
+        )
+    return kind, snapshot
+
+
+def _sync_snapshot_catalog(
+    catalog: SnapshotCatalog,
+    listings: Mapping[Path, tuple[int | None, set[str]]],
+    failed_files: set[Path],
+) -> None:
+    """Prune fully listed directories and settle archives that are complete.
+
+    A name the load skipped (its live copy won the filename dedup) is
+    catalogued here, so a settled archive can answer for every file it holds.
+    """
+    for directory, (mtime_ns, names) in listings.items():
+        complete = mtime_ns is not None
+        for name in sorted(names):
+            filepath = directory / name
+            if not complete:
+                break
+            if filepath in failed_files:
+                complete = False
+                continue
+            try:
+                _load_snapshot_file(filepath, catalog)
+            except Exception:
+                complete = False
+        try:
+            settled = catalog.sync_listing(
+                directory, names, settle_mtime_ns=mtime_ns if complete else None
+            )
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning(
+                "snapshot_catalog_sync_failed",
+                directory=str(directory),
+                **summarize_exception(exc, operation="syncing snapshot catalog"),
+            )
+            continue
+        if settled:
+            logger.debug("snapshot_catalog_dir_settled", directory=str(directory))
+    logger.info("snapshot_catalog_used", **catalog.stats)
+
+
 def load_past_snapshots(
     ticker: str | None,
     results_dir: Path,
@@ -1557,14 +1685,34 @@ def load_past_snapshots(
             continue
         search_dirs.append(archive_path)
 
+    catalog = _open_snapshot_catalog(results_dir)
+    # Archive directories the catalog answers for without listing or stat'ing.
+    settled_dirs: set[Path] = set()
+    # Directories listed in full on an all-ticker load: (mtime before listing,
+    # names). Their rows are pruned to the listing, and archives are settled.
+    listings: dict[Path, tuple[int | None, set[str]]] = {}
+
     files: list[Path] = []
     seen: set[str] = set()
     for search_dir in search_dirs:
         if not search_dir.exists():
             continue
-        found = sorted(search_dir.glob(pattern), reverse=True)
-        if pattern2:
-            found.extend(sorted(search_dir.glob(pattern2), reverse=True))
+        is_archive = search_dir != results_dir
+        settled = (
+            _settled_snapshot_names(catalog, search_dir, [pattern, pattern2])
+            if catalog is not None and is_archive
+            else None
+        )
+        if settled is not None:
+            settled_dirs.add(search_dir)
+            found = [search_dir / name for name in settled]
+        else:
+            dir_mtime_ns = search_dir.stat().st_mtime_ns if is_archive else None
+            found = sorted(search_dir.glob(pattern), reverse=True)
+            if pattern2:
+                found.extend(sorted(search_dir.glob(pattern2), reverse=True))
+            if catalog is not None and ticker is None:
+                listings[search_dir] = (dir_mtime_ns, {path.name for path in found})
         for candidate in found:
             # Deduplicate by filename: the same artifact copied into an archive
             # keeps its name, and the live tree is scanned first.
@@ -1575,6 +1723,7 @@ def load_past_snapshots(
 
     total_files = len(files)
     seen_identities: set[str] = set()
+    failed_files: set[Path] = set()
     if progress is not None:
         progress(
             SnapshotLoadProgress(
@@ -1610,11 +1759,15 @@ def load_past_snapshots(
             )
 
         try:
-            with open(filepath) as handle:
-                data = json.load(handle)
+            kind, snapshot = _load_snapshot_file(
+                filepath, catalog, trusted=filepath.parent in settled_dirs
+            )
 
-            snapshot = data.get("prediction_snapshot")
-            if not snapshot:
+            if kind == SNAPSHOT_MALFORMED:
+                logger.warning("malformed_json", file=filepath.name)
+                emit_progress()
+                continue
+            if kind == SNAPSHOT_EMPTY or snapshot is None:
                 logger.debug(
                     "no_snapshot_in_file",
                     file=filepath.name,
@@ -1626,9 +1779,6 @@ def load_past_snapshots(
             snap_ticker = snapshot.get("ticker", "UNKNOWN")
             if snap_ticker not in snapshots:
                 snapshots[snap_ticker] = []
-            # Attach source file before deriving identity — it is the legacy
-            # fallback for snapshots written before analysis_id existed.
-            snapshot["_source_file"] = filepath.name
             identity = snapshot_identity(snapshot)
             if identity in seen_identities:
                 # Same run re-saved under a different filename (a live artifact
@@ -1643,14 +1793,11 @@ def load_past_snapshots(
                 emit_progress()
                 continue
             seen_identities.add(identity)
-            _resolve_bear_evidence(snapshot, data)
             snapshots[snap_ticker].append(snapshot)
             emit_progress()
 
-        except json.JSONDecodeError:
-            logger.warning("malformed_json", file=filepath.name)
-            emit_progress()
         except Exception as e:
+            failed_files.add(filepath)
             logger.warning(
                 "snapshot_load_error",
                 file=filepath.name,
@@ -1659,6 +1806,10 @@ def load_past_snapshots(
             )
             emit_progress()
 
+    if catalog is not None:
+        _sync_snapshot_catalog(catalog, listings, failed_files)
+        catalog.close()
+
     if progress is not None:
         progress(
             SnapshotLoadProgress(
@@ -1674,7 +1825,11 @@ def load_past_snapshots(
     return snapshots
 
 
-async def compare_to_reality(snapshot: dict[str, Any]) -> dict[str, Any] | None:
+async def compare_to_reality(
+    snapshot: dict[str, Any],
+    *,
+    price_frames: RetrospectivePriceFrames | None = None,
+) -> dict[str, Any] | None:
     """
     Compare a past prediction snapshot to current market reality.
 
@@ -1683,6 +1838,8 @@ async def compare_to_reality(snapshot: dict[str, Any]) -> dict[str, Any] | None:
 
     Args:
         snapshot: Prediction snapshot dict from extract_snapshot()
+        price_frames: Bars prefetched for the whole run; symbols missing from
+            it are fetched individually.
 
     Returns:
         Comparison dict if threshold exceeded, None otherwise.
@@ -1734,22 +1891,37 @@ async def compare_to_reality(snapshot: dict[str, Any]) -> dict[str, Any] | None:
     try:
         import yfinance as yf
 
+        from src.data.price_store import get_price_store
+
+        price_store = get_price_store()
+        window_start = analysis_date.strftime("%Y-%m-%d")
+        window_end = datetime.now().strftime("%Y-%m-%d")
+
+        def _history(symbol: str) -> Any:
+            if price_frames is not None:
+                window = price_frames.window(symbol, window_start, window_end)
+                if window is not None:
+                    return window
+            # The incremental store turns repeated multi-year downloads of the
+            # same ticker/benchmark into a few days of new bars each.
+            if price_store is not None:
+                return price_store.get_window(
+                    symbol, start=window_start, end=window_end
+                )
+            return yf.Ticker(symbol).history(start=window_start, end=window_end)
+
         def _fetch_current_data() -> _RetrospectiveMarketData:
             result: _RetrospectiveMarketData = {}
 
             # Current stock price (adjusted close for total return)
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(
-                    start=analysis_date.strftime("%Y-%m-%d"),
-                    end=datetime.now().strftime("%Y-%m-%d"),
-                )
+                hist = _history(ticker)
                 if len(hist) >= 2:
                     result["start_adj_close"] = float(hist["Close"].iloc[0])
                     result["end_adj_close"] = float(hist["Close"].iloc[-1])
                 else:
                     # Fallback: use info
-                    info = stock.info
+                    info = yf.Ticker(ticker).info
                     current = info.get("currentPrice") or info.get("regularMarketPrice")
                     if current:
                         result["end_adj_close"] = float(current)
@@ -1761,11 +1933,7 @@ async def compare_to_reality(snapshot: dict[str, Any]) -> dict[str, Any] | None:
             # Benchmark return over same period
             benchmark = snapshot.get("benchmark_index", FALLBACK_BENCHMARK)
             try:
-                bench = yf.Ticker(benchmark)
-                bench_hist = bench.history(
-                    start=analysis_date.strftime("%Y-%m-%d"),
-                    end=datetime.now().strftime("%Y-%m-%d"),
-                )
+                bench_hist = _history(benchmark)
                 if len(bench_hist) >= 2:
                     result["bench_start"] = float(bench_hist["Close"].iloc[0])
                     result["bench_end"] = float(bench_hist["Close"].iloc[-1])
@@ -1776,11 +1944,7 @@ async def compare_to_reality(snapshot: dict[str, Any]) -> dict[str, Any] | None:
                 # Fallback to S&P 500 if primary benchmark fails
                 if benchmark != FALLBACK_BENCHMARK:
                     try:
-                        bench = yf.Ticker(FALLBACK_BENCHMARK)
-                        bench_hist = bench.history(
-                            start=analysis_date.strftime("%Y-%m-%d"),
-                            end=datetime.now().strftime("%Y-%m-%d"),
-                        )
+                        bench_hist = _history(FALLBACK_BENCHMARK)
                         if len(bench_hist) >= 2:
                             result["bench_start"] = float(bench_hist["Close"].iloc[0])
                             result["bench_end"] = float(bench_hist["Close"].iloc[-1])
@@ -3810,11 +3974,26 @@ async def run_retrospective(
         return []
 
     # ── Phase 2: price the selected snapshots ────────────────────────────────
+    price_frames = None
+    if selected and getattr(config, "retrospective_bulk_prices_enabled", False):
+        from src.data.price_store import get_price_store
+
+        # One request per chunk of distinct symbols instead of two per
+        # snapshot; benchmark series are shared by every snapshot using them.
+        price_frames = await prefetch_price_frames(
+            [candidate.snapshot for candidate in selected],
+            end=datetime.now().strftime("%Y-%m-%d"),
+            default_benchmark=FALLBACK_BENCHMARK,
+            store=get_price_store(),
+        )
+
     comparisons_by_ticker: dict[str, list[dict[str, Any]]] = {}
     for candidate in selected:
         counters.evaluated += 1
         try:
-            comparison = await compare_to_reality(candidate.snapshot)
+            comparison = await compare_to_reality(
+                candidate.snapshot, price_frames=price_frames
+            )
         except Exception as exc:
             counters.failed += 1
             logger.warning(
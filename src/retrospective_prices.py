@@ -0,0 +1,190 @@
+"""Bulk daily-bar windows for one retrospective run.
+
+``compare_to_reality`` prices each snapshot on its own: one history request for
+the ticker and one for its benchmark, so a full-history run over hundreds of
+snapshots makes hundreds of round-trips, most of them for the same few index
+series. With ``RETROSPECTIVE_BULK_PRICES_ENABLED=true`` the orchestrator calls
+``prefetch_price_frames`` once over the selected snapshots instead. Every
+distinct ticker and benchmark is fetched a single time from its earliest
+needed date, in multi-symbol ``yf.download`` requests (or from the
+incremental price store when that is enabled). The comparisons then slice
+their windows out of these in-memory frames.
+
+A symbol missing from the result (a failed chunk, or no bars in a successful
+one) is simply absent, and ``compare_to_reality`` fetches it on its own as
+before, so a bulk failure costs latency, never a comparison.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+import structlog
+
+from src.async_utils import run_with_hard_timeout
+from src.data.price_store import _bar_dates
+from src.error_safety import summarize_exception
+
+logger = structlog.get_logger(__name__)
+
+# Symbols per yf.download request. Chunks are formed after sorting by start
+# date, so each request's shared start stays close to its members' own.
+_BULK_CHUNK_SIZE = 40
+_CHUNK_TIMEOUT_SECONDS = 60.0
+
+# (symbols, start, end) -> {symbol: daily bars}; ``end`` is exclusive.
+LoadChunkFn = Callable[[list[str], str, str], dict[str, pd.DataFrame]]
+
+
+class RetrospectivePriceFrames:
+    """Daily bars loaded once per symbol, sliced per snapshot window."""
+
+    def __init__(self, frames: Mapping[str, pd.DataFrame]) -> None:
+        self._frames = dict(frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._frames
+
+    def window(self, symbol: str, start: str, end: str) -> pd.DataFrame | None:
+        """Bars in ``[start, end)``, or ``None`` when *symbol* was not loaded."""
+        frame = self._frames.get(symbol)
+        if frame is None:
+            return None
+        if frame.empty:
+            return frame
+        dates = _bar_dates(frame)
+        mask = (dates >= pd.Timestamp(start)) & (dates < pd.Timestamp(end))
+        return frame.loc[mask]
+
+
+def price_window_starts(
+    snapshots: Iterable[Mapping[str, Any]], *, default_benchmark: str
+) -> dict[str, str]:
+    """Earliest analysis date needed per ticker and benchmark symbol."""
+    starts: dict[str, str] = {}
+    for snapshot in snapshots:
+        analysis_date = str(snapshot.get("analysis_date") or "")
+        try:
+            datetime.strptime(analysis_date, "%Y-%m-%d")
+        except ValueError:
+            continue
+        symbols = (
+            snapshot.get("ticker"),
+            snapshot.get("benchmark_index", default_benchmark),
+        )
+        for symbol in symbols:
+            if not symbol:
+                continue
+            symbol = str(symbol)
+            if symbol not in starts or analysis_date < starts[symbol]:
+                starts[symbol] = analysis_date
+    return starts
+
+
+def download_chunk(symbols: list[str], start: str, end: str) -> dict[str, pd.DataFrame]:
+    """One multi-symbol yfinance request; symbols without bars are left out."""
+    import yfinance as yf
+
+    data = yf.download(
+        symbols,
+        start=start,
+        end=end,
+        group_by="ticker",
+        auto_adjust=True,
+        actions=False,
+        threads=True,
+        progress=False,
+    )
+    frames: dict[str, pd.DataFrame] = {}
+    if data is None or data.empty:
+        return frames
+    multi = isinstance(data.columns, pd.MultiIndex)
+    tickers = set(data.columns.get_level_values(0)) if multi else set()
+    for symbol in symbols:
+        if multi:
+            if symbol not in tickers:
+                continue
+            frame = data[symbol]
+        elif len(symbols) == 1:
+            frame = data
+        else:
+            continue
+        if "Close" not in frame:
+            continue
+        frame = frame.dropna(subset=["Close"])
+        if not frame.empty:
+            frames[symbol] = frame
+    return frames
+
+
+def _store_loader(store: Any) -> LoadChunkFn:
+    def _load(symbols: list[str], start: str, end: str) -> dict[str, pd.DataFrame]:
+        frames: dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            try:
+                frame = store.get_window(symbol, start=start, end=end)
+            except Exception as exc:
+                logger.debug(
+                    "retrospective_store_window_failed",
+                    symbol=symbol,
+                    error_type=type(exc).__name__,
+                )
+                continue
+            if frame is not None and not frame.empty:
+                frames[symbol] = frame
+        return frames
+
+    return _load
+
+
+async def prefetch_price_frames(
+    snapshots: Iterable[Mapping[str, Any]],
+    *,
+    end: str,
+    default_benchmark: str,
+    store: Any = None,
+    load_chunk: LoadChunkFn | None = None,
+) -> RetrospectivePriceFrames:
+    """Load every ticker and benchmark the snapshots need, a chunk per request."""
+    starts = price_window_starts(snapshots, default_benchmark=default_benchmark)
+    loader = load_chunk or (
+        _store_loader(store) if store is not None else download_chunk
+    )
+    ordered = sorted(starts, key=lambda symbol: (starts[symbol], symbol))
+
+    frames: dict[str, pd.DataFrame] = {}
+    requests = 0
+    for offset in range(0, len(ordered), _BULK_CHUNK_SIZE):
+        chunk = ordered[offset : offset + _BULK_CHUNK_SIZE]
+        chunk_start = min(starts[symbol] for symbol in chunk)
+        requests += 1
+        try:
+            loaded = await run_with_hard_timeout(
+                asyncio.to_thread(loader, chunk, chunk_start, end),
+                timeout=_CHUNK_TIMEOUT_SECONDS,
+                label=f"retrospective_bulk_prices:{len(chunk)}",
+            )
+        except Exception as exc:
+            logger.warning(
+                "retrospective_bulk_prices_failed",
+                symbols=len(chunk),
+                **summarize_exception(exc, operation="retrospective bulk prices"),
+            )
+            continue
+        frames.update(loaded)
+
+    logger.info(
+        "retrospective_prices_prefetched",
+        symbols=len(ordered),
+        loaded=len(frames),
+        requests=requests,
+        source="price_store" if store is not None and load_chunk is None else "bulk",
+    )
+    return RetrospectivePriceFrames(frames)
@@ -0,0 +1,303 @@
+"""Per-run latency profiler and critical-path report for the analysis graph.
+
+Opt-in with ``--profile`` or ``RUN_PROFILE_ENABLED=true``. While a profiler is
+active, the graph builder wraps every node, and the LLM retry loop, the tool
+execution service, content inspection, the data-source fan-out and the
+process rate limiters record enter/exit spans. Spans are attributed to the graph node that was
+running when they opened, through a context variable that ``asyncio`` tasks
+and ``to_thread`` workers inherit.
+
+The critical path is derived from the node spans, not from a hard-coded DAG.
+LangGraph runs nodes in supersteps: a node starts only after every node of
+the previous step has finished. So the node that blocked a step is the one
+that finished last before it started. Walking that relation back from the
+last node to finish yields the chain that set the wall-clock time.
+
+The result is written as Chrome trace JSON (``chrome://tracing`` or
+https://ui.perfetto.dev) next to the analysis artifact, with the
+critical-path summary under ``otherData``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+NODE_CATEGORY = "node"
+# Lane order in the trace viewer; unknown categories sort after these.
+_CATEGORY_ORDER = (
+    "graph",
+    NODE_CATEGORY,
+    "llm",
+    "rate_limit",
+    "tool",
+    "inspection",
+    "data_source",
+)
+
+_ACTIVE_PROFILER: ContextVar[RunProfiler | None] = ContextVar(
+    "active_run_profiler", default=None
+)
+_CURRENT_NODE: ContextVar[str | None] = ContextVar("profiled_graph_node", default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileSpan:
+    """One closed span; times are nanoseconds since the profiler started."""
+
+    name: str
+    category: str
+    start_ns: int
+    end_ns: int
+    node: str | None
+    args: dict[str, Any]
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+def _ms(nanoseconds: int) -> float:
+    return round(nanoseconds / 1_000_000, 3)
+
+
+class RunProfiler:
+    """Collects spans for one analysis run."""
+
+    def __init__(self, *, label: str = "") -> None:
+        self.label = label
+        self.started_at = datetime.now(UTC)
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: list[ProfileSpan] = []
+        # Synchronous rate-limiter waits record from to_thread workers.
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[ProfileSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; the yielded dict becomes the span's args."""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield args
+        except BaseException as exc:
+            args.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            end_ns = time.perf_counter_ns()
+            span = ProfileSpan(
+                name=name,
+                category=category,
+                start_ns=start_ns - self._origin_ns,
+                end_ns=end_ns - self._origin_ns,
+                node=_CURRENT_NODE.get(),
+                args=args,
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    def wrap_node(self, node_name: str, node: Any) -> Any:
+        """Graph ``node_observer`` hook: time the node and scope child spans."""
+
+        async def wrapped(state, config):
+            token = _CURRENT_NODE.set(node_name)
+            try:
+                with self.span(node_name, NODE_CATEGORY):
+                    return await node(state, config)
+            finally:
+                _CURRENT_NODE.reset(token)
+
+        return wrapped
+
+    def critical_path(self) -> list[dict[str, Any]]:
+        """Return the chain of node spans that determined wall-clock time.
+
+        Each step carries its duration, the idle gap since its blocker
+        finished, and the busy time of its child spans by category. LLM
+        attempt spans include any rate-limit wait inside them.
+        """
+        nodes = [span for span in self.spans if span.category == NODE_CATEGORY]
+        if not nodes:
+            return []
+        chain = [max(nodes, key=lambda span: span.end_ns)]
+        while True:
+            current = chain[-1]
+            blockers = [span for span in nodes if span.end_ns <= current.start_ns]
+            if not blockers:
+                break
+            chain.append(max(blockers, key=lambda span: span.end_ns))
+        chain.reverse()
+
+        children: dict[str, dict[str, int]] = {}
+        for span in self.spans:
+            if span.category == NODE_CATEGORY or span.node is None:
+                continue
+            by_category = children.setdefault(span.node, {})
+            by_category[span.category] = (
+                by_category.get(span.category, 0) + span.duration_ns
+            )
+
+        steps: list[dict[str, Any]] = []
+        previous_end_ns = 0
+        for span in chain:
+            steps.append(
+                {
+                    "node": span.name,
+                    "start_ms": _ms(span.start_ns),
+                    "duration_ms": _ms(span.duration_ns),
+                    "wait_ms": _ms(max(0, span.start_ns - previous_end_ns)),
+                    "busy_ms_by_category": {
+                        category: _ms(total)
+                        for category, total in sorted(
+                            children.get(span.name, {}).items()
+                        )
+                    },
+                }
+            )
+            previous_end_ns = span.end_ns
+        return steps
+
+    def summary(self) -> dict[str, Any]:
+        spans = self.spans
+        path = self.critical_path()
+        wall_ns = max((span.end_ns for span in spans), default=0)
+        return {
+            "label": self.label,
+            "started_at": self.started_at.isoformat(),
+            "wall_ms": _ms(wall_ns),
+            "span_count": len(spans),
+            "critical_path_ms": round(
+                sum(step["duration_ms"] + step["wait_ms"] for step in path), 3
+            ),
+            "critical_path": path,
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return Chrome trace-event JSON with one lane group per category.
+
+        Spans of the same category that overlap (parallel analysts, the
+        data-source fan-out) are packed into separate lanes, because the
+        viewer can only nest events on one thread, not overlap them.
+        """
+        spans = sorted(self.spans, key=lambda span: (span.start_ns, -span.end_ns))
+        categories = sorted(
+            {span.category for span in spans},
+            key=lambda category: (
+                _CATEGORY_ORDER.index(category)
+                if category in _CATEGORY_ORDER
+                else len(_CATEGORY_ORDER),
+                category,
+            ),
+        )
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 0,
+                "args": {"name": f"analysis {self.label}".strip()},
+            }
+        ]
+        lane_ends: dict[str, list[int]] = {category: [] for category in categories}
+        lane_tids: dict[tuple[str, int], int] = {}
+        for span in spans:
+            ends = lane_ends[span.category]
+            lane = next(
+                (index for index, end in enumerate(ends) if end <= span.start_ns),
+                len(ends),
+            )
+            if lane == len(ends):
+                ends.append(span.end_ns)
+            else:
+                ends[lane] = span.end_ns
+            key = (span.category, lane)
+            if key not in lane_tids:
+                lane_tids[key] = (categories.index(span.category) + 1) * 100 + lane
+            args = dict(span.args)
+            if span.node is not None and span.category != NODE_CATEGORY:
+                args["node"] = span.node
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": 1,
+                    "tid": lane_tids[key],
+                    "args": args,
+                }
+            )
+        for (category, lane), tid in sorted(lane_tids.items(), key=lambda i: i[1]):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": f"{category} {lane}"},
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": self.summary(),
+        }
+
+
+def active_run_profiler() -> RunProfiler | None:
+    return _ACTIVE_PROFILER.get()
+
+
+@contextmanager
+def use_run_profiler(profiler: RunProfiler | None) -> Iterator[RunProfiler | None]:
+    """Make *profiler* active for the enclosed block; ``None`` is a no-op."""
+    if profiler is None:
+        yield None
+        return
+    token = _ACTIVE_PROFILER.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _ACTIVE_PROFILER.reset(token)
+
+
+def profile_span(
+    name: str, category: str, **args: Any
+) -> AbstractContextManager[dict[str, Any]]:
+    """Record a span on the active profiler, or do nothing when none is active."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        return nullcontext(args)
+    return profiler.span(name, category, **args)
+
+
+def run_profile_path(analysis_path: Path) -> Path:
+    """Return the trace file that sits next to a saved analysis artifact."""
+    return analysis_path.with_name(f"{analysis_path.stem}.trace.json")
+
+
+def write_run_profile(trace: dict[str, Any], analysis_path: Path) -> Path:
+    path = run_profile_path(analysis_path)
+    path.write_text(json.dumps(trace), encoding="utf-8")
+    logger.info(
+        "run_profile_written",
+        path=str(path),
+        wall_ms=trace.get("otherData", {}).get("wall_ms"),
+    )
+    return path
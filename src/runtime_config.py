@@ -29,6 +29,9 @@ class RuntimeConfig:
     # every run.
     base_fast_model_override: str | None = None
     base_reasoning_model_override: str | None = None
+    # `--profile` / RUN_PROFILE_ENABLED: write a Chrome trace of node, LLM,
+    # tool, rate-limit and data-source spans next to the analysis artifact.
+    profile_run: bool = False
 
     @classmethod
     def from_config(cls, base_config: Any) -> RuntimeConfig:
@@ -48,6 +51,7 @@ class RuntimeConfig:
             quick_mode_active=getattr(base_config, "quick_mode_active", False),
             images_dir=Path(base_config.images_dir),
             quiet_mode=getattr(base_config, "quiet_mode", False),
+            profile_run=bool(getattr(base_config, "run_profile_enabled", False)),
         )
 
     def with_overrides(self, **changes: Any) -> RuntimeConfig:
@@ -94,6 +98,8 @@ def build_runtime_config(args: Any, base_config: Any) -> RuntimeConfig:
         args, "trace_langfuse", False
     ):
         runtime_config = runtime_config.with_overrides(langfuse_enabled=True)
+    if getattr(args, "profile", False):
+        runtime_config = runtime_config.with_overrides(profile_run=True)
     return runtime_config
 
 
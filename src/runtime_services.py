@@ -114,6 +114,32 @@ class RuntimeServices:
             tool_service=self.tool_service.with_extra_hooks(hooks),
         )
 
+    def for_new_run(self) -> RuntimeServices:
+        """Return a copy with fresh run-scoped state and shared process services.
+
+        Providers, inspection, and MCP stay shared; the evidence ledger and
+        issuer-authority registry are per analysis so concurrent runs in one
+        process cannot bind each other's evidence.
+        """
+        evidence_recorder = None
+        tool_service = self.tool_service
+        if self.evidence_recorder is not None:
+            from src.tooling.evidence_recorder import EvidenceRecorder
+
+            evidence_recorder = EvidenceRecorder()
+            tool_service = tool_service.with_hooks(
+                [
+                    evidence_recorder if hook is self.evidence_recorder else hook
+                    for hook in tool_service.hooks
+                ]
+            )
+        return replace(
+            self,
+            tool_service=tool_service,
+            evidence_recorder=evidence_recorder,
+            issuer_authority=IssuerAuthorityRegistry(),
+        )
+
 
 _CURRENT_RUNTIME_SERVICES: ContextVar[RuntimeServices | None] = ContextVar(
     "current_runtime_services",
@@ -236,7 +262,9 @@ def build_provider_runtime(
         rpm = getattr(settings, field_name, None)
         key = ProviderRuntimeKey(vendor_id)
         if rpm is not None and key not in resolved_limiters:
-            resolved_limiters[key] = create_process_rate_limiter(rpm=int(rpm))
+            resolved_limiters[key] = create_process_rate_limiter(
+                rpm=int(rpm), vendor_id=vendor_id
+            )
 
     return ProviderRuntime(
         fetcher=fetcher,
@@ -316,11 +344,18 @@ def build_runtime_services_from_config(
         elif backend_name == "composite":
             from src.tooling.escalating_inspector import EscalatingInspector
             from src.tooling.heuristic_inspector import HeuristicInspector
-            from src.tooling.llm_judge_inspector import LLMJudgeInspector
+            from src.tooling.judge_verdict_cache import JudgeVerdictCache
+            from src.tooling.llm_judge_inspector import (
+                LLMJudgeInspector,
+                resolve_judge_model_name,
+            )
 
             inspector = EscalatingInspector(
                 heuristic=HeuristicInspector(),
-                judge=LLMJudgeInspector(),
+                judge=LLMJudgeInspector(
+                    resolve_judge_model_name(config),
+                    verdict_cache=JudgeVerdictCache.from_config(config),
+                ),
             )
         else:
             raise ValueError(
@@ -364,6 +399,11 @@ def build_runtime_services_from_config(
             mcp_runtime = MCPRuntime(
                 servers=servers,
                 budget_db_path=str(config.mcp_usage_db_path),
+                session_idle_seconds=(
+                    float(getattr(config, "mcp_session_idle_seconds", 300.0))
+                    if getattr(config, "mcp_session_pool_enabled", False)
+                    else None
+                ),
             )
             hooks.append(MCPBudgetHook(mcp_runtime))
             if logger is not None:
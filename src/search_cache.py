@@ -0,0 +1,259 @@
+"""Content-addressed cache for Tavily and DuckDuckGo search results.
+
+The news, foreign-language, legal, value-trap and gap-fill agents all search
+for the same company names, and same-day reruns repeat every query. With
+``SEARCH_CACHE_ENABLED=true`` each search is keyed by (profile, normalized
+query, include_answer, UTC date, active inspection configuration) and its
+*post-inspection* result is stored
+under ``DATA_CACHE_DIR/search`` as one JSON file per key, so any process on
+the box can reuse it until the profile's TTL expires. The date bucket means a
+query is never answered from a previous day's results, however long the TTL,
+and the inspection part (backend, judge prompt version, mode) means a result
+approved by a weaker inspector is never served to a run with a stricter one.
+
+Concurrent identical searches inside one event loop are coalesced: the first
+caller runs the search, the rest await its result. Only truthy results are
+stored, so timeouts and errors (``None``/``[]``) are retried next time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+import unicodedata
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.data.disk_cache import _atomic_write_bytes
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_PROFILE_TTL_SECONDS: dict[str, float] = {
+    "news_basic": 6 * 3600,
+    "finance_deep": 24 * 3600,
+    # Generic Tavily tool behind ``tavily_search_with_timeout``.
+    "tavily": 6 * 3600,
+    "tavily_extract": 24 * 3600,
+    "ddg": 6 * 3600,
+}
+
+_MISS = object()
+
+
+def normalize_query(query: str) -> str:
+    """Fold case, width and whitespace so trivially different queries share a key."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def search_cache_key(
+    profile: str,
+    query: str,
+    *,
+    include_answer: bool = False,
+    extra: dict[str, Any] | None = None,
+    inspection: dict[str, Any] | None = None,
+    day: str | None = None,
+) -> str:
+    payload = {
+        "profile": profile,
+        "query": normalize_query(query),
+        "include_answer": include_answer,
+        "day": day or datetime.now(UTC).date().isoformat(),
+        "extra": extra or {},
+        "inspection": inspection or {},
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+class SearchResultCache:
+    """On-disk search-result cache with per-profile TTLs and single-flight fetches."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        profile_ttls: dict[str, float] | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.profile_ttls = {**DEFAULT_PROFILE_TTL_SECONDS, **(profile_ttls or {})}
+        self.stats: dict[str, Any] = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "writes": 0,
+            "by_profile": {},
+        }
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+
+    @classmethod
+    def from_config(cls, settings: Any) -> SearchResultCache | None:
+        """Return the configured cache, or ``None`` when it is disabled."""
+        if not getattr(settings, "search_cache_enabled", False):
+            return None
+        return cls(
+            Path(settings.data_cache_dir) / "search",
+            profile_ttls={
+                "news_basic": float(settings.search_cache_news_ttl_seconds),
+                "tavily": float(settings.search_cache_news_ttl_seconds),
+                "ddg": float(settings.search_cache_news_ttl_seconds),
+                "finance_deep": float(settings.search_cache_finance_ttl_seconds),
+                "tavily_extract": float(settings.search_cache_finance_ttl_seconds),
+            },
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _ttl(self, profile: str) -> float:
+        return float(
+            self.profile_ttls.get(profile, DEFAULT_PROFILE_TTL_SECONDS["tavily"])
+        )
+
+    def _record(self, profile: str, outcome: str) -> None:
+        self.stats[outcome] += 1
+        by_profile = self.stats["by_profile"].setdefault(
+            profile, {"hits": 0, "misses": 0, "coalesced": 0}
+        )
+        by_profile[outcome] += 1
+
+    def get(self, profile: str, key: str) -> Any:
+        """Return the stored result, or ``_MISS`` when absent, expired or torn."""
+        try:
+            envelope = json.loads(self._path(key).read_text(encoding="utf-8"))
+            stored_at = float(envelope["stored_at"])
+            result = envelope["result"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return _MISS
+        if time.time() - stored_at >= self._ttl(profile):
+            return _MISS
+        return result
+
+    def set(self, profile: str, key: str, result: Any) -> None:
+        try:
+            body = json.dumps(
+                {"stored_at": time.time(), "profile": profile, "result": result},
+                ensure_ascii=False,
+            ).encode("utf-8")
+            _atomic_write_bytes(self._path(key), body)
+            self.stats["writes"] += 1
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(
+                "search_cache_write_failed",
+                profile=profile,
+                error_type=type(exc).__name__,
+            )
+
+    async def get_or_fetch(
+        self,
+        profile: str,
+        query: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        include_answer: bool = False,
+        extra: dict[str, Any] | None = None,
+        inspection: dict[str, Any] | None = None,
+    ) -> Any:
+        key = search_cache_key(
+            profile,
+            query,
+            include_answer=include_answer,
+            extra=extra,
+            inspection=inspection,
+        )
+        cached = self.get(profile, key)
+        if cached is not _MISS:
+            self._record(profile, "hits")
+            logger.debug("search_cache_hit", profile=profile, query=query[:100])
+            return cached
+
+        # Keyed by loop too: the sync Tavily path runs searches on its own loop,
+        # and a task cannot be awaited from another loop.
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, key)
+        task = self._inflight.get(inflight_key)
+        if task is not None:
+            self._record(profile, "coalesced")
+            return await asyncio.shield(task)
+
+        self._record(profile, "misses")
+        task = loop.create_task(self._fetch_and_store(profile, key, fetch))
+        self._inflight[inflight_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        # Shielded so one cancelled caller does not cancel the search for the
+        # others waiting on it.
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self, profile: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        result = await fetch()
+        if result:
+            self.set(profile, key, result)
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            **{k: v for k, v in self.stats.items() if k != "by_profile"},
+            "by_profile": {
+                profile: dict(counts)
+                for profile, counts in sorted(self.stats["by_profile"].items())
+            },
+        }
+
+
+_UNSET = object()
+_search_cache: Any = _UNSET
+
+
+def get_search_cache() -> SearchResultCache | None:
+    """Return the process-wide cache, building it from config on first use."""
+    global _search_cache
+    if _search_cache is _UNSET:
+        from src.config import config
+
+        _search_cache = SearchResultCache.from_config(config)
+    return _search_cache
+
+
+def set_search_cache(cache: SearchResultCache | None) -> None:
+    """Install (or, with ``None``, disable) the process-wide cache."""
+    global _search_cache
+    _search_cache = cache
+
+
+async def cached_search(
+    profile: str,
+    query: str,
+    fetch: Callable[[], Awaitable[Any]],
+    *,
+    include_answer: bool = False,
+    extra: dict[str, Any] | None = None,
+) -> Any:
+    """Run *fetch* through the search cache, or directly when it is disabled."""
+    cache = get_search_cache()
+    if cache is None:
+        return await fetch()
+    from src.runtime_services import get_current_inspection_service
+
+    return await cache.get_or_fetch(
+        profile,
+        query,
+        fetch,
+        include_answer=include_answer,
+        extra=extra,
+        inspection=get_current_inspection_service().cache_identity(),
+    )
+
+
+def search_cache_snapshot() -> dict[str, Any]:
+    """JSON-serializable hit/miss counters for the run summary; empty when disabled."""
+    cache = _search_cache if isinstance(_search_cache, SearchResultCache) else None
+    return cache.snapshot() if cache is not None else {}
@@ -0,0 +1,240 @@
+"""
+Persistent catalog of extracted prediction snapshots.
+
+``load_past_snapshots`` used to glob the live results directory and every
+archive directory and JSON-parse each ``*_analysis.json`` on every
+retrospective run, including the ticker-scoped runs fired after each
+re-analysis. With ``SNAPSHOT_CATALOG_ENABLED=true`` it keeps one row per file,
+keyed by directory and file name, holding the snapshot exactly as the loader
+hands it on (``_source_file`` attached, bear evidence resolved), the
+snapshot's ticker, and the ``(size, mtime_ns)`` it was read at. A file is
+parsed again only when that identity changes.
+
+The live directory is still listed and stat'ed on every load, since artifacts
+can be rewritten in place there. Archive directories are read-only: once an
+all-ticker load has catalogued every file in one, the directory is recorded as
+*settled* at its own mtime, and later loads answer from the catalog without
+listing or stat'ing it, until adding or removing a file moves that mtime.
+
+Rows remember the catalog version they were derived with; bump
+``SNAPSHOT_CATALOG_VERSION`` when snapshot extraction or evidence resolution
+changes what a row should hold.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+SNAPSHOT_CATALOG_VERSION = 1
+
+SNAPSHOT_FOUND = "snapshot"
+SNAPSHOT_EMPTY = "empty"
+SNAPSHOT_MALFORMED = "malformed"
+
+_BUSY_TIMEOUT_SECONDS = 10.0
+# A directory modified this recently may still gain files within the same
+# mtime tick, so it is not recorded as settled yet.
+_SETTLE_GRACE_NS = 2_000_000_000
+
+
+def snapshot_catalog_path(results_dir: Path) -> Path:
+    """Return the sibling SQLite file that stores the snapshot catalog."""
+    return results_dir.parent / f".{results_dir.name}.snapshot_catalog.sqlite3"
+
+
+def _dir_key(directory: Path) -> str:
+    return str(Path(directory).resolve())
+
+
+class SnapshotCatalog:
+    """SQLite-backed snapshot rows keyed by directory and file name."""
+
+    def __init__(
+        self, db_path: Path, *, version: int = SNAPSHOT_CATALOG_VERSION
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self._conn = sqlite3.connect(
+            self._db_path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._init_db()
+        self.stats = {"hits": 0, "misses": 0, "settled_dirs": 0}
+
+    @classmethod
+    def for_results_dir(cls, results_dir: Path) -> SnapshotCatalog:
+        return cls(snapshot_catalog_path(results_dir))
+
+    def _init_db(self) -> None:
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshot_files (
+                directory TEXT NOT NULL,
+                name TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                ticker TEXT,
+                snapshot_json TEXT,
+                PRIMARY KEY (directory, name)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS snapshot_files_ticker "
+            "ON snapshot_files (ticker)"
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS settled_dirs (
+                directory TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                version INTEGER NOT NULL
+            )
+            """
+        )
+
+    def settled_names(self, directory: Path, pattern: str) -> list[str] | None:
+        """File names matching *pattern* in a settled directory, else ``None``.
+
+        ``None`` means the directory must be listed: it was never settled, it
+        was settled under another catalog version, or its mtime has moved.
+        """
+        key = _dir_key(directory)
+        row = self._conn.execute(
+            "SELECT mtime_ns, version FROM settled_dirs WHERE directory = ?", (key,)
+        ).fetchone()
+        if row is None or int(row[1]) != self.version:
+            return None
+        if int(row[0]) != Path(directory).stat().st_mtime_ns:
+            return None
+        names = self._conn.execute(
+            "SELECT name FROM snapshot_files WHERE directory = ? AND name GLOB ?",
+            (key, pattern),
+        ).fetchall()
+        return [name for (name,) in names]
+
+    def lookup(
+        self, directory: Path, name: str, stat: os.stat_result | None
+    ) -> tuple[str, dict[str, Any] | None] | None:
+        """Return ``(kind, snapshot)`` for a current row, or ``None`` on a miss.
+
+        With ``stat=None`` (a settled directory) the row is trusted as-is.
+        """
+        row = self._conn.execute(
+            """
+            SELECT size, mtime_ns, version, kind, snapshot_json
+            FROM snapshot_files WHERE directory = ? AND name = ?
+            """,
+            (_dir_key(directory), name),
+        ).fetchone()
+        if row is None or int(row[2]) != self.version:
+            self.stats["misses"] += 1
+            return None
+        size, mtime_ns, _version, kind, snapshot_json = row
+        if stat is not None and (
+            int(size) != stat.st_size or int(mtime_ns) != stat.st_mtime_ns
+        ):
+            self.stats["misses"] += 1
+            return None
+        try:
+            snapshot = json.loads(snapshot_json) if snapshot_json is not None else None
+        except ValueError:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return str(kind), snapshot
+
+    def store(
+        self,
+        directory: Path,
+        name: str,
+        stat: os.stat_result,
+        *,
+        kind: str,
+        snapshot: dict[str, Any] | None,
+    ) -> None:
+        """Insert or replace the row for one artifact."""
+        ticker = snapshot.get("ticker") if snapshot is not None else None
+        self._conn.execute(
+            """
+            INSERT INTO snapshot_files (
+                directory, name, size, mtime_ns, version, kind, ticker,
+                snapshot_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(directory, name)
+            DO UPDATE SET
+                size = excluded.size,
+                mtime_ns = excluded.mtime_ns,
+                version = excluded.version,
+                kind = excluded.kind,
+                ticker = excluded.ticker,
+                snapshot_json = excluded.snapshot_json
+            """,
+            (
+                _dir_key(directory),
+                name,
+                stat.st_size,
+                stat.st_mtime_ns,
+                self.version,
+                kind,
+                str(ticker) if ticker is not None else None,
+                json.dumps(snapshot) if snapshot is not None else None,
+            ),
+        )
+
+    def sync_listing(
+        self, directory: Path, names: set[str], *, settle_mtime_ns: int | None = None
+    ) -> bool:
+        """Drop rows for files no longer listed; optionally settle the directory.
+
+        *names* must be the directory's complete ``*_analysis.json`` listing.
+        The directory is settled at *settle_mtime_ns* (its mtime taken before
+        the listing) unless that is too recent to trust. Returns whether it
+        was settled.
+        """
+        key = _dir_key(directory)
+        known = {
+            name
+            for (name,) in self._conn.execute(
+                "SELECT name FROM snapshot_files WHERE directory = ?", (key,)
+            ).fetchall()
+        }
+        stale = known - names
+        if stale:
+            self._conn.executemany(
+                "DELETE FROM snapshot_files WHERE directory = ? AND name = ?",
+                [(key, name) for name in stale],
+            )
+        if settle_mtime_ns is None:
+            return False
+        if time.time_ns() - settle_mtime_ns < _SETTLE_GRACE_NS:
+            return False
+        self._conn.execute(
+            """
+            INSERT INTO settled_dirs (directory, mtime_ns, version)
+            VALUES (?, ?, ?)
+            ON CONFLICT(directory)
+            DO UPDATE SET mtime_ns = excluded.mtime_ns, version = excluded.version
+            """,
+            (key, settle_mtime_ns, self.version),
+        )
+        self.stats["settled_dirs"] += 1
+        return True
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> SnapshotCatalog:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
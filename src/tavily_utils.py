@@ -14,6 +14,7 @@ import structlog
 from src.config import config
 from src.error_safety import summarize_exception
 from src.runtime_services import get_current_inspection_service
+from src.search_cache import cached_search
 from src.tooling.inspector import InspectionEnvelope, SourceKind
 
 logger = structlog.get_logger(__name__)
@@ -103,32 +104,41 @@ async def tavily_search_with_timeout(
     """
     if not _tavily_tool:
         return None
+    tool = _tavily_tool
     from src.async_utils import run_with_hard_timeout
 
-    try:
-        raw = await run_with_hard_timeout(
-            _tavily_tool.ainvoke(query),
-            timeout=timeout,
-            label=f"tavily:{query.get('query', '')[:60]}",
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            "tavily_search_timeout",
-            query=query.get("query", "")[:100],
-            timeout_seconds=timeout,
-        )
-        return None
-    except Exception as e:
-        logger.warning(
-            "tavily_search_error",
-            query=query.get("query", "")[:100],
-            **summarize_exception(e, operation="tavily_search_error"),
-        )
-        return None
+    async def _search() -> Any:
+        try:
+            raw = await run_with_hard_timeout(
+                tool.ainvoke(query),
+                timeout=timeout,
+                label=f"tavily:{query.get('query', '')[:60]}",
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "tavily_search_timeout",
+                query=query.get("query", "")[:100],
+                timeout_seconds=timeout,
+            )
+            return None
+        except Exception as e:
+            logger.warning(
+                "tavily_search_error",
+                query=query.get("query", "")[:100],
+                **summarize_exception(e, operation="tavily_search_error"),
+            )
+            return None
 
-    # Preserve the original payload shape on allow/fail-open paths so callers
-    # that merge structured Tavily results do not regress.
-    return await _inspect_tavily_result(raw, query.get("query", ""))
+        # Preserve the original payload shape on allow/fail-open paths so callers
+        # that merge structured Tavily results do not regress.
+        return await _inspect_tavily_result(raw, query.get("query", ""))
+
+    return await cached_search(
+        "tavily",
+        query.get("query", ""),
+        _search,
+        extra={k: v for k, v in query.items() if k != "query"},
+    )
 
 
 async def search_tavily_inspected(
@@ -145,30 +155,33 @@ async def search_tavily_inspected(
 
     from src.async_utils import run_with_hard_timeout
 
-    try:
-        raw = await run_with_hard_timeout(
-            tool.ainvoke({"query": query}),
-            timeout=timeout,
-            label=f"tavily:{profile}:{query[:60]}",
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            "tavily_search_timeout",
-            query=query[:100],
-            timeout_seconds=timeout,
-            profile=profile,
-        )
-        return None
-    except Exception as exc:
-        logger.warning(
-            "tavily_search_error",
-            query=query[:100],
-            **summarize_exception(exc, operation="tavily_search_error"),
-            profile=profile,
-        )
-        return None
+    async def _search() -> Any:
+        try:
+            raw = await run_with_hard_timeout(
+                tool.ainvoke({"query": query}),
+                timeout=timeout,
+                label=f"tavily:{profile}:{query[:60]}",
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "tavily_search_timeout",
+                query=query[:100],
+                timeout_seconds=timeout,
+                profile=profile,
+            )
+            return None
+        except Exception as exc:
+            logger.warning(
+                "tavily_search_error",
+                query=query[:100],
+                **summarize_exception(exc, operation="tavily_search_error"),
+                profile=profile,
+            )
+            return None
+
+        return await _inspect_tavily_result(raw, query)
 
-    return await _inspect_tavily_result(raw, query)
+    return await cached_search(profile, query, _search, include_answer=include_answer)
 
 
 async def extract_tavily_inspected(
@@ -203,28 +216,33 @@ async def extract_tavily_inspected(
     )
     from src.async_utils import run_with_hard_timeout
 
-    try:
-        raw = await run_with_hard_timeout(
-            tool.ainvoke({"urls": urls[:3]}),
-            timeout=timeout,
-            label=f"tavily:extract:{query[:60]}",
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            "tavily_extract_timeout",
-            url_count=len(urls[:3]),
-            timeout_seconds=timeout,
-        )
-        return None
-    except Exception as exc:
-        logger.warning(
-            "tavily_extract_error",
-            url_count=len(urls[:3]),
-            **summarize_exception(exc, operation="tavily_extract_error"),
-        )
-        return None
+    async def _extract() -> Any:
+        try:
+            raw = await run_with_hard_timeout(
+                tool.ainvoke({"urls": urls[:3]}),
+                timeout=timeout,
+                label=f"tavily:extract:{query[:60]}",
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "tavily_extract_timeout",
+                url_count=len(urls[:3]),
+                timeout_seconds=timeout,
+            )
+            return None
+        except Exception as exc:
+            logger.warning(
+                "tavily_extract_error",
+                url_count=len(urls[:3]),
+                **summarize_exception(exc, operation="tavily_extract_error"),
+            )
+            return None
 
-    return await _inspect_tavily_result(raw, query)
+        return await _inspect_tavily_result(raw, query)
+
+    return await cached_search(
+        "tavily_extract", query, _extract, extra={"urls": urls[:3]}
+    )
 
 
 def search_tavily_sync_inspected(
@@ -6,6 +6,9 @@ Provides comprehensive logging of LLM token consumption across all agents.
 import re
 import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, Literal
@@ -434,6 +437,18 @@ class TokenTracker:
         if not self._quiet_mode:
             logger.debug("token_tracker_initialized", session_start=self.session_start)
 
+    @classmethod
+    def create_isolated(cls) -> "TokenTracker":
+        """Return a fresh tracker that is NOT the process singleton.
+
+        Used by in-process batch runs, where concurrent tickers must not share
+        (or ``reset()``) one another's usage. Bind it with ``use_tracker``.
+        """
+        tracker = super().__new__(cls)
+        tracker._initialized = False
+        tracker.__init__()
+        return tracker
+
     @classmethod
     def set_quiet_mode(cls, quiet: bool = True):
         """Enable or disable quiet mode to suppress logging."""
@@ -1216,10 +1231,28 @@ class TokenTrackingCallback(BaseCallbackHandler):
 # Global singleton instance (lazy initialization to respect quiet mode)
 _global_tracker: TokenTracker | None = None
 
+_SCOPED_TRACKER: ContextVar[TokenTracker | None] = ContextVar(
+    "scoped_token_tracker",
+    default=None,
+)
+
 
 def get_tracker() -> TokenTracker:
-    """Get the global TokenTracker singleton (lazy initialization)."""
+    """Get the tracker bound to this context, else the global singleton."""
+    scoped = _SCOPED_TRACKER.get()
+    if scoped is not None:
+        return scoped
     global _global_tracker
     if _global_tracker is None:
         _global_tracker = TokenTracker()
     return _global_tracker
+
+
+@contextmanager
+def use_tracker(tracker: TokenTracker) -> Iterator[TokenTracker]:
+    """Bind *tracker* for the current async/thread context."""
+    token: Token[TokenTracker | None] = _SCOPED_TRACKER.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _SCOPED_TRACKER.reset(token)
@@ -10,7 +10,7 @@ threshold, or when the source kind is in the always-judge set.
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
 import structlog
 
@@ -20,6 +20,7 @@ from src.tooling.inspector import (
     InspectionDecision,
     InspectionEnvelope,
     SourceKind,
+    inspector_identity,
 )
 
 logger = structlog.get_logger(__name__)
@@ -87,6 +88,17 @@ class EscalatingInspector:
             else _DEFAULT_ALWAYS_JUDGE
         )
 
+    def cache_identity(self) -> dict[str, Any]:
+        return {
+            "type": type(self).__name__,
+            "heuristic": inspector_identity(self._heuristic),
+            "judge": inspector_identity(self._judge),
+            "escalation_threshold": self._escalation_threshold,
+            "always_judge_sources": sorted(
+                kind.value for kind in self._always_judge_sources
+            ),
+        }
+
     async def inspect(self, envelope: InspectionEnvelope) -> InspectionDecision:
         heuristic_result = await self._heuristic.inspect(envelope)
 
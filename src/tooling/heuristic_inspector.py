@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections import Counter
 from dataclasses import dataclass
 from typing import Literal
 
@@ -51,6 +52,10 @@ class _Signal:
     pattern: re.Pattern[str]
     weight: float
     threat_type: _ThreatType
+    # Lower-case literals, one of which every match starts with. The scanner
+    # skips the pattern when none occurs and starts its search at the first
+    # occurrence; empty means always search from the start.
+    literals: tuple[str, ...] = ()
 
 
 # Compiled once at import time.
@@ -63,6 +68,7 @@ _SIGNALS: list[_Signal] = [
         ),
         3.0,
         "override",
+        ("ignore",),
     ),
     _Signal(
         re.compile(
@@ -71,6 +77,7 @@ _SIGNALS: list[_Signal] = [
         ),
         3.0,
         "override",
+        ("disregard",),
     ),
     _Signal(
         re.compile(
@@ -79,6 +86,7 @@ _SIGNALS: list[_Signal] = [
         ),
         3.0,
         "override",
+        ("do",),
     ),
     _Signal(
         re.compile(
@@ -87,6 +95,7 @@ _SIGNALS: list[_Signal] = [
         ),
         3.0,
         "override",
+        ("forget",),
     ),
     _Signal(
         re.compile(
@@ -94,74 +103,123 @@ _SIGNALS: list[_Signal] = [
         ),
         2.5,
         "override",
+        ("your",),
     ),
-    _Signal(re.compile(r"you\s+are\s+now\s+(a|an|the)\b", re.I), 2.0, "override"),
-    _Signal(re.compile(r"^system\s*:", re.I | re.M), 2.0, "override"),
+    _Signal(
+        re.compile(r"you\s+are\s+now\s+(a|an|the)\b", re.I), 2.0, "override", ("you",)
+    ),
+    _Signal(re.compile(r"^system\s*:", re.I | re.M), 2.0, "override", ("system",)),
     _Signal(
         re.compile(r"(?:system|admin)\s+(?:notification|alert|message)\s*:", re.I),
         2.0,
         "override",
+        ("system", "admin"),
     ),
     _Signal(
         re.compile(r"user\s+has\s+(?:authorized|approved|confirmed)\b", re.I),
         2.0,
         "override",
+        ("user",),
     ),
     # --- Role-play coercion ---
-    _Signal(re.compile(r"pretend\s+(that\s+)?you\s+are\b", re.I), 2.0, "role_play"),
+    _Signal(
+        re.compile(r"pretend\s+(that\s+)?you\s+are\b", re.I),
+        2.0,
+        "role_play",
+        ("pretend",),
+    ),
     _Signal(
         re.compile(r"act\s+as\s+(if\s+you\s+are\s+)?(a|an|the)\b", re.I),
         1.5,
         "role_play",
+        ("act",),
     ),
     _Signal(
         re.compile(r"you\s+must\s+now\s+(act|behave|respond|operate)\b", re.I),
         2.0,
         "role_play",
+        ("you",),
     ),
     _Signal(
         re.compile(r"switch\s+to\s+(a\s+)?new\s+(mode|persona|role)\b", re.I),
         2.0,
         "role_play",
+        ("switch",),
     ),
     _Signal(
         re.compile(r"entering\s+(DAN|developer|jailbreak|unrestricted)\s+mode", re.I),
         3.0,
         "role_play",
+        ("entering",),
     ),
     # --- Delimiter breakout ---
-    _Signal(re.compile(r"</search_results>", re.I), 3.0, "delimiter_breakout"),
-    _Signal(re.compile(r"</tool_output>", re.I), 3.0, "delimiter_breakout"),
-    _Signal(re.compile(r"</function_results>", re.I), 3.0, "delimiter_breakout"),
-    _Signal(re.compile(r"<\s*/\s*system\s*>", re.I), 3.0, "delimiter_breakout"),
+    _Signal(
+        re.compile(r"</search_results>", re.I),
+        3.0,
+        "delimiter_breakout",
+        ("</search_results>",),
+    ),
+    _Signal(
+        re.compile(r"</tool_output>", re.I),
+        3.0,
+        "delimiter_breakout",
+        ("</tool_output>",),
+    ),
+    _Signal(
+        re.compile(r"</function_results>", re.I),
+        3.0,
+        "delimiter_breakout",
+        ("</function_results>",),
+    ),
+    _Signal(re.compile(r"<\s*/\s*system\s*>", re.I), 3.0, "delimiter_breakout", ("<",)),
     _Signal(
         re.compile(r"---\s*END\s+(SYSTEM|INSTRUCTIONS?|CONTEXT)\s*---", re.I),
         2.5,
         "delimiter_breakout",
+        ("---",),
     ),
     _Signal(
-        re.compile(r"\]\]\s*>\s*>", re.I), 1.5, "delimiter_breakout"
+        re.compile(r"\]\]\s*>\s*>", re.I), 1.5, "delimiter_breakout", ("]]",)
     ),  # ]]>> CDATA-style
     # --- Hidden / injected markup ---
-    _Signal(re.compile(r"<!--.*?-->", re.S), 1.0, "hidden_markup"),
-    _Signal(re.compile(r"display\s*:\s*none", re.I), 1.5, "hidden_markup"),
-    _Signal(re.compile(r"font-size\s*:\s*0", re.I), 1.5, "hidden_markup"),
-    _Signal(re.compile(r"visibility\s*:\s*hidden", re.I), 1.5, "hidden_markup"),
+    _Signal(re.compile(r"<!--.*?-->", re.S), 1.0, "hidden_markup", ("<!--",)),
+    _Signal(
+        re.compile(r"display\s*:\s*none", re.I), 1.5, "hidden_markup", ("display",)
+    ),
+    _Signal(
+        re.compile(r"font-size\s*:\s*0", re.I), 1.5, "hidden_markup", ("font-size",)
+    ),
+    _Signal(
+        re.compile(r"visibility\s*:\s*hidden", re.I),
+        1.5,
+        "hidden_markup",
+        ("visibility",),
+    ),
     _Signal(
         re.compile(r"color\s*:\s*(?:white|transparent|rgba\s*\([^)]*,\s*0\s*\))", re.I),
         1.0,
         "hidden_markup",
+        ("color",),
     ),
     _Signal(
         re.compile(r"position\s*:\s*absolute[^;]*left\s*:\s*-\d{4,}", re.I),
         1.0,
         "hidden_markup",
+        ("position",),
     ),
     # --- Encoded payload hints ---
     _Signal(
-        re.compile(r"(?:base64|eval|decode)\s*[\(:]", re.I), 1.5, "encoded_payload"
+        re.compile(r"(?:base64|eval|decode)\s*[\(:]", re.I),
+        1.5,
+        "encoded_payload",
+        ("base64", "eval", "decode"),
+    ),
+    _Signal(
+        re.compile(r"(?:atob|btoa)\s*\(", re.I),
+        1.5,
+        "encoded_payload",
+        ("atob", "btoa"),
     ),
-    _Signal(re.compile(r"(?:atob|btoa)\s*\(", re.I), 1.5, "encoded_payload"),
     # --- Exfiltration / persistence / looping instructions ---
     _Signal(
         re.compile(
@@ -170,6 +228,7 @@ _SIGNALS: list[_Signal] = [
         ),
         2.0,
         "exfiltration",
+        ("send", "post", "upload", "transmit"),
     ),
     _Signal(
         re.compile(
@@ -178,6 +237,7 @@ _SIGNALS: list[_Signal] = [
         ),
         3.0,
         "exfiltration",
+        ("include", "append", "add"),
     ),
     _Signal(
         re.compile(
@@ -186,6 +246,7 @@ _SIGNALS: list[_Signal] = [
         ),
         3.0,
         "exfiltration",
+        ("reveal", "output", "print", "expose"),
     ),
     _Signal(
         re.compile(
@@ -194,6 +255,7 @@ _SIGNALS: list[_Signal] = [
         ),
         2.0,
         "override",
+        ("save", "store", "remember", "memorize"),
     ),
     _Signal(
         re.compile(
@@ -202,6 +264,7 @@ _SIGNALS: list[_Signal] = [
         ),
         1.5,
         "override",
+        ("keep", "continue"),
     ),
 ]
 
@@ -243,16 +306,75 @@ class _Hit:
     match_text: str
 
 
+# Non-ASCII characters that ``re.IGNORECASE`` matches against an ASCII letter.
+# Folding them first keeps the literal prefilter from missing a match the
+# patterns would find.
+_CASE_INSENSITIVE_ASCII_FOLDS = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+
+
+def _fold_for_prefilter(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    return text.translate(_CASE_INSENSITIVE_ASCII_FOLDS).lower()
+
+
+class _SignalScanner:
+    """Single-pass literal index in front of the signal families.
+
+    Each family starts with one of a few literals (``ignore``, ``</``,
+    ``display``...). ``scan`` folds the text once, finds the first occurrence
+    of every distinct literal, and runs a family's pattern only when one of
+    its literals occurs -- starting the search there, since no match can
+    begin earlier. Results are identical to searching every pattern from the
+    start; clean text exits after the literal pass. (A single alternation of
+    all families was measured slower: it forfeits each pattern's literal-
+    prefix fast path under ``re``.)
+    """
+
+    def __init__(self, signals: list[_Signal]) -> None:
+        self._signals = signals
+        self._literals = tuple(
+            dict.fromkeys(literal for sig in signals for literal in sig.literals)
+        )
+
+    def locate(self, text: str) -> dict[str, int]:
+        """Return the first offset of each family literal present in *text*."""
+        # Folding preserves length, so offsets index into *text* itself.
+        folded = _fold_for_prefilter(text)
+        return {
+            literal: offset
+            for literal in self._literals
+            if (offset := folded.find(literal)) >= 0
+        }
+
+    def scan(self, text: str) -> list[_Hit]:
+        offsets = self.locate(text)
+        hits: list[_Hit] = []
+        for sig in self._signals:
+            if sig.literals:
+                starts = [offsets[lit] for lit in sig.literals if lit in offsets]
+                if not starts:
+                    continue
+                m = sig.pattern.search(text, min(starts))
+            else:
+                m = sig.pattern.search(text)
+            if m:
+                hits.append(_Hit(signal=sig, match_text=m.group()[:120]))
+        return hits
+
+
+# The ``</search_results>`` closer is judged by pairing, in
+# ``_detect_search_results_breakouts``, not by a bare search.
+_SIGNAL_SCANNER = _SignalScanner(
+    [sig for sig in _SIGNALS if sig.pattern.pattern != r"</search_results>"]
+)
+
+
 def _detect_signals(text: str) -> list[_Hit]:
     """Run all pattern families against *text* and return hits."""
-    hits: list[_Hit] = []
-    for sig in _SIGNALS:
-        if sig.pattern.pattern == r"</search_results>":
-            continue
-        m = sig.pattern.search(text)
-        if m:
-            hits.append(_Hit(signal=sig, match_text=m.group()[:120]))
-    return hits
+    return _SIGNAL_SCANNER.scan(text)
 
 
 def _detect_formatting_char_artifact(text: str) -> _Hit | None:
@@ -400,18 +522,23 @@ def _control_char_density(text: str) -> float:
     """
     if len(text) < _CONTROL_CHAR_MIN_LENGTH:
         return 0.0
-    count = 0
-    for ch in text:
-        if not unicodedata.category(ch).startswith("C"):
-            continue
-        if ch in ("\n", "\r", "\t"):
-            continue
-        if _FORMATTING_CHARS_PATTERN.match(ch):
-            continue
-        count += 1
+    # Classify each distinct character once rather than every occurrence.
+    count = sum(
+        occurrences
+        for ch, occurrences in Counter(text).items()
+        if _is_counted_control_char(ch)
+    )
     return count / len(text)
 
 
+def _is_counted_control_char(ch: str) -> bool:
+    if not unicodedata.category(ch).startswith("C"):
+        return False
+    if ch in ("\n", "\r", "\t"):
+        return False
+    return not _FORMATTING_CHARS_PATTERN.match(ch)
+
+
 def _strip_known_breakouts(
     text: str,
     *,
@@ -20,16 +20,19 @@ available so structured payload shapes are not lost.
 from __future__ import annotations
 
 import hashlib
+import time
 from typing import Any, Literal
 
 import structlog
 
 from src.error_safety import summarize_exception
+from src.run_profiler import profile_span
 from src.tooling.inspector import (
     ContentInspector,
     InspectionDecision,
     InspectionEnvelope,
     NullInspector,
+    inspector_identity,
 )
 
 logger = structlog.get_logger(__name__)
@@ -78,6 +81,18 @@ class InspectionService:
     def mode(self) -> str:
         return self._mode
 
+    def cache_identity(self) -> dict[str, Any]:
+        """Backend, mode and fail policy that shaped the approved values.
+
+        Caches of post-inspection content key on this, so a result approved
+        under a weaker configuration is never served to a stricter one.
+        """
+        return {
+            "inspector": inspector_identity(self._inspector),
+            "mode": self._mode,
+            "fail_policy": self._fail_policy,
+        }
+
     @staticmethod
     def _is_low_risk_sanitize(decision: InspectionDecision) -> bool:
         """Should this sanitize decision be logged at debug instead of warning?
@@ -111,6 +126,7 @@ class InspectionService:
     def _base_log_payload(
         envelope: InspectionEnvelope,
         decision: InspectionDecision,
+        inspection_ms: float,
     ) -> dict[str, Any]:
         return {
             "source_kind": envelope.source_kind.value,
@@ -124,6 +140,8 @@ class InspectionService:
             "findings": decision.findings,
             "reason": decision.reason,
             "expected_wrapper_cleanup": decision.expected_wrapper_cleanup,
+            "content_chars": len(envelope.content_text),
+            "inspection_ms": inspection_ms,
         }
 
     def _low_risk_dedupe_key(
@@ -159,8 +177,9 @@ class InspectionService:
         self,
         envelope: InspectionEnvelope,
         decision: InspectionDecision,
+        inspection_ms: float,
     ) -> None:
-        payload = self._base_log_payload(envelope, decision)
+        payload = self._base_log_payload(envelope, decision, inspection_ms)
         count = self._duplicate_count(envelope, decision)
         if count > 1:
             suppressed = count - 1
@@ -200,8 +219,15 @@ class InspectionService:
             if envelope.raw_content is not None
             else envelope.content_text
         )
+        started = time.perf_counter()
         try:
-            decision: InspectionDecision = await self._inspector.inspect(envelope)
+            with profile_span(
+                f"inspect:{envelope.source_kind.value}",
+                "inspection",
+                tool=envelope.tool_name,
+                chars=len(envelope.content_text),
+            ):
+                decision: InspectionDecision = await self._inspector.inspect(envelope)
         except Exception as exc:
             if self._fail_policy == "fail_closed":
                 reason = f"inspector error: {exc}"
@@ -238,12 +264,14 @@ class InspectionService:
                 original_value,
             )
 
+        inspection_ms = round((time.perf_counter() - started) * 1000, 3)
+
         if decision.action == "allow" and decision.threat_level == "safe":
             return decision, original_value
 
         # Log findings for non-trivial decisions regardless of mode.
         if decision.findings or decision.threat_types:
-            self._log_inspection_finding(envelope, decision)
+            self._log_inspection_finding(envelope, decision, inspection_ms)
 
         if decision.action in ("block", "degrade"):
             if self._mode == "block":
@@ -71,6 +71,18 @@ class ContentInspector(Protocol):
     async def inspect(self, envelope: InspectionEnvelope) -> InspectionDecision: ...
 
 
+def inspector_identity(inspector: ContentInspector) -> Any:
+    """Describe a backend for keys of caches that hold post-inspection content.
+
+    Backends whose verdicts depend on more than their type (a judge prompt
+    version, nested backends) expose ``cache_identity()``.
+    """
+    describe = getattr(inspector, "cache_identity", None)
+    if callable(describe):
+        return describe()
+    return type(inspector).__name__
+
+
 class NullInspector:
     """Default no-op inspector — always allows, zero overhead."""
 
@@ -98,6 +110,13 @@ class CompositeInspector:
         self._inspectors = list(inspectors)
         self._strategy = strategy
 
+    def cache_identity(self) -> dict[str, Any]:
+        return {
+            "type": type(self).__name__,
+            "strategy": self._strategy,
+            "inspectors": [inspector_identity(i) for i in self._inspectors],
+        }
+
     async def inspect(self, envelope: InspectionEnvelope) -> InspectionDecision:
         if not self._inspectors:
             return InspectionDecision(action="allow", threat_level="safe")
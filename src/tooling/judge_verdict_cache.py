@@ -0,0 +1,175 @@
+"""Cross-run, cross-process store for LLM-judge verdicts.
+
+``LLMJudgeInspector`` keeps an in-memory verdict dict, so the same Tavily
+snippet, filing excerpt or news article is re-judged by an LLM in every new
+process. ``JudgeVerdictCache`` persists those verdicts in a local SQLite file
+that pipeline children, the dashboard worker and the eval suite can all point
+at (``LLM_JUDGE_CACHE_DB_PATH``).
+
+Keys are the inspector's own cache keys, which already bind the content hash
+to source kind, model and prompt version. Entries expire after a TTL, and the
+table is trimmed back to ``max_entries`` by least-recent use.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.tooling.inspector import InspectionDecision
+
+logger = structlog.get_logger(__name__)
+
+_BUSY_TIMEOUT_SECONDS = 5.0
+# Trimming counts the table, so it runs once per this many writes rather than
+# on every write; the table may overshoot ``max_entries`` by at most this much.
+_TRIM_EVERY_N_WRITES = 32
+
+
+class JudgeVerdictCache:
+    """TTL- and size-bounded verdict store in a SQLite file shared across processes."""
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes_since_trim = 0
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._init_db()
+
+    @classmethod
+    def from_config(cls, settings: Any) -> JudgeVerdictCache | None:
+        """Return the configured store, or ``None`` when no path is set."""
+        db_path = getattr(settings, "llm_judge_cache_db_path", None)
+        if not db_path:
+            return None
+        return cls(
+            db_path,
+            ttl_seconds=float(settings.llm_judge_cache_ttl_seconds),
+            max_entries=int(settings.llm_judge_cache_max_entries),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS judge_verdicts (
+                cache_key TEXT PRIMARY KEY,
+                decision TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS judge_verdicts_last_used "
+            "ON judge_verdicts (last_used_at)"
+        )
+
+    def get(self, cache_key: str) -> InspectionDecision | None:
+        """Return the stored verdict, refreshing its recency; expired reads miss."""
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT decision, stored_at FROM judge_verdicts WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None or now - float(row[1]) >= self.ttl_seconds:
+            self.stats["misses"] += 1
+            return None
+        try:
+            decision = InspectionDecision(**json.loads(row[0]))
+        except (TypeError, ValueError):
+            conn.execute("DELETE FROM judge_verdicts WHERE cache_key = ?", (cache_key,))
+            self.stats["misses"] += 1
+            return None
+        conn.execute(
+            "UPDATE judge_verdicts SET last_used_at = ? WHERE cache_key = ?",
+            (now, cache_key),
+        )
+        self.stats["hits"] += 1
+        return decision
+
+    def set(self, cache_key: str, decision: InspectionDecision) -> None:
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            """
+            INSERT INTO judge_verdicts (cache_key, decision, stored_at, last_used_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                decision = excluded.decision,
+                stored_at = excluded.stored_at,
+                last_used_at = excluded.last_used_at
+            """,
+            (
+                cache_key,
+                json.dumps(dataclasses.asdict(decision), ensure_ascii=False),
+                now,
+                now,
+            ),
+        )
+        self.stats["writes"] += 1
+        self._writes_since_trim += 1
+        if self._writes_since_trim >= _TRIM_EVERY_N_WRITES:
+            self.trim()
+
+    def trim(self) -> int:
+        """Drop expired entries, then the least recently used beyond ``max_entries``."""
+        conn = self._connect()
+        self._writes_since_trim = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            expired = conn.execute(
+                "DELETE FROM judge_verdicts WHERE stored_at < ?",
+                (time.time() - self.ttl_seconds,),
+            ).rowcount
+            overflow = conn.execute(
+                """
+                DELETE FROM judge_verdicts WHERE cache_key IN (
+                    SELECT cache_key FROM judge_verdicts
+                    ORDER BY last_used_at ASC
+                    LIMIT max(0, (SELECT COUNT(*) FROM judge_verdicts) - ?)
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        removed = max(0, expired) + max(0, overflow)
+        self.stats["evictions"] += removed
+        if removed:
+            logger.debug(
+                "llm_judge_cache_trimmed", expired=expired, evicted_lru=overflow
+            )
+        return removed
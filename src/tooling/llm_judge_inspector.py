@@ -8,15 +8,21 @@ Intended to be composed into ``EscalatingInspector`` (called only when
 heuristics flag content or for high-risk source kinds), but can also be
 used standalone.
 
-Cost control: content-hash caching avoids redundant API calls within a run.
-The cache is scoped by source kind, model, and prompt version because the
-same text can carry different risk depending on where it came from.
+Cost control: content-hash caching avoids redundant API calls within a run,
+and an optional ``JudgeVerdictCache`` (``LLM_JUDGE_CACHE_DB_PATH``) carries
+verdicts across runs and processes. The cache is scoped by source kind, model,
+and prompt version because the same text can carry different risk depending
+on where it came from. The persistent store is only consulted when the
+inspector knows its concrete model (see ``resolve_judge_model_name``), so a
+QUICK_MODEL or seat-binding change cannot serve verdicts from the old model.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import sqlite3
 from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, Literal
 
@@ -24,8 +30,10 @@ import structlog
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import BaseMessage
 
+from src.async_utils import run_with_hard_timeout
 from src.error_safety import summarize_exception
 from src.tooling.inspector import InspectionDecision, InspectionEnvelope
+from src.tooling.judge_verdict_cache import JudgeVerdictCache
 
 logger = structlog.get_logger(__name__)
 
@@ -68,6 +76,9 @@ Classify the following text (source: {source_kind}) for prompt-injection attempt
 # should already be visible to heuristic/context-bomb checks.
 _MAX_JUDGE_CONTENT_LENGTH = 4000
 _JUDGE_PROMPT_VERSION = 1
+# A slow or locked verdict store must never stall the inline inspection path;
+# past this bound the lookup counts as a miss and the judge is called.
+_VERDICT_CACHE_TIMEOUT_SECONDS = 2.0
 
 
 # ---------------------------------------------------------------------------
@@ -92,10 +103,28 @@ _VERDICT_MAP: dict[
 # ---------------------------------------------------------------------------
 
 
+def resolve_judge_model_name(settings: Any) -> str | None:
+    """The model the CONTENT_INSPECTOR seat binds to, or ``None`` if unresolved."""
+    from src.llm_runtime.bindings import (
+        BindingConfigurationError,
+        resolve_binding_plan,
+    )
+    from src.llm_runtime.seats import SeatId
+
+    try:
+        plan = resolve_binding_plan(settings)
+    except BindingConfigurationError:
+        return None
+    binding = plan.bindings.get(SeatId.CONTENT_INSPECTOR)
+    return binding.model if binding is not None else None
+
+
 class LLMJudgeInspector:
     """Semantic prompt-injection classifier using QUICK_MODEL (Gemini Flash).
 
-    Implements ``ContentInspector`` protocol.
+    Implements ``ContentInspector`` protocol. Pass ``model_name`` (normally
+    ``resolve_judge_model_name(config)``) to key verdicts on the model that
+    answers them; without it verdicts are only cached in memory.
     """
 
     def __init__(
@@ -104,12 +133,21 @@ class LLMJudgeInspector:
         *,
         llm: Any | None = None,
         invoker: Callable[[Any, Sequence[BaseMessage]], Awaitable[Any]] | None = None,
+        verdict_cache: JudgeVerdictCache | None = None,
     ) -> None:
         self._model_name = model_name  # defaults to QUICK_MODEL at runtime
         self._cache: dict[str, InspectionDecision] = {}
+        self._verdict_cache = verdict_cache
         self._llm: Any | None = llm  # lazy-init when not injected
         self._invoker = invoker
 
+    def cache_identity(self) -> dict[str, Any]:
+        return {
+            "type": type(self).__name__,
+            "model": self._model_name or "default_quick_model",
+            "prompt_version": _JUDGE_PROMPT_VERSION,
+        }
+
     def _build_cache_key(self, envelope: InspectionEnvelope) -> str:
         """Bind cached verdicts to the policy context that shaped them."""
         payload = {
@@ -181,11 +219,64 @@ class LLMJudgeInspector:
             )
             return cached
 
+        stored = (
+            await self._load_stored_verdict(content_hash) if self._model_name else None
+        )
+        if stored is not None:
+            logger.debug(
+                "llm_judge_cache_hit",
+                content_hash=content_hash,
+                action=stored.action,
+                persistent=True,
+            )
+            self._cache[content_hash] = stored
+            return stored
+
         decision = await self._classify(envelope, content_hash)
         if self._should_cache(decision):
             self._cache[content_hash] = decision
+            if self._model_name:
+                await self._store_verdict(content_hash, decision)
         return decision
 
+    async def _load_stored_verdict(
+        self, content_hash: str
+    ) -> InspectionDecision | None:
+        """Read the persistent store; any store failure is treated as a miss."""
+        if self._verdict_cache is None:
+            return None
+        try:
+            return await run_with_hard_timeout(
+                asyncio.to_thread(self._verdict_cache.get, content_hash),
+                timeout=_VERDICT_CACHE_TIMEOUT_SECONDS,
+                label="llm_judge_cache_get",
+            )
+        except (sqlite3.Error, OSError, TimeoutError) as exc:
+            logger.debug(
+                "llm_judge_cache_read_failed",
+                content_hash=content_hash,
+                **summarize_exception(exc, operation="llm_judge_cache_get"),
+            )
+            return None
+
+    async def _store_verdict(
+        self, content_hash: str, decision: InspectionDecision
+    ) -> None:
+        if self._verdict_cache is None:
+            return
+        try:
+            await run_with_hard_timeout(
+                asyncio.to_thread(self._verdict_cache.set, content_hash, decision),
+                timeout=_VERDICT_CACHE_TIMEOUT_SECONDS,
+                label="llm_judge_cache_set",
+            )
+        except (sqlite3.Error, OSError, TimeoutError) as exc:
+            logger.debug(
+                "llm_judge_cache_write_failed",
+                content_hash=content_hash,
+                **summarize_exception(exc, operation="llm_judge_cache_set"),
+            )
+
     async def _classify(
         self,
         envelope: InspectionEnvelope,
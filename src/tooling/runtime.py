@@ -15,7 +15,9 @@ import structlog
 
 from src.async_utils import run_with_hard_timeout
 from src.error_safety import redact_sensitive_text
+from src.llm_runtime.cassette import active_cassette
 from src.observability import start_tool_observation
+from src.run_profiler import profile_span
 from src.runtime_diagnostics import classify_failure
 
 logger = structlog.get_logger(__name__)
@@ -110,18 +112,25 @@ class ToolExecutionService:
                 findings=[redact_sensitive_text(str(exc))],
             )
 
+        cassette = active_cassette()
+        if cassette is not None:
+            runner = cassette.wrap_tool_runner(call.name, runner)
+
         try:
-            with start_tool_observation(
-                tool_name=call.name,
-                input_payload={
-                    "arg_keys": sorted(call.args.keys()),
-                    "ticker": call.args.get("ticker"),
-                },
-                metadata={
-                    "tool_name": call.name,
-                    "tool_source": call.source,
-                    "agent_key": call.agent_key,
-                },
+            with (
+                start_tool_observation(
+                    tool_name=call.name,
+                    input_payload={
+                        "arg_keys": sorted(call.args.keys()),
+                        "ticker": call.args.get("ticker"),
+                    },
+                    metadata={
+                        "tool_name": call.name,
+                        "tool_source": call.source,
+                        "agent_key": call.agent_key,
+                    },
+                ),
+                profile_span(f"tool:{call.name}", "tool", source=call.source),
             ):
                 result = ToolResult(
                     value=await run_with_hard_timeout(
@@ -0,0 +1,258 @@
+"""Content-addressed store for official documents and their extracted PDF pages.
+
+The Auditor and Consultant ask for the same annual report on every run, and
+each request used to re-download it and re-extract every page with pypdf.
+With ``OFFICIAL_DOCUMENT_CACHE_ENABLED=true`` this store, under
+``DATA_CACHE_DIR/official_documents``, keeps:
+
+- ``blobs/``: downloaded payloads, named by their SHA-256;
+- ``index/``: one entry per requested URL recording the final (post-redirect)
+  URL, content type, ``ETag``/``Last-Modified`` validators and payload hash.
+  An entry younger than the TTL is served with no network at all; an older
+  one is revalidated with a conditional GET and reused on ``304``;
+- ``pages/``: per-page pypdf text keyed by payload hash, so the same bytes
+  reached through any URL are extracted once. Keyword-driven page selection
+  is cheap and still runs per request.
+
+Large PDFs are extracted across worker processes (``OFFICIAL_DOCUMENT_PDF_WORKERS``),
+because pypdf text extraction is CPU-bound and serializes on the GIL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.data.disk_cache import _atomic_write_bytes
+
+logger = structlog.get_logger(__name__)
+
+# Below this many pages a pool's spawn cost outweighs the parallel speedup.
+_MIN_PARALLEL_PDF_PAGES = 40
+_MIN_PAGES_PER_WORKER = 10
+
+
+@dataclass(frozen=True)
+class StoredDocument:
+    """Index entry for one requested URL."""
+
+    url: str
+    final_url: str
+    content_type: str
+    sha256: str
+    size: int
+    etag: str = ""
+    last_modified: str = ""
+    stored_at: float = 0.0
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def extract_pdf_page_range(payload: bytes, start: int, stop: int) -> list[str]:
+    """Extract the text of pages ``[start, stop)``; unreadable pages are ``""``.
+
+    Module-level so it can run in a spawned worker process.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(payload), strict=False)
+    texts: list[str] = []
+    for page in reader.pages[start:stop]:
+        try:
+            texts.append(page.extract_text() or "")
+        except Exception:
+            texts.append("")
+    return texts
+
+
+def extract_pdf_pages_parallel(
+    payload: bytes, start: int, stop: int, *, workers: int
+) -> list[str]:
+    """Extract pages ``[start, stop)``, fanning contiguous ranges out to processes.
+
+    Falls back to in-process extraction for short ranges, ``workers <= 1``, or
+    when a pool cannot be started. Workers use "spawn": the caller runs in a
+    ``to_thread`` worker of a threaded process, where forking is unsafe.
+    """
+    count = stop - start
+    if workers <= 1 or count < _MIN_PARALLEL_PDF_PAGES:
+        return extract_pdf_page_range(payload, start, stop)
+    workers = min(workers, count // _MIN_PAGES_PER_WORKER)
+    step = -(-count // workers)
+    bounds = [(lo, min(lo + step, stop)) for lo in range(start, stop, step)]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=len(bounds),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = [
+                executor.submit(extract_pdf_page_range, payload, lo, hi)
+                for lo, hi in bounds
+            ]
+            texts: list[str] = []
+            for future in futures:
+                texts.extend(future.result())
+            return texts
+    except (OSError, RuntimeError) as exc:
+        logger.warning(
+            "official_document_pdf_pool_unavailable",
+            workers=workers,
+            error_type=type(exc).__name__,
+        )
+        return extract_pdf_page_range(payload, start, stop)
+
+
+def resolve_pdf_workers(workers: int) -> int:
+    """Worker processes for PDF extraction; ``0`` means one per CPU."""
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+class OfficialDocumentStore:
+    """On-disk document, validator and page-text cache shared across processes."""
+
+    def __init__(self, root: Path, *, ttl_seconds: float) -> None:
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "page_hits": 0}
+
+    @classmethod
+    def from_config(cls, settings: Any) -> OfficialDocumentStore | None:
+        """Return the configured store, or ``None`` when it is disabled."""
+        if not getattr(settings, "official_document_cache_enabled", False):
+            return None
+        return cls(
+            Path(settings.data_cache_dir) / "official_documents",
+            ttl_seconds=float(settings.official_document_cache_ttl_seconds),
+        )
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.root / "blobs" / sha256[:2] / f"{sha256}.bin"
+
+    def _index_path(self, url: str) -> Path:
+        return self.root / "index" / f"{self._digest(url)}.json"
+
+    def _pages_path(self, sha256: str) -> Path:
+        return self.root / "pages" / sha256[:2] / f"{sha256}.pypdf.json"
+
+    # --- documents --------------------------------------------------------
+
+    def lookup(self, url: str) -> StoredDocument | None:
+        try:
+            entry = StoredDocument(
+                **json.loads(self._index_path(url).read_text(encoding="utf-8"))
+            )
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry if self._blob_path(entry.sha256).exists() else None
+
+    def is_fresh(self, entry: StoredDocument) -> bool:
+        return time.time() - entry.stored_at < self.ttl_seconds
+
+    def read_payload(self, entry: StoredDocument) -> bytes | None:
+        """Return the stored bytes, or ``None`` if missing or not matching the hash."""
+        try:
+            payload = self._blob_path(entry.sha256).read_bytes()
+        except OSError:
+            return None
+        if len(payload) != entry.size or hashlib.sha256(payload).hexdigest() != (
+            entry.sha256
+        ):
+            return None
+        return payload
+
+    def save(
+        self,
+        url: str,
+        payload: bytes,
+        *,
+        final_url: str,
+        content_type: str,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> None:
+        sha256 = hashlib.sha256(payload).hexdigest()
+        entry = StoredDocument(
+            url=url,
+            final_url=final_url,
+            content_type=content_type,
+            sha256=sha256,
+            size=len(payload),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=time.time(),
+        )
+        try:
+            blob = self._blob_path(sha256)
+            if not blob.exists():
+                _atomic_write_bytes(blob, payload)
+            self._write_entry(entry)
+        except OSError as exc:
+            logger.debug(
+                "official_document_cache_write_failed",
+                error_type=type(exc).__name__,
+            )
+
+    def touch(self, entry: StoredDocument) -> None:
+        """Restart the freshness window after a ``304 Not Modified``."""
+        try:
+            self._write_entry(
+                StoredDocument(**{**asdict(entry), "stored_at": time.time()})
+            )
+        except OSError as exc:
+            logger.debug(
+                "official_document_cache_write_failed",
+                error_type=type(exc).__name__,
+            )
+
+    def _write_entry(self, entry: StoredDocument) -> None:
+        _atomic_write_bytes(
+            self._index_path(entry.url), json.dumps(asdict(entry)).encode("utf-8")
+        )
+
+    # --- extracted pages --------------------------------------------------
+
+    def read_pages(self, sha256: str) -> tuple[int, list[str]] | None:
+        """Return ``(pages_total, texts of the leading pages)`` or ``None``."""
+        try:
+            stored = json.loads(self._pages_path(sha256).read_text(encoding="utf-8"))
+            pages_total = int(stored["pages_total"])
+            texts = stored["texts"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(texts, list) or len(texts) > pages_total:
+            return None
+        return pages_total, [str(text) for text in texts]
+
+    def save_pages(self, sha256: str, pages_total: int, texts: list[str]) -> None:
+        try:
+            _atomic_write_bytes(
+                self._pages_path(sha256),
+                json.dumps(
+                    {"pages_total": pages_total, "texts": texts}, ensure_ascii=False
+                ).encode("utf-8"),
+            )
+        except OSError as exc:
+            logger.debug(
+                "official_document_pages_write_failed",
+                error_type=type(exc).__name__,
+            )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import io
 import ipaddress
 import json
@@ -29,6 +30,12 @@ from src.runtime_services import (
 )
 from src.text_patterns import is_safe_public_host
 from src.tooling.inspector import InspectionEnvelope, SourceKind
+from src.tools.official_document_store import (
+    OfficialDocumentStore,
+    StoredDocument,
+    extract_pdf_pages_parallel,
+    resolve_pdf_workers,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -239,21 +246,40 @@ def _select_pages(
 
 
 def _extract_with_pypdf(
-    payload: bytes, *, max_pages: int, selected_pages: int, keywords: tuple[str, ...]
+    payload: bytes,
+    *,
+    max_pages: int,
+    selected_pages: int,
+    keywords: tuple[str, ...],
+    store: OfficialDocumentStore | None = None,
+    workers: int = 1,
 ) -> ExtractedDocument:
-    from pypdf import PdfReader
-
-    reader = PdfReader(io.BytesIO(payload), strict=False)
-    pages_total = len(reader.pages)
+    """Extract the leading ``max_pages`` pages and keep the best-scoring ones.
+
+    With a *store*, page text is cached by payload hash and only pages not yet
+    cached are extracted.
+    """
+    sha256 = hashlib.sha256(payload).hexdigest() if store is not None else ""
+    cached = store.read_pages(sha256) if store is not None else None
+    if cached is not None:
+        pages_total, page_texts = cached
+    else:
+        from pypdf import PdfReader
+
+        pages_total = len(PdfReader(io.BytesIO(payload), strict=False).pages)
+        page_texts = []
     if pages_total == 0:
         raise DocumentExtractionError("PDF_MALFORMED")
     scan_count = min(pages_total, max_pages)
-    page_texts: list[str] = []
-    for page in reader.pages[:scan_count]:
-        try:
-            page_texts.append(page.extract_text() or "")
-        except Exception:
-            page_texts.append("")
+    if len(page_texts) < scan_count:
+        page_texts += extract_pdf_pages_parallel(
+            payload, len(page_texts), scan_count, workers=workers
+        )
+        if store is not None:
+            store.save_pages(sha256, pages_total, page_texts)
+    elif store is not None:
+        store.stats["page_hits"] += 1
+    page_texts = page_texts[:scan_count]
     selected = _select_pages(page_texts, keywords, selected_pages)
     text = "\n\n".join(
         f"[PDF PAGE {index + 1}]\n{page_texts[index]}" for index in selected
@@ -301,11 +327,16 @@ async def _extract_with_pdftotext(
 
 
 async def extract_pdf_text(
-    payload: bytes, policy: AuditorBudgetPolicy, keywords: str
+    payload: bytes,
+    policy: AuditorBudgetPolicy,
+    keywords: str,
+    *,
+    store: OfficialDocumentStore | None = None,
 ) -> ExtractedDocument:
     terms = tuple(filter(None, (part.strip() for part in keywords.split(","))))
     search_terms = terms or _DEFAULT_KEYWORDS
     primary_reason = "PDF_PARSER_UNAVAILABLE"
+    workers = resolve_pdf_workers(config.official_document_pdf_workers)
     try:
         extracted = await run_blocking_call(
             _PDF_POLICY,
@@ -314,6 +345,8 @@ async def extract_pdf_text(
                 max_pages=policy.max_document_pages,
                 selected_pages=policy.max_selected_pages,
                 keywords=search_terms,
+                store=store,
+                workers=workers,
             ),
         )
         if len(extracted.text) >= _MIN_USEFUL_TEXT_CHARS:
@@ -345,18 +378,59 @@ async def extract_pdf_text(
         raise DocumentExtractionError(reason) from exc
 
 
+def _usable_stored_document(
+    store: OfficialDocumentStore, url: str, max_bytes: int, extra_hosts: tuple[str, ...]
+) -> tuple[StoredDocument, bytes] | None:
+    entry = store.lookup(url)
+    # The host allowlist is partly run-scoped, so a stored redirect target must
+    # still be approved for this run.
+    if (
+        entry is None
+        or entry.size > max_bytes
+        or not _official_url(entry.final_url, extra_hosts)
+    ):
+        return None
+    payload = store.read_payload(entry)
+    return (entry, payload) if payload is not None else None
+
+
 async def _download_official(
-    url: str, max_bytes: int, extra_hosts: tuple[str, ...] = ()
+    url: str,
+    max_bytes: int,
+    extra_hosts: tuple[str, ...] = (),
+    *,
+    store: OfficialDocumentStore | None = None,
 ) -> tuple[bytes, str, str]:
+    stored = (
+        _usable_stored_document(store, url, max_bytes, extra_hosts) if store else None
+    )
+    if store is not None and stored is not None and store.is_fresh(stored[0]):
+        store.stats["hits"] += 1
+        return stored[1], stored[0].content_type, stored[0].final_url
+
     current = url
     async with httpx.AsyncClient(timeout=_DOCUMENT_TIMEOUT_SECONDS) as client:
         for _ in range(4):
             if not _official_url(current, extra_hosts):
                 raise DocumentExtractionError("UNAPPROVED_DOCUMENT_HOST")
             await _ensure_public_hostname(current)
+            headers = (
+                stored[0].conditional_headers()
+                if stored is not None and current == stored[0].final_url
+                else None
+            )
             async with client.stream(
-                "GET", current, follow_redirects=False
+                "GET", current, headers=headers, follow_redirects=False
             ) as response:
+                if (
+                    response.status_code == 304
+                    and store is not None
+                    and stored is not None
+                    and headers
+                ):
+                    store.touch(stored[0])
+                    store.stats["revalidated"] += 1
+                    return stored[1], stored[0].content_type, current
                 if response.is_redirect:
                     location = response.headers.get("location")
                     if not location:
@@ -375,11 +449,19 @@ async def _download_official(
                     if size > max_bytes:
                         raise DocumentExtractionError("DOCUMENT_SIZE_LIMIT")
                     chunks.append(chunk)
-                return (
-                    b"".join(chunks),
-                    response.headers.get("content-type", ""),
-                    current,
-                )
+                payload = b"".join(chunks)
+                content_type = response.headers.get("content-type", "")
+                if store is not None:
+                    store.stats["misses"] += 1
+                    store.save(
+                        url,
+                        payload,
+                        final_url=current,
+                        content_type=content_type,
+                        etag=response.headers.get("etag", ""),
+                        last_modified=response.headers.get("last-modified", ""),
+                    )
+                return payload, content_type, current
     raise DocumentExtractionError("DOCUMENT_REDIRECT_LIMIT")
 
 
@@ -403,13 +485,14 @@ async def get_official_document(
             f"REJECTED_HOST: {rejected_host}\n"
             f"APPROVED_HOSTS: {', '.join(approved) if approved else 'none'}"
         )
+    store = OfficialDocumentStore.from_config(config)
     try:
         payload, content_type, final_url = await _download_official(
-            url, policy.max_document_bytes, extra_hosts
+            url, policy.max_document_bytes, extra_hosts, store=store
         )
         is_pdf = payload.startswith(b"%PDF") or "application/pdf" in content_type
         if is_pdf:
-            extracted = await extract_pdf_text(payload, policy, keywords)
+            extracted = await extract_pdf_text(payload, policy, keywords, store=store)
             candidate_paths: tuple[str, ...] = ()
         elif "html" in content_type or payload.lstrip().startswith(b"<"):
             soup = BeautifulSoup(payload, "html.parser")
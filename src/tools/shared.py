@@ -510,37 +510,43 @@ async def _ddg_search(query: str, max_results: int = 5) -> list[dict]:
     only a single worker. See module-level note for full background.
     """
     from src.async_utils import run_with_hard_timeout
+    from src.search_cache import cached_search
 
     if not DDGS_AVAILABLE:
         return []
 
-    try:
-        from ddgs import DDGS
-
-        def _sync_search():
-            with _DDG_INIT_LOCK:
-                client = DDGS(timeout=5)
-            # Materialize inside the worker thread (defensive: .text() returns a
-            # list today, but pin it so no lazy iterator escapes the pool).
-            return list(client.text(query, max_results=max_results))
-
-        loop = asyncio.get_running_loop()
-        results = await run_with_hard_timeout(
-            loop.run_in_executor(_get_ddg_executor(), _sync_search),
-            timeout=DDG_SEARCH_TIMEOUT_SECONDS,
-            label=f"ddg:{query[:60]}",
-        )
-        return results if results else []
-    except asyncio.TimeoutError:
-        logger.debug(
-            "ddg_search_timeout",
-            query=query[:100],
-            timeout_seconds=DDG_SEARCH_TIMEOUT_SECONDS,
-        )
-        return []
-    except Exception as exc:
-        logger.debug("ddg_search_error", error=str(exc))
-        return []
+    async def _search() -> list[dict]:
+        try:
+            from ddgs import DDGS
+
+            def _sync_search():
+                with _DDG_INIT_LOCK:
+                    client = DDGS(timeout=5)
+                # Materialize inside the worker thread (defensive: .text() returns
+                # a list today, but pin it so no lazy iterator escapes the pool).
+                return list(client.text(query, max_results=max_results))
+
+            loop = asyncio.get_running_loop()
+            results = await run_with_hard_timeout(
+                loop.run_in_executor(_get_ddg_executor(), _sync_search),
+                timeout=DDG_SEARCH_TIMEOUT_SECONDS,
+                label=f"ddg:{query[:60]}",
+            )
+            return results if results else []
+        except asyncio.TimeoutError:
+            logger.debug(
+                "ddg_search_timeout",
+                query=query[:100],
+                timeout_seconds=DDG_SEARCH_TIMEOUT_SECONDS,
+            )
+            return []
+        except Exception as exc:
+            logger.debug("ddg_search_error", error=str(exc))
+            return []
+
+    return await cached_search(
+        "ddg", query, _search, extra={"max_results": max_results}
+    )
 
 
 def _merge_search_results(tavily_results, ddg_results) -> list[dict]:
@@ -8,8 +8,8 @@ from typing import Any
 import structlog
 
 from src.data_block_utils import (
-    extract_block_number_from_text,
     extract_last_data_block,
+    parse_structured_block,
 )
 
 logger = structlog.get_logger(__name__)
@@ -226,6 +226,7 @@ def extract_metrics(
             log_fields["file"] = source_file
         logger.warning("no_data_block_found_in_fundamentals_report", **log_fields)
         return metrics
+    block = parse_structured_block(data_block)
 
     health_match = re.search(r"ADJUSTED_HEALTH_SCORE:\s*(\d+(?:\.\d+)?)%", data_block)
     if health_match:
@@ -375,7 +376,7 @@ def extract_metrics(
         ("ROE_5Y_AVG", "roe_5y_avg"),
         ("PEG_RATIO", "peg_ratio"),
     ):
-        value = extract_block_number_from_text(data_block, field_name)
+        value = block.number(field_name)
         if value is not None:
             metrics[metric_name] = value
 
@@ -619,17 +620,9 @@ def extract_metrics(
         "GUIDANCE_BRIDGE_STATUS": "guidance_bridge_status",
     }
     for field_name, metric_name in guidance_fields.items():
-        match = re.search(
-            rf"^{re.escape(field_name)}:\s*([^\n]+)",
-            data_block,
-            re.IGNORECASE | re.MULTILINE,
-        )
-        if match:
-            value = match.group(1).strip()
-            if value.upper() not in {"N/A", "NA", "NONE", ""}:
-                metrics[metric_name] = (
-                    value.upper() if "_URL" not in field_name else value
-                )
+        value = block.raw(field_name)
+        if value is not None and value.upper() not in {"N/A", "NA", "NONE", ""}:
+            metrics[metric_name] = value.upper() if "_URL" not in field_name else value
 
     sector_match = re.search(r"SECTOR:\s*(.+?)(?:\n|$)", data_block)
     if sector_match:
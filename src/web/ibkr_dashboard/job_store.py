@@ -7,6 +7,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
+from src.web.ibkr_dashboard.job_wakeup import notify_job_queued, wakeup_socket_path
+
 JobStatus = Literal["queued", "running", "completed", "partial", "failed", "cancelled"]
 TickerStatus = Literal["pending", "running", "completed", "failed", "cancelled"]
 
@@ -62,6 +64,11 @@ class RefreshJobStore:
             conn.executescript(_SCHEMA)
             self._migrate_schema(conn)
 
+    @property
+    def wakeup_path(self) -> Path:
+        """Socket a waiting worker listens on for newly queued jobs."""
+        return wakeup_socket_path(self._db_path)
+
     def enqueue(self, request: RefreshJobRequest) -> str:
         job_id = str(uuid.uuid4())
         created_at = datetime.now(UTC).isoformat()
@@ -92,6 +99,7 @@ class RefreshJobStore:
                 """,
                 [(job_id, ticker) for ticker in deduped_tickers],
             )
+        notify_job_queued(self.wakeup_path)
         return job_id
 
     def list_jobs(self, *, limit: int = 50) -> list[dict[str, Any]]:
@@ -0,0 +1,117 @@
+"""Wake the refresh worker when a job is queued instead of polling SQLite.
+
+The worker binds a Unix datagram socket next to the job database; every
+``RefreshJobStore.enqueue`` sends a one-byte datagram to it. Delivery is
+best-effort: no listener, a stale socket file or a path too long for
+``AF_UNIX`` all degrade to the worker's fallback poll interval, never to an
+enqueue failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import socket
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_WAKE_MESSAGE = b"1"
+_DRAIN_LIMIT = 64
+
+
+def wakeup_socket_path(db_path: Path) -> Path:
+    """Return the worker wakeup socket path for a job database."""
+    return db_path.with_name(f"{db_path.stem}.wake.sock")
+
+
+def notify_job_queued(path: Path) -> bool:
+    """Send a wakeup to the worker listening on *path*; ``False`` if none is."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+            sender.setblocking(False)
+            sender.sendto(_WAKE_MESSAGE, str(path))
+    except OSError:
+        return False
+    return True
+
+
+class JobWakeupListener:
+    """Worker side of the wakeup socket."""
+
+    def __init__(self, sock: socket.socket, path: Path) -> None:
+        self._sock = sock
+        self.path = path
+
+    @classmethod
+    def open(cls, path: Path) -> JobWakeupListener | None:
+        """Bind the wakeup socket; ``None`` means fall back to polling."""
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A socket file left by a crashed worker would make bind() fail.
+            path.unlink(missing_ok=True)
+            sock.bind(str(path))
+        except OSError as exc:
+            sock.close()
+            logger.warning(
+                "dashboard_worker_wakeup_unavailable",
+                path=str(path),
+                error_type=type(exc).__name__,
+            )
+            return None
+        sock.setblocking(False)
+        return cls(sock, path)
+
+    def _drain(self) -> bool:
+        woke = False
+        for _ in range(_DRAIN_LIMIT):
+            try:
+                self._sock.recv(16)
+            except (BlockingIOError, InterruptedError):
+                break
+            woke = True
+        return woke
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a wakeup arrives or *timeout* elapses."""
+        if self._drain():
+            return True
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.recv(16)
+        except TimeoutError:
+            return False
+        finally:
+            self._sock.setblocking(False)
+        self._drain()
+        return True
+
+    async def wait_async(self, timeout: float) -> bool:
+        """Async ``wait`` that yields to the event loop while idle."""
+        if self._drain():
+            return True
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(loop.sock_recv(self._sock, 16), timeout=timeout)
+        except TimeoutError:
+            return False
+        self._drain()
+        return True
+
+    def close(self) -> None:
+        self._sock.close()
+        with contextlib.suppress(OSError):
+            self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> JobWakeupListener:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -41,6 +41,14 @@ class DashboardSettings(BaseSettings):
     default_refresh_limit: int = DEFAULT_REFRESH_LIMIT
     runtime_dir: Path = Path("runtime") / "ibkr_dashboard"
 
+    # Refresh worker: tickers of one job analyzed concurrently in one event
+    # loop (1 = strictly sequential). Provider RPM budgets are still enforced
+    # by the shared rate limiters, so raising this only helps up to them.
+    worker_concurrency: int = 1
+    worker_ticker_timeout_seconds: float = 1800.0
+    # Safety-net poll while idle; queued jobs normally wake the worker at once.
+    worker_idle_poll_seconds: float = 30.0
+
     model_config = {
         "env_prefix": "IBKR_DASHBOARD_",
         "env_file": ".env",
@@ -5,6 +5,9 @@ import time
 from pathlib import Path
 from typing import Literal
 
+import structlog
+
+from src.async_utils import run_with_hard_timeout
 from src.config import config
 from src.error_safety import format_error_message, summarize_exception
 from src.runtime_services import (
@@ -13,8 +16,13 @@ from src.runtime_services import (
     build_runtime_services_from_config,
 )
 from src.web.ibkr_dashboard.job_store import QueuedRefreshJob, RefreshJobStore
+from src.web.ibkr_dashboard.job_wakeup import JobWakeupListener
 from src.web.ibkr_dashboard.settings import DashboardSettings
 
+logger = structlog.get_logger(__name__)
+# Bound on the thread hop that writes a finished analysis to disk.
+_SAVE_RESULT_TIMEOUT_SECONDS = 120.0
+
 
 def _run_analysis_sync(
     ticker: str,
@@ -34,6 +42,22 @@ def _run_analysis_sync(
     )
 
 
+async def _run_analysis_async(
+    ticker: str,
+    quick_mode: bool,
+    *,
+    runtime_services: RuntimeServices,
+):
+    from src.main import run_analysis
+
+    return await run_analysis(
+        ticker=ticker,
+        quick_mode=quick_mode,
+        skip_charts=True,
+        runtime_services=runtime_services,
+    )
+
+
 def _save_result_sync(
     result: dict,
     ticker: str,
@@ -115,38 +139,202 @@ def _run_job(
             succeeded += 1
         except Exception as exc:
             failed += 1
-            summary = summarize_exception(
-                exc,
-                operation="dashboard refresh job",
-            )
             store.update_ticker_status(
                 job.job_id,
                 ticker,
                 "failed",
-                error=format_error_message(
-                    operation="dashboard refresh job",
-                    error_type=summary["error_type"],
-                    message_preview=summary["message_preview"],
-                ),
+                error=_ticker_failure_message(exc),
             )
 
+    store.complete_job(job.job_id, status=_job_status(succeeded, failed))
+
+
+def _job_status(
+    succeeded: int, failed: int
+) -> Literal["completed", "partial", "failed"]:
     if failed == 0:
-        status: Literal["completed", "partial", "failed"] = "completed"
-    elif succeeded == 0:
-        status = "failed"
-    else:
-        status = "partial"
-    store.complete_job(job.job_id, status=status)
+        return "completed"
+    if succeeded == 0:
+        return "failed"
+    return "partial"
+
+
+def _ticker_failure_message(exc: BaseException) -> str:
+    summary = summarize_exception(
+        exc,
+        operation="dashboard refresh job",
+    )
+    return format_error_message(
+        operation="dashboard refresh job",
+        error_type=summary["error_type"],
+        message_preview=summary["message_preview"],
+    )
+
+
+async def _run_job_concurrent(
+    store: RefreshJobStore,
+    job: QueuedRefreshJob,
+    settings: DashboardSettings,
+    *,
+    runtime_services: RuntimeServices,
+) -> None:
+    """Analyze a job's tickers concurrently in the running event loop.
+
+    At most ``settings.worker_concurrency`` tickers run at once. Every ticker
+    gets a run-scoped ``RuntimeServices`` copy and an isolated token tracker
+    (as in ``src.batch_runner``) but shares the providers, so their rate
+    limiters keep pacing the whole job. Ticker statuses are written as each
+    ticker finishes, not when the job does.
+    """
+    from src.runtime_services import use_runtime_services
+    from src.token_tracker import TokenTracker, use_tracker
+
+    if not job.request.tickers:
+        store.complete_job(job.job_id, status="completed")
+        return
+
+    semaphore = asyncio.Semaphore(max(1, settings.worker_concurrency))
+    timeout = settings.worker_ticker_timeout_seconds
+
+    async def run_one(ticker: str) -> bool:
+        async with semaphore:
+            store.update_ticker_status(job.job_id, ticker, "running")
+            run_services = runtime_services.for_new_run()
+            started = time.monotonic()
+            try:
+                with (
+                    use_tracker(TokenTracker.create_isolated()),
+                    use_runtime_services(run_services),
+                ):
+                    result = await run_with_hard_timeout(
+                        _run_analysis_async(
+                            ticker,
+                            job.request.quick_mode,
+                            runtime_services=run_services,
+                        ),
+                        timeout=timeout,
+                        label=f"dashboard_refresh.analyze.{ticker}",
+                    )
+                if result is None:
+                    raise RuntimeError("run_analysis returned no result")
+                output_path = await run_with_hard_timeout(
+                    asyncio.to_thread(
+                        _save_result_sync,
+                        result,
+                        ticker,
+                        job.request.quick_mode,
+                        results_dir=job.request.results_dir,
+                    ),
+                    timeout=_SAVE_RESULT_TIMEOUT_SECONDS,
+                    label=f"dashboard_refresh.save.{ticker}",
+                )
+            except Exception as exc:
+                store.update_ticker_status(
+                    job.job_id,
+                    ticker,
+                    "failed",
+                    error=_ticker_failure_message(exc),
+                )
+                logger.warning(
+                    "dashboard_refresh_ticker_failed",
+                    job_id=job.job_id,
+                    ticker=ticker,
+                    elapsed_seconds=round(time.monotonic() - started, 2),
+                    **summarize_exception(exc, operation="dashboard refresh job"),
+                )
+                return False
+            store.update_ticker_status(
+                job.job_id,
+                ticker,
+                "completed",
+                output_path=str(output_path),
+            )
+            logger.info(
+                "dashboard_refresh_ticker_completed",
+                job_id=job.job_id,
+                ticker=ticker,
+                elapsed_seconds=round(time.monotonic() - started, 2),
+            )
+            return True
+
+    outcomes = await asyncio.gather(*(run_one(t) for t in job.request.tickers))
+    succeeded = sum(1 for ok in outcomes if ok)
+    store.complete_job(
+        job.job_id, status=_job_status(succeeded, len(outcomes) - succeeded)
+    )
+
+
+async def run_once_async(
+    store: RefreshJobStore,
+    settings: DashboardSettings,
+    *,
+    runtime_services: RuntimeServices | None = None,
+) -> bool:
+    """Concurrent-mode counterpart of ``run_once``."""
+    job = store.claim_next()
+    if job is None:
+        return False
+    await _run_job_concurrent(
+        store,
+        job,
+        settings,
+        runtime_services=runtime_services or build_worker_runtime_services(),
+    )
+    return True
+
+
+async def _serve_concurrent(
+    store: RefreshJobStore,
+    settings: DashboardSettings,
+    *,
+    runtime_services: RuntimeServices,
+    wakeup: JobWakeupListener | None,
+    poll_interval_seconds: float,
+) -> None:
+    idle_wait = settings.worker_idle_poll_seconds if wakeup else poll_interval_seconds
+    while True:
+        ran = await run_once_async(store, settings, runtime_services=runtime_services)
+        if ran:
+            continue
+        if wakeup is not None:
+            await wakeup.wait_async(idle_wait)
+        else:
+            await asyncio.sleep(idle_wait)
 
 
 def main(poll_interval_seconds: float = 2.0) -> None:
     settings = DashboardSettings()
     store = RefreshJobStore(settings.runtime_dir / "jobs.sqlite")
     runtime_services = build_worker_runtime_services()
-    while True:
-        ran = run_once(store, settings, runtime_services=runtime_services)
-        if not ran:
-            time.sleep(poll_interval_seconds)
+    wakeup = JobWakeupListener.open(store.wakeup_path)
+    logger.info(
+        "dashboard_worker_starting",
+        concurrency=settings.worker_concurrency,
+        wakeup=wakeup is not None,
+    )
+    try:
+        if settings.worker_concurrency > 1:
+            asyncio.run(
+                _serve_concurrent(
+                    store,
+                    settings,
+                    runtime_services=runtime_services,
+                    wakeup=wakeup,
+                    poll_interval_seconds=poll_interval_seconds,
+                )
+            )
+            return
+        while True:
+            ran = run_once(store, settings, runtime_services=runtime_services)
+            if ran:
+                continue
+            if wakeup is not None:
+                wakeup.wait(settings.worker_idle_poll_seconds)
+            else:
+                time.sleep(poll_interval_seconds)
+    finally:
+        if wakeup is not None:
+            wakeup.close()
 
 
 if __name__ == "__main__":
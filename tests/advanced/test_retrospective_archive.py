@@ -271,7 +271,7 @@ class TestArchivedSnapshotsAreEvaluated:
         )
         seen: list[str] = []
 
-        async def _price(snapshot):
+        async def _price(snapshot, **_kwargs):
             seen.append(snapshot["analysis_id"])
             return None
 
@@ -489,7 +489,7 @@ class TestOrchestration:
         }
         memo_path = tmp_path / "memo.json"
 
-        async def _below_threshold(_snapshot):
+        async def _below_threshold(_snapshot, **_kwargs):
             return None
 
         for expected_calls in (2, 0):
@@ -563,7 +563,7 @@ class TestOrchestration:
         memo_path = tmp_path / "memo.json"
         priced: list[str] = []
 
-        async def _record(snapshot):
+        async def _record(snapshot, **_kwargs):
             priced.append(snapshot["analysis_id"])
             return None
 
@@ -593,7 +593,7 @@ class TestOrchestration:
         }
         calls: list[str] = []
 
-        async def _explode(snapshot):
+        async def _explode(snapshot, **_kwargs):
             calls.append(snapshot["analysis_id"])
             raise RuntimeError("yfinance exploded")
 
@@ -0,0 +1,117 @@
+"""Bulk repricing: one load per distinct symbol, comparisons from in-memory frames."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.retrospective import compare_to_reality, run_retrospective
+from src.retrospective_prices import (
+    RetrospectivePriceFrames,
+    prefetch_price_frames,
+    price_window_starts,
+)
+from tests.advanced.retrospective_fakes import days_ago, make_snapshot
+
+pytestmark = pytest.mark.asyncio
+
+
+def _bars(start: str, closes: list[float]) -> pd.DataFrame:
+    index = pd.date_range(start, periods=len(closes), freq="D")
+    return pd.DataFrame({"Close": closes}, index=index)
+
+
+def _no_single_fetch(*_a, **_k):
+    raise AssertionError("priced from the bulk frames, not per snapshot")
+
+
+async def test_prefetch_loads_each_symbol_once_from_its_earliest_date() -> None:
+    snapshots = [
+        make_snapshot("7203.T", age_days=200),
+        make_snapshot("6758.T", age_days=300),
+        make_snapshot("AAPL", age_days=100, benchmark_index="^GSPC"),
+        make_snapshot("7203.T", age_days=400),
+    ]
+    calls: list[tuple[list[str], str, str]] = []
+
+    def _load(symbols, start, end):
+        calls.append((symbols, start, end))
+        return {symbol: _bars(start, [1.0, 2.0]) for symbol in symbols}
+
+    frames = await prefetch_price_frames(
+        snapshots, end=days_ago(0), default_benchmark="^GSPC", load_chunk=_load
+    )
+
+    assert len(calls) == 1
+    assert sorted(calls[0][0]) == ["6758.T", "7203.T", "AAPL", "^GSPC", "^N225"]
+    assert calls[0][1] == days_ago(400)
+    assert len(frames) == 5
+    assert price_window_starts(snapshots, default_benchmark="^GSPC")["^N225"] == (
+        days_ago(400)
+    )
+
+
+async def test_failed_chunk_leaves_symbols_to_the_per_snapshot_path() -> None:
+    def _load(symbols, start, end):
+        raise ConnectionError("bulk endpoint down")
+
+    frames = await prefetch_price_frames(
+        [make_snapshot()], end=days_ago(0), default_benchmark="^GSPC", load_chunk=_load
+    )
+
+    assert len(frames) == 0
+    assert frames.window("2767.T", days_ago(10), days_ago(0)) is None
+
+
+async def test_compare_to_reality_slices_windows_from_the_frames(monkeypatch) -> None:
+    import yfinance
+
+    monkeypatch.setattr(yfinance, "Ticker", _no_single_fetch)
+    snapshot = make_snapshot("7203.T", age_days=184, currency="USD")
+    start = days_ago(190)
+    frames = RetrospectivePriceFrames(
+        {
+            # Bars before the analysis date must not move the start price.
+            "7203.T": _bars(start, [500.0] * 6 + [1000.0] * 170 + [600.0] * 14),
+            "^N225": _bars(start, [9.0] * 6 + [100.0] * 184),
+        }
+    )
+
+    comparison = await compare_to_reality(snapshot, price_frames=frames)
+
+    assert comparison is not None
+    assert comparison["start_price"] == 1000.0
+    assert comparison["end_price"] == 600.0
+    assert comparison["benchmark_return_pct"] == 0.0
+    assert comparison["excess_return_pct"] == -40.0
+
+
+async def test_run_retrospective_prefetches_once_when_enabled(
+    monkeypatch, tmp_path
+) -> None:
+    from src.config import config
+
+    monkeypatch.setattr(config, "retrospective_bulk_prices_enabled", True)
+    snapshots = {"7203.T": [make_snapshot("7203.T"), make_snapshot("6758.T")]}
+    frames = RetrospectivePriceFrames({})
+    prefetch = AsyncMock(return_value=frames)
+    compare = AsyncMock(return_value=None)
+    memory = MagicMock()
+    memory.situation_collection.get.return_value = {"ids": [], "metadatas": []}
+
+    with (
+        patch("src.retrospective.load_past_snapshots", return_value=snapshots),
+        patch("src.retrospective.prefetch_price_frames", prefetch),
+        patch("src.retrospective.compare_to_reality", compare),
+    ):
+        await run_retrospective(
+            None, Path("/fake"), memory, memo_path=tmp_path / "memo.json"
+        )
+
+    prefetch.assert_awaited_once()
+    assert len(prefetch.await_args.args[0]) == 2
+    assert compare.await_count == 2
+    assert all(c.kwargs["price_frames"] is frames for c in compare.await_args_list)
@@ -0,0 +1,115 @@
+"""The snapshot catalog: unchanged artifacts are never parsed twice."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import src.retrospective as retrospective
+from src.retrospective import load_past_snapshots
+from tests.advanced.retrospective_fakes import make_snapshot, write_analysis_artifact
+
+
+@pytest.fixture(autouse=True)
+def _catalog_enabled(monkeypatch):
+    monkeypatch.setattr(retrospective.config, "snapshot_catalog_enabled", True)
+
+
+@pytest.fixture
+def parses():
+    with patch(
+        "src.retrospective._parse_snapshot_file",
+        wraps=retrospective._parse_snapshot_file,
+    ) as parse:
+        yield parse
+
+
+def _age_dir(directory: Path) -> None:
+    """Backdate a directory's mtime past the settle grace window."""
+    past = time.time() - 60
+    os.utime(directory, (past, past))
+
+
+def _ids(loaded, ticker: str = "2767.T") -> list[str]:
+    return [snapshot["analysis_id"] for snapshot in loaded[ticker]]
+
+
+def test_second_load_parses_only_new_files(tmp_path, parses) -> None:
+    live = tmp_path / "results"
+    write_analysis_artifact(live, make_snapshot(age_days=90, analysis_id="run-a"))
+    write_analysis_artifact(live, make_snapshot(age_days=60, analysis_id="run-b"))
+
+    first = load_past_snapshots(None, live)
+    assert parses.call_count == 2
+
+    write_analysis_artifact(live, make_snapshot(age_days=30, analysis_id="run-c"))
+    second = load_past_snapshots(None, live)
+
+    assert parses.call_count == 3
+    assert _ids(second) == ["run-c", *_ids(first)]
+    assert second["2767.T"][1] == first["2767.T"][0]
+    assert second["2767.T"][1]["bear_evidence_provenance"]
+
+
+def test_rewritten_and_removed_live_files_are_noticed(tmp_path, parses) -> None:
+    live = tmp_path / "results"
+    kept = write_analysis_artifact(live, make_snapshot(age_days=60, analysis_id="a"))
+    gone = write_analysis_artifact(live, make_snapshot(age_days=90, analysis_id="b"))
+    load_past_snapshots(None, live)
+
+    write_analysis_artifact(
+        live,
+        make_snapshot(age_days=60, analysis_id="a", verdict="SELL"),
+        filename=kept.name,
+    )
+    os.utime(kept, ns=(kept.stat().st_atime_ns, kept.stat().st_mtime_ns + 10**9))
+    gone.unlink()
+    loaded = load_past_snapshots(None, live)
+
+    assert parses.call_count == 3
+    assert [s["verdict"] for s in loaded["2767.T"]] == ["SELL"]
+
+
+def test_settled_archive_is_served_without_listing(tmp_path, parses) -> None:
+    live, archive = tmp_path / "results", tmp_path / "archive"
+    live.mkdir()
+    write_analysis_artifact(archive, make_snapshot(age_days=200, analysis_id="old"))
+    write_analysis_artifact(
+        archive, make_snapshot("7203.T", age_days=210, analysis_id="other")
+    )
+    _age_dir(archive)
+    load_past_snapshots(None, live, archive_dirs=[archive])
+    assert parses.call_count == 2
+
+    real_glob = Path.glob
+
+    def _glob(self, pattern):
+        assert self != archive, "a settled archive must not be listed"
+        return real_glob(self, pattern)
+
+    with patch.object(Path, "glob", _glob):
+        scoped = load_past_snapshots("2767.T", live, archive_dirs=[archive])
+        everything = load_past_snapshots(None, live, archive_dirs=[archive])
+
+    assert parses.call_count == 2
+    assert list(scoped) == ["2767.T"]
+    assert _ids(scoped) == ["old"]
+    assert set(everything) == {"2767.T", "7203.T"}
+
+
+def test_a_file_added_to_a_settled_archive_is_picked_up(tmp_path, parses) -> None:
+    live, archive = tmp_path / "results", tmp_path / "archive"
+    live.mkdir()
+    write_analysis_artifact(archive, make_snapshot(age_days=200, analysis_id="old"))
+    _age_dir(archive)
+    load_past_snapshots(None, live, archive_dirs=[archive])
+
+    write_analysis_artifact(archive, make_snapshot(age_days=150, analysis_id="new"))
+    loaded = load_past_snapshots("2767.T", live, archive_dirs=[archive])
+
+    assert parses.call_count == 2
+    assert _ids(loaded) == ["new", "old"]
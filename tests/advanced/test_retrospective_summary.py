@@ -216,7 +216,7 @@ class TestSummaryFromARealRun:
         comparison.update({"excess_return_pct": -40.0, "days_elapsed": 180})
         priced: list[str] = []
 
-        async def _price(snapshot):
+        async def _price(snapshot, **_kwargs):
             priced.append(snapshot["analysis_id"])
             return dict(comparison)
 
@@ -264,7 +264,7 @@ class TestSummaryFromARealRun:
         comparison.update({"excess_return_pct": -40.0, "days_elapsed": 180})
         priced: list[str] = []
 
-        async def _price(snapshot):
+        async def _price(snapshot, **_kwargs):
             priced.append(snapshot["analysis_id"])
             return dict(comparison)
 
@@ -305,7 +305,7 @@ class TestSummaryFromARealRun:
         memo_path = tmp_path / "m.json"
         priced: list[str] = []
 
-        async def _price(snapshot):
+        async def _price(snapshot, **_kwargs):
             priced.append(snapshot["analysis_id"])
             out = dict(snapshot)
             out.update({"excess_return_pct": -40.0, "days_elapsed": 180})
@@ -343,7 +343,7 @@ class TestSummaryFromARealRun:
         snapshots = {"2767.T": [make_snapshot(age_days=180, analysis_id="run-a")]}
         seen, on_summary = _capture()
 
-        async def _explode(_snapshot):
+        async def _explode(_snapshot, **_kwargs):
             raise RuntimeError("yfinance exploded")
 
         with (
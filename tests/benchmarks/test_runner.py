@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from src.benchmarks.cases import BENCHMARK_CASES, get_benchmark_case
+from src.benchmarks.runner import find_regressions, measure_case
+
+
+@pytest.mark.parametrize("case", BENCHMARK_CASES, ids=lambda case: case.name)
+def test_case_runs_against_committed_fixtures(case, tmp_path) -> None:
+    # Fixture drift or a signature change must fail here, not in the nightly run.
+    case.setup(tmp_path)()
+
+
+def test_measure_case_reports_gated_and_recorded_metrics(tmp_path) -> None:
+    row = measure_case(
+        get_benchmark_case("extract_metrics"), repeats=2, work_dir=tmp_path
+    )
+
+    assert row["case"] == "extract_metrics"
+    assert 0 < row["wall_min_ms"] <= row["wall_median_ms"]
+    assert row["alloc_peak_bytes"] > 0
+    assert row["peak_rss_bytes"] > 0
+
+
+def test_find_regressions_respects_threshold_and_floor() -> None:
+    baseline = {
+        "slow": {"wall_min_ms": 10.0, "alloc_peak_bytes": 1_000_000},
+        "tiny": {"wall_min_ms": 0.1, "alloc_peak_bytes": 1_000},
+    }
+    results = [
+        {"case": "slow", "wall_min_ms": 14.0, "alloc_peak_bytes": 1_100_000},
+        # 3x slower, but under the absolute jitter floors.
+        {"case": "tiny", "wall_min_ms": 0.3, "alloc_peak_bytes": 3_000},
+        {"case": "new", "wall_min_ms": 99.0, "alloc_peak_bytes": 99_000_000},
+    ]
+
+    regressions = find_regressions(results, baseline, threshold=0.25)
+
+    assert [(r.case, r.metric) for r in regressions] == [("slow", "wall_min_ms")]
+    assert regressions[0].ratio == pytest.approx(1.4)
+    assert find_regressions(results, baseline, threshold=0.5) == []
@@ -0,0 +1,130 @@
+"""Tests for the cross-process market-data disk cache."""
+
+from __future__ import annotations
+
+import json
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.disk_cache import MarketDataDiskCache, history_window_key
+from src.data.fetcher import SmartMarketDataFetcher
+
+
+def _history_frame() -> pd.DataFrame:
+    index = pd.date_range("2025-01-06", periods=4, tz="Asia/Tokyo", name="Date")
+    return pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0, np.nan],
+            "Close": [1.5, 2.5, 3.5, 4.5],
+            "Volume": [100, 200, 300, 400],
+        },
+        index=index,
+    )
+
+
+def test_history_round_trips_with_timezone_and_dtypes(tmp_path):
+    cache = MarketDataDiskCache(tmp_path)
+    frame = _history_frame()
+
+    cache.set_history("7203.T", "1y", frame)
+    restored = cache.get_history("7203.T", "1y")
+
+    assert restored is not None
+    pd.testing.assert_frame_equal(restored, frame, check_freq=False)
+    assert cache.get_history("7203.T", "6mo") is None
+
+
+def test_history_is_stored_column_wise_and_memory_mappable(tmp_path):
+    cache = MarketDataDiskCache(tmp_path)
+    cache.set_history("7203.T", "1y", _history_frame())
+
+    entry = (
+        tmp_path
+        / "history"
+        / "yfinance"
+        / "7203.T"
+        / history_window_key("1y", None, None)
+    )
+    meta = json.loads((entry / "meta.json").read_text())
+
+    assert meta["columns"] == ["Open", "Close", "Volume"]
+    assert isinstance(np.load(entry / "col2.npy", mmap_mode="r"), np.memmap)
+
+
+def test_expired_entries_read_as_misses(tmp_path):
+    cache = MarketDataDiskCache(tmp_path, source_ttls={"merged": 0, "yfinance": 0})
+
+    cache.set_metrics("AAPL", {"currentPrice": 200.0})
+    cache.set_history("AAPL", "1y", _history_frame())
+
+    assert cache.get_metrics("AAPL") is None
+    assert cache.get_history("AAPL", "1y") is None
+    assert cache.stats["misses"] == 2
+
+
+def test_closed_windows_outlive_the_open_window_ttl(tmp_path):
+    cache = MarketDataDiskCache(tmp_path, source_ttls={"yfinance": 0})
+
+    cache.set_history("AAPL", "1y", _history_frame(), "2025-01-01", "2025-02-01")
+
+    assert cache.get_history("AAPL", "1y", "2025-01-01", "2025-02-01") is not None
+
+
+def test_error_payloads_and_corrupt_entries_are_not_served(tmp_path):
+    cache = MarketDataDiskCache(tmp_path)
+
+    cache.set_metrics("AAPL", {"error": "provider down"})
+    assert cache.get_metrics("AAPL") is None
+
+    path = tmp_path / "metrics" / "merged" / "MSFT.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{not json")
+    assert cache.get_metrics("MSFT") is None
+
+
+def test_invalidate_scopes_by_ticker(tmp_path):
+    cache = MarketDataDiskCache(tmp_path)
+    for ticker in ("AAPL", "MSFT"):
+        cache.set_metrics(ticker, {"currentPrice": 1.0})
+        cache.set_history(ticker, "1y", _history_frame())
+
+    assert cache.invalidate("AAPL") == 2
+
+    assert cache.get_metrics("AAPL") is None
+    assert cache.get_history("AAPL", "1y") is None
+    assert cache.get_metrics("MSFT") == {"currentPrice": 1.0}
+
+
+def test_from_config_is_disabled_by_default(tmp_path):
+    settings = SimpleNamespace(
+        market_data_disk_cache_enabled=False, data_cache_dir=tmp_path
+    )
+
+    assert MarketDataDiskCache.from_config(settings) is None
+
+
+@pytest.mark.asyncio
+async def test_fetcher_serves_metrics_from_disk_across_instances(tmp_path):
+    calls = []
+
+    async def uncached(ticker, timeout):
+        calls.append(ticker)
+        return {"symbol": ticker, "currentPrice": 10.0, "fetched_at": time.time()}
+
+    first = SmartMarketDataFetcher()
+    first._disk_cache = MarketDataDiskCache(tmp_path)
+    first._get_financial_metrics_uncached = uncached
+    stored = await first.get_financial_metrics("AAPL")
+
+    second = SmartMarketDataFetcher()
+    second._disk_cache = MarketDataDiskCache(tmp_path)
+    second._get_financial_metrics_uncached = uncached
+    served = await second.get_financial_metrics("AAPL")
+
+    assert calls == ["AAPL"]
+    assert served == stored
+    assert second.get_stats()["disk_cache"]["hits"] == 1
@@ -0,0 +1,159 @@
+"""Tests for the incremental per-ticker price-history store."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.data.price_store import PriceHistoryStore, period_start
+
+
+class FakeBars:
+    """Serves a daily series up to ``today`` and records each requested range."""
+
+    def __init__(self, first: str = "2020-01-01", last: str = "2025-06-30") -> None:
+        self.today = date(2025, 3, 3)
+        index = pd.date_range(first, last, freq="B", tz="America/New_York", name="Date")
+        self.frame = pd.DataFrame(
+            {"Close": [float(i + 1) for i in range(len(index))], "Volume": 100},
+            index=index,
+        )
+        self.calls: list[tuple[str | None, str | None]] = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((start, end))
+        dates = self.frame.index.tz_localize(None).normalize()
+        mask = pd.Series(dates <= pd.Timestamp(self.today), index=self.frame.index)
+        if start is not None:
+            mask &= dates >= pd.Timestamp(start)
+        if end is not None:
+            mask &= dates < pd.Timestamp(end)
+        return self.frame.loc[mask.to_numpy()].copy()
+
+
+def _store(tmp_path, bars, today):
+    bars.today = today
+    store = PriceHistoryStore(
+        tmp_path, fetch_bars=bars, min_refresh_seconds=0, clock=lambda: bars.today
+    )
+    return store, bars
+
+
+def test_later_windows_fetch_only_new_bars(tmp_path):
+    bars = FakeBars()
+    store, clock = _store(tmp_path, bars, date(2025, 3, 3))
+
+    first = store.get_window("AAPL", start="2025-01-02", end="2025-03-03")
+    clock.today = date(2025, 3, 10)
+    second = store.get_window("AAPL", start="2025-01-02")
+
+    assert bars.calls == [("2025-01-02", None), ("2025-02-26", None)]
+    assert first.index[-1] < second.index[-1]
+    assert second.index[0].date() == date(2025, 1, 2)
+    assert store.stats["delta_fetches"] == 1
+
+
+def test_older_window_backfills_then_is_served_locally(tmp_path):
+    bars = FakeBars()
+    store, _ = _store(tmp_path, bars, date(2025, 3, 3))
+
+    store.get_window("AAPL", start="2025-01-02", end="2025-03-01")
+    older = store.get_window("AAPL", start="2024-06-03", end="2024-07-01")
+    again = store.get_window("AAPL", start="2024-06-03", end="2024-07-01")
+
+    assert bars.calls[1] == ("2024-06-03", "2025-01-07")
+    assert len(bars.calls) == 2
+    assert older.index[0].date() == date(2024, 6, 3)
+    assert older.index[-1].date() == date(2024, 6, 28)
+    pd.testing.assert_frame_equal(again, older)
+
+
+def test_listing_start_is_remembered(tmp_path):
+    bars = FakeBars(first="2024-03-01")
+    store, _ = _store(tmp_path, bars, date(2025, 3, 3))
+
+    store.get_window("NEWCO", start="2024-06-03", end="2024-07-01")
+    store.get_window("NEWCO", period="5y", end="2025-03-01")
+    calls_after_backfill = len(bars.calls)
+    store.get_window("NEWCO", start="2020-01-02", end="2024-07-01")
+
+    assert len(bars.calls) == calls_after_backfill
+
+
+def test_adjustment_drift_triggers_full_refetch(tmp_path):
+    bars = FakeBars()
+    store, clock = _store(tmp_path, bars, date(2025, 3, 3))
+    store.get_window("AAPL", start="2025-01-02")
+
+    bars.frame["Close"] = bars.frame["Close"] * 0.5  # e.g. a 2:1 split
+    clock.today = date(2025, 3, 10)
+    refreshed = store.get_window("AAPL", start="2025-01-02")
+
+    assert bars.calls[-1] == ("2025-01-02", None)
+    expected = bars.frame.loc["2025-01-02":"2025-03-10", "Close"]
+    assert refreshed["Close"].tolist() == expected.tolist()
+
+
+def test_intraday_last_bar_is_overwritten_without_refetch(tmp_path):
+    bars = FakeBars()
+    store, clock = _store(tmp_path, bars, date(2025, 3, 3))
+    store.get_window("AAPL", start="2025-01-02")
+
+    # The stored 3 March close was a partial bar; the final one differs by 2%.
+    bars.frame.loc["2025-03-03", "Close"] *= 1.02
+    clock.today = date(2025, 3, 4)
+    refreshed = store.get_window("AAPL", start="2025-01-02")
+
+    assert store.stats["full_fetches"] == 1
+    assert store.stats["delta_fetches"] == 1
+    final = bars.frame.loc["2025-03-03", "Close"]
+    assert refreshed.loc["2025-03-03", "Close"] == final
+
+
+def test_adjustment_drift_during_backfill_triggers_full_refetch(tmp_path):
+    bars = FakeBars()
+    store, _ = _store(tmp_path, bars, date(2025, 3, 3))
+    store.get_window("AAPL", start="2025-01-02", end="2025-03-01")
+
+    bars.frame["Close"] = bars.frame["Close"] * 0.5  # e.g. a 2:1 split
+    older = store.get_window("AAPL", start="2024-06-03", end="2025-03-01")
+
+    assert bars.calls[1:] == [("2024-06-03", "2025-01-07"), ("2024-06-03", None)]
+    expected = bars.frame.loc["2024-06-03":"2025-02-28", "Close"]
+    assert older["Close"].tolist() == expected.tolist()
+
+
+def test_todays_partial_bar_is_refreshed_once_stale(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr("src.data.price_store.time.time", lambda: now[0])
+    bars = FakeBars()
+    store, _ = _store(tmp_path, bars, date(2025, 3, 3))
+    store.min_refresh_seconds = 600
+    store.get_window("AAPL", start="2025-01-02")
+
+    bars.frame.loc["2025-03-03", "Close"] *= 1.01  # the session moved on
+    now[0] += 300
+    early = store.get_window("AAPL", start="2025-01-02")
+    now[0] += 600
+    later = store.get_window("AAPL", start="2025-01-02")
+
+    assert bars.calls == [("2025-01-02", None), ("2025-02-26", None)]
+    assert early.loc["2025-03-03", "Close"] != later.loc["2025-03-03", "Close"]
+    assert later.loc["2025-03-03", "Close"] == bars.frame.loc["2025-03-03", "Close"]
+
+
+def test_period_windows_slice_local_series(tmp_path):
+    bars = FakeBars()
+    store, _ = _store(tmp_path, bars, date(2025, 3, 3))
+    store.min_refresh_seconds = 3600
+
+    year = store.get_window("AAPL", period="1y")
+    month = store.get_window("AAPL", period="1mo")
+
+    assert len(bars.calls) == 1
+    assert month.index[0] >= year.index[0]
+    assert month.index[0].date() >= date(2025, 1, 31)
+    with pytest.raises(ValueError):
+        period_start("1h", date(2025, 3, 3))
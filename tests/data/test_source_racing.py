@@ -0,0 +1,121 @@
+"""Tests for early-exit source racing and per-source latency tracking."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.data import source_fetchers
+from src.data.disk_cache import MarketDataDiskCache
+from src.data.fetcher import SOURCE_RESULT_CACHE_TTL_SECONDS, SmartMarketDataFetcher
+
+
+def _complete_payload(fetcher: SmartMarketDataFetcher) -> dict:
+    return {
+        "symbol": "7203.T",
+        "currency": "JPY",
+        "currentPrice": 2900.0,
+        "longName": "Toyota Motor Corporation",
+        **dict.fromkeys(fetcher.IMPORTANT_FIELDS, 1.0),
+    }
+
+
+def _stub_sources(mocker, fetcher, *, yfinance: dict | None, slow_delay: float):
+    slow_calls: list[str] = []
+
+    async def slow_fmp(symbol):
+        slow_calls.append(symbol)
+        await asyncio.sleep(slow_delay)
+        return {"symbol": symbol, "grossMargins": 0.3}
+
+    mocker.patch.object(
+        fetcher, "_fetch_yfinance_enhanced", AsyncMock(return_value=yfinance)
+    )
+    mocker.patch.object(fetcher, "_fetch_yahooquery_fallback", return_value=None)
+    mocker.patch.object(fetcher, "_fetch_fmp_fallback", side_effect=slow_fmp)
+    mocker.patch.object(fetcher, "_fetch_eodhd_fallback", AsyncMock(return_value=None))
+    mocker.patch.object(fetcher, "_fetch_av_fallback", AsyncMock(return_value=None))
+    return slow_calls
+
+
+async def _race(fetcher: SmartMarketDataFetcher, coverage: float) -> dict:
+    return await source_fetchers.fetch_all_sources_parallel(
+        fetcher, "7203.T", 5, early_exit_coverage=coverage
+    )
+
+
+@pytest.mark.asyncio
+async def test_early_exit_returns_before_slow_source_and_keeps_its_result(
+    mocker,
+) -> None:
+    fetcher = SmartMarketDataFetcher()
+    slow_calls = _stub_sources(
+        mocker, fetcher, yfinance=_complete_payload(fetcher), slow_delay=0.2
+    )
+
+    results = await asyncio.wait_for(_race(fetcher, 0.8), timeout=0.15)
+
+    assert results["yfinance"]["longName"] == "Toyota Motor Corporation"
+    assert results["fmp"] is None
+
+    await asyncio.sleep(0.3)
+    assert fetcher._cached_source_result("fmp", "7203.T") == {
+        "symbol": "7203.T",
+        "grossMargins": 0.3,
+    }
+
+    again = await _race(fetcher, 0.8)
+    assert again["fmp"] == {"symbol": "7203.T", "grossMargins": 0.3}
+    assert slow_calls == ["7203.T"]
+
+
+@pytest.mark.asyncio
+async def test_race_waits_for_all_sources_without_an_identity_anchor(mocker) -> None:
+    fetcher = SmartMarketDataFetcher()
+    payload = _complete_payload(fetcher)
+    payload.pop("longName")
+    payload.pop("industry")
+    _stub_sources(mocker, fetcher, yfinance=payload, slow_delay=0.05)
+
+    results = await _race(fetcher, 0.5)
+
+    assert results["fmp"] == {"symbol": "7203.T", "grossMargins": 0.3}
+
+
+def test_disk_mirrored_source_results_expire_with_the_source_ttl(
+    tmp_path, monkeypatch
+) -> None:
+    fetcher = SmartMarketDataFetcher()
+    fetcher._disk_cache = MarketDataDiskCache(tmp_path)
+    fetcher._remember_source_result("yfinance", "7203.T", {"currentPrice": 2900.0})
+    fetcher._source_results.clear()  # a new process: only the disk mirror is left
+
+    assert fetcher._cached_source_result("yfinance", "7203.T") == {
+        "currentPrice": 2900.0
+    }
+
+    stored = time.time()
+    monkeypatch.setattr(
+        "src.data.disk_cache.time.time",
+        lambda: stored + SOURCE_RESULT_CACHE_TTL_SECONDS + 1,
+    )
+    assert fetcher._cached_source_result("yfinance", "7203.T") is None
+
+
+def test_latency_snapshot_reports_nearest_rank_percentiles(monkeypatch) -> None:
+    monkeypatch.setattr(source_fetchers, "_source_latency_samples", {})
+    monkeypatch.setattr(source_fetchers, "_source_timeout_counts", {})
+    for millis in range(1, 101):
+        source_fetchers.record_source_latency("fmp", millis / 1000, "success")
+    source_fetchers.record_source_latency("fmp", 15.0, "timeout")
+
+    snapshot = source_fetchers.source_latency_snapshot()["fmp"]
+
+    assert snapshot["count"] == 101
+    assert snapshot["p50"] == 51.0
+    assert snapshot["p90"] == 91.0
+    assert snapshot["max"] == 15000.0
+    assert snapshot["timeouts"] == 1
@@ -29,6 +29,20 @@ def _isolate_results_dir(tmp_path, monkeypatch):
     monkeypatch.setattr(config, "results_dir", str(isolated), raising=False)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_conid_cache(tmp_path, monkeypatch):
+    """Keep the conid mapping cache out of the working tree.
+
+    Probe tests resolve fixture conids (e.g. 3600.HK -> 3600/SEHK) through
+    ``cache_conid_mapping``; without this they would be written to the real
+    ``scratch/conid_map.json`` and served to later live runs.
+    """
+    from src.ibkr import ticker_mapper
+
+    monkeypatch.setattr(ticker_mapper, "CACHE_FILE", tmp_path / "conid_map.json")
+    monkeypatch.setattr(ticker_mapper, "_cache", None)
+
+
 @pytest.fixture
 def mock_ibkr_client():
     """Mock IbkrClient that returns sample data."""
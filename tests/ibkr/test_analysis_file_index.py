@@ -0,0 +1,187 @@
+"""Tests for the per-file analysis parse index behind load_latest_analyses."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import src.ibkr.analysis_index as analysis_index
+from src.ibkr.analysis_file_index import AnalysisFileIndex, analysis_file_index_path
+from src.ibkr.analysis_index import _analysis_index_path, load_latest_analyses
+
+
+def _write_snapshot(directory, filename, ticker, date, verdict="BUY"):
+    path = directory / filename
+    path.write_text(
+        json.dumps(
+            {
+                "prediction_snapshot": {
+                    "ticker": ticker,
+                    "analysis_date": date,
+                    "verdict": verdict,
+                },
+                "investment_analysis": {},
+            }
+        )
+    )
+    return path
+
+
+def _count_parses(monkeypatch):
+    parsed: list[str] = []
+    original = analysis_index._build_analysis_record_from_file
+
+    def counting(filepath):
+        parsed.append(filepath.name)
+        return original(filepath)
+
+    monkeypatch.setattr(analysis_index, "_build_analysis_record_from_file", counting)
+    return parsed
+
+
+def test_rebuild_after_new_file_parses_only_the_new_file(tmp_path, monkeypatch):
+    _write_snapshot(tmp_path, "7203_T_2026-03-01_analysis.json", "7203.T", "2026-03-01")
+    _write_snapshot(
+        tmp_path, "0005_HK_2026-03-01_analysis.json", "0005.HK", "2026-03-01"
+    )
+    load_latest_analyses(tmp_path)
+
+    _write_snapshot(tmp_path, "9984_T_2026-03-02_analysis.json", "9984.T", "2026-03-02")
+    parsed = _count_parses(monkeypatch)
+    analyses = load_latest_analyses(tmp_path)
+
+    assert analyses.keys() == {"7203.T", "0005.HK", "9984.T"}
+    assert parsed == ["9984_T_2026-03-02_analysis.json"]
+
+
+def test_summary_loss_and_touched_files_reuse_indexed_records(tmp_path, monkeypatch):
+    path = _write_snapshot(
+        tmp_path, "7203_T_2026-03-01_analysis.json", "7203.T", "2026-03-01"
+    )
+    first = load_latest_analyses(tmp_path)
+    _analysis_index_path(tmp_path).unlink()
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    parsed = _count_parses(monkeypatch)
+    second = load_latest_analyses(tmp_path)
+
+    assert parsed == []
+    assert second["7203.T"] == first["7203.T"]
+
+
+def test_changed_file_is_reparsed(tmp_path, monkeypatch):
+    name = "7203_T_2026-03-01_analysis.json"
+    _write_snapshot(tmp_path, name, "7203.T", "2026-03-01", verdict="BUY")
+    load_latest_analyses(tmp_path)
+    _analysis_index_path(tmp_path).unlink()
+
+    _write_snapshot(tmp_path, name, "7203.T", "2026-03-01", verdict="SELL")
+    parsed = _count_parses(monkeypatch)
+    analyses = load_latest_analyses(tmp_path)
+
+    assert parsed == [name]
+    assert analyses["7203.T"].verdict == "SELL"
+
+
+def test_schema_bump_rederives_only_consulted_files(tmp_path, monkeypatch):
+    # Filenames without a parseable ticker key, so dedupe needs the ticker.
+    _write_snapshot(tmp_path, "b_newest_analysis.json", "7203.T", "2026-03-02")
+    _write_snapshot(tmp_path, "a_older_analysis.json", "7203.T", "2026-03-01")
+    load_latest_analyses(tmp_path)
+
+    monkeypatch.setattr(
+        analysis_index,
+        "_ANALYSIS_INDEX_VERSION",
+        analysis_index._ANALYSIS_INDEX_VERSION + 1,
+    )
+    parsed = _count_parses(monkeypatch)
+    analyses = load_latest_analyses(tmp_path)
+
+    assert parsed == ["b_newest_analysis.json"]
+    assert analyses["7203.T"].analysis_date == "2026-03-02"
+
+
+def test_deleted_files_are_pruned(tmp_path):
+    keep = _write_snapshot(
+        tmp_path, "7203_T_2026-03-01_analysis.json", "7203.T", "2026-03-01"
+    )
+    gone = _write_snapshot(
+        tmp_path, "0005_HK_2026-03-01_analysis.json", "0005.HK", "2026-03-01"
+    )
+    load_latest_analyses(tmp_path)
+    gone.unlink()
+
+    analyses = load_latest_analyses(tmp_path)
+
+    assert analyses.keys() == {"7203.T"}
+    with AnalysisFileIndex(
+        analysis_file_index_path(tmp_path),
+        schema_version=analysis_index._ANALYSIS_INDEX_VERSION,
+    ) as file_index:
+        hit, _ = file_index.lookup(keep, keep.stat())
+        assert hit
+        assert file_index.prune({keep.name}) == 0
+
+
+def _write_mixed_snapshots(directory):
+    _write_snapshot(
+        directory, "7203_T_2026-03-03_analysis.json", "7203.T", "2026-03-03"
+    )
+    _write_snapshot(
+        directory, "7203_T_2026-03-01_analysis.json", "7203.T", "2026-03-01"
+    )
+    # Newest 0005.HK snapshot is corrupt, so the older one must win.
+    (directory / "0005_HK_2026-03-02_analysis.json").write_text("{not json")
+    _write_snapshot(
+        directory, "0005_HK_2026-03-01_analysis.json", "0005.HK", "2026-03-01"
+    )
+    _write_snapshot(directory, "b_newest_analysis.json", "9984.T", "2026-03-02")
+    _write_snapshot(directory, "a_older_analysis.json", "9984.T", "2026-02-01")
+
+
+def test_plan_leaves_out_filename_duplicates(tmp_path):
+    _write_mixed_snapshots(tmp_path)
+    filepaths = sorted(tmp_path.glob("*_analysis.json"), reverse=True)
+
+    planned = [
+        path.name for path in analysis_index._plan_parallel_parses(filepaths, None)
+    ]
+
+    assert "7203_T_2026-03-01_analysis.json" not in planned
+    assert "0005_HK_2026-03-01_analysis.json" not in planned
+    assert planned[0] == "b_newest_analysis.json"
+    assert planned == sorted(planned, reverse=True)
+
+
+def test_pooled_rebuild_matches_sequential_rebuild(tmp_path, monkeypatch):
+    sequential_dir = tmp_path / "sequential" / "results"
+    pooled_dir = tmp_path / "pooled" / "results"
+    for directory in (sequential_dir, pooled_dir):
+        directory.mkdir(parents=True)
+        _write_mixed_snapshots(directory)
+    monkeypatch.setattr(analysis_index, "_MIN_PARALLEL_PARSE_FILES", 0)
+    phases: list[str] = []
+
+    expected = load_latest_analyses(sequential_dir, parse_workers=1)
+    pooled = load_latest_analyses(
+        pooled_dir,
+        parse_workers=2,
+        progress=lambda update: phases.append(update.phase),
+    )
+
+    assert pooled.keys() == expected.keys() == {"7203.T", "0005.HK", "9984.T"}
+    for ticker, record in expected.items():
+        assert pooled[ticker].analysis_date == record.analysis_date
+        assert pooled[ticker].verdict == record.verdict
+    assert pooled["0005.HK"].analysis_date == "2026-03-01"
+    assert pooled["9984.T"].analysis_date == "2026-03-02"
+    assert phases[0] == "discovered"
+    assert "parsing" in phases
+    assert phases[-1] == "complete"
+
+    # Parse results were indexed, so a summary-less reload parses nothing.
+    _analysis_index_path(pooled_dir).unlink()
+    parsed = _count_parses(monkeypatch)
+    assert load_latest_analyses(pooled_dir, parse_workers=1).keys() == pooled.keys()
+    assert parsed == ["0005_HK_2026-03-02_analysis.json"]
@@ -206,6 +206,48 @@ class TestGetMarketdataSnapshot:
 
         assert result == {}
 
+    def test_batch_snapshots_chunk_conids_with_one_warmup(self):
+        client = _make_client()
+        calls = []
+
+        def snapshot(conids, fields):
+            calls.append(list(conids))
+            return _response([{"conid": int(c), "31": f"{c}.0"} for c in conids])
+
+        client._ibind_client.live_marketdata_snapshot.side_effect = snapshot
+
+        with (
+            patch(self._PATCH_ENSURE),
+            patch(self._PATCH_SESSION, return_value=True),
+            patch("src.ibkr.client.time.sleep") as mock_sleep,
+        ):
+            result = client.get_marketdata_snapshots([1, 2, 3, 2], chunk_size=2)
+
+        # Pre-flight every chunk, one warm-up for the batch, then the real calls.
+        assert calls == [["1", "2"], ["3"], ["1", "2"], ["3"]]
+        mock_sleep.assert_called_once_with(0.5)
+        client._ibind_client.receive_brokerage_accounts.assert_called_once()
+        assert result == {
+            1: {"conid": 1, "31": "1.0"},
+            2: {"conid": 2, "31": "2.0"},
+            3: {"conid": 3, "31": "3.0"},
+        }
+
+    def test_batch_snapshots_skip_failed_chunk(self):
+        client = _make_client()
+        responses = [
+            _response([{}]),
+            _response([{}]),
+            RuntimeError("boom"),
+            _response([{"conid": "2", "31": "9.87"}]),
+        ]
+        client._ibind_client.live_marketdata_snapshot.side_effect = responses
+
+        with patch(self._PATCH_ENSURE), patch(self._PATCH_SESSION, return_value=True):
+            result = client.get_marketdata_snapshots([1, 2], chunk_size=1)
+
+        assert result == {2: {"conid": "2", "31": "9.87"}}
+
     # ------------------------------------------------------------------ #
     # Two-call protocol (pre-flight + real)
     # ------------------------------------------------------------------ #
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +12,7 @@ from src.ibkr.recommendation_service import (
     PortfolioRecommendationRequest,
     PortfolioRecommendationService,
 )
+from src.ibkr.security_data_service import IbkrSecurityDataService, IbkrSecurityProbe
 from tests.ibkr.reconciler_cases import _make_analysis, _make_position
 
 
@@ -228,6 +231,14 @@ async def test_refresh_runs_and_rereconciles():
     refresh_calls: list[tuple[str, bool, bool]] = []
     saved: list[tuple[str, bool]] = []
 
+    probed: list[list[str]] = []
+
+    class FakeSecurityDataService:
+        async def probe_securities(self, tickers, **_kwargs):
+            assert not refresh_calls, "probes must be warmed before refreshing"
+            probed.append(list(tickers))
+            return {}
+
     async def fake_run_analysis(*, ticker: str, quick_mode: bool, skip_charts: bool):
         refresh_calls.append((ticker, quick_mode, skip_charts))
         return {"ticker": ticker}
@@ -243,12 +254,14 @@ async def test_refresh_runs_and_rereconciles():
         compute_portfolio_health_fn=fake_health,
         run_analysis_fn=fake_run_analysis,
         save_results_fn=fake_save,
+        security_data_service=FakeSecurityDataService(),
     )
 
     bundle = await service.build_bundle(
         _make_request(recommend=True, refresh_policy="blocking")
     )
 
+    assert probed == [["7203.T"]]
     assert refresh_calls == [("7203.T", False, True)]
     assert saved == [("7203.T", False)]
     assert len(reconcile_calls) == 2
@@ -257,6 +270,85 @@ async def test_refresh_runs_and_rereconciles():
     assert bundle.items == []
 
 
+@pytest.mark.asyncio
+async def test_prewarmed_probes_outlive_the_first_analysis():
+    tickers = ("7203.T", "6758.T", "9984.T", "8306.T")
+    snapshot = PortfolioSnapshot(
+        positions=[_make_position(ticker=ticker) for ticker in tickers],
+        portfolio=PortfolioSummary(portfolio_value_usd=1000),
+        watchlist=WatchlistSnapshot(found=True, explicitly_requested=False),
+    )
+    stale_items = [
+        ReconciliationItem(
+            ticker=ticker,
+            action="REVIEW",
+            reason="Stale analysis: age 20d > max_age_days 14",
+            urgency="MEDIUM",
+            ibkr_position=_make_position(ticker=ticker),
+            analysis=_make_analysis(ticker=ticker, age_days=20),
+        )
+        for ticker in tickers
+    ]
+    reconcile_calls: list[dict] = []
+
+    def fake_reconcile(**kwargs):
+        reconcile_calls.append(kwargs)
+        return stale_items if len(reconcile_calls) == 1 else []
+
+    now = [1000.0]
+    security = IbkrSecurityDataService()
+    batches: list[list[str]] = []
+
+    def fake_batch(batch):
+        batches.append(list(batch))
+        return {
+            ticker: IbkrSecurityProbe(
+                configured=True,
+                requested_ticker=ticker,
+                identity_confidence="VERIFIED",
+                last_price=100.0,
+            )
+            for ticker in batch
+        }
+
+    served: list[IbkrSecurityProbe] = []
+
+    async def fake_run_analysis(*, ticker: str, quick_mode: bool, skip_charts: bool):
+        served.append(await security.probe_security(ticker))
+        now[0] += 10 * 60  # a full analysis takes minutes
+        return {"ticker": ticker}
+
+    service = PortfolioRecommendationService(
+        portfolio_data_service=FakePortfolioDataService(snapshot),
+        load_analyses_fn=lambda path: {
+            item.ticker: item.analysis for item in stale_items
+        },
+        reconcile_fn=fake_reconcile,
+        compute_portfolio_health_fn=lambda **kwargs: [],
+        run_analysis_fn=fake_run_analysis,
+        save_results_fn=lambda result, ticker, *, quick_mode: Path("/tmp/x.json"),
+        security_data_service=security,
+    )
+
+    with (
+        patch(
+            "src.ibkr.security_data_service.time",
+            SimpleNamespace(monotonic=lambda: now[0]),
+        ),
+        patch.object(security, "_probe_securities_sync", side_effect=fake_batch),
+        patch.object(security, "_probe_security_sync") as single,
+        patch("src.persistence._maybe_save_rejection_record"),
+    ):
+        bundle = await service.build_bundle(
+            _make_request(recommend=True, refresh_policy="blocking")
+        )
+
+    assert bundle.refresh_activity.refreshed == list(tickers)
+    assert [probe.requested_ticker for probe in served] == list(tickers)
+    assert batches == [list(tickers[:3]), list(tickers[3:])]
+    single.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_missing_explicit_watchlist_raises_value_error():
     snapshot = PortfolioSnapshot(
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
-from src.ibkr.security_data_service import IbkrSecurityDataService
+from src.ibkr.security_data_service import IbkrSecurityDataService, IbkrSecurityProbe
 
 
 class _FakeConfig:
@@ -172,3 +173,117 @@ async def test_probe_async_cache_reuses_previous_result():
 
     assert first == second
     assert wrapped.call_count == 1
+
+
+class _BatchClient(_FakeClient):
+    snapshot_batches: list[list[int]] = []
+
+    def stock_conid_by_symbol(self, symbol: str, default_filtering: bool = False):
+        return {
+            symbol: [
+                {
+                    "conid": int(symbol),
+                    "exchange": "SEHK",
+                    "symbol": symbol,
+                    "currency": "HKD",
+                }
+            ]
+        }
+
+    def get_contract_info(self, conid: int, *, compete: bool = True):
+        return {"symbol": str(conid), "exchange": "SEHK", "currency": "HKD"}
+
+    def get_marketdata_snapshot(self, conid: int, **kwargs):
+        raise AssertionError("batch probes must not snapshot per conid")
+
+    def get_marketdata_snapshots(self, conids, *, fields: str = "", compete=False):
+        self.snapshot_batches.append(list(conids))
+        return {conid: {"31": f"{conid}.5", "55": str(conid)} for conid in conids}
+
+
+@pytest.mark.asyncio
+async def test_batch_probe_snapshots_all_conids_once_and_fills_cache():
+    _BatchClient.snapshot_batches = []
+    service = IbkrSecurityDataService(
+        config=_FakeConfig(configured=True),
+        client_cls=_BatchClient,
+    )
+
+    with patch("src.ibkr.security_data_service.cache_conid_mapping"):
+        probes = await service.probe_securities(["3600.HK", "0700.HK", "3600.HK"])
+        with patch.object(service, "_probe_security_sync") as single:
+            cached = await service.probe_security("0700.HK")
+
+    assert list(probes) == ["3600.HK", "0700.HK"]
+    assert _BatchClient.snapshot_batches == [[3600, 700]]
+    assert probes["3600.HK"].last_price == 3600.5
+    assert probes["0700.HK"].identity_confidence == "VERIFIED"
+    assert cached is probes["0700.HK"]
+    single.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_extended_cache_ttl_only_keeps_quoted_verified_probes():
+    now = [1000.0]
+    service = IbkrSecurityDataService()
+
+    def fake_batch(tickers):
+        return {
+            "QUOTED.T": IbkrSecurityProbe(
+                configured=True,
+                requested_ticker="QUOTED.T",
+                identity_confidence="VERIFIED",
+                last_price=10.0,
+            ),
+            "NOQUOTE.T": IbkrSecurityProbe(
+                configured=True,
+                requested_ticker="NOQUOTE.T",
+                identity_confidence="VERIFIED",
+            ),
+            "LIMITED.T": IbkrSecurityProbe(
+                configured=True,
+                requested_ticker="LIMITED.T",
+                identity_confidence="UNVERIFIED",
+                error_kind="RATE_LIMIT",
+            ),
+        }
+
+    with (
+        patch(
+            "src.ibkr.security_data_service.time",
+            SimpleNamespace(monotonic=lambda: now[0]),
+        ),
+        patch.object(service, "_probe_securities_sync", side_effect=fake_batch),
+    ):
+        await service.probe_securities(
+            ["QUOTED.T", "NOQUOTE.T", "LIMITED.T"], cache_ttl_secs=20 * 3600.0
+        )
+        now[0] += 5 * 60
+        assert service._get_cached_probe("QUOTED.T") is not None
+        assert service._get_cached_probe("NOQUOTE.T") is None
+        assert service._get_cached_probe("LIMITED.T") is None
+        now[0] += 2 * 3600
+        assert service._get_cached_probe("QUOTED.T") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_probe_keeps_unverified_tickers_out_of_the_snapshot():
+    _BatchClient.snapshot_batches = []
+
+    class _MixedClient(_BatchClient):
+        def stock_conid_by_symbol(self, symbol: str, default_filtering: bool = False):
+            if symbol == "BEC":
+                return _AmbiguousClient.stock_conid_by_symbol(self, symbol)
+            return super().stock_conid_by_symbol(symbol, default_filtering)
+
+    service = IbkrSecurityDataService(
+        config=_FakeConfig(configured=True),
+        client_cls=_MixedClient,
+    )
+
+    with patch("src.ibkr.security_data_service.cache_conid_mapping"):
+        probes = await service.probe_securities(["BEC.SG", "3600.HK"])
+
+    assert probes["BEC.SG"].error_kind == "AMBIGUOUS"
+    assert probes["BEC.SG"].last_price is None
+    assert _BatchClient.snapshot_batches == [[3600]]
@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from src.config import Settings
+from src.llm_runtime.bindings import resolve_binding_plan
+from src.llm_runtime.cassette import (
+    CassetteChatModel,
+    CassetteMissError,
+    LLMCassette,
+    configure_cassette,
+    reset_cassette_for_tests,
+)
+from src.llm_runtime.construction import build_model_for_seat
+from src.llm_runtime.seats import SeatId
+from src.tooling.runtime import ToolExecutionService, ToolInvocation
+
+
+@pytest.fixture(autouse=True)
+def _no_process_cassette():
+    configure_cassette(None)
+    yield
+    reset_cassette_for_tests()
+
+
+def _messages(day: str) -> list:
+    return [
+        SystemMessage(content=f"You are the market analyst. Today is {day}."),
+        HumanMessage(content="Analyze 7203.T"),
+    ]
+
+
+class Verdict(BaseModel):
+    verdict: str
+
+
+class ToolCapableFake(FakeMessagesListChatModel):
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def with_structured_output(self, schema, **kwargs):
+        return self | (lambda _message: Verdict(verdict="HOLD"))
+
+
+def test_replay_serves_recorded_response_without_inner_model(tmp_path) -> None:
+    recorder = LLMCassette(tmp_path, mode="record")
+    inner = FakeMessagesListChatModel(
+        responses=[AIMessage(content="BUY", usage_metadata=None)]
+    )
+    live = CassetteChatModel(seat="market_analyst", cassette=recorder, inner=inner)
+    recorded = asyncio.run(live.ainvoke(_messages("2026-03-01")))
+
+    replayer = LLMCassette(tmp_path, mode="replay", strict=True)
+    offline = CassetteChatModel(seat="market_analyst", cassette=replayer)
+    replayed = asyncio.run(offline.ainvoke(_messages("2026-03-09")))
+
+    assert recorded.content == replayed.content == "BUY"
+    assert replayer.stats == {"recorded": 0, "replayed": 1, "fuzzy": 0}
+
+
+def test_tool_bound_calls_replay_tool_calls(tmp_path) -> None:
+    call = {"name": "get_news", "args": {"ticker": "7203.T"}, "id": "call_1"}
+    recorder = LLMCassette(tmp_path, mode="record")
+    inner = ToolCapableFake(responses=[AIMessage(content="", tool_calls=[call])])
+    live = CassetteChatModel(seat="news_analyst", cassette=recorder, inner=inner)
+    live.bind_tools([{"name": "get_news"}]).invoke(_messages("2026-03-01"))
+
+    offline = CassetteChatModel(
+        seat="news_analyst", cassette=LLMCassette(tmp_path, mode="replay", strict=True)
+    )
+    replayed = offline.bind_tools([{"name": "get_news"}]).invoke(
+        _messages("2026-03-01")
+    )
+
+    assert replayed.tool_calls[0]["args"] == {"ticker": "7203.T"}
+    with pytest.raises(CassetteMissError):
+        offline.invoke(_messages("2026-03-01"))
+
+
+def test_structured_output_round_trips(tmp_path) -> None:
+    recorder = LLMCassette(tmp_path, mode="record")
+    inner = ToolCapableFake(responses=[AIMessage(content="")])
+    live = CassetteChatModel(seat="portfolio_manager", cassette=recorder, inner=inner)
+    live.with_structured_output(Verdict).invoke(_messages("2026-03-01"))
+
+    offline = CassetteChatModel(
+        seat="portfolio_manager", cassette=LLMCassette(tmp_path, mode="replay")
+    )
+    result = offline.with_structured_output(Verdict).invoke(_messages("2026-03-01"))
+
+    assert result == Verdict(verdict="HOLD")
+
+
+def test_unmatched_request_falls_back_to_seat_order_unless_strict(tmp_path) -> None:
+    recorder = LLMCassette(tmp_path, mode="record")
+    inner = FakeMessagesListChatModel(
+        responses=[AIMessage(content="first"), AIMessage(content="second")]
+    )
+    live = CassetteChatModel(seat="bull_researcher", cassette=recorder, inner=inner)
+    live.invoke([HumanMessage(content="round 1")])
+    live.invoke([HumanMessage(content="round 2")])
+
+    loose = CassetteChatModel(
+        seat="bull_researcher", cassette=LLMCassette(tmp_path, mode="replay")
+    )
+    assert loose.invoke([HumanMessage(content="round 2")]).content == "second"
+    assert loose.invoke([HumanMessage(content="edited")]).content == "first"
+
+    strict = CassetteChatModel(
+        seat="bull_researcher",
+        cassette=LLMCassette(tmp_path, mode="replay", strict=True),
+    )
+    with pytest.raises(CassetteMissError):
+        strict.invoke([HumanMessage(content="edited")])
+
+
+def test_tool_results_are_recorded_and_replayed(tmp_path) -> None:
+    calls = []
+
+    async def runner(args):
+        calls.append(args)
+        return f"news for {args['ticker']}"
+
+    service = ToolExecutionService()
+    invocation = ToolInvocation(
+        name="get_news", args={"ticker": "7203.T"}, source="toolnode"
+    )
+    configure_cassette(LLMCassette(tmp_path, mode="record"))
+    recorded = asyncio.run(service.execute(invocation, runner))
+    configure_cassette(LLMCassette(tmp_path, mode="replay", strict=True))
+    replayed = asyncio.run(service.execute(invocation, runner))
+
+    assert recorded.value == replayed.value == "news for 7203.T"
+    assert len(calls) == 1
+
+
+def test_replay_construction_builds_no_provider_client(tmp_path) -> None:
+    settings = Settings(
+        _env_file=None,
+        llm_base_provider="openai",
+        llm_review_provider="google",
+        llm_regional_provider="zai",
+        llm_writer_provider="anthropic",
+        llm_operational_provider="openai",
+        llm_judge_provider="google",
+        google_api_key="g",
+        openai_api_key="o",
+        claude_api_key="a",
+        zai_api_key="z",
+    )
+    configure_cassette(LLMCassette(tmp_path, mode="replay"))
+
+    model = build_model_for_seat(
+        SeatId.MACRO_CONTEXT, settings=settings, plan=resolve_binding_plan(settings)
+    )
+
+    assert isinstance(model, CassetteChatModel)
+    assert model.inner is None
+    assert model.seat == SeatId.MACRO_CONTEXT.value
+    assert model.model_name
@@ -19,7 +19,7 @@ def test_direct_construction_reuses_provider_specific_process_fallback(
 ) -> None:
     created = []
 
-    def fake_create(rpm: int):
+    def fake_create(rpm: int, **_kwargs):
         limiter = SimpleNamespace(rpm=rpm)
         created.append(limiter)
         return limiter
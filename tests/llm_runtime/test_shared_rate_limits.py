@@ -0,0 +1,90 @@
+"""Tests for the SQLite-backed cross-process token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm_runtime import rate_limits
+from src.llm_runtime.shared_rate_limits import (
+    SharedTokenBucketRateLimiter,
+    bucket_key,
+)
+
+
+def _limiter(db_path, **overrides) -> SharedTokenBucketRateLimiter:
+    kwargs = {
+        "vendor_id": "google",
+        "requests_per_second": 1000.0,
+        "max_bucket_size": 2.0,
+        "check_every_n_seconds": 0.001,
+    }
+    kwargs.update(overrides)
+    return SharedTokenBucketRateLimiter(db_path, **kwargs)
+
+
+def test_bucket_key_scopes_by_vendor_and_endpoint_host() -> None:
+    assert bucket_key("openai") == "openai"
+    assert bucket_key("openai", "api.example.com") == "openai@api.example.com"
+
+
+def test_instances_on_same_file_share_one_bucket(tmp_path) -> None:
+    db_path = tmp_path / "buckets.db"
+    first = _limiter(db_path, requests_per_second=0.001)
+    second = _limiter(db_path, requests_per_second=0.001)
+
+    assert first.acquire(blocking=False) is False
+    first._connect().execute(
+        "UPDATE rate_buckets SET tokens = 1.0 WHERE bucket_key = 'google'"
+    )
+
+    assert second.acquire(blocking=False) is True
+    assert first.acquire(blocking=False) is False
+
+
+def test_distinct_endpoint_hosts_do_not_share_budget(tmp_path) -> None:
+    db_path = tmp_path / "buckets.db"
+    primary = _limiter(db_path, vendor_id="openai", requests_per_second=0.001)
+    other = _limiter(
+        db_path,
+        vendor_id="openai",
+        endpoint_host="proxy.example.com",
+        requests_per_second=0.001,
+    )
+    primary.acquire(blocking=False)
+    other.acquire(blocking=False)
+
+    levels = primary.token_levels()
+
+    assert set(levels) == {"openai", "openai@proxy.example.com"}
+
+
+def test_blocking_acquire_records_wait_histogram(tmp_path) -> None:
+    limiter = _limiter(tmp_path / "buckets.db")
+
+    assert limiter.acquire() is True
+    assert asyncio.run(limiter.aacquire()) is True
+
+    assert sum(limiter.wait_histogram().values()) == 2
+    assert 0.0 <= limiter.token_levels()["google"] <= 2.0
+
+
+def test_create_process_rate_limiter_uses_shared_store_when_configured(
+    monkeypatch, tmp_path
+) -> None:
+    db_path = tmp_path / "shared.db"
+    monkeypatch.setattr(
+        "src.config.config",
+        SimpleNamespace(shared_rate_limit_db_path=db_path),
+    )
+
+    limiter = rate_limits.create_process_rate_limiter(
+        60, vendor_id="anthropic", endpoint_host="api.anthropic.com"
+    )
+
+    assert isinstance(limiter, SharedTokenBucketRateLimiter)
+    assert limiter.key == "anthropic@api.anthropic.com"
+    assert limiter.requests_per_second == pytest.approx(0.8)
+    assert db_path.exists()
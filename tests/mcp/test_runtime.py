@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
 
+import httpx
 import pytest
 from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
 
@@ -376,3 +379,131 @@ class TestPartialServerAvailability:
         )
         assert runtime.unavailable_servers == {}
         assert runtime.usable_server_ids == frozenset()
+
+
+def _pooled_runtime(tmp_path: Path, *, idle_seconds: float = 0.0) -> MCPRuntime:
+    runtime = _runtime(tmp_path)
+    return MCPRuntime(
+        list(runtime.specs.values()),
+        budget_db_path=str(tmp_path / "mcp_usage.db"),
+        session_idle_seconds=idle_seconds,
+    )
+
+
+class _CountingOpener:
+    """Fake ``_open_session`` that records handshakes and closes."""
+
+    def __init__(self, *sessions):
+        self.sessions = list(sessions)
+        self.opened = 0
+        self.closed = 0
+
+    @asynccontextmanager
+    async def __call__(self, _spec):
+        self.opened += 1
+        try:
+            yield self.sessions.pop(0) if len(self.sessions) > 1 else self.sessions[0]
+        finally:
+            self.closed += 1
+
+
+class _EchoSession:
+    async def call_tool(self, name, arguments):
+        await asyncio.sleep(0)
+        return {"tool": name, **arguments}
+
+    async def list_tools(self):
+        return SimpleNamespace(
+            tools=[
+                SimpleNamespace(
+                    name="quote",
+                    description="Quote tool",
+                    inputSchema={"type": "object"},
+                    outputSchema=None,
+                )
+            ]
+        )
+
+
+@pytest.mark.asyncio
+async def test_pooled_runtime_reuses_one_session_across_calls(
+    tmp_path: Path, monkeypatch
+):
+    runtime = _pooled_runtime(tmp_path)
+    spec = runtime.specs["fmp_remote"]
+    opener = _CountingOpener(_EchoSession())
+    monkeypatch.setattr(runtime, "_open_session", opener)
+
+    first = await runtime._execute_with_retry(spec, "quote", {"symbol": "A"})
+    concurrent = await asyncio.gather(
+        *(
+            runtime._execute_with_retry(spec, "quote", {"symbol": s})
+            for s in ("B", "C", "D")
+        )
+    )
+
+    assert first == {"tool": "quote", "symbol": "A"}
+    assert [r["symbol"] for r in concurrent] == ["B", "C", "D"]
+    assert opener.opened == 1
+    assert opener.closed == 0
+
+    await runtime.aclose()
+    assert opener.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_pooled_runtime_reconnects_after_transport_failure(
+    tmp_path: Path, monkeypatch
+):
+    class _BrokenSession(_EchoSession):
+        async def call_tool(self, name, arguments):
+            raise httpx.ReadError("connection reset")
+
+    runtime = _pooled_runtime(tmp_path)
+    spec = runtime.specs["fmp_remote"]
+    opener = _CountingOpener(_BrokenSession(), _EchoSession())
+    monkeypatch.setattr(runtime, "_open_session", opener)
+    monkeypatch.setattr("src.mcp.client.asyncio.sleep", _no_sleep)
+
+    result = await runtime._execute_with_retry(spec, "quote", {"symbol": "A"})
+
+    assert result == {"tool": "quote", "symbol": "A"}
+    assert opener.opened == 2
+    assert opener.closed == 1
+    await runtime.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_closes_after_idle_timeout(tmp_path: Path, monkeypatch):
+    runtime = _pooled_runtime(tmp_path, idle_seconds=0.05)
+    spec = runtime.specs["fmp_remote"]
+    opener = _CountingOpener(_EchoSession())
+    monkeypatch.setattr(runtime, "_open_session", opener)
+
+    await runtime._execute_with_retry(spec, "quote", {"symbol": "A"})
+    await asyncio.sleep(0.2)
+    assert opener.closed == 1
+
+    await runtime._execute_with_retry(spec, "quote", {"symbol": "A"})
+    assert opener.opened == 2
+    await runtime.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_tools_results_are_cached_in_the_catalog(
+    tmp_path: Path, monkeypatch
+):
+    runtime = _runtime(tmp_path)
+    opener = _CountingOpener(_EchoSession())
+    monkeypatch.setattr(runtime, "_open_session", opener)
+
+    first = await runtime.list_tools_for_scope("consultant")
+    second = await runtime.list_tools_for_scope("consultant")
+
+    assert [tool.name for tool in first] == ["quote"]
+    assert first == second
+    assert opener.opened == 1
+
+
+async def _no_sleep(_seconds):
+    return None
@@ -0,0 +1,108 @@
+"""Tests for the embedding-vector cache and batched memory embeddings."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.embedding_cache import EmbeddingCache, embedding_cache_key, set_embedding_cache
+from src.llms import _LazyRateLimiterProxy
+from src.memory import FinancialSituationMemory
+
+
+class _CountingLimiter:
+    def __init__(self) -> None:
+        self.acquired = 0
+
+    async def aacquire(self, *, blocking=True):
+        self.acquired += 1
+        return True
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state():
+    FinancialSituationMemory._reset_shared_state_for_tests()
+    yield
+    set_embedding_cache(None)
+
+
+@pytest.fixture
+def limiter():
+    limiter = _CountingLimiter()
+    with patch("src.llms.GLOBAL_RATE_LIMITER", _LazyRateLimiterProxy(lambda: limiter)):
+        yield limiter
+
+
+def _memory(name: str = "test_memory") -> FinancialSituationMemory:
+    memory = FinancialSituationMemory(name)
+    memory.available = True
+    memory.embeddings = MagicMock()
+    memory.embeddings.aembed_query = AsyncMock(return_value=[0.5, 0.25])
+    memory.embeddings.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [[float(len(text)), 1.0] for text in texts]
+    )
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_query_embeds_each_distinct_text_once_across_memories(limiter) -> None:
+    set_embedding_cache(EmbeddingCache(max_entries=100))
+    bull, bear = _memory("bull_memory"), _memory("bear_memory")
+    bear.embeddings = bull.embeddings
+
+    results = await asyncio.gather(
+        bull._get_embedding("same situation"),
+        bear._get_embedding("same situation"),
+        bull._get_embedding("same situation"),
+    )
+    again = await bear._get_embedding("same situation")
+
+    assert results == [[0.5, 0.25]] * 3
+    assert again == [0.5, 0.25]
+    assert bull.embeddings.aembed_query.await_count == 1
+    assert limiter.acquired == 1
+
+
+@pytest.mark.asyncio
+async def test_add_situations_batches_misses_into_one_request(limiter) -> None:
+    cache = EmbeddingCache(max_entries=100)
+    set_embedding_cache(cache)
+    memory = _memory()
+    memory.situation_collection = MagicMock()
+    cache.set(memory._embedding_cache_key("cached"), [9.0, 9.0])
+
+    with patch("src.memory.get_current_inspection_service") as service:
+        service.return_value.check = AsyncMock(side_effect=lambda env: env.raw_content)
+        ok = await memory.add_situations(["alpha", "cached", "beta", "alpha"])
+
+    assert ok is True
+    memory.embeddings.aembed_documents.assert_awaited_once_with(["alpha", "beta"])
+    memory.embeddings.aembed_query.assert_not_awaited()
+    assert limiter.acquired == 1
+    stored = memory.situation_collection.add.call_args.kwargs["embeddings"]
+    assert stored == [[5.0, 1.0], [9.0, 9.0], [4.0, 1.0], [5.0, 1.0]]
+    assert await memory._get_embedding("beta") == [4.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_per_text_embedding(limiter) -> None:
+    memory = _memory()
+    memory.embeddings.aembed_documents = AsyncMock(side_effect=RuntimeError("boom"))
+
+    vectors = await memory._get_embeddings(["one", "two"])
+
+    assert vectors == [[0.5, 0.25], [0.5, 0.25]]
+    assert memory.embeddings.aembed_query.await_count == 2
+
+
+def test_persistent_cache_survives_a_new_process(tmp_path) -> None:
+    key = embedding_cache_key("abc123", "situation")
+    EmbeddingCache(max_entries=10, db_path=tmp_path / "emb.db").set(key, [0.1, 0.2])
+
+    reopened = EmbeddingCache(max_entries=10, db_path=tmp_path / "emb.db")
+
+    assert reopened.get(key) == [0.1, 0.2]
+    assert reopened.get(embedding_cache_key("def456", "situation")) is None
+    assert reopened.stats["persistent_hits"] == 1
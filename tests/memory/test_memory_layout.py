@@ -0,0 +1,191 @@
+"""Tests for the consolidated (per-role / single) ticker memory layout."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import chromadb
+import pytest
+
+from scripts.memory_layout_migrate import migrate
+from src.config import config
+from src.embeddings import fingerprinted_collection_name, resolve_embedding_binding
+from src.memory import (
+    FinancialSituationMemory,
+    _cleanup_consolidated_ticker,
+    _consolidated_ticker_stats,
+    consolidated_collection_base,
+    scoped_where,
+    ticker_memory_scope,
+)
+
+
+@pytest.fixture
+def client(tmp_path):
+    return chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+
+
+def _shared_name(role: str, layout: str = "per_role") -> str:
+    return fingerprinted_collection_name(
+        consolidated_collection_base(role, layout), resolve_embedding_binding(config)
+    )
+
+
+def _scoped_memory(collection, safe_ticker: str, role: str = "bull"):
+    memory = FinancialSituationMemory.__new__(FinancialSituationMemory)
+    memory.name = f"{safe_ticker}_{role}_memory"
+    memory.available = True
+    memory.collection_base = consolidated_collection_base(role, "per_role")
+    memory.scope = ticker_memory_scope(safe_ticker, role)
+    memory.situation_collection = collection
+    return memory
+
+
+def test_scoped_where_combines_scope_and_caller_filter() -> None:
+    scope = ticker_memory_scope("AAPL", "bull")
+
+    assert scoped_where(None, {"ticker": "AAPL"}) == {"ticker": "AAPL"}
+    assert scoped_where(scope, {"ticker": "AAPL"}) == {
+        "$and": [
+            {"memory_ticker": "AAPL"},
+            {"memory_role": "bull"},
+            {"ticker": "AAPL"},
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_shared_collection_keeps_tickers_isolated(client) -> None:
+    collection = client.get_or_create_collection(_shared_name("bull"))
+    aapl = _scoped_memory(collection, "AAPL")
+    msft = _scoped_memory(collection, "MSFT")
+
+    with patch("src.memory.get_current_inspection_service") as service:
+        service.return_value.check = AsyncMock(side_effect=lambda env: env.raw_content)
+        for memory, text in ((aapl, "apple thesis"), (msft, "microsoft thesis")):
+            memory._get_embeddings = AsyncMock(return_value=[[1.0, 0.0]])
+            memory._get_embedding = AsyncMock(return_value=[1.0, 0.0])
+            assert await memory.add_situations([text], [{"memory_ticker": "EVIL"}])
+
+        results = await aapl.query_similar_situations("thesis", n_results=5)
+
+    assert [row["document"] for row in results] == ["apple thesis"]
+    assert results[0]["metadata"]["memory_ticker"] == "AAPL"
+    assert aapl.get_stats()["count"] == 1
+    assert collection.count() == 2
+
+
+def test_migration_copies_scoped_rows_and_is_idempotent(client) -> None:
+    binding = resolve_embedding_binding(config)
+    for ticker in ("AAPL", "7203_T"):
+        base = f"{ticker}_invest_judge_memory"
+        legacy = client.get_or_create_collection(
+            fingerprinted_collection_name(base, binding),
+            metadata={"legacy_base_name": base},
+        )
+        legacy.add(
+            ids=["2026-01-01T00:00:00_0"],
+            embeddings=[[0.5, 0.5]],
+            documents=[f"{ticker} judgment"],
+            metadatas=[{"timestamp": "2026-01-01T00:00:00"}],
+        )
+
+    migrate(client, "per_role", apply=True, delete_source=False)
+    report = migrate(client, "per_role", apply=True, delete_source=True)
+
+    target = client.get_collection(_shared_name("invest_judge"))
+    assert target.count() == 2
+    assert all(entry["deleted"] for entry in report)
+    rows = target.get(
+        where=scoped_where(ticker_memory_scope("7203_T", "invest_judge"), None)
+    )
+    assert rows["ids"] == ["7203_T_invest_judge_2026-01-01T00:00:00_0"]
+    assert rows["documents"] == ["7203_T judgment"]
+    assert {c.name for c in client.list_collections()} == {target.name}
+
+
+def test_consolidated_stats_and_cleanup_touch_only_one_ticker(
+    client, monkeypatch
+) -> None:
+    monkeypatch.setattr(config, "memory_collection_layout", "per_role")
+    collection = client.get_or_create_collection(_shared_name("bear"))
+    for ticker, stamp in (
+        ("AAPL", "2020-01-01"),
+        ("AAPL", "2999-01-01"),
+        ("MSFT", "2020-01-01"),
+    ):
+        collection.add(
+            ids=[f"{ticker}_bear_{stamp}_0"],
+            embeddings=[[0.1, 0.9]],
+            documents=[ticker],
+            metadatas=[{"timestamp": stamp, **ticker_memory_scope(ticker, "bear")}],
+        )
+
+    stats = _consolidated_ticker_stats(
+        client,
+        "AAPL",
+        "AAPL",
+        {"bear_researcher": "AAPL_bear_memory", "trader": "AAPL_trader_memory"},
+        "per_role",
+    )
+    assert stats["bear_researcher"] == {
+        "available": True,
+        "name": "AAPL_bear_memory",
+        "count": 2,
+    }
+    assert stats["trader"]["available"] is False
+
+    assert _cleanup_consolidated_ticker(client, "AAPL", 30)["AAPL_bear_memory"] == 1
+    assert _cleanup_consolidated_ticker(client, "AAPL", 0)["AAPL_bear_memory"] == 1
+    assert collection.get()["documents"] == ["MSFT"]
+
+
+def test_migration_leaves_unscoped_legacy_collections_alone(client) -> None:
+    binding = resolve_embedding_binding(config)
+    base = "legacy_bull_memory"
+    legacy = client.get_or_create_collection(
+        fingerprinted_collection_name(base, binding),
+        metadata={"legacy_base_name": base},
+    )
+    legacy.add(
+        ids=["2026-01-01T00:00:00_0"],
+        embeddings=[[0.5, 0.5]],
+        documents=["unscoped lesson"],
+        metadatas=[{"timestamp": "2026-01-01T00:00:00"}],
+    )
+
+    report = migrate(client, "per_role", apply=True, delete_source=True)
+
+    assert report == []
+    assert client.get_collection(legacy.name).count() == 1
+    assert {c.name for c in client.list_collections()} == {legacy.name}
+
+
+def test_clear_old_memories_by_ticker_uses_the_shared_collections(
+    tmp_path, monkeypatch
+) -> None:
+    from chromadb.config import Settings
+
+    monkeypatch.setattr(config, "memory_collection_layout", "per_role")
+    monkeypatch.setattr(config, "chroma_persist_directory", str(tmp_path / "chroma"))
+    # Same settings as clear_old_memories, so Chroma shares the instance.
+    client = chromadb.PersistentClient(
+        path=str(tmp_path / "chroma"),
+        settings=Settings(anonymized_telemetry=False, allow_reset=True),
+    )
+    collection = client.get_or_create_collection(_shared_name("trader"))
+    for ticker in ("AAPL", "MSFT"):
+        collection.add(
+            ids=[f"{ticker}_trader_2020-01-01_0"],
+            embeddings=[[0.1, 0.9]],
+            documents=[ticker],
+            metadatas=[
+                {"timestamp": "2020-01-01", **ticker_memory_scope(ticker, "trader")}
+            ],
+        )
+
+    memory = FinancialSituationMemory.__new__(FinancialSituationMemory)
+    deleted = memory.clear_old_memories(days_to_keep=30, ticker="AAPL")
+
+    assert deleted["AAPL_trader_memory"] == 1
+    assert collection.get()["documents"] == ["MSFT"]
@@ -5,6 +5,7 @@ import json
 import math
 import signal
 import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from urllib.parse import urlparse
@@ -1014,6 +1015,367 @@ class TestFetchAndFilter:
         assert len(passing) == 1
 
 
+# ============================================================
+# TestBulkPrescreen — batched quote pass, mocked quote endpoint
+# ============================================================
+class TestBulkPrescreen:
+    """Vectorized Filters A/B/C over batched quote data."""
+
+    FX = {"USD": 1.0, "JPY": 0.0067, "GBP": 1.25}
+
+    @staticmethod
+    def _quote(symbol, **overrides):
+        quote = {
+            "symbol": symbol,
+            "quoteType": "EQUITY",
+            "marketCap": 100_000_000_000,
+            "averageDailyVolume3Month": 1_000_000,
+            "regularMarketPrice": 1500,
+            "currency": "JPY",
+        }
+        quote.update(overrides)
+        return quote
+
+    def _fetcher(self, quotes, calls=None):
+        by_symbol = {q["symbol"]: q for q in quotes}
+
+        def fetch(symbols, *, debug=False):
+            if calls is not None:
+                calls.append(list(symbols))
+            return {s: by_symbol[s] for s in symbols if s in by_symbol}
+
+        return fetch
+
+    def _survivors(self, records, quotes, **criteria):
+        with patch("find_gems.time.sleep"):
+            kept = find_gems._bulk_prescreen(
+                records,
+                fx_rates=self.FX,
+                criteria=find_gems.ScreenCriteria(**criteria),
+                fetch_batch=self._fetcher(quotes),
+            )
+        return [row["YF_Ticker"] for row in kept]
+
+    def test_filters_match_per_symbol_rules(self):
+        records = [
+            {"YF_Ticker": t}
+            for t in ("GOOD.T", "ETF.T", "TINY.T", "THIN.T", "GONE.T", "BARE.T")
+        ]
+        quotes = [
+            self._quote("GOOD.T"),
+            self._quote("ETF.T", quoteType="ETF"),
+            self._quote("TINY.T", marketCap=1_000_000_000),  # ~$6.7M
+            self._quote("THIN.T", averageDailyVolume3Month=10),
+            self._quote(
+                "BARE.T",
+                marketCap=None,
+                averageDailyVolume3Month=None,
+                quoteType=None,
+            ),
+        ]
+
+        assert self._survivors(records, quotes) == ["GOOD.T", "BARE.T"]
+
+    def test_london_turnover_is_converted_from_pence(self):
+        records = [{"YF_Ticker": "VOD.L"}]
+        # 100k shares x 200p = £200k = $250k before the pence correction;
+        # £2k = $2.5k after it, which is below the liquidity floor.
+        quotes = [
+            self._quote(
+                "VOD.L",
+                currency="GBP",
+                marketCap=1_000_000_000,
+                averageDailyVolume3Month=100_000,
+                regularMarketPrice=20,
+            )
+        ]
+
+        assert self._survivors(records, quotes) == []
+        assert self._survivors(records, quotes, min_volume=0) == ["VOD.L"]
+
+    def test_failed_batch_keeps_rows_for_per_symbol_fetch(self):
+        records = [{"YF_Ticker": "7203.T"}, {"YF_Ticker": ""}]
+
+        with patch("find_gems.time.sleep"):
+            kept = find_gems._bulk_prescreen(
+                records,
+                fx_rates=self.FX,
+                criteria=find_gems.ScreenCriteria(),
+                fetch_batch=lambda symbols, *, debug=False: None,
+            )
+
+        assert [row["YF_Ticker"] for row in kept] == ["7203.T"]
+
+    def test_fetch_and_filter_only_enriches_survivors(self):
+        df = pd.DataFrame({"YF_Ticker": ["7203.T", "1306.T"]})
+        calls = []
+        fetch = self._fetcher(
+            [self._quote("7203.T"), self._quote("1306.T", quoteType="ETF")], calls
+        )
+        mock_ticker = MagicMock()
+        mock_ticker.info = TestFetchAndFilter._mock_info_good()
+
+        with (
+            patch("find_gems._fetch_quote_batch", side_effect=fetch),
+            patch("find_gems.yf.Ticker", return_value=mock_ticker) as ticker_cls,
+            patch("find_gems._fetch_fx_rates", return_value=self.FX),
+            patch("find_gems.time.sleep"),
+        ):
+            passing, enriched = find_gems.fetch_and_filter(
+                df, workers=1, bulk_quotes=True
+            )
+
+        assert calls == [["7203.T", "1306.T"]]
+        assert [call.args[0] for call in ticker_cls.call_args_list] == ["7203.T"]
+        assert list(passing["YF_Ticker"]) == ["7203.T"]
+
+
+# ============================================================
+# TestScanJournal — checkpoint / resume / offline re-filter
+# ============================================================
+class TestScanJournal:
+    """Append-only scan journal."""
+
+    @staticmethod
+    def _enriched_row(ticker, **overrides):
+        row = {
+            "YF_Ticker": ticker,
+            "P/E": 12.0,
+            "ROE": 0.15,
+            "ROA": 0.08,
+            "Debt_to_Equity": 80.0,
+            "Operating_Cash_Flow": 1_000_000,
+            "Net_Income": 900_000,
+        }
+        row.update(overrides)
+        return row
+
+    def test_collector_journals_results_and_skips_but_not_transient_errors(
+        self, tmp_path
+    ):
+        records = [{"YF_Ticker": t} for t in ("GOOD.T", "DEAR.T", "ETF.T", "FLAKY.T")]
+
+        def fake_worker(task):
+            ticker = task[0]["YF_Ticker"]
+            if ticker == "ETF.T":
+                task[0]["_skip_reason"] = "not_equity"
+                return None
+            if ticker == "FLAKY.T":
+                return None
+            pe = 40.0 if ticker == "DEAR.T" else 12.0
+            return self._enriched_row(ticker, **{"P/E": pe})
+
+        with find_gems.ScanJournal(tmp_path / "scan.journal.jsonl") as journal:
+            find_gems._collect_enrichment_results(
+                records,
+                fx_rates={"USD": 1.0},
+                criteria=find_gems.ScreenCriteria(),
+                workers=2,
+                worker_fn=fake_worker,
+                journal=journal,
+            )
+
+        entries = find_gems.load_journal(tmp_path / "scan.journal.jsonl")
+        assert set(entries) == {"GOOD.T", "DEAR.T", "ETF.T"}
+        assert entries["GOOD.T"]["reason"] is None
+        assert entries["DEAR.T"]["reason"] == "pe_too_high"
+        assert entries["ETF.T"] == {
+            "YF_Ticker": "ETF.T",
+            "status": "skipped",
+            "reason": "not_equity",
+            "row": None,
+        }
+
+    def test_resume_skips_journaled_tickers_and_refilters_them(self, tmp_path):
+        path = tmp_path / "scan.journal.jsonl"
+        with find_gems.ScanJournal(path) as journal:
+            journal.record("6758.T", row=self._enriched_row("6758.T"))
+            journal.record("1306.T", reason="not_equity")
+
+        mock_ticker = MagicMock()
+        mock_ticker.info = TestFetchAndFilter._mock_info_good()
+        df = pd.DataFrame({"YF_Ticker": ["6758.T", "1306.T", "7203.T"]})
+
+        with (
+            find_gems.ScanJournal(path, resume=True) as journal,
+            patch("find_gems.yf.Ticker", return_value=mock_ticker) as ticker_cls,
+            patch(
+                "find_gems._fetch_fx_rates", return_value={"USD": 1.0, "JPY": 0.0067}
+            ),
+            patch("find_gems.time.sleep"),
+        ):
+            passing, enriched = find_gems.fetch_and_filter(
+                df, workers=1, journal=journal
+            )
+
+        assert [call.args[0] for call in ticker_cls.call_args_list] == ["7203.T"]
+        assert set(passing["YF_Ticker"]) == {"6758.T", "7203.T"}
+        assert set(find_gems.load_journal(path)) == {"6758.T", "1306.T", "7203.T"}
+
+    def test_filter_journal_reapplies_criteria_offline(self, tmp_path):
+        path = tmp_path / "scan.journal.jsonl"
+        with find_gems.ScanJournal(path) as journal:
+            journal.record("CHEAP.T", row=self._enriched_row("CHEAP.T"))
+            journal.record(
+                "PRICEY.T",
+                row={
+                    **self._enriched_row("PRICEY.T", **{"P/E": 16.0}),
+                    "_reject_reason": None,
+                },
+            )
+        with path.open("a") as handle:
+            handle.write('{"YF_Ticker": "TORN.T", "status": "enr')
+
+        with patch("find_gems.yf.Ticker", side_effect=AssertionError("network")):
+            loose, _ = find_gems.filter_journal(
+                path, criteria=find_gems.ScreenCriteria()
+            )
+            strict, enriched = find_gems.filter_journal(
+                path,
+                criteria=find_gems.ScreenCriteria(max_pe=14.0, max_pe_contextual=14.0),
+            )
+
+        assert set(loose["YF_Ticker"]) == {"CHEAP.T", "PRICEY.T"}
+        assert list(strict["YF_Ticker"]) == ["CHEAP.T"]
+        assert len(enriched) == 2
+
+    def test_rerun_without_resume_keeps_the_checkpoint(self, tmp_path):
+        path = tmp_path / "scan.journal.jsonl"
+        with find_gems.ScanJournal(path) as journal:
+            journal.record("6758.T", row=self._enriched_row("6758.T"))
+
+        with pytest.raises(FileExistsError, match="--resume"):
+            find_gems.ScanJournal(path)
+        assert set(find_gems.load_journal(path)) == {"6758.T"}
+
+        with find_gems.ScanJournal(path, fresh=True) as journal:
+            journal.record("7203.T", reason="not_equity")
+        assert set(find_gems.load_journal(path)) == {"7203.T"}
+
+    def test_finished_scan_is_started_over_but_interrupted_one_is_kept(self, tmp_path):
+        path = tmp_path / "scan.journal.jsonl"
+        mock_ticker = MagicMock()
+        mock_ticker.info = TestFetchAndFilter._mock_info_good()
+        df = pd.DataFrame({"YF_Ticker": ["6758.T", "7203.T"]})
+
+        with (
+            patch("find_gems.yf.Ticker", return_value=mock_ticker),
+            patch(
+                "find_gems._fetch_fx_rates", return_value={"USD": 1.0, "JPY": 0.0067}
+            ),
+            patch("find_gems.time.sleep"),
+        ):
+            with find_gems.ScanJournal(path) as journal:
+                find_gems.fetch_and_filter(df, workers=1, journal=journal)
+            assert set(find_gems.load_journal(path)) == {"6758.T", "7203.T"}
+
+            with find_gems.ScanJournal(path) as journal:
+                with patch(
+                    "find_gems._process_row_serial_task",
+                    side_effect=KeyboardInterrupt,
+                ):
+                    find_gems.fetch_and_filter(df, workers=1, journal=journal)
+                journal.record("6758.T", reason="not_equity")
+
+        with pytest.raises(FileExistsError, match="unfinished"):
+            find_gems.ScanJournal(path)
+        assert set(find_gems.load_journal(path)) == {"6758.T"}
+
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            ["--resume", "--no-journal"],
+            ["--fresh-journal", "--no-journal"],
+            ["--resume", "--fresh-journal"],
+        ],
+    )
+    def test_contradictory_journal_flags_are_rejected(self, flags):
+        argv = ["find_gems.py", "--output", "out.txt", *flags]
+        with patch("sys.argv", argv), pytest.raises(SystemExit):
+            find_gems.parse_args()
+
+
+# ============================================================
+# TestAdaptiveThrottle — AIMD worker limit + shared token bucket
+# ============================================================
+class TestAdaptiveThrottle:
+    """Adaptive concurrency for enrichment workers."""
+
+    def test_limit_grows_while_latency_is_flat_and_halves_on_throttle(self):
+        throttle = find_gems.AdaptiveThrottle(initial_workers=2, max_workers=8)
+
+        for _ in range(40):
+            throttle.record_success(0.3)
+        assert throttle.limit == 8
+
+        throttle.record_throttle(0.05, exchange="Tokyo")
+        throttle.record_throttle(0.05, exchange="Tokyo")  # same pause window
+        assert throttle.limit == 4
+        assert throttle.throttle_events == 2
+
+    def test_limit_holds_when_latency_degrades(self):
+        throttle = find_gems.AdaptiveThrottle(initial_workers=2, max_workers=8)
+        throttle.record_success(0.2)
+        throttle.record_success(0.2)
+        assert throttle.limit == 3
+
+        for _ in range(20):
+            throttle.record_success(2.0)
+        assert throttle.limit == 3
+
+    def test_throttle_pauses_the_shared_bucket(self):
+        throttle = find_gems.AdaptiveThrottle(
+            initial_workers=1, max_workers=1, rate_per_second=1000.0
+        )
+        throttle.wait_for_token()
+        throttle.record_throttle(0.1)
+
+        started = time.monotonic()
+        throttle.wait_for_token()
+
+        assert time.monotonic() - started >= 0.09
+
+    def test_process_row_reports_rate_limits_instead_of_sleeping(self):
+        throttle = MagicMock(spec=find_gems.AdaptiveThrottle)
+
+        with (
+            patch("find_gems.yf.Ticker", side_effect=YFRateLimitError()),
+            patch("find_gems.time.sleep") as mock_sleep,
+        ):
+            result = find_gems._process_row(
+                {"YF_Ticker": "7203.T", "Exchange": "Tokyo"}, throttle=throttle
+            )
+
+        assert result is None
+        assert mock_sleep.call_count == 0
+        assert throttle.wait_for_token.call_count == 5
+        assert throttle.record_throttle.call_count == 4
+        assert throttle.record_throttle.call_args.kwargs == {"exchange": "Tokyo"}
+
+    def test_collector_reports_throughput_per_exchange(self, capsys):
+        records = [
+            {"YF_Ticker": f"T{i}", "Exchange": "Tokyo" if i % 2 else "HKEX"}
+            for i in range(6)
+        ]
+        throttle = find_gems.AdaptiveThrottle(initial_workers=1, max_workers=3)
+
+        with patch("find_gems._passes_filters", return_value=True):
+            passing, _ = find_gems._collect_enrichment_results(
+                records,
+                fx_rates={"USD": 1.0},
+                criteria=find_gems.ScreenCriteria(),
+                workers=1,
+                worker_fn=lambda task: {"YF_Ticker": task[0]["YF_Ticker"]},
+                throttle=throttle,
+            )
+
+        summary = throttle.summary()
+        assert len(passing) == 6
+        assert "Throughput: 6 rows" in summary
+        assert "0 throttle events" in summary
+        assert "HKEX" in summary and "Tokyo" in summary
+
+
 # ============================================================
 # TestWriteOutputs — filesystem with tmp_path
 # ============================================================
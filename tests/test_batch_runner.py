@@ -0,0 +1,120 @@
+"""Tests for the in-process multi-ticker batch runner."""
+
+from __future__ import annotations
+
+import asyncio
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from src.batch_runner import (
+    batch_report_path,
+    format_batch_summary,
+    load_tickers_file,
+    run_ticker_batch,
+    ticker_args_for,
+)
+from src.runtime_services import RuntimeServices, get_current_runtime_services
+from src.token_tracker import TokenTracker, get_tracker
+from src.tooling.evidence_recorder import EvidenceRecorder
+from src.tooling.inspection_service import InspectionService
+from src.tooling.runtime import ToolExecutionService
+
+
+def _services() -> RuntimeServices:
+    recorder = EvidenceRecorder()
+    return RuntimeServices(
+        tool_service=ToolExecutionService([recorder]),
+        inspection_service=InspectionService(),
+        evidence_recorder=recorder,
+    )
+
+
+def test_load_tickers_file_skips_comments_blanks_and_duplicates(tmp_path):
+    path = tmp_path / "tickers.txt"
+    path.write_text("# header\n7203.T\n\n0005.hk  # HSBC\n7203.T\nAAPL extra\n")
+
+    assert load_tickers_file(path) == ["7203.T", "0005.HK", "AAPL"]
+
+
+def test_ticker_args_for_forces_quiet_per_ticker_output(tmp_path):
+    args = Namespace(ticker=None, output=None, quiet=False, tickers_file="x.txt")
+
+    ticker_args = ticker_args_for(args, "0005.HK", tmp_path)
+
+    assert ticker_args.ticker == "0005.HK"
+    assert ticker_args.output == str(tmp_path / "0005_HK.md")
+    assert ticker_args.quiet is True
+    assert ticker_args.tickers_file is None
+    assert args.ticker is None
+
+
+@pytest.mark.asyncio
+async def test_run_ticker_batch_isolates_tracker_and_run_services(tmp_path):
+    base_services = _services()
+    seen: dict[str, tuple[object, object]] = {}
+
+    async def analyze(ticker_args, run_services):
+        assert get_current_runtime_services() is run_services
+        seen[ticker_args.ticker] = (get_tracker(), run_services.evidence_recorder)
+        await asyncio.sleep(0)
+        return batch_report_path(tmp_path, ticker_args.ticker)
+
+    outcomes = await run_ticker_batch(
+        Namespace(ticker=None, output=None, quiet=False, tickers_file="x"),
+        ["AAA", "BBB"],
+        runtime_services=base_services,
+        analyze_ticker=analyze,
+        output_dir=tmp_path,
+        concurrency=2,
+    )
+
+    assert [outcome.status for outcome in outcomes] == ["ok", "ok"]
+    trackers = {id(tracker) for tracker, _ in seen.values()}
+    recorders = {id(recorder) for _, recorder in seen.values()}
+    assert len(trackers) == 2
+    assert id(TokenTracker()) not in trackers
+    assert len(recorders) == 2
+    assert id(base_services.evidence_recorder) not in recorders
+
+
+@pytest.mark.asyncio
+async def test_run_ticker_batch_bounds_concurrency_and_reports_timeouts(tmp_path):
+    active = 0
+    peak = 0
+
+    async def analyze(ticker_args, run_services):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            if ticker_args.ticker == "SLOW":
+                await asyncio.sleep(5)
+            await asyncio.sleep(0.01)
+            if ticker_args.ticker == "BOOM":
+                raise RuntimeError("boom")
+            return Path(ticker_args.output)
+        finally:
+            active -= 1
+
+    outcomes = await run_ticker_batch(
+        Namespace(ticker=None, output=None, quiet=True, tickers_file="x"),
+        ["A", "SLOW", "BOOM", "B"],
+        runtime_services=_services(),
+        analyze_ticker=analyze,
+        output_dir=tmp_path,
+        concurrency=2,
+        ticker_timeout=0.2,
+    )
+
+    assert peak <= 2
+    assert [(outcome.ticker, outcome.status) for outcome in outcomes] == [
+        ("A", "ok"),
+        ("SLOW", "timeout"),
+        ("BOOM", "failed"),
+        ("B", "ok"),
+    ]
+    summary = format_batch_summary(outcomes)
+    assert "2/4 tickers completed." in summary
+    assert "| SLOW | timeout |" in summary
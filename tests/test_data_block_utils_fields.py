@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from src.data_block_utils import (
     extract_block_field,
+    extract_block_number,
     extract_data_block_field,
     extract_data_block_number,
     find_fenced_block_spans,
+    parse_structured_block,
+    structured_block,
 )
 
 
@@ -85,3 +88,44 @@ def test_extract_data_block_accessors_return_none_for_missing_or_malformed_repor
     assert extract_data_block_field("", "SECTOR") is None
     assert extract_data_block_field(None, "SECTOR") is None
     assert extract_data_block_number("not a block", "CURRENT_PRICE") is None
+
+
+def test_structured_block_matches_field_regex_semantics():
+    block = parse_structured_block(
+        "SECTOR: Industrials\n"
+        "sector: shadowed\n"
+        "PE_RATIO_TTM : 12\n"
+        "GUIDANCE_PERIOD:\n"
+        "\n"
+        "  FY2026  \n"
+        "ROA_PERCENT: N/A\n"
+        "PEG_RATIO: ~1,234.5x\n"
+        "TRAILING:   "
+    )
+
+    assert list(block)[:2] == ["SECTOR", "PE_RATIO_TTM "]
+    assert block.raw("Sector") == "Industrials"
+    assert block.raw("PE_RATIO_TTM") is None
+    assert block.raw("GUIDANCE_PERIOD") == "FY2026"
+    assert block.raw("ROA_PERCENT") == "N/A"
+    assert block.field("ROA_PERCENT") is None
+    assert block.number("PEG_RATIO") == 1234.5
+    assert block.raw("TRAILING") == ""
+    assert "TRAILING" in block and "MISSING" not in block
+
+
+def test_structured_block_is_parsed_once_per_report():
+    report = """
+### --- START PM_BLOCK ---
+VERDICT: BUY
+POSITION_SIZE: 2.5
+### --- END PM_BLOCK ---
+"""
+
+    block = structured_block(report, "PM_BLOCK")
+
+    assert block is structured_block(report, "PM_BLOCK")
+    assert block.field("VERDICT") == "BUY"
+    assert extract_block_number(report, "PM_BLOCK", "POSITION_SIZE") == 2.5
+    assert structured_block(report, "DATA_BLOCK") is None
+    assert parse_structured_block(None).raw("VERDICT") is None
@@ -1295,6 +1295,38 @@ class TestMainOrchestration:
             "final",
         ]
 
+    def test_batch_ticker_runs_its_retrospective_before_the_analysis(self, monkeypatch):
+        from src.cli import OutputTargets
+        from src.main import _analyze_batch_ticker
+
+        call_order = []
+        args = SimpleNamespace(ticker="6083.T", quick=True, quiet=True, brief=False)
+        services = object()
+
+        async def fake_retrospective(passed_args):
+            call_order.append(("retrospective", passed_args.ticker))
+
+        async def fake_execute(passed_args, targets, **kwargs):
+            call_order.append(("execute", kwargs["runtime_services"]))
+            return None
+
+        monkeypatch.setattr(
+            "src.main._maybe_run_ticker_retrospective", fake_retrospective
+        )
+        monkeypatch.setattr(
+            "src.main.cli._resolve_output_targets",
+            lambda passed_args: OutputTargets(
+                Path("results/batch/6083_T.md"), Path("images"), True
+            ),
+        )
+        monkeypatch.setattr("src.main._execute_analysis", fake_execute)
+
+        assert (
+            asyncio.run(_analyze_batch_ticker(args, services, provider_preflight={}))
+            is None
+        )
+        assert call_order == [("retrospective", "6083.T"), ("execute", services)]
+
     def test_main_returns_two_for_cli_usage_error(self, monkeypatch):
         from src.main import main
 
@@ -0,0 +1,102 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+from src.config import Settings
+from src.llm_runtime.rate_limits import create_process_rate_limiter
+from src.run_profiler import (
+    RunProfiler,
+    profile_span,
+    run_profile_path,
+    use_run_profiler,
+)
+from src.runtime_config import build_runtime_config
+
+
+def _node(delay: float, *, llm_delay: float = 0.0):
+    async def node(state, config):
+        if llm_delay:
+            with profile_span("llm:test", "llm"):
+                await asyncio.sleep(llm_delay)
+        await asyncio.sleep(delay)
+        return {}
+
+    return node
+
+
+async def _run_supersteps(profiler: RunProfiler) -> None:
+    dispatcher = profiler.wrap_node("Dispatcher", _node(0))
+    fast = profiler.wrap_node("Market Analyst", _node(0.01))
+    slow = profiler.wrap_node("Foreign Language Analyst", _node(0.01, llm_delay=0.05))
+    sync = profiler.wrap_node("Sync Check", _node(0))
+    pm = profiler.wrap_node("Portfolio Manager", _node(0.01))
+    await dispatcher({}, {})
+    await asyncio.gather(fast({}, {}), slow({}, {}))
+    await sync({}, {})
+    await pm({}, {})
+
+
+def test_critical_path_follows_the_slowest_fan_out_branch() -> None:
+    profiler = RunProfiler(label="7203.T")
+    with use_run_profiler(profiler):
+        asyncio.run(_run_supersteps(profiler))
+
+    path = profiler.critical_path()
+
+    assert [step["node"] for step in path] == [
+        "Dispatcher",
+        "Foreign Language Analyst",
+        "Sync Check",
+        "Portfolio Manager",
+    ]
+    assert path[1]["busy_ms_by_category"]["llm"] >= 50
+    assert path[1]["duration_ms"] > path[1]["busy_ms_by_category"]["llm"]
+
+
+def test_chrome_trace_packs_overlapping_nodes_into_separate_lanes() -> None:
+    profiler = RunProfiler(label="7203.T")
+    with use_run_profiler(profiler):
+        asyncio.run(_run_supersteps(profiler))
+
+    trace = json.loads(json.dumps(profiler.to_chrome_trace()))
+
+    spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert spans["Market Analyst"]["tid"] != spans["Foreign Language Analyst"]["tid"]
+    assert spans["llm:test"]["args"]["node"] == "Foreign Language Analyst"
+    lanes = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+    assert {"node 0", "node 1", "llm 0"} <= lanes
+    assert trace["otherData"]["critical_path"][-1]["node"] == "Portfolio Manager"
+
+
+def test_profile_span_is_inert_without_an_active_profiler() -> None:
+    profiler = RunProfiler()
+    with profile_span("tool:get_news", "tool") as args:
+        args["outcome"] = "ok"
+
+    assert profiler.spans == []
+
+
+def test_rate_limiter_waits_are_recorded_as_spans() -> None:
+    limiter = create_process_rate_limiter(600)
+    profiler = RunProfiler()
+
+    with use_run_profiler(profiler):
+        assert limiter.acquire(blocking=True)
+    assert limiter.acquire(blocking=True)
+
+    assert isinstance(limiter, InMemoryRateLimiter)
+    assert [span.category for span in profiler.spans] == ["rate_limit"]
+
+
+def test_profile_flag_and_trace_path(tmp_path) -> None:
+    settings = Settings(_env_file=None)
+    base = build_runtime_config(SimpleNamespace(), settings)
+    profiled = build_runtime_config(SimpleNamespace(profile=True), settings)
+
+    assert not base.profile_run
+    assert profiled.profile_run
+    assert run_profile_path(tmp_path / "7203.T_20260301_120000_analysis.json") == (
+        tmp_path / "7203.T_20260301_120000_analysis.trace.json"
+    )
@@ -99,7 +99,7 @@ def test_provider_runtime_builds_only_configured_independent_vendor_buckets(
 ):
     created = []
 
-    def fake_limiter(rpm=None):
+    def fake_limiter(rpm=None, **_kwargs):
         limiter = SimpleNamespace(rpm=rpm)
         created.append(limiter)
         return limiter
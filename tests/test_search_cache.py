@@ -0,0 +1,150 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+import src.tools.shared as shared
+from src.search_cache import (
+    SearchResultCache,
+    cached_search,
+    search_cache_key,
+    search_cache_snapshot,
+    set_search_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SearchResultCache(tmp_path / "search")
+    set_search_cache(cache)
+    yield cache
+    set_search_cache(None)
+
+
+def _counting_fetch(result):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return result
+
+    return fetch, calls
+
+
+def test_key_normalizes_query_and_separates_profiles_and_days() -> None:
+    base = search_cache_key("news_basic", "Toyota  Motor ", day="2026-03-01")
+
+    assert base == search_cache_key("news_basic", "toyota motor", day="2026-03-01")
+    assert base == search_cache_key(
+        "news_basic", "ＴＯＹＯＴＡ motor", day="2026-03-01"
+    )
+    assert base != search_cache_key("finance_deep", "toyota motor", day="2026-03-01")
+    assert base != search_cache_key("news_basic", "toyota motor", day="2026-03-02")
+    assert base != search_cache_key(
+        "news_basic", "toyota motor", include_answer=True, day="2026-03-01"
+    )
+
+
+def test_results_are_reused_across_instances(cache, tmp_path) -> None:
+    fetch, calls = _counting_fetch({"results": [{"url": "https://a"}]})
+
+    first = asyncio.run(cache.get_or_fetch("news_basic", "toyota", fetch))
+    other = SearchResultCache(tmp_path / "search")
+    second = asyncio.run(other.get_or_fetch("news_basic", "Toyota", fetch))
+
+    assert first == second == {"results": [{"url": "https://a"}]}
+    assert len(calls) == 1
+    assert other.stats["hits"] == 1
+
+
+def test_expired_and_empty_results_are_refetched(cache, monkeypatch) -> None:
+    empty, empty_calls = _counting_fetch([])
+    asyncio.run(cache.get_or_fetch("ddg", "q", empty))
+    asyncio.run(cache.get_or_fetch("ddg", "q", empty))
+    assert len(empty_calls) == 2
+
+    fetch, calls = _counting_fetch(["x"])
+    asyncio.run(cache.get_or_fetch("news_basic", "q", fetch))
+    later = time.time() + cache.profile_ttls["news_basic"] + 1
+    monkeypatch.setattr("src.search_cache.time.time", lambda: later)
+    asyncio.run(cache.get_or_fetch("news_basic", "q", fetch))
+    assert len(calls) == 2
+
+
+def test_concurrent_identical_searches_share_one_fetch(cache) -> None:
+    fetch, calls = _counting_fetch(["result"])
+
+    async def run():
+        return await asyncio.gather(
+            *(cached_search("news_basic", "sony", fetch) for _ in range(4))
+        )
+
+    assert asyncio.run(run()) == [["result"]] * 4
+    assert len(calls) == 1
+    snapshot = search_cache_snapshot()
+    assert snapshot["misses"] == 1
+    assert snapshot["coalesced"] == 3
+    assert snapshot["by_profile"]["news_basic"]["coalesced"] == 3
+
+
+def test_cache_disabled_calls_through_and_reports_nothing() -> None:
+    set_search_cache(None)
+    fetch, calls = _counting_fetch(["r"])
+
+    asyncio.run(cached_search("ddg", "q", fetch))
+    asyncio.run(cached_search("ddg", "q", fetch))
+
+    assert len(calls) == 2
+    assert search_cache_snapshot() == {}
+
+
+def test_ddg_search_goes_through_the_cache(cache) -> None:
+    searches = []
+
+    class FakeDDGS:
+        def __init__(self, timeout):
+            pass
+
+        def text(self, query, max_results):
+            searches.append(query)
+            return [{"title": "t", "href": "https://x", "body": "b"}]
+
+    with (
+        patch.object(shared, "DDGS_AVAILABLE", True),
+        patch("ddgs.DDGS", FakeDDGS),
+    ):
+        first = asyncio.run(shared._ddg_search("Sony Group"))
+        second = asyncio.run(shared._ddg_search("sony group"))
+
+    assert first == second
+    assert searches == ["Sony Group"]
+
+
+def test_results_are_not_shared_across_inspection_backends(cache) -> None:
+    from src.tooling.escalating_inspector import EscalatingInspector
+    from src.tooling.heuristic_inspector import HeuristicInspector
+    from src.tooling.inspection_service import InspectionService
+    from src.tooling.llm_judge_inspector import LLMJudgeInspector
+
+    fetch, calls = _counting_fetch({"results": [{"url": "https://a"}]})
+    null = InspectionService()
+    composite = InspectionService(
+        EscalatingInspector(heuristic=HeuristicInspector(), judge=LLMJudgeInspector()),
+        mode="sanitize",
+    )
+
+    async def _search(service):
+        with patch(
+            "src.runtime_services.get_current_inspection_service",
+            return_value=service,
+        ):
+            return await cached_search("news_basic", "toyota", fetch)
+
+    asyncio.run(_search(null))
+    asyncio.run(_search(composite))
+    asyncio.run(_search(composite))
+
+    assert len(calls) == 2
+    assert composite.cache_identity()["inspector"]["judge"]["prompt_version"] >= 1
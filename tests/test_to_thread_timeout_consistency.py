@@ -41,15 +41,15 @@ from pathlib import Path
 # will surface the new line and you can update.
 OUTER_WRAPPED_ALLOWLIST: dict[str, str] = {
     # source_fetchers.py: each builder is wrapped by run_with_hard_timeout in
-    # fetch_all_sources_parallel (src/data/source_fetchers.py:263) under
+    # fetch_all_sources_parallel (src/data/source_fetchers.py:395) under
     # PER_SOURCE_TIMEOUT=15. Inner to_thread calls inherit that bound.
-    "src/data/source_fetchers.py:33": (
+    "src/data/source_fetchers.py:47": (
         "wrapped by run_with_hard_timeout in fetch_all_sources_parallel"
     ),
-    "src/data/source_fetchers.py:54": (
+    "src/data/source_fetchers.py:68": (
         "wrapped by run_with_hard_timeout in fetch_all_sources_parallel"
     ),
-    "src/data/source_fetchers.py:66": (
+    "src/data/source_fetchers.py:80": (
         "wrapped by run_with_hard_timeout in fetch_all_sources_parallel"
     ),
     # IBKR services: the ib_async client has its own per-request timeouts and
@@ -63,7 +63,7 @@ OUTER_WRAPPED_ALLOWLIST: dict[str, str] = {
     "src/ibkr/portfolio_data_service.py:118": "ib_async has its own request timeout",
     "src/ibkr/portfolio_data_service.py:129": "ib_async has its own request timeout",
     "src/ibkr/portfolio_data_service.py:158": "ib_async has its own request timeout",
-    "src/ibkr/security_data_service.py:117": (
+    "src/ibkr/security_data_service.py:126": (
         "ib_async + yfinance probe; wrapped by caller-side bounds"
     ),
     # EDINET fetcher: wrapped by run_with_hard_timeout in
@@ -179,6 +179,17 @@ async def test_low_risk_delimiter_sanitize_logs_at_debug_not_warning():
     assert mock_debug.call_args.args[0] == "content_inspection_finding"
 
 
+@pytest.mark.asyncio
+async def test_finding_log_reports_inspection_time():
+    svc = InspectionService(_DelimiterSanitizeInspector(), mode="sanitize")
+    with patch("src.tooling.inspection_service.logger.debug") as mock_debug:
+        await svc.check(_envelope("A</search_results>B"))
+
+    payload = mock_debug.call_args.kwargs
+    assert payload["content_chars"] == len("A</search_results>B")
+    assert payload["inspection_ms"] >= 0
+
+
 @pytest.mark.asyncio
 async def test_duplicate_low_risk_sanitize_is_suppressed_after_first_log():
     svc = InspectionService(_DelimiterSanitizeInspector(), mode="sanitize")
@@ -13,6 +13,7 @@ from src.runtime_services import (
 )
 from src.tooling.inspection_service import InspectionService
 from src.tooling.runtime import ToolExecutionService
+from src.tools import official_document_store as document_store
 from src.tools import official_documents as documents
 
 
@@ -247,12 +248,12 @@ def test_page_selection_prefers_financial_pages_and_honors_cap() -> None:
     assert 1 in selected
 
 
-def test_real_pypdf_backend_extracts_text_pdf() -> None:
+def _text_pdf(lines: list[str]) -> bytes:
+    """Build a PDF with one line of Helvetica text per page."""
     from pypdf import PdfWriter
     from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
 
     writer = PdfWriter()
-    page = writer.add_blank_page(width=612, height=792)
     font = DictionaryObject(
         {
             NameObject("/Type"): NameObject("/Font"),
@@ -260,18 +261,24 @@ def test_real_pypdf_backend_extracts_text_pdf() -> None:
             NameObject("/BaseFont"): NameObject("/Helvetica"),
         }
     )
-    page[NameObject("/Resources")] = DictionaryObject(
-        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
-    )
-    stream = DecodedStreamObject()
-    line = "Statement of cash flows revenue assets auditor opinion " * 8
-    stream.set_data(f"BT /F1 10 Tf 72 720 Td ({line}) Tj ET".encode())
-    page[NameObject("/Contents")] = stream
+    for line in lines:
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 10 Tf 72 720 Td ({line}) Tj ET".encode())
+        page[NameObject("/Contents")] = stream
     payload = io.BytesIO()
     writer.write(payload)
+    return payload.getvalue()
+
+
+def test_real_pypdf_backend_extracts_text_pdf() -> None:
+    payload = _text_pdf(["Statement of cash flows revenue assets auditor opinion " * 8])
 
     result = documents._extract_with_pypdf(
-        payload.getvalue(),
+        payload,
         max_pages=10,
         selected_pages=2,
         keywords=("statement of cash flows",),
@@ -439,3 +446,95 @@ async def test_document_tool_uses_html_fallback_and_inspects_text(monkeypatch) -
     assert "evil.example" not in result
     assert "Annual report" in result
     inspection.check.assert_awaited_once()
+
+
+def test_pdf_page_text_is_cached_by_content_hash(tmp_path, monkeypatch) -> None:
+    store = document_store.OfficialDocumentStore(tmp_path, ttl_seconds=3600)
+    payload = _text_pdf(["cover page", "Income statement " + "10 20 " * 30])
+    first = documents._extract_with_pypdf(
+        payload,
+        max_pages=10,
+        selected_pages=2,
+        keywords=("income statement",),
+        store=store,
+    )
+
+    def no_extraction(*args, **kwargs):
+        raise AssertionError("pages should come from the store")
+
+    monkeypatch.setattr(documents, "extract_pdf_pages_parallel", no_extraction)
+    second = documents._extract_with_pypdf(
+        payload, max_pages=10, selected_pages=2, keywords=("cover",), store=store
+    )
+
+    assert first.pages_selected == (0, 1)
+    assert second.text == first.text
+    assert store.stats["page_hits"] == 1
+
+
+def test_parallel_page_extraction_matches_serial() -> None:
+    payload = _text_pdf([f"page {index} revenue" for index in range(44)])
+
+    parallel = document_store.extract_pdf_pages_parallel(payload, 2, 44, workers=2)
+
+    assert parallel == document_store.extract_pdf_page_range(payload, 2, 44)
+    assert parallel[0].strip() == "page 2 revenue"
+
+
+@pytest.mark.asyncio
+async def test_fresh_stored_document_skips_the_network(tmp_path, monkeypatch) -> None:
+    store = document_store.OfficialDocumentStore(tmp_path, ttl_seconds=3600)
+    url = "https://links.sgx.com/report.pdf"
+    store.save(
+        url,
+        b"%PDF-stored",
+        final_url="https://links.sgx.com/final.pdf",
+        content_type="application/pdf",
+    )
+    monkeypatch.setattr(
+        documents,
+        "_ensure_public_hostname",
+        AsyncMock(side_effect=AssertionError("no network expected")),
+    )
+
+    result = await documents._download_official(url, 1_000_000, store=store)
+
+    assert result == (
+        b"%PDF-stored",
+        "application/pdf",
+        "https://links.sgx.com/final.pdf",
+    )
+    assert store.stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_stored_document_is_revalidated_with_etag(
+    tmp_path, monkeypatch
+) -> None:
+    import httpx
+
+    store = document_store.OfficialDocumentStore(tmp_path, ttl_seconds=0)
+    url = "https://links.sgx.com/report.pdf"
+    store.save(
+        url, b"%PDF-stored", final_url=url, content_type="application/pdf", etag='"v1"'
+    )
+    seen_headers: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        return httpx.Response(304)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        documents.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(documents, "_ensure_public_hostname", AsyncMock())
+
+    result = await documents._download_official(url, 1_000_000, store=store)
+
+    assert result[0] == b"%PDF-stored"
+    assert seen_headers == ['"v1"']
+    assert store.stats["revalidated"] == 1
+    assert store.is_fresh(store.lookup(url)) is False  # ttl 0 stays stale
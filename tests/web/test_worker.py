@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from src.web.ibkr_dashboard.job_store import RefreshJobRequest, RefreshJobStore
+from src.web.ibkr_dashboard.job_wakeup import JobWakeupListener
 from src.web.ibkr_dashboard.settings import DashboardSettings
-from src.web.ibkr_dashboard.worker import run_once
+from src.web.ibkr_dashboard.worker import run_once, run_once_async
 
 
 def test_worker_completes_job(tmp_path: Path, monkeypatch):
@@ -110,3 +112,86 @@ def test_worker_passes_explicit_runtime_services(tmp_path: Path, monkeypatch):
 
     assert run_once(store, settings, runtime_services=sentinel_runtime) is True
     assert seen["runtime_services"] is sentinel_runtime
+
+
+class _RunScopedRuntime:
+    def for_new_run(self):
+        return self
+
+
+def test_concurrent_worker_caps_in_flight_tickers(tmp_path: Path, monkeypatch):
+    store = RefreshJobStore(tmp_path / "jobs.sqlite")
+    settings = DashboardSettings(runtime_dir=tmp_path / "runtime", worker_concurrency=2)
+    tickers = ("7203.T", "MEGP.L", "0005.HK", "AAPL")
+    store.enqueue(
+        RefreshJobRequest(
+            scope="ticker_list",
+            tickers=tickers,
+            results_dir="results-d",
+            watchlist_name=None,
+            quick_mode=True,
+            refresh_limit=5,
+            max_age_days=14,
+        )
+    )
+    in_flight = {"now": 0, "peak": 0}
+    statuses_seen: list[list[str]] = []
+
+    async def fake_run(ticker, quick_mode, *, runtime_services):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if ticker == "MEGP.L":
+            raise RuntimeError("boom")
+        return {"ticker": ticker}
+
+    original_update = store.update_ticker_status
+
+    def recording_update(job_id, ticker, status, **kwargs):
+        original_update(job_id, ticker, status, **kwargs)
+        if status != "running":
+            job = store.get_job(job_id)
+            statuses_seen.append([row["status"] for row in job["tickers"]])
+
+    monkeypatch.setattr(store, "update_ticker_status", recording_update)
+    monkeypatch.setattr("src.web.ibkr_dashboard.worker._run_analysis_async", fake_run)
+    monkeypatch.setattr(
+        "src.web.ibkr_dashboard.worker._save_result_sync",
+        lambda result, ticker, quick_mode, *, results_dir: Path(
+            f"{results_dir}/{ticker}.json"
+        ),
+    )
+
+    ran = asyncio.run(
+        run_once_async(store, settings, runtime_services=_RunScopedRuntime())
+    )
+
+    assert ran is True
+    assert in_flight["peak"] == 2
+    job = store.list_jobs()[0]
+    assert job["status"] == "partial"
+    # The first finished ticker was visible while others were still running.
+    assert "running" in statuses_seen[0]
+    rows = {row["ticker"]: row for row in store.get_job(job["job_id"])["tickers"]}
+    assert rows["MEGP.L"]["status"] == "failed"
+    assert rows["AAPL"]["output_path"] == "results-d/AAPL.json"
+
+
+def test_enqueue_wakes_a_waiting_worker(tmp_path: Path):
+    store = RefreshJobStore(tmp_path / "jobs.sqlite")
+    with JobWakeupListener.open(store.wakeup_path) as wakeup:
+        assert wakeup.wait(0.01) is False
+        store.enqueue(
+            RefreshJobRequest(
+                scope="ticker_list",
+                tickers=("7203.T",),
+                results_dir="results-e",
+                watchlist_name=None,
+                quick_mode=True,
+                refresh_limit=5,
+                max_age_days=14,
+            )
+        )
+        assert wakeup.wait(5.0) is True
+        assert wakeup.wait(0.01) is False